@@ -9,16 +9,20 @@
 #-----------------------------------------------------------------------------
 import pyrogue as pr
 import rogue
+import rogue.interfaces.memory as rim
 
 import threading
 import time
 import queue
 
 class _Regs(pr.Device):
-    def __init__(self, pollPeriod=0.0, **kwargs):
+    def __init__(self, pollPeriod=0.0, maxBackoff=0.01, timeout=1.0, **kwargs):
         super().__init__(**kwargs)
 
         self._pollPeriod = pollPeriod
+        self._maxBackoff = maxBackoff
+        self._timeout    = timeout
+        self._latency    = 0.0
 
         self._queue = queue.Queue()
         self._pollThread = threading.Thread(target=self._pollWorker)
@@ -81,68 +85,94 @@ class _Regs(pr.Device):
 
     def _pollWorker(self):
         while True:
-            #print('Main thread loop start')
-            transaction = self._queue.get()
-            if transaction is None:
-                return
-            with self._memLock, transaction.lock():
-                #tranId = transaction.id()
-                #print(f'Woke the pollWorker with id: {tranId}')
-
-                # Get the transaction address and write it to the proxy address register
-                addr = transaction.address()
-                #print('Writing address')
-                self.Addr.set(addr, write=True)
-                #print(f'Wrote address {addr:x}')
-
-                if transaction.type() == rogue.interfaces.memory.Write:
-                    # Convert data bytes to int and write data to proxy register
-                    dataBa = bytearray(4)
-                    transaction.getData(dataBa, 0)
-                    data = int.from_bytes(dataBa, 'little', signed=False)
-                    self.Data.set(data, write=True)
-                    #print(f'Wrote data {data:x}')
-
-                    # Kick off the proxy transaction
-                    self.Rnw.setDisp('Write', write=True)
-                    #print(f'Started write transaction: {tranId}')
-
-                elif (transaction.type() == rogue.interfaces.memory.Read) or (transaction.type() == rogue.interfaces.memory.Verify):
-
-                    # Kick off the read proxy txn
-                    self.Rnw.setDisp('Read', write=True)
-                    #print(f'Started read transaction: {tranId}')
-
-                else:
-                    # Post transactions not allowed
-                    transaction.error(f'Unsupported transaction type {transaction.type()}')
+            # Drain everything queued so far (e.g. the chunks of a bulk block access) back to back
+            transactions = [self._queue.get()]
+            while not self._queue.empty():
+                transactions.append(self._queue.get_nowait())
+
+            with self._memLock:
+                for transaction in transactions:
+                    if transaction is None:
+                        return
+                    with transaction.lock():
+                        self._proxy(transaction)
+
+    def _readStatus(self):
+        # Done/Resp, Addr and Data registers in one block read
+        return self._rawTxnChunker(0x04, None, txnType=rim.Read, numWords=3)
+
+    def _access(self, address, rnw, data=0):
+        """
+        One proxied 32-bit access, returns the read data
+        """
+        # Address and data in one block write, then the command write which
+        # starts the proxy transaction.  The first status read is queued right
+        # behind it: the proxied access is usually done by the time it arrives
+        # so an access normally costs a single round trip.
+        self._clearError()
+        self._rawTxnChunker(0x08, [address & 0xFFFFFFFF, data], txnType=rim.Write)
+        self._rawTxnChunker(0x00, [rnw], txnType=rim.Write)
+        status = self._readStatus()
+        start  = time.monotonic()
+        self._waitTransaction(0)
+
+        # Slow targets: wait for the expected latency, then back off exponentially
+        delay = max(self._pollPeriod, self._latency)
+        polls = 0
+        while (self._getError() == '') and ((status[0] & 0x1) == 0):
+            if (time.monotonic() - start) > self._timeout:
+                raise pr.MemoryError(name=self.name, address=address, msg=f'AXIL proxy timeout after {self._timeout} s')
+            time.sleep(delay)
+            delay  = min(max(2*delay, 1.0E-6), self._maxBackoff)
+            polls += 1
+            status = self._readStatus()
+            self._waitTransaction(0)
+
+        if self._getError() != '':
+            raise pr.MemoryError(name=self.name, address=address, msg=self._getError())
+
+        # Track the latency of the targets which need more than one poll
+        elapsed = (time.monotonic() - start) if polls > 0 else 0.0
+        self._latency = 0.75*self._latency + 0.25*elapsed
+
+        # Check for error flags
+        resp = (status[0] >> 1) & 0x3
+        if resp != 0:
+            raise pr.MemoryError(name=self.name, address=address, msg=f'AXIL tranaction failed with RESP: {resp}')
+
+        return int.from_bytes(status[8:12], 'little', signed=False)
+
+    def _proxy(self, transaction):
+        if transaction.type() == rim.Write:
+            rnw = 0
+        elif (transaction.type() == rim.Read) or (transaction.type() == rim.Verify):
+            rnw = 1
+        else:
+            # Post transactions not allowed
+            transaction.error(f'Unsupported transaction type {transaction.type()}')
+            return
+
+        # Split the burst into word accesses, all done under the same locks
+        address = transaction.address()
+        dataBa  = bytearray(transaction.size())
+        if rnw == 0:
+            transaction.getData(dataBa, 0)
+
+        try:
+            for i in range(0, len(dataBa), 4):
+                if transaction.expired():
                     return
-
-                # Poll done register
-                # Probably need some timeout here
-                done = False
-                while done is False:
-                    done = self.Done.get(read=True)
-                    #print(f'Polled done: {done}')
-                    time.sleep(self._pollPeriod)
-
-                # Check for error flags
-                resp = self.Resp.get(read=True)
-                #print(f'Resp: {resp}')
-                if resp != 0:
-                    transaction.error(f'AXIL tranaction failed with RESP: {resp}')
-
-                # Finish the transaction
-                elif self.Rnw.valueDisp() == 'Write':
-                    transaction.done()
-                else:
-                    data = self.Data.get(read=True)
-                    #print(f'Got read data: {data:x}')
-                    dataBa = bytearray(data.to_bytes(4, 'little', signed=False))
-                    #print(dataBa)
-                    transaction.setData(dataBa, 0)
-                    transaction.done()
-
+                data = self._access(address + i, rnw, int.from_bytes(dataBa[i:i+4], 'little', signed=False))
+                if rnw == 1:
+                    dataBa[i:i+4] = data.to_bytes(4, 'little', signed=False)
+        except pr.MemoryError as e:
+            transaction.error(str(e))
+            return
+
+        # Finish the transaction
+        if rnw == 1:
+            transaction.setData(dataBa, 0)
+        transaction.done()
 
     def _stop(self):
         self._queue.put(None)
@@ -151,8 +181,9 @@ class _Regs(pr.Device):
 
 class _ProxySlave(rogue.interfaces.memory.Slave):
 
-    def __init__(self, regs):
-        super().__init__(4,4)
+    def __init__(self, regs, maxSize=4096):
+        # Bursts up to maxSize bytes are split into word accesses by the Regs worker
+        super().__init__(4,maxSize)
         self._regs = regs
 
     def _doTransaction(self, transaction):
@@ -161,7 +192,7 @@ class _ProxySlave(rogue.interfaces.memory.Slave):
 
 class AxiLiteMasterProxy(pr.Device):
 
-    def __init__(self, hidden=True, pollPeriod=0.0, **kwargs):
+    def __init__(self, hidden=True, pollPeriod=0.0, maxBackoff=0.01, timeout=1.0, maxSize=4096, **kwargs):
         super().__init__(hidden=hidden, **kwargs)
 
         self.add(_Regs(
@@ -170,8 +201,10 @@ class AxiLiteMasterProxy(pr.Device):
             offset  = 0x0000,
             hidden  = hidden,
             pollPeriod = pollPeriod,
+            maxBackoff = maxBackoff,
+            timeout    = timeout,
         ))
-        self.proxy = _ProxySlave(self.Regs)
+        self.proxy = _ProxySlave(self.Regs, maxSize)
 
     def add(self, node):
         pr.Node.add(self, node)
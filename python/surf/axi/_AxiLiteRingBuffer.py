@@ -14,14 +14,19 @@
 #-----------------------------------------------------------------------------
 
 import pyrogue as pr
+import rogue.interfaces.memory as rim
+import numpy as np
+from contextlib import ExitStack
 
 class AxiLiteRingBuffer(pr.Device):
 
     # Last comment added by rherbst for demonstration.
-    def __init__(self, datawidth=32, **kwargs):
+    def __init__(self, datawidth=32, ramAddrWidth=10, **kwargs):
         super().__init__(**kwargs)
 
-        self._datawidth = datawidth
+        self._datawidth    = datawidth
+        self._ramAddrWidth = ramAddrWidth
+        self._depth        = (1 << ramAddrWidth) - 1
 
         ##############################
         # Variables
@@ -57,33 +62,78 @@ class AxiLiteRingBuffer(pr.Device):
             mode         = 'RW',
         ))
 
-        self.addRemoteVariables(
+        self.add(pr.RemoteVariable(
+            name         = 'ramAddrWidth',
+            description  = 'RAM_ADDR_WIDTH_G of the firmware',
+            offset       = 0x00,
+            bitSize      = 8,
+            bitOffset    = 20,
+            base         = pr.UInt,
+            mode         = 'RO',
+            hidden       = True,
+        ))
+
+        # The whole buffer as one array, read with a single block transaction
+        self.add(pr.RemoteVariable(
             name         = 'data',
-            description  = 'Buffer values',
+            description  = 'Buffer values, oldest first',
             offset       = 0x4,
-            bitSize      = 32,
+            bitSize      = 32*self._depth,
             bitOffset    = 0x00,
+            numValues    = self._depth,
+            valueBits    = 32,
+            valueStride  = 32,
             base         = pr.UInt,
             mode         = 'RO',
-            number       = 0x3ff,
-            stride       = 4,
+            bulkOpEn     = False,
             hidden       = True,
-        )
-
-        @self.command()
-        def Dump():
-            mask  = (1<<self._datawidth)-1
-            # cmask = (self._datawidth+3)/4
-            len_  = self.blen.get()
-            if len_ > 512:
-                len_ = 256
-
-            buff = []
-            for i in range(len_):
-                buff.append( self.data[i].get() & mask )
-
-            fmt = '{:0%d'%(self._datawidth/4)+'x} '
-            for i in range(len_):
-                print(fmt.format(buff[i])),
-                if (i&0xf)==0xf:
-                    print()
+            groups       = ['NoStream','NoState','NoConfig'],
+        ))
+
+        @self.command(value='', description='Print the buffer, or save it to a .npy or .csv file when a filename is given')
+        def Dump(arg):
+            data = self.readBuffer()
+
+            if arg.endswith('.npy'):
+                np.save(arg, data)
+            elif arg.endswith('.csv'):
+                np.savetxt(arg, np.column_stack([np.arange(len(data)), data]), fmt='%d', delimiter=',', header='index,value', comments='')
+            else:
+                digits = (self._datawidth+3)//4
+                words  = [f'{x:0{digits}x}' for x in data.tolist()]
+                for i in range(0, len(words), 16):
+                    print(' '.join(words[i:i+16]))
+
+    def readBuffer(self):
+        """
+        Read the valid entries of the buffer, oldest first, as a numpy array
+        of datawidth bits.  The control register and the whole buffer are
+        read with one block transaction.
+        """
+        return readRingBuffers([self])[0]
+
+def readRingBuffers(buffers):
+    """
+    Read several AxiLiteRingBuffer (e.g. one per board on every trigger).
+    Each buffer costs one block read of its control register and data, the
+    reads of all the buffers are queued before waiting on any of them so
+    their round trips overlap.  Returns one numpy array per buffer.
+    """
+    with ExitStack() as stack:
+        data = []
+        for buf in buffers:
+            stack.enter_context(buf._memLock)
+            buf._clearError()
+            data.append(buf._rawTxnChunker(0x0, None, txnType=rim.Read, numWords=buf._depth+1))
+
+        for buf in buffers:
+            buf._waitTransaction(0)
+            if buf._getError() != "":
+                raise pr.MemoryError(name=buf.name, address=buf.address, msg=buf._getError())
+
+    result = []
+    for buf, d in zip(buffers, data):
+        words  = np.frombuffer(bytes(d), dtype='<u4')
+        length = min(int(words[0]) & ((1 << buf._ramAddrWidth) - 1), buf._depth)
+        result.append(words[1:1+length] & np.uint32((1 << buf._datawidth) - 1))
+    return result
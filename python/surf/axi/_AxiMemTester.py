@@ -14,13 +14,25 @@
 #-----------------------------------------------------------------------------
 
 import pyrogue as pr
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Register window holding all the status, timers, geometry and error data
+WINDOW_OFFSET = 0x100
+WINDOW_WORDS  = (0x230 - 0x100) // 4
 
 class AxiMemTester(pr.Device):
     def __init__(self,
                  description = 'AXI4 Memory Tester Module',
+                 axiClkFreq  = None,
+                 burstLen    = 4096,
                  **kwargs):
         super().__init__(description=description, **kwargs)
 
+        # AXI4 clock frequency (Hz) and BURST_LEN_G (bytes), used for the throughput
+        self._axiClkFreq = axiClkFreq
+        self._burstLen   = burstLen
+
         ##############################
         # Variables
         ##############################
@@ -165,3 +177,116 @@ class AxiMemTester(pr.Device):
                 mode        = 'RO',
                 hidden      = True,
             ))
+
+        @self.command(description='Wait for the memory test to complete and print the results')
+        def Run():
+            printMemTestReport([self.run()])
+
+        # Decode table of the window: (variable, byte offset, byte count, shift, mask)
+        self._window = []
+        for var in self.variables.values():
+            if isinstance(var, pr.RemoteVariable) and (var.offset >= WINDOW_OFFSET):
+                bo = var.bitOffset[0] if isinstance(var.bitOffset, list) else var.bitOffset
+                bs = var.bitSize[0] if isinstance(var.bitSize, list) else var.bitSize
+                self._window.append((var, var.offset - WINDOW_OFFSET, (bo + bs + 7)//8, bo, (1 << bs) - 1))
+
+    def readResults(self, update=True):
+        """
+        Read the whole status/timer/error window with one block read and
+        decode it.  WriteGBps/ReadGBps are derived from the timers, the
+        tested span and axiClkFreq (None when unknown or the timer saturated),
+        ErrorBits is RdData xor RandomData.  When update is set the variable
+        shadows are refreshed from the same read.
+        """
+        data = b''.join(int(w).to_bytes(4, 'little') for w in self._rawRead(offset=WINDOW_OFFSET, numWords=WINDOW_WORDS))
+
+        result = {'Path' : self.path}
+        for var, start, size, shift, mask in self._window:
+            value = (int.from_bytes(data[start:start + size], 'little') >> shift) & mask
+            if '[' not in var.name:
+                result[var.name] = value
+            if update:
+                var.set(bool(value) if var.nativeType is bool else value, write=False)
+                var._queueUpdate()
+
+        # The 32 words of RdData/RandomData as single integers
+        result['RdData']     = int.from_bytes(data[0x30:0xB0], 'little')
+        result['RandomData'] = int.from_bytes(data[0xB0:0x130], 'little')
+        result['ErrorBits']  = result['RdData'] ^ result['RandomData']
+
+        # The tester walks 4kB aligned bursts from the start to the stop address, inclusive
+        span = (result['StopAddress'] & ~0xFFF) - (result['StartAddress'] & ~0xFFF) + self._burstLen
+        result['Bytes'] = span
+        for name, timer in (('WriteGBps', 'WriteTimer'), ('ReadGBps', 'ReadTimer')):
+            cycles = result[timer]
+            if (self._axiClkFreq is None) or (cycles == 0) or (cycles == 0xFFFFFFFF):
+                result[name] = None
+            else:
+                result[name] = span * self._axiClkFreq / cycles / 1.0E9
+
+        return result
+
+    def run(self, start=None, timeout=None, pollPeriod=0.001, maxPollPeriod=1.0):
+        """
+        Wait for the memory test and return readResults().
+
+        The test is started by the firmware start input (usually the memory
+        calibration done).  start may be a variable or a function which
+        drives that input, it is then set to 1 (or called with True) first.
+        Busy/Passed/Failed are polled with a period doubling from pollPeriod
+        up to maxPollPeriod.  Raises TimeoutError after timeout seconds.
+        """
+        if isinstance(start, pr.BaseVariable):
+            start.set(1)
+        elif start is not None:
+            start(True)
+
+        t0 = time.monotonic()
+        while True:
+            status = self._rawRead(offset=WINDOW_OFFSET, numWords=2)
+            busy, passed, failed = (status[0] >> 2) & 0x1, status[0] & 0x1, status[1] & 0x1
+            if (not busy) and (passed or failed):
+                break
+            if (timeout is not None) and (time.monotonic() - t0) > timeout:
+                raise TimeoutError(f'{self.path}: memory test not done after {timeout} s')
+            time.sleep(pollPeriod)
+            pollPeriod = min(2*pollPeriod, maxPollPeriod)
+
+        if isinstance(start, pr.BaseVariable):
+            start.set(0)
+        elif start is not None:
+            start(False)
+
+        return self.readResults()
+
+def runMemTesters(testers, start=None, timeout=None, pollPeriod=0.001, maxPollPeriod=1.0):
+    """
+    Run several AxiMemTester (e.g. one per memory controller) concurrently,
+    one thread per tester.  start is either None, one variable/function for
+    all the testers or a list with one per tester.  Returns the list of
+    readResults() of every tester, see printMemTestReport().
+    """
+    starts = start if isinstance(start, (list, tuple)) else [start]*len(testers)
+
+    with ThreadPoolExecutor(max_workers=max(1, len(testers))) as pool:
+        futures = [pool.submit(tester.run, s, timeout, pollPeriod, maxPollPeriod) for tester, s in zip(testers, starts)]
+        return [future.result() for future in futures]
+
+def printMemTestReport(results):
+    """
+    Print one line per tester and the overall verdict
+    """
+    def gbps(x):
+        return '     n/a' if x is None else f'{x:8.3f}'
+
+    print(f'{"Path":40s} {"Result":6s} {"Bytes":>14s} {"Wr GB/s":>8s} {"Rd GB/s":>8s}  Errors')
+    for r in results:
+        errors = [name for name in ('WrErrResp', 'RdErrResp', 'RdErrData') if r[name]]
+        verdict = 'PASS' if (r['Passed'] and not r['Failed']) else 'FAIL'
+        print(f'{r["Path"]:40s} {verdict:6s} {r["Bytes"]:14d} {gbps(r["WriteGBps"])} {gbps(r["ReadGBps"])}  {",".join(errors)}')
+        if r['RdErrData']:
+            print(f'{"":40s} first mismatch bits: {r["ErrorBits"]:#x}')
+
+    passed = all(r['Passed'] and not r['Failed'] for r in results)
+    print(f'{sum(bool(r["Passed"] and not r["Failed"]) for r in results)}/{len(results)} passed: {"PASS" if passed else "FAIL"}')
+    return passed
@@ -9,6 +9,23 @@
 #-----------------------------------------------------------------------------
 
 import pyrogue as pr
+import time
+import numpy as np
+
+from surf.axi._AxiStreamMonAxiL import readStreamMonitors
+
+# One row per sweep point
+SWEEP_DTYPE = np.dtype([
+    ('direction',    'U5'),
+    ('size',         'u4'),   # bytes per transaction
+    ('burst',        'U8'),
+    ('cache',        'u1'),
+    ('period',       'u4'),   # TimerConfig
+    ('transactions', 'u8'),
+    ('seconds',      'f8'),
+    ('gbps',         'f8'),   # achieved, GB/s from the transaction count
+    ('monitorGbps',  'f8'),   # monitor Bandwidth register at the end of the point, GB/s
+])
 
 class AxiRateGen(pr.Device):
     def __init__(self, **kwargs):
@@ -173,3 +190,74 @@ class AxiRateGen(pr.Device):
             mode         = 'RO',
             disp         = '{:d}',
         ))
+
+def axiRateSweep(gen, monitor, lane=0,
+                 sizes      = (64, 256, 1024, 4096),
+                 bursts     = ('INCR',),
+                 caches     = (0b0011,),
+                 directions = ('Write', 'Read'),
+                 period     = 0,
+                 duration   = 1.0):
+    """
+    Bandwidth sweep of an AxiRateGen, measured by the AxiMonAxiL watching its
+    AXI4 bus (lane selects the Write[lane]/Read[lane] monitor channels).
+
+    Every point (direction, transaction size in bytes, burst type, cache
+    attribute) is configured with one batched write of the generator
+    registers, run for duration seconds and measured from the monitor
+    FrameCnt (completed transactions) read in bulk before and after.
+    Returns a numpy structured array of SWEEP_DTYPE, see compareAxiRateSweep().
+    """
+    rows = []
+    burstEnum = {v: k for k, v in gen.awburst.enum.items()}
+
+    for direction in directions:
+        prefix, burstVar, cacheVar = ('Write', gen.awburst, gen.awcache) if direction == 'Write' else ('Read', gen.arburst, gen.arcache)
+        channel = 2*lane + (0 if direction == 'Write' else 1)
+
+        for size in sizes:
+            for burst in bursts:
+                for cache in caches:
+                    gen.WriteEnable.set(False, write=False)
+                    gen.ReadEnable.set(False, write=False)
+                    gen.variables[f'{prefix}Size'].set(size-1, write=False)
+                    gen.variables[f'{prefix}TimerConfig'].set(period, write=False)
+                    burstVar.set(burstEnum[burst], write=False)
+                    cacheVar.set(cache, write=False)
+                    gen.writeBlocks()
+                    gen.checkBlocks()
+
+                    gen.variables[f'{prefix}Enable'].set(True)
+                    before = readStreamMonitors([monitor], update=False)[0]
+                    time.sleep(duration)
+                    after  = readStreamMonitors([monitor], update=False)[0]
+                    gen.variables[f'{prefix}Enable'].set(False)
+
+                    count   = int(after['FrameCnt'][channel] - before['FrameCnt'][channel])
+                    seconds = after['time'] - before['time']
+                    rows.append((direction, size, burst, cache, period, count, seconds,
+                                 count * size / seconds / 1.0E9, after['Bandwidth'][channel] / 8.0E3))
+
+    return np.array(rows, dtype=SWEEP_DTYPE)
+
+def compareAxiRateSweep(results, baseline, tolerance=0.05):
+    """
+    Compare a sweep to a baseline sweep (array or .npy file saved with
+    np.save).  Returns the rows of results whose achieved bandwidth dropped
+    by more than tolerance (fraction) from the matching baseline point,
+    with the baseline bandwidth in a baselineGbps column.
+    """
+    if isinstance(baseline, str):
+        baseline = np.load(baseline)
+
+    keys = ('direction', 'size', 'burst', 'cache', 'period')
+    ref  = {tuple(row[k].item() for k in keys): row['gbps'] for row in baseline}
+
+    dtype = np.dtype(SWEEP_DTYPE.descr + [('baselineGbps', 'f8')])
+    regressions = []
+    for row in results:
+        key = tuple(row[k].item() for k in keys)
+        if (key in ref) and (row['gbps'] < ref[key] * (1 - tolerance)):
+            regressions.append(tuple(row.tolist()) + (ref[key],))
+
+    return np.array(regressions, dtype=dtype)
@@ -14,13 +14,26 @@
 #-----------------------------------------------------------------------------
 
 import pyrogue as pr
+import rogue.interfaces.memory as rim
+import numpy as np
+import time
+from contextlib import ExitStack
+
+# Control word bits (0x800 + 4*buffer)
+INIT_BIT         = 2
+SOFT_TRIGGER_BIT = 3
 
 class AxiStreamDmaRingWrite(pr.Device):
-    def __init__(self, numBuffers=4, **kwargs):
+    def __init__(self, numBuffers=4, memory=None, **kwargs):
         super().__init__(**kwargs)
 
         self._numBuffers = numBuffers
 
+        # Device mapping the address space the buffers are written to (the
+        # buffer addresses are used as offsets into it), used by the readout
+        self._memory  = memory
+        self._buffers = {}
+
         ##############################
         # Variables
         ##############################
@@ -258,12 +271,155 @@ class AxiStreamDmaRingWrite(pr.Device):
         ##############################
         @self.command(name="Initialize", description="Initialize the buffer. Reset the write pointer to StartAddr. Clear the Done field.",)
         def Initialize():
-            for i in range(self._numBuffers):
-                self.Init[i].set(1)
-                self.Init[i].set(0)
+            pulseRingControl([self], INIT_BIT)
 
         @self.command(name="SoftTriggerAll", description="Send a trigger to the buffer",)
         def SoftTriggerAll():
-            for i in range(self._numBuffers):
-                self.SoftTrigger[i].set(1)
-                self.SoftTrigger[i].set(0)
+            pulseRingControl([self], SOFT_TRIGGER_BIT)
+
+    def readStatus(self):
+        """
+        Read the StartAddr, EndAddr, WrAddr and Status of all the buffers,
+        queued back to back and waited on once.  Returns a dict of numpy arrays.
+        """
+        n = self._numBuffers
+        with self._memLock:
+            self._clearError()
+            data = [self._rawTxnChunker(offset, None, txnType=rim.Read, numWords=2*n) for offset in (0x000, 0x200, 0x400)]
+            data.append(self._rawTxnChunker(0xA00, None, txnType=rim.Read, numWords=n))
+            self._waitTransaction(0)
+            if self._getError() != "":
+                raise pr.MemoryError(name=self.name, address=self.address, msg=self._getError())
+
+        start, end, wr = [np.frombuffer(bytes(d), dtype='<u8') for d in data[:3]]
+        status = np.frombuffer(bytes(data[3]), dtype='<u4')
+        return {
+            'StartAddr' : start,
+            'EndAddr'   : end,
+            'WrAddr'    : wr,
+            'Full'      : (status & 0x2) != 0,
+            'Done'      : (status & 0x4) != 0,
+            'Triggered' : (status & 0x8) != 0,
+        }
+
+    def waitDone(self, buffers=None, timeout=None, pollPeriod=0.01):
+        """
+        Poll the status of the buffers until they are all done.
+        Returns the last status, raises TimeoutError after timeout seconds.
+        """
+        buffers = list(range(self._numBuffers)) if buffers is None else list(buffers)
+        start   = time.monotonic()
+        while True:
+            status = self.readStatus()
+            if status['Done'][buffers].all():
+                return status
+            if (timeout is not None) and (time.monotonic() - start) > timeout:
+                raise TimeoutError(f'{self.path}: buffers {buffers} not done after {timeout} s')
+            time.sleep(pollPeriod)
+
+    @staticmethod
+    def validRegions(status, i):
+        """
+        (address, size) regions holding the data of buffer i, oldest first.
+        Once the buffer wrapped (Full) the oldest data starts at WrAddr.
+        """
+        start, end, wr = int(status['StartAddr'][i]), int(status['EndAddr'][i]), int(status['WrAddr'][i])
+        if status['Full'][i]:
+            return [(wr, end - wr), (start, wr - start)]
+        return [(start, wr - start)]
+
+    def readBuffers(self, buffers=None, status=None):
+        """
+        Read the valid data of the buffers from memory.  Every region is read
+        with large block transactions and the reads of all the buffers are
+        queued before waiting, so the readout runs at the link rate.  The data
+        lands in one numpy array per buffer, allocated once and reused by the
+        following captures.  Returns {buffer: uint8 array}.
+        """
+        if self._memory is None:
+            raise ValueError(f'{self.path}: no memory device to read the buffers from')
+
+        buffers = list(range(self._numBuffers)) if buffers is None else list(buffers)
+        status  = self.readStatus() if status is None else status
+        mem     = self._memory
+
+        with mem._memLock:
+            mem._clearError()
+            pending = []
+            for i in buffers:
+                size = int(status['EndAddr'][i] - status['StartAddr'][i])
+                if (i not in self._buffers) or (len(self._buffers[i]) != size):
+                    self._buffers[i] = np.empty(size, dtype=np.uint8)
+                for addr, length in self.validRegions(status, i):
+                    if length > 0:
+                        # Whole words are read, a region ending mid-word is sliced back to length bytes
+                        pending.append((i, length, mem._rawTxnChunker(addr, None, txnType=rim.Read, numWords=(length+3)//4)))
+
+            mem._waitTransaction(0)
+            if mem._getError() != "":
+                raise pr.MemoryError(name=mem.name, address=mem.address, msg=mem._getError())
+
+        # Copy the regions of each buffer back to back, oldest first
+        fill = {i: 0 for i in buffers}
+        for i, length, data in pending:
+            self._buffers[i][fill[i]:fill[i]+length] = np.frombuffer(bytes(data), dtype=np.uint8)[:length]
+            fill[i] += length
+
+        return {i: self._buffers[i][:fill[i]] for i in buffers}
+
+    def capture(self, buffers=None, callback=None, prefix=None, timeout=None, pollPeriod=0.01, reinit=False):
+        """
+        Wait for the buffers to be done, read them all back and either pass
+        each one to callback(buffer, data) or append it to the file
+        '{prefix}{buffer}.bin'.  With reinit the buffers are re-armed after
+        the readout.  Returns {buffer: uint8 array}.
+        """
+        status = self.waitDone(buffers, timeout, pollPeriod)
+        data   = self.readBuffers(buffers, status)
+
+        for i, d in data.items():
+            if callback is not None:
+                callback(i, d)
+            if prefix is not None:
+                with open(f'{prefix}{i}.bin', 'ab') as f:
+                    d.tofile(f)
+
+        if reinit:
+            self.Initialize()
+
+        return data
+
+def pulseRingControl(rings, bit, buffers=None):
+    """
+    Pulse a control bit (INIT_BIT or SOFT_TRIGGER_BIT) of several buffers
+    on several AxiStreamDmaRingWrite devices.  The control words of each
+    device are read with one block read, then written with the bit set and
+    cleared again as two block writes.  The transactions of all the devices
+    are queued before waiting on any of them, so all the buffers are
+    triggered or armed as close together as the bus allows.
+    """
+    with ExitStack() as stack:
+        spans = []
+        for ring in rings:
+            sel   = list(range(ring._numBuffers)) if buffers is None else sorted(buffers)
+            first = sel[0]
+            stack.enter_context(ring._memLock)
+            ring._clearError()
+            spans.append((ring, sel, first, ring._rawTxnChunker(0x800 + 4*first, None, txnType=rim.Read, numWords=sel[-1]-first+1)))
+
+        for ring, *_ in spans:
+            ring._waitTransaction(0)
+            if ring._getError() != "":
+                raise pr.MemoryError(name=ring.name, address=ring.address|0x800, msg=ring._getError())
+
+        for ring, sel, first, data in spans:
+            words = np.frombuffer(bytes(data), dtype='<u4') & ~np.uint32((1 << INIT_BIT) | (1 << SOFT_TRIGGER_BIT))
+            pulse = words.copy()
+            pulse[np.array(sel) - first] |= np.uint32(1 << bit)
+            ring._rawTxnChunker(0x800 + 4*first, pulse.tolist(), txnType=rim.Write)
+            ring._rawTxnChunker(0x800 + 4*first, words.tolist(), txnType=rim.Write)
+
+        for ring, *_ in spans:
+            ring._waitTransaction(0)
+            if ring._getError() != "":
+                raise pr.MemoryError(name=ring.name, address=ring.address|0x800, msg=ring._getError())
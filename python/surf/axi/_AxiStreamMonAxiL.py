@@ -14,9 +14,30 @@
 #-----------------------------------------------------------------------------
 
 import pyrogue as pr
+import rogue.interfaces.memory as rim
+import numpy as np
+import time
+from contextlib import ExitStack
+
+# Lane register window: 16 words per lane (0x40 stride)
+LANE_WORDS = 16
+
+# Lane registers: name, word index, number of 32-bit words, signed
+LANE_FIELDS = [
+    ('FrameCnt',         1, 2, False),
+    ('FrameRate',        3, 1, True),
+    ('FrameRateMax',     4, 1, True),
+    ('FrameRateMin',     5, 1, True),
+    ('RawBandwidth',     6, 2, False),
+    ('RawBandwidthMax',  8, 2, False),
+    ('RawBandwidthMin', 10, 2, False),
+    ('FrameSize',       12, 1, True),
+    ('FrameSizeMax',    13, 1, True),
+    ('FrameSizeMin',    14, 1, True),
+]
 
 class AxiStreamMonChannel(pr.Device):
-    def __init__(self, **kwargs):
+    def __init__(self, pollInterval=1, **kwargs):
         super().__init__(**kwargs)
 
         def addPair(name, offset, bitSize, units, bitOffset, description, function, pollInterval=0):
@@ -46,7 +67,7 @@ class AxiStreamMonChannel(pr.Device):
             offset       = 0x04,
             bitSize      = 64,
             mode         = 'RO',
-            pollInterval = 1,
+            pollInterval = pollInterval,
         ))
 
         self.add(pr.RemoteVariable(
@@ -58,7 +79,7 @@ class AxiStreamMonChannel(pr.Device):
             mode         = "RO",
             base         = pr.Int,
             units        = 'Hz',
-            pollInterval = 1,
+            pollInterval = pollInterval,
         ))
 
         self.add(pr.RemoteVariable(
@@ -70,7 +91,7 @@ class AxiStreamMonChannel(pr.Device):
             mode         = "RO",
             base         = pr.Int,
             units        = 'Hz',
-            pollInterval = 1,
+            pollInterval = pollInterval,
         ))
 
         self.add(pr.RemoteVariable(
@@ -82,7 +103,7 @@ class AxiStreamMonChannel(pr.Device):
             mode         = "RO",
             base         = pr.Int,
             units        = 'Hz',
-            pollInterval = 1,
+            pollInterval = pollInterval,
         ))
 
         addPair(
@@ -93,7 +114,7 @@ class AxiStreamMonChannel(pr.Device):
             bitOffset    = 0,
             function     = self.convMbps,
             units        = 'Mbps',
-            pollInterval = 1,
+            pollInterval = pollInterval,
         )
 
         addPair(
@@ -104,7 +125,7 @@ class AxiStreamMonChannel(pr.Device):
             bitOffset    = 0,
             function     = self.convMbps,
             units        = 'Mbps',
-            pollInterval = 1,
+            pollInterval = pollInterval,
         )
 
         addPair(
@@ -115,7 +136,7 @@ class AxiStreamMonChannel(pr.Device):
             bitOffset    = 0,
             function     = self.convMbps,
             units        = 'Mbps',
-            pollInterval = 1,
+            pollInterval = pollInterval,
         )
 
         self.add(pr.RemoteVariable(
@@ -127,7 +148,7 @@ class AxiStreamMonChannel(pr.Device):
             mode         = 'RO',
             base         = pr.Int,
             units        = 'Byte',
-            pollInterval = 1,
+            pollInterval = pollInterval,
         ))
 
         self.add(pr.RemoteVariable(
@@ -139,7 +160,7 @@ class AxiStreamMonChannel(pr.Device):
             mode         = 'RO',
             base         = pr.Int,
             units        = 'Byte',
-            pollInterval = 1,
+            pollInterval = pollInterval,
         ))
 
         self.add(pr.RemoteVariable(
@@ -151,7 +172,7 @@ class AxiStreamMonChannel(pr.Device):
             mode         = 'RO',
             base         = pr.Int,
             units        = 'Byte',
-            pollInterval = 1,
+            pollInterval = pollInterval,
         ))
 
     @staticmethod
@@ -159,9 +180,12 @@ class AxiStreamMonChannel(pr.Device):
         return var.dependencies[0].get(read=read) * 8e-6
 
 class AxiStreamMonAxiL(pr.Device):
-    def __init__(self, numberLanes=1, hideConfig=True, chName=None, **kwargs):
+    def __init__(self, numberLanes=1, hideConfig=True, chName=None, batchPoll=False, pollInterval=1, **kwargs):
         super().__init__(**kwargs)
 
+        self._numberLanes = numberLanes
+        self._last        = None
+
         self.add(pr.RemoteCommand(
             name         = 'CntRst',
             description  = "Counter Reset",
@@ -280,6 +304,20 @@ class AxiStreamMonAxiL(pr.Device):
                 name        = self.chName[i],
                 offset      = (i*0x40),
                 expand      = True,
+                pollInterval = 0 if batchPoll else pollInterval,
+            ))
+
+        # With batchPoll the lanes are only refreshed by one block read per poll
+        if batchPoll:
+            self.add(pr.LocalVariable(
+                name         = 'LanesPollTime',
+                description  = 'Time of the last lanes snapshot, polling it reads all the lanes with one block read',
+                mode         = 'RO',
+                value        = 0.0,
+                units        = 's',
+                pollInterval = pollInterval,
+                localGet     = lambda: readStreamMonitors([self])[0]['time'],
+                hidden       = True,
             ))
 
     def hardReset(self):
@@ -291,6 +329,71 @@ class AxiStreamMonAxiL(pr.Device):
     def countReset(self):
         self.CntRst()
 
+    def readLanes(self, update=True):
+        """
+        Read the counters of all the lanes with one block read, see readStreamMonitors()
+        """
+        return readStreamMonitors([self], update=update)[0]
+
+def readStreamMonitors(monitors, update=True):
+    """
+    Read all the lanes of several AxiStreamMonAxiL devices.
+
+    The lane registers of a device are contiguous (0x40 per lane), so each
+    device costs one block read, and the reads of all the devices are
+    queued before waiting on any of them.  The words are decoded with numpy
+    into per-lane arrays (one entry per lane), the Bandwidth arrays in Mbps.
+    HostFrameRate is derived from the FrameCnt delta since the previous
+    snapshot of the same device and the host time stamps (nan on the first
+    one).  When update is set the channel variable shadows are refreshed
+    from the same read.
+    """
+    with ExitStack() as stack:
+        data = []
+        for mon in monitors:
+            stack.enter_context(mon._memLock)
+            mon._clearError()
+            data.append(mon._rawTxnChunker(0x0, None, txnType=rim.Read, numWords=mon._numberLanes*LANE_WORDS))
+
+        for mon in monitors:
+            mon._waitTransaction(0)
+            if mon._getError() != "":
+                raise pr.MemoryError(name=mon.name, address=mon.address, msg=mon._getError())
+
+    now    = time.monotonic()
+    result = []
+    for mon, d in zip(monitors, data):
+        words = np.frombuffer(bytes(d), dtype='<u4').reshape(mon._numberLanes, LANE_WORDS).astype(np.uint64)
+
+        lanes = {}
+        for name, word, size, signed in LANE_FIELDS:
+            value = words[:, word] | ((words[:, word+1] << np.uint64(32)) if size == 2 else np.uint64(0))
+            lanes[name] = value.astype(np.uint32).view(np.int32) if signed else value
+
+        for name in ('Bandwidth', 'BandwidthMax', 'BandwidthMin'):
+            lanes[name] = lanes['Raw'+name] * 8e-6
+
+        # Host side frame rate from successive FrameCnt snapshots
+        if mon._last is None:
+            lanes['HostFrameRate'] = np.full(mon._numberLanes, np.nan)
+        else:
+            lastTime, lastCnt = mon._last
+            delta = (lanes['FrameCnt'] - lastCnt).astype(np.float64)
+            lanes['HostFrameRate'] = np.where(lanes['FrameCnt'] >= lastCnt, delta / (now - lastTime), np.nan) # nan after a CntRst
+        mon._last = (now, lanes['FrameCnt'])
+
+        if update:
+            for i, ch in enumerate(mon.chName):
+                lane = mon.nodes[ch]
+                for name, *_ in LANE_FIELDS:
+                    lane.variables[name].set(int(lanes[name][i]), write=False)
+                    lane.variables[name]._queueUpdate()
+
+        lanes['time'] = time.time()
+        result.append(lanes)
+
+    return result
+
 class AxiStreamMonitoring(AxiStreamMonAxiL):
     def __init__(self, numberLanes=1, **kwargs):
 
@@ -15,13 +15,32 @@
 
 # Comment added by rherbst for demonstration purposes.
 import datetime
+import functools
 import parse
 import click
 import pyrogue as pr
+import rogue.interfaces.memory as rim
+from contextlib import ExitStack
 
 # Another comment added by rherbst for demonstration
 # Yet Another comment added by rherbst for demonstration
 
+BUILD_STAMP_FORMAT = "{ImageName}: {BuildEnv}, {BuildServer}, Built {BuildDate} by {Builder}"
+
+@functools.lru_cache(maxsize=256)
+def parseBuildStamp(buildStamp):
+    """
+    Parse a BuildStamp string into a {field: value} dict, empty if it does
+    not match.  Memoized on the raw stamp: the five build LinkVariables of
+    every AxiVersion share one parse per distinct firmware image.
+    """
+    if buildStamp is None:
+        return {}
+
+    # Strip away the whitespace padding
+    p = parse.parse(BUILD_STAMP_FORMAT, buildStamp.strip())
+    return {} if p is None else dict(p.named)
+
 class AxiVersion(pr.Device):
 
     # Last comment added by rherbst for demonstration.
@@ -216,51 +235,37 @@ class AxiVersion(pr.Device):
             hidden       = True,
         ))
 
-        def parseBuildStamp(var,read):
-            buildStamp = var.dependencies[0].get(read=read)
-            if buildStamp is None:
-                return ''
-            else:
-                # Strip away the whitespace padding
-                buildStamp = buildStamp.strip()
-
-                # Parse the string
-                p = parse.parse("{ImageName}: {BuildEnv}, {BuildServer}, Built {BuildDate} by {Builder}", buildStamp)
-
-                # Check if failed
-                if p is None:
-                    return ''
-                else:
-                    return p[var.name]
+        def getBuildStamp(var,read):
+            return parseBuildStamp(var.dependencies[0].get(read=read)).get(var.name, '')
 
         self.add(pr.LinkVariable(
             name = 'ImageName',
             mode = 'RO',
-            linkedGet = parseBuildStamp,
+            linkedGet = getBuildStamp,
             variable = self.BuildStamp))
 
         self.add(pr.LinkVariable(
             name = 'BuildEnv',
             mode = 'RO',
-            linkedGet = parseBuildStamp,
+            linkedGet = getBuildStamp,
             variable = self.BuildStamp))
 
         self.add(pr.LinkVariable(
             name = 'BuildServer',
             mode = 'RO',
-            linkedGet = parseBuildStamp,
+            linkedGet = getBuildStamp,
             variable = self.BuildStamp))
 
         self.add(pr.LinkVariable(
             name = 'BuildDate',
             mode = 'RO',
-            linkedGet = parseBuildStamp,
+            linkedGet = getBuildStamp,
             variable = self.BuildStamp))
 
         self.add(pr.LinkVariable(
             name = 'Builder',
             mode = 'RO',
-            linkedGet = parseBuildStamp,
+            linkedGet = getBuildStamp,
             variable = self.BuildStamp))
 
 
@@ -291,3 +296,59 @@ class AxiVersion(pr.Device):
             print("Builder      = {}".format(self.Builder.value()))
         except Exception:
             print("Failed to get %s status" % self)
+
+# Register groups read by axiVersionInventory: (offset, number of 32-bit words)
+_INVENTORY_BLOCKS = {
+    'Header'     : (0x000, 3),  # FpgaVersion, ScratchPad, UpTimeCnt
+    'GitHash'    : (0x600, 5),
+    'DeviceDna'  : (0x700, 4),
+    'BuildStamp' : (0x800, 64),
+}
+
+def axiVersionInventory(nodes):
+    """
+    Read the identity of many boards at once.
+
+    nodes is a list of AxiVersion devices and/or Roots (all the AxiVersion
+    devices of a Root are used).  The FpgaVersion/UpTimeCnt, GitHash,
+    DeviceDna and BuildStamp register groups of every device are read with
+    one block read each, and the reads of all the devices are queued before
+    waiting on any of them, so the whole fleet costs about one round trip.
+    The AxiVersion address map is not contiguous (unmapped addresses return
+    DECERR), hence one block per register group.
+
+    Returns a list with one dict per device.
+    """
+    devs = []
+    for node in nodes:
+        devs.extend([node] if isinstance(node, AxiVersion) else node.find(typ=AxiVersion))
+
+    with ExitStack() as stack:
+        data = []
+        for dev in devs:
+            stack.enter_context(dev._memLock)
+            dev._clearError()
+            data.append({k: dev._rawTxnChunker(offset, None, txnType=rim.Read, numWords=n) for k, (offset, n) in _INVENTORY_BLOCKS.items()})
+
+        errors = {}
+        for dev in devs:
+            dev._waitTransaction(0)
+            errors[dev.path] = dev._getError()
+
+    table = []
+    for dev, d in zip(devs, data):
+        row = {'Path' : dev.path}
+        if errors[dev.path] != "":
+            row['Error'] = errors[dev.path]
+        else:
+            header = [int.from_bytes(d['Header'][i:i+4], 'little') for i in range(0, 12, 4)]
+            stamp  = bytes(d['BuildStamp']).split(b'\0')[0].decode('ascii', errors='replace')
+            row['FpgaVersion'] = header[0]
+            row['UpTimeCnt']   = header[2]
+            row['GitHash']     = int.from_bytes(d['GitHash'], 'little')
+            row['DeviceDna']   = int.from_bytes(d['DeviceDna'], 'little')
+            row['BuildStamp']  = stamp.strip()
+            row.update(parseBuildStamp(stamp))
+        table.append(row)
+
+    return table
@@ -16,6 +16,102 @@
 import pyrogue as pr
 import rogue.interfaces.memory as rim
 import math
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+def countPatternErrors(words, pattern, mask=0x3FFF):
+    """
+    Count the debug samples that do not match an ADC test pattern.
+    words is an array of AdcChannel register values with shape (snapshots, channels),
+    each word holding the last two 16-bit samples of its channel.
+    pattern is the expected sample or a list of acceptable samples
+    (e.g. both words of an alternating test mode).
+    Returns the number of mismatched samples for each channel.
+    """
+    words   = np.asarray(words, dtype=np.uint32)
+    samples = np.stack([words & 0xFFFF, words >> 16]) & mask
+    good    = np.isin(samples, np.atleast_1d(np.asarray(pattern, dtype=np.uint32)) & mask)
+    return np.count_nonzero(~good, axis=(0, 1))
+
+def findDelayWindows(errors, taps):
+    """
+    Find the widest error-free window of each lane in a delay sweep.
+    errors has shape (len(taps), lanes) and taps are the swept delay values.
+    Returns (center, width) arrays, width being the window span in taps.
+    Lanes without any error-free tap get a center of -1 and a width of 0.
+    """
+    errors = np.asarray(errors)
+    taps   = np.asarray(taps)
+    center = np.full(errors.shape[1], -1, dtype=np.int64)
+    width  = np.zeros(errors.shape[1], dtype=np.int64)
+
+    for lane in range(errors.shape[1]):
+        # Pad with a failing tap so the last window is always closed
+        good  = np.concatenate(([False], errors[:, lane] == 0, [False]))
+        edges = np.flatnonzero(np.diff(good.astype(np.int8)))
+        for start, stop in zip(edges[0::2], edges[1::2]):
+            span = taps[stop-1] - taps[start] + 1
+            if span > width[lane]:
+                width[lane]  = span
+                center[lane] = (taps[start] + taps[stop-1]) // 2
+
+    return center, width
+
+def queueAdcDebugSnapshot(dev, channels):
+    """
+    Queue the FreezeDebug set write, the block read of the AdcChannel debug
+    registers and the FreezeDebug clear write back to back, so the debug
+    registers are only frozen for that single transaction.  The caller
+    holds dev._memLock and has cleared the device error.
+    Returns the read buffer, see checkAdcDebugSnapshot().
+    """
+    dev._rawTxnChunker(0xA0, 1, txnType=rim.Write)
+    ldata = dev._rawTxnChunker(0x80, None, txnType=rim.Read, numWords=channels)
+    dev._rawTxnChunker(0xA0, 0, txnType=rim.Write)
+    return ldata
+
+def checkAdcDebugSnapshot(dev, ldata, channels, update=True):
+    """
+    Wait for a snapshot queued by queueAdcDebugSnapshot() and decode it.
+    When update is set the AdcChannel variables are refreshed from the
+    snapshot.  Returns the raw register words and a (channels, 2) array of
+    the decoded 16-bit samples, newest sample first.
+    """
+    with dev._memLock:
+        dev._waitTransaction(0)
+
+        if dev._getError() != "":
+            raise pr.MemoryError(name=dev.name, address=dev.address|0x80, msg=dev._getError())
+
+    words   = np.frombuffer(bytes(ldata), dtype='<u4')
+    samples = np.stack([words & 0xFFFF, words >> 16], axis=-1)
+
+    if update:
+        for i in range(channels):
+            dev.AdcChannel[i].set(int(words[i]), write=False)
+            dev.AdcChannel[i]._queueUpdate()
+
+    return words, samples
+
+def readAdcDebugSnapshot(dev, channels, update=True):
+    """
+    Read the AdcChannel debug registers of a readout group in one frozen
+    block transaction, see queueAdcDebugSnapshot() and checkAdcDebugSnapshot().
+    """
+    with dev._memLock:
+        dev._clearError()
+        ldata = queueAdcDebugSnapshot(dev, channels)
+        return checkAdcDebugSnapshot(dev, ldata, channels, update)
+
+def calibrateReadoutGroups(groups, **kwargs):
+    """
+    Run autoCalibrate() on several readout groups concurrently.
+    Each group sweeps its own lanes in parallel, so a whole detector head
+    takes about as long as a single group.  kwargs are passed to autoCalibrate().
+    Returns the list of per-group results in the order of groups.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, len(groups))) as pool:
+        return list(pool.map(lambda g: g.autoCalibrate(**kwargs), groups))
 
 class Ad9249ConfigGroup(pr.Device):
     def __init__(self,
@@ -292,6 +388,10 @@ class Ad9249ReadoutGroup(pr.Device):
         else:
             delayBits = 6
 
+        self._channels  = channels
+        self._debugSnapshot = None
+        self._delayBits = delayBits
+
         for i in range(channels):
             self.add(pr.RemoteVariable(
                 name         = f'ChannelDelay[{i}]',
@@ -365,6 +465,7 @@ class Ad9249ReadoutGroup(pr.Device):
                 base        = pr.UInt,
                 disp        = '{:_x}',
                 mode        = 'RO',
+                bulkOpEn    = False,
             ))
 
         self.add(pr.RemoteCommand(
@@ -386,6 +487,12 @@ class Ad9249ReadoutGroup(pr.Device):
             base=pr.UInt,
             function=pr.RemoteCommand.touch))
 
+        @self.command(value=0, description='Sweep the IDELAY of all channels against the static ADC test pattern given as arg and center each channel in its widest error-free window')
+        def AutoCalibrate(arg):
+            result = self.autoCalibrate(pattern=arg)
+            for i in range(self._channels):
+                print(f'{self.path}.ChannelDelay[{i}]: delay = {result["delay"][i]}, eye width = {result["width"][i]} taps')
+
     @staticmethod
     def setDelay(var, value, write):
         iValue = value + 512
@@ -396,6 +503,59 @@ class Ad9249ReadoutGroup(pr.Device):
     def getDelay(var, read):
         return var.dependencies[0].get(read=read)
 
+    def _setChannelDelays(self, delays):
+        # The MSB of each delay register strobes the load of the IDELAY primitive
+        load = 1 << (self._delayBits-1)
+        self._rawWrite(offset=0x00, data=[int(d) | load for d in delays])
+
+    def _readDebugSnapshots(self, count):
+        return np.array([self.readDebugSnapshot(update=False)[0] for _ in range(count)])
+
+    def autoCalibrate(self, pattern, mask=0x3FFF, taps=None, samples=4):
+        """
+        Sweep the IDELAY taps of all channels in parallel and center each
+        channel in its widest error-free window.
+
+        The ADC must already be driving a static test pattern (see
+        Ad9249ConfigGroup.OutputTestMode) and pattern is the expected sample
+        value, or a list of acceptable values.  Every step loads the delays
+        of all channels in a single block write and scores the tap from
+        `samples` frozen AdcChannel snapshots.  Channels without an
+        error-free window keep their current delay.
+
+        Returns a dict with the swept taps, the (taps, channels) error
+        counts and the per-channel delay and eye width.
+        """
+        numTaps = 1 << (self._delayBits-1)
+        taps    = np.arange(numTaps) if taps is None else np.asarray(taps)
+        current = np.atleast_1d(self._rawRead(offset=0x00, numWords=self._channels)) & (numTaps-1)
+        errors  = np.zeros((len(taps), self._channels), dtype=np.int64)
+
+        for i, tap in enumerate(taps):
+            self._setChannelDelays([tap]*self._channels)
+            errors[i] = countPatternErrors(self._readDebugSnapshots(samples), pattern, mask)
+
+        center, width = findDelayWindows(errors, taps)
+        delay = np.where(width > 0, center, current)
+        self._setChannelDelays(delay)
+
+        # Keep the shadow values in sync with the loaded delays
+        for i in range(self._channels):
+            self.ChannelDelay[i].set(int(delay[i]), write=False)
+
+        return {
+            'taps'   : taps,
+            'errors' : errors,
+            'delay'  : delay,
+            'width'  : width,
+        }
+
+    def readDebugSnapshot(self, update=True):
+        """
+        Read all AdcChannel debug registers in one frozen block transaction
+        """
+        return readAdcDebugSnapshot(self, self._channels, update)
+
     def readBlocks(self, *, recurse=True, variable=None, checkEach=False, index=-1, **kwargs):
         """
         Perform background reads
@@ -411,16 +571,29 @@ class Ad9249ReadoutGroup(pr.Device):
                 self.FreezeDebug(0)
 
         else:
-            self.FreezeDebug(1)
+            # The AdcChannel registers are excluded from the bulk blocks and read in a single
+            # frozen snapshot, only queued here and decoded by checkBlocks()
+            with self._memLock:
+                self._clearError()
+                self._debugSnapshot = queueAdcDebugSnapshot(self, self._channels)
             for block in self._blocks:
                 if block.bulkOpEn:
                     pr.startTransaction(block, type=rim.Read, checkEach=checkEach, **kwargs)
-            self.FreezeDebug(0)
 
             if recurse:
                 for key,value in self.devices.items():
                     value.readBlocks(recurse=True, checkEach=checkEach, **kwargs)
 
+    def checkBlocks(self, *, recurse=True, variable=None, **kwargs):
+        """
+        Wait for the background reads, including the queued AdcChannel snapshot
+        """
+        if (variable is None) and (self._debugSnapshot is not None):
+            ldata, self._debugSnapshot = self._debugSnapshot, None
+            checkAdcDebugSnapshot(self, ldata, self._channels)
+
+        super().checkBlocks(recurse=recurse, variable=variable, **kwargs)
+
 
 class Ad9249ReadoutGroup2(pr.Device):
     def __init__(self,
@@ -440,6 +613,8 @@ class Ad9249ReadoutGroup2(pr.Device):
         else:
             delayBits = 6
 
+        self._channels = channels
+        self._debugSnapshot = None
 
         self.add(pr.RemoteVariable(
             name         = 'Delay',
@@ -522,6 +697,7 @@ class Ad9249ReadoutGroup2(pr.Device):
                 base        = pr.UInt,
                 disp        = '{:09_x}',
                 mode        = 'RO',
+                bulkOpEn    = False,
             ))
 
         for i in range(channels):
@@ -552,6 +728,12 @@ class Ad9249ReadoutGroup2(pr.Device):
             base=pr.UInt,
             function=pr.RemoteCommand.touch))
 
+    def readDebugSnapshot(self, update=True):
+        """
+        Read all AdcChannel debug registers in one frozen block transaction
+        """
+        return readAdcDebugSnapshot(self, self._channels, update)
+
     def readBlocks(self, *, recurse=True, variable=None, checkEach=False, index=-1, **kwargs):
         """
         Perform background reads
@@ -562,16 +744,29 @@ class Ad9249ReadoutGroup2(pr.Device):
             pr.startTransaction(variable._block, type=rim.Read, checkEach=checkEach, variable=variable, index=index, **kwargs)
 
         else:
-            self.FreezeDebug(1)
+            # The AdcChannel registers are excluded from the bulk blocks and read in a single
+            # frozen snapshot, only queued here and decoded by checkBlocks()
+            with self._memLock:
+                self._clearError()
+                self._debugSnapshot = queueAdcDebugSnapshot(self, self._channels)
             for block in self._blocks:
                 if block.bulkOpEn:
                     pr.startTransaction(block, type=rim.Read, checkEach=checkEach, **kwargs)
-            self.FreezeDebug(0)
 
             if recurse:
                 for key,value in self.devices.items():
                     value.readBlocks(recurse=True, checkEach=checkEach, **kwargs)
 
+    def checkBlocks(self, *, recurse=True, variable=None, **kwargs):
+        """
+        Wait for the background reads, including the queued AdcChannel snapshot
+        """
+        if (variable is None) and (self._debugSnapshot is not None):
+            ldata, self._debugSnapshot = self._debugSnapshot, None
+            checkAdcDebugSnapshot(self, ldata, self._channels)
+
+        super().checkBlocks(recurse=recurse, variable=variable, **kwargs)
+
 
 class AdcTester(pr.Device):
     def __init__(self, **kwargs):
@@ -15,8 +15,15 @@
 
 import pyrogue as pr
 import rogue.interfaces.memory as rim
+import numpy as np
+from surf.devices.analog_devices._Ad9249 import countPatternErrors, findDelayWindows, readAdcDebugSnapshot, queueAdcDebugSnapshot, checkAdcDebugSnapshot
 # import math
 
+# Debug samples: 14-bit value left justified in [15:2] with the 2 LSBs clear,
+# lane 0 delivers bits [7:0] and lane 1 bits [15:8] of each sample
+SAMPLE_MASK = 0xFFFC
+LANE_MASK   = (0x00FF, 0xFF00)
+
 class Ad9681Config(pr.Device):
     def __init__(self,
                  description = 'Configure one side of an AD9249 ADC',
@@ -349,6 +356,9 @@ class Ad9681ReadoutManual(pr.Device):
         else:
             delayBits = 6
 
+        self._channels  = channels
+        self._debugSnapshot = None
+        self._delayBits = delayBits
 
         for ch in range(channels):
             for i in range(2):
@@ -451,6 +461,7 @@ class Ad9681ReadoutManual(pr.Device):
                 base        = pr.UInt,
                 disp        = '{:09_x}',
                 mode        = 'RO',
+                bulkOpEn    = False,
             ))
 
         for i in range(channels):
@@ -490,6 +501,73 @@ class Ad9681ReadoutManual(pr.Device):
             base=pr.UInt,
             function=pr.RemoteCommand.createToggle([0, 3, 0])))
 
+        @self.command(value=0, description='Sweep the IDELAY of all channel lanes against the static ADC test pattern given as arg and center each lane in its widest error-free window')
+        def AutoCalibrate(arg):
+            result = self.autoCalibrate(pattern=arg)
+            for ch in range(self._channels):
+                for i in range(2):
+                    print(f'{self.path}.ChannelDelay[{ch}][{i}]: delay = {result["delay"][ch][i]}, eye width = {result["width"][ch][i]} taps')
+
+    def _setChannelDelays(self, delays):
+        # Registers are ordered ChannelDelay[ch][i] at ch*8 + i*4, any write loads the IDELAY
+        self._rawWrite(offset=0x00, data=[int(d) for d in np.asarray(delays).flatten()])
+
+    def _readDebugSnapshots(self, count):
+        return np.array([self.readDebugSnapshot(update=False)[0] for _ in range(count)])
+
+    def autoCalibrate(self, pattern, mask=SAMPLE_MASK, taps=None, samples=4):
+        """
+        Sweep the IDELAY taps of all channels in parallel and center each
+        lane in its widest error-free window.
+
+        The ADC must already be driving a static test pattern (see
+        Ad9681Config.OutputTestMode) and pattern is the expected sample
+        value, or a list of acceptable values.  Lane 0 and lane 1 of every
+        channel are swept in two passes, holding the other lane at its
+        current delay.  Every step loads all channel delays in a single
+        block write and scores the tap from `samples` frozen AdcChannel
+        snapshots, comparing only the sample bits of the swept lane (mask
+        restricted to LANE_MASK).  Lanes without an error-free window keep
+        their current delay.  The frame delays are not changed.
+
+        Returns a dict with the swept taps, the (lane, taps, channels) error
+        counts and the (channels, lane) delay and eye width.
+        """
+        numTaps = 1 << (self._delayBits-1)
+        taps    = np.arange(numTaps) if taps is None else np.asarray(taps)
+        delay   = (np.array(self._rawRead(offset=0x00, numWords=16)) & (numTaps-1)).reshape(8, 2)
+        width   = np.zeros((8, 2), dtype=np.int64)
+        errors  = np.zeros((2, len(taps), self._channels), dtype=np.int64)
+
+        for lane in range(2):
+            sweep = delay.copy()
+            for i, tap in enumerate(taps):
+                sweep[:self._channels, lane] = tap
+                self._setChannelDelays(sweep)
+                errors[lane][i] = countPatternErrors(self._readDebugSnapshots(samples), pattern, mask & LANE_MASK[lane])
+
+            center, width[:self._channels, lane] = findDelayWindows(errors[lane], taps)
+            delay[:self._channels, lane] = np.where(center >= 0, center, delay[:self._channels, lane])
+
+        self._setChannelDelays(delay)
+
+        # Keep the shadow values in sync with the loaded delays
+        for ch in range(self._channels):
+            for i in range(2):
+                self.ChannelDelay[ch][i].set(int(delay[ch][i]), write=False)
+
+        return {
+            'taps'   : taps,
+            'errors' : errors,
+            'delay'  : delay[:self._channels],
+            'width'  : width[:self._channels],
+        }
+
+    def readDebugSnapshot(self, update=True):
+        """
+        Read all AdcChannel debug registers in one frozen block transaction
+        """
+        return readAdcDebugSnapshot(self, self._channels, update)
 
     def readBlocks(self, *, recurse=True, variable=None, checkEach=False, index=-1, **kwargs):
         """
@@ -506,16 +584,29 @@ class Ad9681ReadoutManual(pr.Device):
                 self.FreezeDebug(0)
 
         else:
-            self.FreezeDebug(1)
+            # The AdcChannel registers are excluded from the bulk blocks and read in a single
+            # frozen snapshot, only queued here and decoded by checkBlocks()
+            with self._memLock:
+                self._clearError()
+                self._debugSnapshot = queueAdcDebugSnapshot(self, self._channels)
             for block in self._blocks:
                 if block.bulkOpEn:
                     pr.startTransaction(block, type=rim.Read, checkEach=checkEach, **kwargs)
-            self.FreezeDebug(0)
 
             if recurse:
                 for key,value in self.devices.items():
                     value.readBlocks(recurse=True, checkEach=checkEach, **kwargs)
 
+    def checkBlocks(self, *, recurse=True, variable=None, **kwargs):
+        """
+        Wait for the background reads, including the queued AdcChannel snapshot
+        """
+        if (variable is None) and (self._debugSnapshot is not None):
+            ldata, self._debugSnapshot = self._debugSnapshot, None
+            checkAdcDebugSnapshot(self, ldata, self._channels)
+
+        super().checkBlocks(recurse=recurse, variable=variable, **kwargs)
+
 class Ad9681Readout(pr.Device):
     def __init__(self,
                  name        = 'Ad9249Readout',
@@ -534,6 +625,9 @@ class Ad9681Readout(pr.Device):
         else:
             delayBits = 6
 
+        self._channels = channels
+        self._debugSnapshot = None
+
         self.add(pr.RemoteVariable(
             name         = 'EnUsrDelay',
             description  = 'Enable manual delay value',
@@ -634,6 +728,7 @@ class Ad9681Readout(pr.Device):
                 base        = pr.UInt,
                 disp        = '{:09_x}',
                 mode        = 'RO',
+                bulkOpEn    = False,
             ))
 
         for i in range(channels):
@@ -674,6 +769,12 @@ class Ad9681Readout(pr.Device):
             function=pr.RemoteCommand.createToggle([0, 3, 0])))
 
 
+    def readDebugSnapshot(self, update=True):
+        """
+        Read all AdcChannel debug registers in one frozen block transaction
+        """
+        return readAdcDebugSnapshot(self, self._channels, update)
+
     def readBlocks(self, *, recurse=True, variable=None, checkEach=False, index=-1, **kwargs):
         """
         Perform background reads
@@ -684,12 +785,25 @@ class Ad9681Readout(pr.Device):
             pr.startTransaction(variable._block, type=rim.Read, checkEach=checkEach, variable=variable, index=index, **kwargs)
 
         else:
-            self.FreezeDebug(1)
+            # The AdcChannel registers are excluded from the bulk blocks and read in a single
+            # frozen snapshot, only queued here and decoded by checkBlocks()
+            with self._memLock:
+                self._clearError()
+                self._debugSnapshot = queueAdcDebugSnapshot(self, self._channels)
             for block in self._blocks:
                 if block.bulkOpEn:
                     pr.startTransaction(block, type=rim.Read, checkEach=checkEach, **kwargs)
-            self.FreezeDebug(0)
 
             if recurse:
                 for key,value in self.devices.items():
                     value.readBlocks(recurse=True, checkEach=checkEach, **kwargs)
+
+    def checkBlocks(self, *, recurse=True, variable=None, **kwargs):
+        """
+        Wait for the background reads, including the queued AdcChannel snapshot
+        """
+        if (variable is None) and (self._debugSnapshot is not None):
+            ldata, self._debugSnapshot = self._debugSnapshot, None
+            checkAdcDebugSnapshot(self, ldata, self._channels)
+
+        super().checkBlocks(recurse=recurse, variable=variable, **kwargs)
@@ -13,6 +13,19 @@ import pyrogue as pr
 import surf.protocols.i2c
 
 class EM22xx(surf.protocols.i2c.PMBus):
+
+    # Telemetry record, matching the LinkVariables
+    _telemetry = (
+        ('VIN',            'READ_VIN',           'Linear11'),
+        ('VOUT',           'READ_VOUT',          'Linear16'),
+        ('IOUT',           'READ_IOUT',          'Linear11'),
+        ('TEMPERATURE[1]', 'READ_TEMPERATURE_1', 'Linear11'),
+        ('TEMPERATURE[2]', 'READ_TEMPERATURE_2', 'Linear11'),
+        ('DUTY_CYCLE',     'READ_DUTY_CYCLE',    'Linear11'),
+        ('FREQUENCY',      'READ_FREQUENCY',     'Linear11'),
+        ('POUT',           'READ_POUT',          'Linear11'),
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
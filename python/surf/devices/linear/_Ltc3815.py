@@ -13,6 +13,16 @@ import pyrogue as pr
 import surf.protocols.i2c
 
 class Ltc3815(surf.protocols.i2c.PMBus):
+
+    # Telemetry record, matching the LinkVariables conversion factors
+    _telemetry = (
+        ('Vin',          'READ_VIN',           4.0E-3),
+        ('Iin',          'READ_IIN',           10.0E-3),
+        ('Vout',         'READ_VOUT',          0.5E-3),
+        ('Iout',         'READ_IOUT',          10.0E-3),
+        ('DieTempature', 'READ_TEMPERATURE_1', 1.0),
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
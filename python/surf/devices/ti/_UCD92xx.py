@@ -13,6 +13,21 @@ import pyrogue as pr
 import surf.protocols.i2c
 
 class UCD92xx(surf.protocols.i2c.PMBus):
+
+    # Telemetry record, matching the LinkVariables (fixed 2^-12 exponent)
+    _telemetry = (
+        ('VIN',            'READ_VIN',           2.0**-12),
+        ('IIN',            'READ_IIN',           2.0**-12),
+        ('VOUT',           'READ_VOUT',          2.0**-12),
+        ('IOUT',           'READ_IOUT',          2.0**-12),
+        ('TEMPERATURE[1]', 'READ_TEMPERATURE_1', 2.0**-12),
+        ('TEMPERATURE[2]', 'READ_TEMPERATURE_2', 2.0**-12),
+        ('FAN_SPEED[1]',   'READ_FAN_SPEED_1',   2.0**-12),
+        ('DUTY_CYCLE',     'READ_DUTY_CYCLE',    2.0**-12),
+        ('POUT',           'READ_POUT',          2.0**-12),
+        ('PIN',            'READ_PIN',           2.0**-12),
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -39,8 +54,8 @@ class UCD92xx(surf.protocols.i2c.PMBus):
             mode         = 'RO',
             units        = 'V',
             disp         = '{:1.3f}',
-            linkedGet    = surf.protocols.i2c.getPMbusLinearDataFormat,
-            dependencies = [self.READ_VIN],
+            linkedGet    = self.getPMbusLinearDataFormat11Bit,
+            dependencies = [self.READ_VOUT],
         ))
 
         self.add(pr.LinkVariable(
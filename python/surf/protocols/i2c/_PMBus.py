@@ -8,12 +8,70 @@
 # contained in the LICENSE.txt file.
 #-----------------------------------------------------------------------------
 
+import time
+import threading
+import contextlib
 import pyrogue as pr
+import numpy as np
+import rogue.interfaces.memory as rim
+from contextlib import ExitStack
+
+##############################################################################
+# Lookup tables of the PMBus data formats (PMBus spec Part II, 7.1 and 8.3.1)
+##############################################################################
+
+def _twos(value, bits):
+    return np.where(value & (1 << (bits-1)), value - (1 << bits), value)
+
+# Linear11 value of every 16-bit code: 11-bit mantissa, 5-bit exponent (two's complement)
+_codes   = np.arange(1 << 16, dtype=np.int64)
+LINEAR11 = _twos(_codes & 0x7FF, 11) * 2.0**_twos(_codes >> 11, 5)
+
+# Linear16 scale of every VOUT_MODE exponent: value = unsigned 16-bit mantissa * scale
+LINEAR16_SCALE = 2.0**_twos(np.arange(32, dtype=np.int64), 5)
+
+def linear11(raw):
+    return LINEAR11[np.asarray(raw, dtype=np.int64) & 0xFFFF]
+
+def linear16(raw, voutMode):
+    return (np.asarray(raw, dtype=np.int64) & 0xFFFF) * LINEAR16_SCALE[np.asarray(voutMode, dtype=np.int64) & 0x1F]
 
 class PMBus(pr.Device):
-    def __init__(self, simpleDisplay = True, dynamicAddr=False, **kwargs):
+
+    # Telemetry record of readTelemetry(): (name, READ_* register, format) rows,
+    # format is 'Linear11', 'Linear16' (exponent from VOUT_MODE) or a LSB weight.
+    # Devices override it to match their own LinkVariables.
+    _telemetry = (
+        ('VIN',           'READ_VIN',           'Linear11'),
+        ('IIN',           'READ_IIN',           'Linear11'),
+        ('VCAP',          'READ_VCAP',          'Linear11'),
+        ('VOUT',          'READ_VOUT',          'Linear16'),
+        ('IOUT',          'READ_IOUT',          'Linear11'),
+        ('TEMPERATURE_1', 'READ_TEMPERATURE_1', 'Linear11'),
+        ('TEMPERATURE_2', 'READ_TEMPERATURE_2', 'Linear11'),
+        ('TEMPERATURE_3', 'READ_TEMPERATURE_3', 'Linear11'),
+        ('FAN_SPEED_1',   'READ_FAN_SPEED_1',   'Linear11'),
+        ('FAN_SPEED_2',   'READ_FAN_SPEED_2',   'Linear11'),
+        ('FAN_SPEED_3',   'READ_FAN_SPEED_3',   'Linear11'),
+        ('FAN_SPEED_4',   'READ_FAN_SPEED_4',   'Linear11'),
+        ('DUTY_CYCLE',    'READ_DUTY_CYCLE',    'Linear11'),
+        ('FREQUENCY',     'READ_FREQUENCY',     'Linear11'),
+        ('POUT',          'READ_POUT',          'Linear11'),
+        ('PIN',           'READ_PIN',           'Linear11'),
+    )
+
+    def __init__(self, simpleDisplay = True, dynamicAddr=False, batchPoll=False, pollInterval=1, pages=None, **kwargs):
         super().__init__(**kwargs)
 
+        # PAGE values of the rails of a multi-rail controller (None: single page device),
+        # the selected page is cached and kept with the reads under the page lock
+        self._pages    = [None] if pages is None else list(pages)
+        self._page     = None
+        self._pageLock = threading.RLock()
+
+        # With batchPoll the READ_* registers are refreshed by the TelemetryTime snapshot
+        readPoll = 0 if batchPoll else pollInterval
+
         self.add(pr.RemoteVariable(
             name         = 'i2cAddr',
             offset       =  0x400,
@@ -794,7 +852,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -803,7 +861,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -812,7 +870,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -821,7 +879,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -830,7 +888,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -839,7 +897,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -848,7 +906,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -857,7 +915,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -866,7 +924,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -875,7 +933,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -884,7 +942,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -893,7 +951,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -902,7 +960,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -911,7 +969,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -920,7 +978,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -929,7 +987,7 @@ class PMBus(pr.Device):
             bitSize      = 16,
             mode         = 'RO',
             hidden       = simpleDisplay,
-            pollInterval = 1,
+            pollInterval = readPoll,
         ))
 
         self.add(pr.RemoteVariable(
@@ -987,3 +1045,237 @@ class PMBus(pr.Device):
             mode         = 'RO',
             hidden       = simpleDisplay,
         ))
+
+        if batchPoll:
+            def _snapshot():
+                self.readTelemetry()
+                return time.time()
+
+            self.add(pr.LocalVariable(
+                name         = 'TelemetryTime',
+                description  = 'Time of the last telemetry snapshot, polling it reads all the READ_* registers as one batch',
+                mode         = 'RO',
+                value        = 0.0,
+                units        = 's',
+                pollInterval = pollInterval,
+                localGet     = _snapshot,
+                hidden       = True,
+            ))
+
+    def readTelemetry(self, pages=None, update=True):
+        """
+        Telemetry record of the device, see readPMBusTelemetry()
+        """
+        return readPMBusTelemetry([self], pages, update)[0]
+
+    def _selectedPage(self):
+        # The cache is only trusted while the PAGE shadow agrees with it,
+        # a direct PAGE.set() by another user invalidates it
+        return self._page if (self._page is not None) and (self._page == self.PAGE.value()) else None
+
+    def selectPage(self, page):
+        """
+        Select page, the PAGE write is skipped when it is already selected
+        """
+        with self._pageLock:
+            if page != self._selectedPage():
+                self._page = None
+                self.PAGE.set(page)
+                self._page = page
+
+    @contextlib.contextmanager
+    def onPage(self, page):
+        """
+        Context holding the page lock with page selected, so the PAGE write
+        and the accesses done in the context are atomic with respect to the
+        other users of the device:
+
+            with dev.onPage(1):
+                vout = dev.READ_VOUT.get()
+        """
+        with self._pageLock:
+            self.selectPage(page)
+            yield self
+
+_layouts = {}
+
+class PMBusLayout():
+    """
+    Telemetry registers of a PMBus device class, built once from its
+    _telemetry table.  Consecutive registers are grouped into block reads and
+    every format gets its column indexes so a record decodes with a few
+    numpy operations.  It is shared by all the devices of the class, so it
+    only holds register names, addresses and formats, never variables.
+    """
+    def __init__(self, dev):
+        self.names     = [name for name, reg, fmt in dev._telemetry]
+        self.registers = [reg for name, reg, fmt in dev._telemetry]
+        self.addr      = np.array([dev.variables[reg].offset // 4 for reg in self.registers], dtype=np.int64)
+
+        fmts = [fmt for name, reg, fmt in dev._telemetry]
+        self.l11   = np.array([i for i, f in enumerate(fmts) if f == 'Linear11'], dtype=np.int64)
+        self.l16   = np.array([i for i, f in enumerate(fmts) if f == 'Linear16'], dtype=np.int64)
+        self.scale = np.array([1.0 if isinstance(f, str) else f for f in fmts], dtype=np.float64)
+        self.dtype = np.dtype([('PAGE', np.int16)] + [(name, np.float64) for name in self.names])
+
+        # Block reads of the runs of consecutive registers: (first register, count)
+        self.runs = []
+        for a in sorted(set(self.addr.tolist())):
+            if len(self.runs) > 0 and a == self.runs[-1][0] + self.runs[-1][1]:
+                self.runs[-1][1] += 1
+            else:
+                self.runs.append([a, 1])
+        self.column = np.searchsorted(sorted(set(self.addr.tolist())), self.addr)
+
+    @classmethod
+    def of(cls, dev):
+        if type(dev) not in _layouts:
+            _layouts[type(dev)] = cls(dev)
+        return _layouts[type(dev)]
+
+    def queue(self, dev):
+        """
+        Queue the block reads of the telemetry registers (and VOUT_MODE when a
+        Linear16 value needs it), returns the read buffers
+        """
+        data = [dev._rawTxnChunker(4*a, None, txnType=rim.Read, numWords=n) for a, n in self.runs]
+        if len(self.l16) > 0:
+            data.append(dev._rawTxnChunker(dev.VOUT_MODE.offset, None, txnType=rim.Read, numWords=1))
+        return data
+
+    def decode(self, data):
+        """
+        Return the (raw register values, VOUT_MODE, converted values) of the
+        read buffers of one or more snapshots
+        """
+        words = np.array([np.concatenate([np.frombuffer(bytes(d), dtype='<u4') for d in row[:len(self.runs)]]) for row in data],
+                         dtype=np.int64).reshape(len(data), -1) & 0xFFFF
+        raw   = words[:, self.column]
+        mode  = np.array([np.frombuffer(bytes(row[-1]), dtype='<u4')[0] if len(self.l16) > 0 else 0 for row in data], dtype=np.int64)
+
+        values = raw * self.scale
+        values[:, self.l11] = LINEAR11[raw[:, self.l11]]
+        values[:, self.l16] = raw[:, self.l16] * LINEAR16_SCALE[mode & 0x1F][:, None]
+        return raw, mode, values
+
+def _readPages(devs, pageLists, update):
+    # Page locks first, then the memory locks, always in path order so that
+    # callers passing the same devices in a different order cannot deadlock
+    byPath    = sorted(range(len(devs)), key=lambda i: devs[i].path)
+    devs      = [devs[i] for i in byPath]
+    pageLists = [pageLists[i] for i in byPath]
+
+    with ExitStack() as stack:
+        for dev in devs:
+            stack.enter_context(dev._pageLock)
+
+        with ExitStack() as memStack:
+            data, orders = [], []
+            for dev, rows in zip(devs, pageLists):
+                layout = PMBusLayout.of(dev)
+                memStack.enter_context(dev._memLock)
+                dev._clearError()
+
+                # Read the selected page first and the other pages grouped by
+                # value, the PAGE write is only queued on a page change
+                page  = dev._selectedPage()
+                order = sorted(range(len(rows)), key=lambda i: ((rows[i] is not None) and (rows[i] != page), -1 if rows[i] is None else rows[i]))
+                devData = []
+                for i in order:
+                    if (rows[i] is not None) and (rows[i] != page):
+                        dev._rawTxnChunker(dev.PAGE.offset, [rows[i]], txnType=rim.Write)
+                        page = rows[i]
+                    devData.append(layout.queue(dev))
+                data.append(devData)
+                orders.append(order)
+                dev._page = None
+
+            for dev in devs:
+                dev._waitTransaction(0)
+                if dev._getError() != "":
+                    raise pr.MemoryError(name=dev.name, address=dev.address, msg=dev._getError())
+
+        result = []
+        for dev, rows, order, devData in zip(devs, pageLists, orders, data):
+            layout = PMBusLayout.of(dev)
+            record = np.zeros(len(rows), dtype=layout.dtype).view(np.recarray)
+            result.append(record)
+
+            # Nothing was read for an empty page list
+            if len(order) == 0:
+                continue
+
+            raw, mode, values = layout.decode(devData)
+            record['PAGE'][order] = [-1 if rows[i] is None else rows[i] for i in order]
+            for i, name in enumerate(layout.names):
+                record[name][order] = values[:, i]
+
+            # The PAGE shadow always follows the selected page so the cache stays valid
+            last = rows[order[-1]]
+            if last is not None:
+                dev.PAGE.set(last, write=False)
+                dev.PAGE._queueUpdate()
+                dev._page = last
+
+            if update:
+                # Shadows of this device: the layout is shared by all the devices of the class
+                updates = list(zip([dev.variables[reg] for reg in layout.registers], raw[-1].tolist()))
+                if len(layout.l16) > 0:
+                    updates.append((dev.VOUT_MODE, int(mode[-1])))
+                for var, v in updates:
+                    var.set(v, write=False)
+                    var._queueUpdate()
+
+    # Back to the order of the caller
+    ordered = [None]*len(result)
+    for i, record in zip(byPath, result):
+        ordered[i] = record
+    return ordered
+
+def readPMBusTelemetry(devs, pages=None, update=True):
+    """
+    Read the telemetry of several PMBus devices.
+
+    All the READ_* registers listed in the _telemetry table of each device are
+    read with one block read per run of consecutive registers and the reads
+    of all the devices are queued before waiting on any of them, so their
+    round trips overlap.  With pages (list of PAGE values) the PAGE writes and
+    the reads of every page are queued back to back, starting with the page
+    already selected and skipping the PAGE write when it does not change.
+    The page locks of the devices are taken in path order and held for the
+    whole batch.  The values are decoded with the Linear11/Linear16 lookup
+    tables.  When update is set, the READ_* (and VOUT_MODE) shadows are
+    refreshed from the last page read so the LinkVariables follow without any
+    further transaction.
+
+    Returns one numpy record array per device, with one row per page in the
+    order of pages.
+    """
+    rows = [None] if pages is None else list(pages)
+    return _readPages(devs, [rows]*len(devs), update)
+
+def scanPMBusRails(devs, update=False):
+    """
+    Read every rail (page) of several PMBus devices, see readPMBusTelemetry().
+
+    Returns (rails, metrics, table): rails is the list of (device path, page),
+    metrics the list of the telemetry names of all the devices and table the
+    rails x metrics numpy array of the values, nan for the metrics a device
+    does not report.
+    """
+    records = _readPages(devs, [dev._pages for dev in devs], update)
+
+    metrics = []
+    for record in records:
+        metrics += [name for name in record.dtype.names[1:] if name not in metrics]
+
+    rails = [(dev.path, None if page < 0 else int(page)) for dev, record in zip(devs, records) for page in record['PAGE']]
+    table = np.full((len(rails), len(metrics)), np.nan)
+
+    row = 0
+    for record in records:
+        for name in record.dtype.names[1:]:
+            table[row:row+len(record), metrics.index(name)] = record[name]
+        row += len(record)
+
+    return rails, metrics, table
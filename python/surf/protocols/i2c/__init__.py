@@ -10,8 +10,6 @@
 
 from surf.protocols.i2c._PMBus import *
 
-import pyrogue as pr
-
 ##############################################################################
 # PMBus Power System Mgt Protocol Specification – Part II – Revision 1.0:
 ##############################################################################
@@ -34,15 +32,8 @@ def getPMbusLiteralDataFormat(var, read):
     # Get the 16-bt RAW value
     raw = var.dependencies[0].get(read=read)
 
-    # 11 bit, two's complement mantissa
-    Y  = pr.twosComplement( int( (raw >> 0)  & 0x7FF), 11)
-
-    # 5 bit, two's complement exponent (scaling factor)
-    N  = pr.twosComplement( int( (raw >> 11) & 0x1F), 5)
-
-    # X is the 'real world' value
-    X = Y*(2**N)
-    return X
+    # X = Y*(2**N) is the 'real world' value, precomputed for every code in LINEAR11
+    return float(LINEAR11[int(raw) & 0xFFFF])
 
 ##############################################################################
 # PMBus Power System Mgt Protocol Specification – Part II – Revision 1.0:
@@ -55,12 +46,5 @@ def getPMbusLinearDataFormat(var, read):
     voutMode = var.dependencies[0].get(read=read)
     voutCmd  = var.dependencies[1].get(read=read)
 
-    # 11 bit, two's complement mantissa
-    Y  = pr.twosComplement( int(voutCmd  & 0xFFFF), 11)
-
-    # 5 bit, two's complement exponent (scaling factor)
-    N  = pr.twosComplement( int(voutMode & 0x001F), 5)
-
-    # X is the 'real world' value
-    X = Y*(2**N)
-    return X
+    # 16 bit, unsigned mantissa scaled by the 5 bit, two's complement exponent
+    return float(linear16(voutCmd, voutMode))
@@ -0,0 +1,104 @@
+#-----------------------------------------------------------------------------
+# Title      : JESD204B link bring-up orchestrator
+#-----------------------------------------------------------------------------
+# Description:
+# Runs the clock, SYSREF, converter and JESD core bring-up stages of a board
+# in dependency order, with the devices of each stage running concurrently.
+#-----------------------------------------------------------------------------
+# This file is part of the 'SLAC Firmware Standard Library'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'SLAC Firmware Standard Library', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import time
+import click
+from concurrent.futures import ThreadPoolExecutor
+
+class JesdBringUp():
+    """
+    Bring up the JESD204B links of a board.
+
+    The stages run in dependency order: clocks -> SYSREF -> converters ->
+    JESD cores -> link-up.  All the work of one stage runs concurrently, so
+    each stage takes as long as its slowest device instead of the sum.
+
+    clocks     : LMK style devices, their Init() command runs first
+    sysref     : callables run once the clocks are up (e.g. lmk.PwrUpSysRef)
+    converters : ADC/DAC devices (Adc32Rf45, Dac38J84, ...), their Init() command runs third
+    jesdRx     : JesdRx cores, reset with CmdResetGTs() then polled for link-up
+    jesdTx     : JesdTx cores, reset with CmdResetGTs() then polled for link-up
+    """
+    def __init__(self,
+            clocks     = (),
+            sysref     = (),
+            converters = (),
+            jesdRx     = (),
+            jesdTx     = (),
+            timeout    = 5.0,
+            pollPeriod = 0.01):
+        self.clocks     = list(clocks)
+        self.sysref     = list(sysref)
+        self.converters = list(converters)
+        self.jesdCores  = list(jesdRx) + list(jesdTx)
+        self.timeout    = timeout
+        self.pollPeriod = pollPeriod
+        self.report     = {}
+
+    def _runStage(self, name, funcs):
+        start = time.monotonic()
+        if len(funcs) > 0:
+            with ThreadPoolExecutor(max_workers=len(funcs)) as pool:
+                # result() re-raises any exception from the stage
+                for future in [pool.submit(f) for f in funcs]:
+                    future.result()
+        self.report[name] = {'time' : time.monotonic() - start}
+
+    def _waitLinkUp(self, core, deadline):
+        start = time.monotonic()
+        while True:
+            up = core.linkStatus()
+            if up.all() or time.monotonic() > deadline:
+                return up, time.monotonic() - start
+            time.sleep(self.pollPeriod)
+
+    def run(self):
+        """
+        Run all the bring-up stages and return True when every enabled lane
+        of every JESD core is up.  Per-stage and per-core timing is kept in
+        the report attribute.
+        """
+        self.report = {}
+        total = time.monotonic()
+
+        self._runStage('Clocks',     [dev.Init for dev in self.clocks])
+        self._runStage('SysRef',     self.sysref)
+        self._runStage('Converters', [dev.Init for dev in self.converters])
+        self._runStage('JesdReset',  [core.CmdResetGTs for core in self.jesdCores])
+
+        # Poll all cores concurrently, each with one block read per iteration
+        start    = time.monotonic()
+        deadline = start + self.timeout
+        links    = {}
+        if len(self.jesdCores) > 0:
+            with ThreadPoolExecutor(max_workers=len(self.jesdCores)) as pool:
+                futures = {core.path: pool.submit(self._waitLinkUp, core, deadline) for core in self.jesdCores}
+                for path, future in futures.items():
+                    up, elapsed = future.result()
+                    links[path] = {'lanes' : up, 'time' : elapsed}
+
+        self.report['LinkUp'] = {'time' : time.monotonic() - start, 'links' : links}
+        self.report['Total']  = {'time' : time.monotonic() - total}
+
+        return all(link['lanes'].all() for link in links.values())
+
+    def printReport(self):
+        for name, stage in self.report.items():
+            print(f'{name:12s}: {stage["time"]*1e3:10.1f} ms')
+            for path, link in stage.get('links', {}).items():
+                up = link['lanes']
+                click.secho(f'   {path}: {up.sum()}/{len(up)} lanes up after {link["time"]*1e3:.1f} ms',
+                            fg='green' if up.all() else 'red')
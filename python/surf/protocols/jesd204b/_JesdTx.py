@@ -12,6 +12,8 @@
 #-----------------------------------------------------------------------------
 
 import pyrogue as pr
+import rogue.interfaces.memory as rim
+import numpy as np
 
 class JesdTx(pr.Device):
     def __init__(
@@ -21,6 +23,8 @@ class JesdTx(pr.Device):
             **kwargs):
         super().__init__(**kwargs)
 
+        self._numLanes = numTxLanes
+
         ##############################
         # Variables
         ##############################
@@ -376,3 +380,23 @@ class JesdTx(pr.Device):
 
     def countReset(self):
         self.CmdClearErrors()
+
+    def linkStatus(self):
+        """
+        Read the Enable register and the status words of all lanes from
+        hardware, queued back to back and waited on once.  Returns a per-lane
+        bool array which is True when the lane is GT ready with valid data.
+        Lanes masked off by Enable are reported as up.  Only raw transactions
+        are used, so this also works with instantiate=False.
+        """
+        with self._memLock:
+            self._clearError()
+            enable = self._rawTxnChunker(0x00, None, txnType=rim.Read, numWords=1)
+            status = self._rawTxnChunker(0x40, None, txnType=rim.Read, numWords=self._numLanes)
+            self._waitTransaction(0)
+            if self._getError() != "":
+                raise pr.MemoryError(name=self.name, address=self.address, msg=self._getError())
+
+        status  = np.frombuffer(bytes(status), dtype='<u4')
+        enabled = (int(np.frombuffer(bytes(enable), dtype='<u4')[0]) >> np.arange(self._numLanes)) & 0x1
+        return ((status & 0x3) == 0x3) | (enabled == 0)
@@ -9,3 +9,4 @@
 ##############################################################################
 from surf.protocols.jesd204b._JesdRx import *
 from surf.protocols.jesd204b._JesdTx import *
+from surf.protocols.jesd204b._JesdBringUp import *
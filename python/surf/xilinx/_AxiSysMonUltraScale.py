@@ -10,6 +10,8 @@
 
 import pyrogue as pr
 
+from surf.xilinx._SysMonTelemetry import readSysMon, addTelemetryPoll
+
 class AxiSysMonUltraScale(pr.Device):
     def __init__(
             self,
@@ -17,14 +19,24 @@ class AxiSysMonUltraScale(pr.Device):
             XIL_DEVICE_G   = "ULTRASCALE",
             simpleViewList = None,
             pollInterval   = 5,
+            batchPoll      = False,
             **kwargs):
         super().__init__(description=description, **kwargs)
 
+        # Sensor registers window (0x400 - 0x4FC) read by readTelemetry()
+        self._sensorBase  = 0x400
+        self._sensorWords = 64
+        self._sensors     = []
+
         if simpleViewList is not None:
             self.simpleViewList = simpleViewList[:]
             self.simpleViewList.append('enable')
 
         def addPair(name, offset, bitSize, units, bitOffset, description, function, pollInterval=0):
+            # With batchPoll the snapshot poll refreshes the sensors instead
+            if batchPoll:
+                pollInterval = 0
+
             self.add(pr.RemoteVariable(
                 name         = ("Raw"+name),
                 offset       = offset,
@@ -43,13 +55,16 @@ class AxiSysMonUltraScale(pr.Device):
                 typeStr      = "Float32",
                 dependencies = [self.variables["Raw"+name]],
             ))
+            self._sensors.append((self.variables["Raw"+name], name, function))
 
         if XIL_DEVICE_G == "ULTRASCALE":
             self.convTemp = self.convTempSYSMONE1
             self.convSetTemp = self.convSetTempSYSMONE1
+            self._primitive = 'SYSMONE1'
         elif XIL_DEVICE_G == "ULTRASCALE_PLUS":
             self.convTemp = self.convTempSYSMONE4
             self.convSetTemp = self.convSetTempSYSMONE4
+            self._primitive = 'SYSMONE4'
         else:
             raise Exception('AxiSysMonUltraScale: Device {} not supported'.format(XIL_DEVICE_G))
 
@@ -529,10 +544,20 @@ class AxiSysMonUltraScale(pr.Device):
             hidden       =  True,
         )
 
+        if batchPoll:
+            addTelemetryPoll(self, pollInterval)
+
         # Default to simple view
         if simpleViewList is not None:
             self.simpleView()
 
+    def readTelemetry(self, update=True):
+        """
+        Read all the sensors with one block read of the 0x400 - 0x4FC window
+        and return the converted values as a {name: value} dict
+        """
+        return readSysMon([self], update=update)[0]
+
     @staticmethod
     def convTempSYSMONE1(dev, var, read):
         value   = var.dependencies[0].get(read=read)
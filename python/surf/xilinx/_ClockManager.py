@@ -8,7 +8,169 @@
 # the terms contained in the LICENSE.txt file.
 #-----------------------------------------------------------------------------
 
+import functools
 import pyrogue as pr
+import numpy as np
+
+from surf.xilinx._GtDrp import drpRead, drpWrite
+
+# Legal ranges (-1 speed grade) of the VCO, phase detector and counters
+CLOCK_MANAGER_LIMITS = {
+    'MMCME2' : dict(vco=(600.0e6, 1200.0e6), pfd=(10.0e6, 450.0e6), mult=(2, 64),  div=(1, 106), out=(1, 128), frac=True),
+    'PLLE2'  : dict(vco=(800.0e6, 1600.0e6), pfd=(19.0e6, 450.0e6), mult=(2, 64),  div=(1, 56),  out=(1, 128), frac=False),
+    'MMCME3' : dict(vco=(600.0e6, 1440.0e6), pfd=(10.0e6, 450.0e6), mult=(2, 64),  div=(1, 106), out=(1, 128), frac=True),
+    'PLLE3'  : dict(vco=(600.0e6, 1335.0e6), pfd=(70.0e6, 667.5e6), mult=(1, 19),  div=(1, 15),  out=(1, 128), frac=False),
+    'MMCME4' : dict(vco=(800.0e6, 1600.0e6), pfd=(10.0e6, 450.0e6), mult=(2, 128), div=(1, 106), out=(1, 128), frac=True),
+    'PLLE4'  : dict(vco=(750.0e6, 1500.0e6), pfd=(70.0e6, 667.5e6), mult=(1, 19),  div=(1, 15),  out=(1, 128), frac=False),
+}
+
+# XAPP888 7-series MMCM lock table, indexed by CLKFBOUT_MULT-1:
+# (LockRefDly, LockFBDly, LockCnt, LockSatHigh, UnlockCnt)
+_LOCK_CNT = [1000]*10 + [900, 825, 750, 700, 650, 625, 575, 550, 525, 500, 475, 450, 425, 400, 400, 375,
+             350, 350, 325, 325, 300, 300, 300, 275, 275, 275] + [250]*28
+_LOCK_DLY = [6, 6, 8, 11, 14, 17, 19, 22, 25, 28] + [31]*54
+MMCME2_LOCK = [(dly, dly, cnt, 1001, 1) for dly, cnt in zip(_LOCK_DLY, _LOCK_CNT)]
+
+# XAPP888 7-series MMCM filter table (OPTIMIZED/HIGH bandwidth), indexed by
+# CLKFBOUT_MULT-1: CP[9:6], RES[5:2], LFHF[1:0]
+MMCME2_FILTER = [
+    0b0010_1111_00, 0b0100_1111_00, 0b0101_1011_00, 0b0111_0111_00,
+    0b1101_0111_00, 0b1110_1011_00, 0b1110_1101_00, 0b1111_0011_00,
+    0b1110_0101_00, 0b1111_0101_00, 0b1111_1001_00, 0b1101_0001_00,
+    0b1111_1001_00, 0b1111_1001_00, 0b1111_1001_00, 0b1111_1001_00,
+    0b1111_0101_00, 0b1111_0101_00, 0b1100_0001_00, 0b1100_0001_00,
+    0b1100_0001_00, 0b0101_1100_00, 0b0101_1100_00, 0b0101_1100_00,
+    0b0101_1100_00] + [0b0011_0100_00]*16 + [0b0010_1000_00]*5 + [
+    0b0111_0001_00, 0b0111_0001_00, 0b0100_1100_00, 0b0100_1100_00,
+    0b0100_1100_00, 0b0100_1100_00, 0b0110_0001_00, 0b0110_0001_00,
+    0b0101_0110_00, 0b0101_0110_00, 0b0101_0110_00, 0b0010_0100_00,
+    0b0010_0100_00, 0b0100_1010_00] + [0b0011_1100_00]*4
+
+def _divider(divide):
+    """
+    XAPP888 50% duty cycle counter: (HIGH_TIME, LOW_TIME, EDGE, NO_COUNT)
+    """
+    if divide == 1:
+        return 1, 1, 0, 1
+    high = divide // 2
+    return high, divide - high, divide % 2, 0
+
+def _phase(divide, phase):
+    """
+    XAPP888 phase offset in 1/8 VCO periods: (DELAY_TIME, PHASE_MUX)
+    """
+    eighths = int(round(((phase % 360.0) / 360.0) * divide * 8))
+    return min(eighths >> 3, 63), eighths & 0x7
+
+def _fracCounter(divide, frac, phase):
+    """
+    XAPP888 fractional counter of CLKOUT0/CLKFBOUT, frac in 1/8 steps.
+    Returns the register fields keyed by their generic name.
+    """
+    even = divide >> 1
+    odd  = divide - 2*even
+    oaf  = 8*odd + frac
+
+    period  = 8*divide + frac
+    mdeg    = int(round((phase % 360.0) * 1000)) + 10
+    rise    = (mdeg * period // 360000) & 0x7
+    fall    = ((odd << 2) + (frac >> 1) + rise) & 0x7
+    delay   = ((mdeg * period // 8) // 360000) & 0x3F
+
+    return {
+        'HIGH_TIME'   : even - (oaf <= 8),
+        'LOW_TIME'    : even - (oaf <= 9),
+        'EDGE'        : 0,
+        'NO_COUNT'    : 0,
+        'DELAY_TIME'  : delay,
+        'PHASE_MUX'   : rise,
+        'FRAC'        : frac,
+        'FRAC_EN'     : 1,
+        'FRAC_WF_R'   : int(1 <= oaf <= 8),
+        'PHASE_MUX_F' : fall,
+        'FRAC_WF_F'   : int(2 <= oaf <= 9),
+    }
+
+def _counter(divide, phase=0.0):
+    # Integer or fractional counter fields keyed by their generic name
+    whole = int(divide)
+    frac  = int(round((divide - whole) * 8))
+    if frac != 0:
+        return _fracCounter(whole, frac, phase)
+
+    high, low, edge, noCount = _divider(whole)
+    delay, mux = _phase(whole, phase)
+    return {
+        'HIGH_TIME'   : high,
+        'LOW_TIME'    : low,
+        'EDGE'        : edge,
+        'NO_COUNT'    : noCount,
+        'DELAY_TIME'  : delay,
+        'PHASE_MUX'   : mux,
+        'FRAC'        : 0,
+        'FRAC_EN'     : 0,
+        'FRAC_WF_R'   : 0,
+        'PHASE_MUX_F' : 0,
+        'FRAC_WF_F'   : 0,
+    }
+
+@functools.lru_cache(maxsize=256)
+def solveClockManager(type, fin, fout, phase=None, limits=None):
+    """
+    Search the legal CLKFBOUT_MULT (M), DIVCLK_DIVIDE (D) and CLKOUT_DIVIDE (O)
+    space of a MMCM/PLL for the outputs closest to the requested frequencies.
+
+    type   : MMCME2, PLLE2, MMCME3, PLLE3, MMCME4 or PLLE4
+    fin    : input clock frequency in Hz
+    fout   : tuple of the requested output frequencies in Hz (CLKOUT0 first)
+    phase  : optional tuple of the output phases in degrees
+    limits : optional tuple of (key, value) pairs overriding CLOCK_MANAGER_LIMITS
+
+    The best solution minimizes the worst relative frequency error, then
+    prefers an integer M, the highest VCO frequency and the smallest D.  The
+    MMCMs use 1/8 fractional steps for M and O0.  Solutions are cached.
+    """
+    lim = dict(CLOCK_MANAGER_LIMITS[type])
+    if limits is not None:
+        lim.update(dict(limits))
+
+    fout  = tuple(float(f) for f in fout)
+    phase = tuple(phase) if phase is not None else (0.0,) * len(fout)
+    step  = 8 if lim['frac'] else 1
+
+    mult = np.arange(lim['mult'][0]*step, lim['mult'][1]*step + 1) / step
+    div  = np.arange(lim['div'][0], lim['div'][1] + 1)
+    M, D = np.meshgrid(mult, div)
+    M, D = M.ravel(), D.ravel()
+
+    pfd = fin / D
+    vco = fin * M / D
+    ok  = (pfd >= lim['pfd'][0]) & (pfd <= lim['pfd'][1]) & (vco >= lim['vco'][0]) & (vco <= lim['vco'][1])
+    if not ok.any():
+        raise ValueError(f'ClockManager: no legal VCO for {type} with a {fin*1e-6} MHz input')
+
+    M, D, vco = M[ok], D[ok], vco[ok]
+    outs = []
+    err  = np.zeros(len(vco))
+    for i, f in enumerate(fout):
+        oStep = 8 if (lim['frac'] and i == 0) else 1
+        odiv = np.clip(np.round(vco / f * oStep) / oStep, lim['out'][0], lim['out'][1])
+        # Fractional dividers must be at least 2
+        odiv = np.where((odiv % 1 != 0) & (odiv < 2), np.round(odiv), odiv)
+        outs.append(odiv)
+        err = np.maximum(err, np.abs(vco / odiv - f) / f)
+
+    best = np.lexsort((D, -vco, (M % 1 != 0), err))[0]
+
+    return {
+        'mult'  : float(M[best]),
+        'div'   : int(D[best]),
+        'out'   : tuple(float(odiv[best]) for odiv in outs),
+        'vco'   : float(vco[best]),
+        'fout'  : tuple(float(vco[best] / odiv[best]) for odiv in outs),
+        'phase' : phase,
+        'error' : float(err[best]),
+    }
 
 class ClockManager(pr.Device):
     def __init__(
@@ -18,6 +180,8 @@ class ClockManager(pr.Device):
             **kwargs):
         super().__init__(description=description, **kwargs)
 
+        self._type = type
+
         # Determine the number of clkout
         if (type == 'PLLE3') or (type == 'PLLE4'):
             numClkOut = 2
@@ -534,3 +698,134 @@ class ClockManager(pr.Device):
             mode         = "WO",
             value        = 0xFFFF
         ))
+
+        self._numClkOut  = numClkOut
+        self._ultraScale = UltraScale
+
+    def solve(self, fin, fout, phase=None):
+        """
+        Return the cached solveClockManager() solution for this primitive
+        """
+        return solveClockManager(self._type, float(fin), tuple(fout), None if phase is None else tuple(phase))
+
+    def configFields(self, solution):
+        """
+        Return the {variable name: value} register fields of a solution
+        """
+        isMmcm = self._type.startswith('MMCM')
+        hasMux = self._type not in ('PLLE3', 'PLLE4')
+        fields = {}
+
+        def add(names, counter):
+            for key, name in names.items():
+                if (name is not None) and (name in self.variables):
+                    fields[name] = counter[key]
+
+        for i, (divide, phase) in enumerate(zip(solution['out'], solution['phase'])):
+            counter = _counter(divide, phase)
+            add({
+                'HIGH_TIME'   : f'HIGH_TIME[{i}]',
+                'LOW_TIME'    : f'LOW_TIME[{i}]',
+                'EDGE'        : f'EDGE[{i}]',
+                'NO_COUNT'    : f'NO_COUNT[{i}]',
+                'DELAY_TIME'  : f'DELAY_TIME[{i}]',
+                'PHASE_MUX'   : f'PHASE_MUX[{i}]' if hasMux else None,
+                'FRAC'        : 'FRAC[0]' if (i == 0) else None,
+                'FRAC_EN'     : 'FRAC_EN[0]' if (i == 0) else None,
+                'FRAC_WF_R'   : 'FRAC_WF_R[0]' if (i == 0) else None,
+                'PHASE_MUX_F' : 'PHASE_MUX_F_CLKOUT[0]' if (i == 0) else None,
+                'FRAC_WF_F'   : 'FRAC_WF_F_CLKOUT[0]' if (i == 0) else None,
+            }, counter)
+            fields[f'MX[{i}]'] = 0
+
+        add({
+            'HIGH_TIME'   : 'HIGH_TIME_FB',
+            'LOW_TIME'    : 'LOW_TIME_FB',
+            'EDGE'        : 'EDGE_FB',
+            'NO_COUNT'    : 'NO_COUNT_FB',
+            'DELAY_TIME'  : 'DELAY_TIME_FB',
+            'PHASE_MUX'   : 'PHASE_MUX_FB' if hasMux else None,
+            'FRAC'        : 'FRAC_FB' if isMmcm else None,
+            'FRAC_EN'     : 'FRAC_EN_FB' if isMmcm else None,
+            'FRAC_WF_R'   : 'FRAC_WF_R_FB' if isMmcm else None,
+            'PHASE_MUX_F' : 'PHASE_MUX_F_CLKOUT_FB' if isMmcm else None,
+            'FRAC_WF_F'   : 'FRAC_WF_F_CLKOUT_FB' if isMmcm else None,
+        }, _counter(solution['mult']))
+        fields['MX_FB'] = 0
+
+        high, low, edge, noCount = _divider(solution['div'])
+        fields.update({'HIGH_TIME_DIV': high, 'LOW_TIME_DIV': low, 'EDGE_DIV': edge, 'NO_COUNT_DIV': noCount})
+
+        return fields
+
+    def configure(self, fin, fout, phase=None, reset=None):
+        """
+        Retune the outputs to the fout frequencies (Hz) of a fin input clock.
+
+        All the register fields of the solution are applied as one batched
+        read-modify-write of the DRP registers.  The XAPP888 lock and filter
+        registers are computed for the MMCME2; the other primitives keep their
+        current lock and filter settings.  The MMCM/PLL must be held in reset
+        during the reconfiguration: reset is an optional variable (set to 1
+        then 0) or a callable (called with True then False) driving its RST.
+        Returns the solution.
+        """
+        solution = self.solve(fin, fout, phase)
+        fields   = self.configFields(solution)
+
+        # (mask of the bits to replace, value) of every touched DRP register
+        regs = {}
+        for name, value in fields.items():
+            var  = self.variables[name]
+            addr = var.offset >> 2
+            bo   = var.bitOffset[0] if isinstance(var.bitOffset, list) else var.bitOffset
+            bs   = var.bitSize[0] if isinstance(var.bitSize, list) else var.bitSize
+            mask = ((1 << bs) - 1) << bo
+            m, v = regs.get(addr, (0, 0))
+            regs[addr] = (m | mask, (v & ~mask) | ((value << bo) & mask))
+
+        regs[self.POWER.offset >> 2] = (0xFFFF, 0xFFFF)
+
+        if self._type == 'MMCME2':
+            refDly, fbDly, lockCnt, satHigh, unlockCnt = MMCME2_LOCK[int(solution['mult']) - 1]
+            filt = MMCME2_FILTER[int(solution['mult']) - 1]
+
+            def bit(n):
+                return (filt >> n) & 0x1
+
+            regs[0x18] = (0x03FF, lockCnt)
+            regs[0x19] = (0x7FFF, (fbDly << 10) | unlockCnt)
+            regs[0x1A] = (0x7FFF, (refDly << 10) | satHigh)
+            regs[0x4E] = (0x9900, (bit(9) << 15) | (bit(8) << 12) | (bit(7) << 11) | (bit(6) << 8))
+            regs[0x4F] = (0x9990, (bit(5) << 15) | (bit(4) << 12) | (bit(3) << 11) | (bit(2) << 8) | (bit(1) << 7) | (bit(0) << 4))
+
+        # One block read spanning all the registers, then one batch of writes
+        lo, hi = min(regs), max(regs)
+        cur    = drpRead(self, lo, hi - lo + 1)
+        words  = [(a, (int(cur[a - lo]) & ~m) | v) for a, (m, v) in sorted(regs.items())]
+
+        if isinstance(reset, pr.BaseVariable):
+            reset.set(1)
+        elif reset is not None:
+            reset(True)
+
+        drpWrite(self, words)
+
+        if isinstance(reset, pr.BaseVariable):
+            reset.set(0)
+        elif reset is not None:
+            reset(False)
+
+        # Refresh the shadows without reading back
+        values = dict(words)
+        for var in self.variables.values():
+            if isinstance(var, pr.RemoteVariable) and (var.offset >> 2) in values:
+                if var.name in fields:
+                    var.set(fields[var.name], write=False)
+                elif var.name.startswith(('LockReg', 'FiltReg')) or (var is self.POWER):
+                    var.set(values[var.offset >> 2] & 0xFFFF, write=False)
+                else:
+                    continue
+                var._queueUpdate()
+
+        return solution
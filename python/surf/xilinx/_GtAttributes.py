@@ -0,0 +1,168 @@
+#-----------------------------------------------------------------------------
+# Description:
+# Load GT wizard attribute sets and apply them as batched DRP writes
+#-----------------------------------------------------------------------------
+# This file is part of the 'SLAC Firmware Standard Library'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'SLAC Firmware Standard Library', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import re
+import json
+import collections
+import numpy as np
+
+from surf.xilinx._GtDrp         import drpReadMany, drpWriteMany
+from surf.xilinx._GtDrpSnapshot import GtDrpLayout
+
+# Attribute name prefix of the wizard output (e.g. GTYE4_CHANNEL_RXCDR_CFG2)
+GT_PREFIX = re.compile(r'^GT[A-Z]+\d_(CHANNEL|COMMON)_')
+
+# Wizard attribute lists: instance parameters ".NAME (VALUE)" or "parameter NAME = VALUE"
+_INSTANCE_PARAM = re.compile(r'\.\s*(GT[A-Z]+\d_(?:CHANNEL|COMMON)_\w+)\s*\(\s*([^()]*?)\s*\)')
+_DECLARED_PARAM = re.compile(r'parameter\s*(?:\[[^\]]*\])?\s*(GT[A-Z]+\d_(?:CHANNEL|COMMON)_\w+)\s*=\s*([^,;)]+)')
+_VERILOG_NUM    = re.compile(r"^(\d*)\s*'[sS]?([bBoOdDhH])\s*([0-9a-fA-F_]+)$")
+_RADIX          = {'b': 2, 'o': 8, 'd': 10, 'h': 16}
+
+def parseGtValue(value):
+    """
+    Convert an attribute value (verilog literal, integer or string) to an int,
+    strings such as "TRUE" or enum names are returned as a str
+    """
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+
+    value = str(value).strip().strip('"')
+    m = _VERILOG_NUM.match(value)
+    if m:
+        return int(m.group(3).replace('_', ''), _RADIX[m.group(2).lower()])
+
+    try:
+        return int(value, 0)
+    except ValueError:
+        return value
+
+def loadGtAttributes(source):
+    """
+    Load an attribute set as a {name: value} dict from a dict, a .json file,
+    a .csv/.txt file of name/value rows or a wizard generated verilog file
+    """
+    if isinstance(source, dict):
+        return {k: parseGtValue(v) for k, v in source.items()}
+
+    with open(source) as f:
+        text = f.read()
+
+    if source.endswith('.json'):
+        return {k: parseGtValue(v) for k, v in json.loads(text).items()}
+
+    if source.endswith(('.csv', '.txt')):
+        attrs = {}
+        for line in text.splitlines():
+            fields = [x for x in re.split(r'[,\s]+', line.split('#')[0].strip()) if x != '']
+            if len(fields) >= 2 and fields[0].lower() != 'name':
+                attrs[fields[0]] = parseGtValue(fields[1])
+        return attrs
+
+    attrs = {}
+    for regex in (_DECLARED_PARAM, _INSTANCE_PARAM):
+        for name, value in regex.findall(text):
+            attrs[name] = parseGtValue(value)
+    return attrs
+
+def _encode(var, value):
+    # Enum names (or the integer spelling of them, e.g. RXOUT_DIV 4) map through
+    # the variable enum, booleans default to 1/0, other integers must fit the field
+    enum = getattr(var, 'enum', None)
+    if enum is not None:
+        for k, v in enum.items():
+            if v == str(value):
+                return k
+
+    if isinstance(value, str):
+        return int(value == 'TRUE') if value in ('TRUE', 'FALSE') else None
+
+    bitSize = sum(var.bitSize) if isinstance(var.bitSize, list) else var.bitSize
+    if not 0 <= value < (1 << bitSize):
+        raise ValueError(f'{var.path}: value {value} is not in the enum and does not fit in {bitSize} bits')
+
+    return value
+
+def applyGtAttributes(devs, attributes, update=True):
+    """
+    Apply an attribute set to several GT channels or commons.
+
+    The attributes are mapped to their DRP fields and all the fields sharing
+    a DRP register are merged into one read-modify-write.  For all the lanes
+    of the same type the touched registers are read with one overlapped block
+    read and only the registers which change are written back, with one
+    overlapped batch of writes.  Wizard prefixed names (GTYE4_CHANNEL_...)
+    only apply to the matching channel or common devices.
+
+    Returns the sorted list of the attributes which did not map to any device.
+    """
+    if not isinstance(attributes, dict):
+        attributes = loadGtAttributes(attributes)
+
+    groups = collections.defaultdict(list)
+    for dev in devs:
+        groups[type(dev)].append(dev)
+
+    unmatched = set(attributes)
+
+    for kind, group in groups.items():
+        layout   = GtDrpLayout.of(group[0])
+        index    = {name: i for i, name in enumerate(layout.names.tolist())}
+        isCommon = 'Common' in kind.__name__
+
+        clear  = collections.defaultdict(int)
+        bits   = collections.defaultdict(int)
+        fields = {}
+
+        for key, value in attributes.items():
+            m = GT_PREFIX.match(key)
+            if m and ((m.group(1) == 'COMMON') != isCommon):
+                continue
+
+            name = key[m.end():] if m else key
+            if name not in index:
+                continue
+
+            value = _encode(group[0].variables[name], value)
+            if value is None:
+                continue
+
+            unmatched.discard(key)
+            fields[name] = value
+
+            for s in np.flatnonzero(layout.segVar == index[name]):
+                word = int(layout.segWord[s])
+                size = int(layout.segSize[s])
+                mask = ((1 << size) - 1) << int(layout.segShift[s])
+                clear[word] |= mask
+                bits[word]   = (bits[word] & ~mask) | (((value >> int(layout.segDst[s])) & ((1 << size) - 1)) << int(layout.segShift[s]))
+
+        if len(clear) == 0:
+            continue
+
+        # One block read spanning the touched registers on every lane
+        addrs = np.array(sorted(clear))
+        old   = drpReadMany(group, int(addrs[0]), int(addrs[-1] - addrs[0]) + 1)[:, addrs - addrs[0]]
+        keep  = np.array([~clear[a] & 0xFFFFFFFF for a in addrs], dtype=np.uint32)
+        new   = (old & keep) | np.array([bits[a] for a in addrs], dtype=np.uint32)
+
+        drpWriteMany(group, [[(int(a), int(n)) for a, n, o in zip(addrs, rowNew, rowOld) if n != o]
+                             for rowNew, rowOld in zip(new, old)])
+
+        if update:
+            for dev in group:
+                for name, value in fields.items():
+                    var = dev.variables[name]
+                    var.set(bool(value) if var.nativeType is bool else value, write=False)
+                    var._queueUpdate()
+
+    return sorted(unmatched)
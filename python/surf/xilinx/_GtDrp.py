@@ -0,0 +1,115 @@
+#-----------------------------------------------------------------------------
+# Description:
+# Batched DRP access helpers for the GT channel and common devices
+#-----------------------------------------------------------------------------
+# This file is part of the 'SLAC Firmware Standard Library'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'SLAC Firmware Standard Library', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import pyrogue as pr
+import rogue.interfaces.memory as rim
+import numpy as np
+from contextlib import ExitStack
+
+# The GT devices map each 16-bit DRP register to a 32-bit word (offset = addr << 2)
+
+def addDrpVariables(dev, table, names=None, mode=None):
+    """
+    Add the DRP attribute variables of a register table to dev.
+
+    Each row is (name, addr, bitSize, bitOffset, mode[, kwargs]) with the DRP
+    address(es) instead of byte offsets, a list of addresses for attributes
+    split over several registers and an optional dict of extra RemoteVariable
+    arguments.  Rows with a number argument are added as variable arrays, their
+    stride is in DRP registers too.  The tables are module constants shared by
+    all the lanes.
+
+    names : optional collection of the attributes to instantiate, a lane which
+            only needs a few attributes then skips the construction of the rest
+    mode  : optional mode overriding the 'RW' rows (e.g. 'RO')
+    """
+    for row in table:
+        name, addr, bitSize, bitOffset, rowMode = row[:5]
+        if (names is not None) and (name not in names):
+            continue
+
+        kwargs = dict(row[5]) if len(row) > 5 else {}
+        kwargs['name']      = name
+        kwargs['offset']    = [a << 2 for a in addr] if isinstance(addr, list) else addr << 2
+        kwargs['bitSize']   = bitSize
+        kwargs['bitOffset'] = bitOffset
+        kwargs['mode']      = mode if (mode is not None and rowMode == 'RW') else rowMode
+
+        if 'number' in kwargs:
+            kwargs['stride'] = kwargs['stride'] << 2
+            dev.addRemoteVariables(**kwargs)
+        else:
+            dev.add(pr.RemoteVariable(**kwargs))
+
+def drpRead(dev, addr, numWords=1):
+    """
+    Read numWords consecutive DRP registers of dev in a single block transaction.
+    Returns a uint32 numpy array of the 16-bit register values.
+    """
+    return np.array(dev._rawRead(offset=addr << 2, numWords=numWords), ndmin=1, dtype=np.uint32) & 0xFFFF
+
+def _drpRuns(words):
+    # Merge runs of consecutive addresses into (addr, [values]) block writes
+    runs = []
+    for addr, value in words:
+        if len(runs) > 0 and addr == runs[-1][0] + len(runs[-1][1]):
+            runs[-1][1].append(int(value) & 0xFFFF)
+        else:
+            runs.append((addr, [int(value) & 0xFFFF]))
+    return runs
+
+def drpWrite(dev, words):
+    """
+    Write a sequence of (addr, value) DRP registers of dev as one batch.
+    Runs of consecutive addresses are merged into single block writes, all the
+    transactions are queued back to back in the given order and waited on once.
+    """
+    drpWriteMany([dev], [words])
+
+def drpWriteMany(devs, words):
+    """
+    Write a sequence of (addr, value) DRP registers to each of several devices,
+    words holds one sequence per device.  The writes of all the devices are
+    queued before waiting on any of them, so their round trips overlap.
+    """
+    with ExitStack() as stack:
+        for dev, devWords in zip(devs, words):
+            stack.enter_context(dev._memLock)
+            dev._clearError()
+            for addr, values in _drpRuns(devWords):
+                dev._rawTxnChunker(addr << 2, values, txnType=rim.Write)
+
+        for dev in devs:
+            dev._waitTransaction(0)
+            if dev._getError() != "":
+                raise pr.MemoryError(name=dev.name, address=dev.address, msg=dev._getError())
+
+def drpReadMany(devs, addr, numWords=1):
+    """
+    Read the same numWords DRP registers from several devices.  The reads of
+    all the devices are queued before waiting on any of them, so their round
+    trips overlap.  Returns a (len(devs), numWords) uint32 numpy array.
+    """
+    with ExitStack() as stack:
+        data = []
+        for dev in devs:
+            stack.enter_context(dev._memLock)
+            dev._clearError()
+            data.append(dev._rawTxnChunker(addr << 2, None, txnType=rim.Read, numWords=numWords))
+
+        for dev in devs:
+            dev._waitTransaction(0)
+            if dev._getError() != "":
+                raise pr.MemoryError(name=dev.name, address=dev.address|(addr << 2), msg=dev._getError())
+
+    return np.array([np.frombuffer(bytes(d), dtype='<u4') for d in data], dtype=np.uint32).reshape(len(devs), numWords) & 0xFFFF
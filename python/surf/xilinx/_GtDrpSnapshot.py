@@ -0,0 +1,201 @@
+#-----------------------------------------------------------------------------
+# Description:
+# Whole DRP snapshot, diff and restore for the GT channel and common devices
+#-----------------------------------------------------------------------------
+# This file is part of the 'SLAC Firmware Standard Library'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'SLAC Firmware Standard Library', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import collections
+import pyrogue as pr
+import numpy as np
+
+from surf.xilinx._GtDrp import drpRead, drpWrite, drpReadMany
+
+_layouts = {}
+
+class GtDrpLayout():
+    """
+    Bit layout of the DRP attributes of a device, built once from its
+    RemoteVariables.  Every attribute is split into segments which never
+    cross a 32-bit word so all the fields decode with a few numpy operations.
+    """
+    def __init__(self, names, rw, segVar, segWord, segShift, segSize, segDst):
+        self.names    = np.asarray(names)
+        self.rw       = np.asarray(rw, dtype=bool)
+        self.segVar   = np.asarray(segVar, dtype=np.int64)
+        self.segWord  = np.asarray(segWord, dtype=np.int64)
+        self.segShift = np.asarray(segShift, dtype=np.uint64)
+        self.segSize  = np.asarray(segSize, dtype=np.uint64)
+        self.segDst   = np.asarray(segDst, dtype=np.int64)
+        self.numWords = int(self.segWord.max()) + 1 if len(self.segWord) > 0 else 0
+
+        # Segments of an attribute are contiguous, reduce them per attribute
+        self._starts = np.flatnonzero(np.r_[True, self.segVar[1:] != self.segVar[:-1]])
+
+    @classmethod
+    def fromDevice(cls, dev):
+        names, rw, segVar, segWord, segShift, segSize, segDst = [], [], [], [], [], [], []
+
+        for var in dev.variables.values():
+            if not isinstance(var, pr.RemoteVariable):
+                continue
+
+            bitOffsets = var.bitOffset if isinstance(var.bitOffset, list) else [var.bitOffset]
+            bitSizes   = var.bitSize   if isinstance(var.bitSize, list)   else [var.bitSize]
+
+            idx = len(names)
+            names.append(var.name)
+            rw.append(var.mode == 'RW')
+
+            dst = 0
+            for bitOffset, bitSize in zip(bitOffsets, bitSizes):
+                pos = var.offset*8 + bitOffset
+                while bitSize > 0:
+                    size = min(bitSize, 32 - pos % 32)
+                    segVar.append(idx)
+                    segWord.append(pos // 32)
+                    segShift.append(pos % 32)
+                    segSize.append(size)
+                    segDst.append(dst)
+                    pos, dst, bitSize = pos + size, dst + size, bitSize - size
+
+        return cls(names, rw, segVar, segWord, segShift, segSize, segDst)
+
+    @classmethod
+    def of(cls, dev):
+        """
+        Layout of dev, the attribute set is fixed once the device is built so
+        it is cached per device
+        """
+        if id(dev) not in _layouts:
+            _layouts[id(dev)] = cls.fromDevice(dev)
+        return _layouts[id(dev)]
+
+    def decode(self, words):
+        """
+        Decode all the attributes of a words array, returns an object array
+        of python ints (some attributes are wider than 64 bits)
+        """
+        if len(self.names) == 0:
+            return np.zeros(0, dtype=object)
+        words  = np.asarray(words, dtype=np.uint64)
+        values = (words[self.segWord] >> self.segShift) & ((np.uint64(1) << self.segSize) - np.uint64(1))
+        values = values.astype(object) << self.segDst.astype(object)
+        return np.bitwise_or.reduceat(values, self._starts)
+
+    def wordsOf(self, fields):
+        """
+        DRP addresses holding any bit of the given attribute mask
+        """
+        return np.unique(self.segWord[fields[self.segVar]])
+
+    def toDict(self):
+        return {f'layout_{k}': getattr(self, k) for k in ('names', 'rw', 'segVar', 'segWord', 'segShift', 'segSize', 'segDst')}
+
+class GtDrpSnapshot():
+    """
+    Snapshot of the whole DRP address space of a GT channel or common.
+
+    The space spanning all the attributes of the device is read with one
+    block read into the words array, and every attribute is decoded from it
+    in one vectorized pass.  Snapshots can be diffed against each other
+    (lanes, boards or points in time), saved to .npz files and restored with
+    one batch of block writes.
+    """
+    def __init__(self, words, layout, path=''):
+        self.words  = np.asarray(words, dtype=np.uint32)
+        self.layout = layout
+        self.path   = path
+        self.values = layout.decode(self.words)
+
+    @classmethod
+    def read(cls, dev):
+        layout = GtDrpLayout.of(dev)
+        return cls(drpRead(dev, 0, layout.numWords), layout, dev.path)
+
+    @classmethod
+    def readMany(cls, devs):
+        """
+        Snapshot many devices, the reads of all the devices of the same type
+        are queued before waiting so their round trips overlap
+        """
+        groups = collections.defaultdict(list)
+        for dev in devs:
+            groups[(type(dev), GtDrpLayout.of(dev).numWords)].append(dev)
+
+        snaps = {}
+        for (_, numWords), group in groups.items():
+            words = drpReadMany(group, 0, numWords)
+            for dev, w in zip(group, words):
+                snaps[dev.path] = cls(w, GtDrpLayout.of(dev), dev.path)
+
+        return [snaps[dev.path] for dev in devs]
+
+    @property
+    def fields(self):
+        return dict(zip(self.layout.names.tolist(), self.values.tolist()))
+
+    def diff(self, other):
+        """
+        Return {name: (self value, other value)} of the attributes which differ
+        """
+        if not np.array_equal(self.layout.names, other.layout.names):
+            raise ValueError(f'{self.path} and {other.path} do not have the same DRP attributes')
+
+        changed = np.flatnonzero(self.values != other.values)
+        return {str(self.layout.names[i]): (self.values[i], other.values[i]) for i in changed}
+
+    def printDiff(self, other):
+        for name, (a, b) in self.diff(other).items():
+            print(f'{name:32s} {a:#x} -> {b:#x}')
+
+    def restore(self, dev, update=True):
+        """
+        Write back the DRP registers holding RW attributes in one batch and,
+        when update is set, refresh the variable shadows without a read back
+        """
+        layout = GtDrpLayout.of(dev)
+        if not np.array_equal(layout.names, self.layout.names):
+            raise ValueError(f'{dev.path}: snapshot of {self.path} has different DRP attributes')
+
+        addrs = layout.wordsOf(layout.rw)
+        drpWrite(dev, [(int(a), int(self.words[a])) for a in addrs])
+
+        if update:
+            for name, value, rw in zip(layout.names, self.values, layout.rw):
+                if rw:
+                    var = dev.variables[name]
+                    var.set(var.nativeType(value) if var.nativeType is bool else value, write=False)
+                    var._queueUpdate()
+
+    def save(self, filename):
+        np.savez(filename, words=self.words, path=self.path, **self.layout.toDict())
+
+    @classmethod
+    def load(cls, filename):
+        data   = np.load(filename)
+        layout = GtDrpLayout(*[data[f'layout_{k}'] for k in ('names', 'rw', 'segVar', 'segWord', 'segShift', 'segSize', 'segDst')])
+        return cls(data['words'], layout, str(data['path']))
+
+def auditDrp(devs, reference=None):
+    """
+    Snapshot all the devices (e.g. every lane of a board) and return
+    {path: {name: (value, reference value)}} of the attributes differing from
+    the reference snapshot.  Without a reference, each attribute is compared
+    to its most common value across the devices.
+    """
+    snaps = GtDrpSnapshot.readMany(devs)
+
+    if reference is None:
+        values = np.array([s.values for s in snaps], dtype=object)
+        common = [collections.Counter(col.tolist()).most_common(1)[0][0] for col in values.T]
+        reference = GtDrpSnapshot(snaps[0].words, snaps[0].layout, 'majority')
+        reference.values = np.array(common, dtype=object)
+
+    return {s.path: s.diff(reference) for s in snaps}
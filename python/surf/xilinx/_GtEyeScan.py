@@ -0,0 +1,294 @@
+#-----------------------------------------------------------------------------
+# Description:
+# Statistical 2D eye scan engine for the UltraScale GTHE3 and GTYE4 channels
+#-----------------------------------------------------------------------------
+# This file is part of the 'SLAC Firmware Standard Library'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'SLAC Firmware Standard Library', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import time
+import math
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+from surf.xilinx._GtDrp        import drpRead, drpWrite
+from surf.xilinx._Gthe3Channel import Gthe3Channel
+from surf.xilinx._Gtye4Channel import Gtye4Channel
+
+# Eye scan attribute DRP addresses, common to GTHE3_CHANNEL and GTYE4_CHANNEL
+ES_CTRL_ADDR       = 0x03C # ES_CONTROL[15:10], ES_ERRDET_EN[9], ES_EYE_SCAN_EN[8], ES_PRESCALE[4:0]
+ES_QUAL_MASK_ADDR  = 0x044 # ES_QUAL_MASK[79:0], 5 registers
+ES_SDATA_MASK_ADDR = 0x049 # ES_SDATA_MASK[79:0], 5 registers
+ES_HORZ_ADDR       = 0x04F # ES_HORZ_OFFSET[15:4]
+RX_DATA_WIDTH_ADDR = 0x003 # RX_DATA_WIDTH[8:5]
+RXOUT_DIV_ADDR     = 0x063 # RXOUT_DIV[2:0]
+RX_INT_WIDTH_ADDR  = 0x066 # RX_INT_DATAWIDTH[1:0]
+ES_VERT_ADDR       = 0x097 # RX_EYESCAN_VS_NEG_DIR[10], _UT_SIGN[9], _CODE[8:2], _RANGE[1:0]
+
+# Channel type: DRP address of the es_error_count, es_sample_count, es_control_status
+# read-only registers (9-bit DRP address space on GTHE3, 10-bit on GTYE4)
+ES_STATUS_ADDR = {
+    Gthe3Channel : 0x151,
+    Gtye4Channel : 0x251,
+}
+
+RX_DATA_WIDTH = {2: 16, 3: 20, 4: 32, 5: 40, 6: 64, 7: 80, 8: 128, 9: 160}
+
+# ES_SDATA_MASK per internal data width: the unmasked (0) bits select the compared data
+ES_SDATA_MASK = {
+    16 : 0xFFFFF_0000F_FFFFF_FFFFF,
+    20 : 0xFFFFF_00000_FFFFF_FFFFF,
+    32 : 0x00000_000FF_FFFFF_FFFFF,
+    40 : 0x00000_00000_FFFFF_FFFFF,
+    64 : 0x0000_0000_0000_0000_FFFF,
+    80 : 0x0000_0000_0000_0000_0000,
+}
+
+MAX_VERT = 127
+
+class GtEyeScan():
+    """
+    Statistical eye scan of one Gthe3Channel or Gtye4Channel.
+
+    The horizontal offset is stepped across the full +/-0.5 UI range and the
+    vertical offset across the +/-127 codes.  Each point is first measured at
+    minPrescale.  Points which already show minErrors errors (the eye edges)
+    are done, otherwise the prescale is raised in one step to the value which
+    reaches targetBer.  Every start is a single DRP batch and every poll is a
+    single block read of the error, sample and status registers.
+
+    The eye scan circuit must be enabled (ES_EYE_SCAN_EN) before the last RX
+    reset; setup() enables it if needed but the RX PMA must then be reset.
+    In DFE mode (dfe=True) both unit threshold signs are measured and summed.
+    """
+    def __init__(self,
+            channel,
+            horzStep    = None,
+            vertStep    = 8,
+            targetBer   = 1e-8,
+            minErrors   = 10,
+            minPrescale = 0,
+            maxPrescale = 20,
+            dataWidth   = None,
+            dfe         = False,
+            pollPeriod  = 0.001):
+        self.channel     = channel
+        self.horzStep    = horzStep
+        self.vertStep    = vertStep
+        self.targetBer   = targetBer
+        self.minErrors   = minErrors
+        self.minPrescale = minPrescale
+        self.maxPrescale = maxPrescale
+        self.dataWidth   = dataWidth
+        self.dfe         = dfe
+        self.pollPeriod  = pollPeriod
+        self.progress    = 0.0
+
+        kind = next((k for k in ES_STATUS_ADDR if isinstance(channel, k)), None)
+        if kind is None:
+            raise TypeError(f'{channel.path}: eye scan not supported for {type(channel).__name__}')
+        self._statusAddr = ES_STATUS_ADDR[kind]
+
+    def setup(self):
+        """
+        Enable the eye scan circuit, program the masks and allocate the result arrays
+        """
+        dev = self.channel
+
+        ctrl = int(drpRead(dev, ES_CTRL_ADDR)[0])
+        if not (ctrl >> 8) & 0x1:
+            print(f'{dev.path}: ES_EYE_SCAN_EN was disabled, the RX PMA must be reset before scanning')
+
+        if self.dataWidth is None:
+            width     = RX_DATA_WIDTH[int(drpRead(dev, RX_DATA_WIDTH_ADDR)[0] >> 5) & 0xF]
+            intBytes  = 2 << int(drpRead(dev, RX_INT_WIDTH_ADDR)[0] & 0x3)
+            self.dataWidth = intBytes * (10 if width % 10 == 0 else 8)
+
+        self._rxOutDiv = 1 << int(drpRead(dev, RXOUT_DIV_ADDR)[0] & 0x7)
+        self._horzWord = int(drpRead(dev, ES_HORZ_ADDR)[0] & 0x000F)
+        self._vertWord = int(drpRead(dev, ES_VERT_ADDR)[0] & 0xF800)
+        self._ctrlWord = (ctrl & 0x00E0) | 0x0300 # ES_EYE_SCAN_EN=1, ES_ERRDET_EN=1
+
+        sdata = ES_SDATA_MASK[self.dataWidth]
+        words = [(ES_CTRL_ADDR, self._ctrlWord)]
+        words += [(ES_QUAL_MASK_ADDR+i, 0xFFFF) for i in range(5)]
+        words += [(ES_SDATA_MASK_ADDR+i, (sdata >> (16*i)) & 0xFFFF) for i in range(5)]
+        drpWrite(dev, words)
+
+        # Horizontal range is +/-32 taps per RXOUT_DIV, spanning +/-0.5 UI
+        maxHorz   = 32 * self._rxOutDiv
+        horzStep  = self._rxOutDiv if self.horzStep is None else self.horzStep
+        self.horz = np.arange(-maxHorz, maxHorz+1, horzStep)
+        self.vert = np.arange(-MAX_VERT, MAX_VERT+1, self.vertStep)
+
+        self.errors = np.zeros((len(self.vert), len(self.horz)), dtype=np.uint64)
+        self.bits   = np.zeros((len(self.vert), len(self.horz)), dtype=np.float64)
+        self.progress = 0.0
+
+    @property
+    def horzUi(self):
+        return self.horz / (64 * self._rxOutDiv)
+
+    @property
+    def ber(self):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.bits > 0, self.errors / self.bits, np.nan)
+
+    def _start(self, horz, vert, utSign, prescale):
+        horzWord = self._horzWord | ((((horz & 0x7FF) | (0x800 if horz < 0 else 0))) << 4)
+        vertWord = self._vertWord | ((1 if vert < 0 else 0) << 10) | (utSign << 9) | (abs(vert) << 2)
+        ctrlWord = self._ctrlWord | prescale
+
+        # Return to WAIT, move the offsets, then set the run bit
+        drpWrite(self.channel, [
+            (ES_CTRL_ADDR, ctrlWord),
+            (ES_HORZ_ADDR, horzWord),
+            (ES_VERT_ADDR, vertWord),
+            (ES_CTRL_ADDR, ctrlWord | (0x1 << 10)),
+        ])
+
+    def _poll(self):
+        errors, samples, status = drpRead(self.channel, self._statusAddr, 3)
+        return (status & 0x1) == 0x1, int(errors), int(samples)
+
+    def _pointGen(self, horz, vert):
+        """
+        Generator measuring a single point, yields while waiting on the hardware.
+        Returns the (errors, bits) of the point.
+        """
+        totalErrors = 0
+        totalBits   = 0
+
+        for utSign in ((0, 1) if self.dfe else (0,)):
+            prescale = self.minPrescale
+            while True:
+                self._start(horz, vert, utSign, prescale)
+
+                done = False
+                while not done:
+                    yield
+                    done, errors, samples = self._poll()
+
+                totalErrors += errors
+                totalBits   += samples * (2 ** (1+prescale)) * self.dataWidth
+
+                if (totalErrors >= self.minErrors) or (prescale >= self.maxPrescale) or (totalBits*self.targetBer >= 1):
+                    break
+
+                # Jump straight to the prescale which reaches the BER target
+                needed   = math.ceil(math.log2(1 / (self.targetBer * max(totalBits, 1))))
+                prescale = min(self.maxPrescale, prescale + max(1, needed))
+
+        return totalErrors, totalBits
+
+    def _scanGen(self):
+        self.setup()
+        numPoints = len(self.vert) * len(self.horz)
+
+        for iv, vert in enumerate(self.vert):
+            for ih, horz in enumerate(self.horz):
+                errors, bits = yield from self._pointGen(int(horz), int(vert))
+                self.errors[iv, ih] = errors
+                self.bits[iv, ih]   = bits
+                self.progress = (iv*len(self.horz) + ih + 1) / numPoints
+
+        # Leave the scan state machine in WAIT
+        drpWrite(self.channel, [(ES_CTRL_ADDR, self._ctrlWord)])
+
+    def scan(self):
+        """
+        Run the full 2D scan and return the (vert, horz) BER array
+        """
+        for _ in self._scanGen():
+            time.sleep(self.pollPeriod)
+        return self.ber
+
+    def save(self, filename):
+        """
+        Save the scan to a .csv (one row per point) or a numpy .npz file
+        """
+        if filename.endswith('.csv'):
+            vert, horz = np.meshgrid(self.vert, self.horz, indexing='ij')
+            table = np.column_stack([horz.ravel(), vert.ravel(), self.errors.ravel(), self.bits.ravel(), self.ber.ravel()])
+            np.savetxt(filename, table, delimiter=',', header='horz,vert,errors,bits,ber', comments='')
+        else:
+            np.savez(filename, horz=self.horz, horzUi=self.horzUi, vert=self.vert, errors=self.errors, bits=self.bits, ber=self.ber)
+
+    def plot(self, ax=None):
+        """
+        Plot the log10 BER of the scan, matplotlib is only needed for plotting.
+        Points without errors are shown at their measured BER floor.
+        """
+        import matplotlib.pyplot as plt
+
+        if ax is None:
+            ax = plt.figure().add_subplot()
+
+        with np.errstate(divide='ignore'):
+            ber = np.where(self.errors > 0, self.ber, 1 / self.bits)
+        image = ax.imshow(np.log10(ber), origin='lower', aspect='auto', cmap='jet',
+                          extent=[self.horzUi[0], self.horzUi[-1], self.vert[0], self.vert[-1]])
+        ax.figure.colorbar(image, ax=ax, label='log10(BER)')
+        ax.set_xlabel('Horizontal offset (UI)')
+        ax.set_ylabel('Vertical offset (codes)')
+        ax.set_title(self.channel.path)
+        return ax
+
+class GtEyeScanGroup():
+    """
+    Eye scan many lanes at once.
+
+    The per-point steps of all the lanes are interleaved round robin: every
+    pass polls each lane once and immediately restarts the lanes whose point
+    is done, so the dwell time of one lane overlaps the DRP traffic of the
+    others.  With workers > 1 the lanes are split over a bounded pool of
+    threads, each running its own round robin.  A board takes about as long
+    as its slowest lane.
+
+    scans    : list of GtEyeScan, one per lane
+    callback : optional function called with each GtEyeScan whose progress changed
+    """
+    def __init__(self, scans, workers=1, pollPeriod=0.001, callback=None):
+        self.scans      = list(scans)
+        self.workers    = max(1, min(workers, len(self.scans)))
+        self.pollPeriod = pollPeriod
+        self.callback   = callback
+
+    @property
+    def progress(self):
+        return {scan.channel.path: scan.progress for scan in self.scans}
+
+    def _runInterleaved(self, scans):
+        active = [(scan, scan._scanGen()) for scan in scans]
+
+        while len(active) > 0:
+            for scan, gen in list(active):
+                last = scan.progress
+                try:
+                    next(gen)
+                except StopIteration:
+                    active.remove((scan, gen))
+
+                if (self.callback is not None) and (scan.progress != last):
+                    self.callback(scan)
+
+            time.sleep(self.pollPeriod)
+
+    def scan(self):
+        """
+        Scan all the lanes and return a {path: BER array} dict
+        """
+        if self.workers == 1:
+            self._runInterleaved(self.scans)
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(self._runInterleaved, self.scans[i::self.workers]) for i in range(self.workers)]
+                for future in futures:
+                    future.result()
+
+        return {scan.channel.path: scan.ber for scan in self.scans}
@@ -0,0 +1,210 @@
+#-----------------------------------------------------------------------------
+# Description:
+# PRBS bit error rate soak test for the GTXE2 and GTYE4 channels
+#-----------------------------------------------------------------------------
+# This file is part of the 'SLAC Firmware Standard Library'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'SLAC Firmware Standard Library', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import time
+import math
+import numpy as np
+
+from surf.xilinx._GtDrp        import drpRead, drpWrite, drpReadMany
+from surf.xilinx._Gtxe2Channel import Gtxe2Channel
+from surf.xilinx._Gtye4Channel import Gtye4Channel
+
+# Channel type: (RX_PRBS_ERR_CNT address, number of 16-bit registers, (RXPRBS_ERR_LOOPBACK address, bit))
+PRBS_ERR_CNT = {
+    Gtxe2Channel : (0x15C, 1, (0x011, 0)),
+    Gtye4Channel : (0x25E, 2, (0x064, 8)),
+}
+
+def poissonLimits(k, cl=0.95):
+    """
+    Two-sided confidence limits on the mean of a Poisson variable with k
+    observed events, solved by bisection of the Poisson CDF.
+    For k = 0 the upper limit is the usual one-sided -ln(1-cl).
+    """
+    def cdf(n, lam):
+        if n < 0:
+            return 0.0
+        if lam == 0:
+            return 1.0
+        return sum(math.exp(i*math.log(lam) - lam - math.lgamma(i+1)) for i in range(n+1))
+
+    def solve(func, target):
+        lo, hi = 0.0, k + 20*math.sqrt(k+1) + 20
+        for _ in range(100):
+            mid = (lo + hi) / 2
+            if func(mid) > target:
+                lo = mid
+            else:
+                hi = mid
+        return (lo + hi) / 2
+
+    if k == 0:
+        return 0.0, -math.log(1-cl)
+
+    # Normal approximation once the exact sum gets expensive
+    if k > 1000:
+        z = math.sqrt(2) * _erfinv(cl)
+        return max(0.0, k - z*math.sqrt(k)), k + z*math.sqrt(k) + 1
+
+    alpha = (1-cl) / 2
+    lower = solve(lambda lam: cdf(k-1, lam), 1 - alpha)
+    upper = solve(lambda lam: cdf(k, lam), alpha)
+    return lower, upper
+
+def _erfinv(y):
+    # Bisection is plenty for a confidence level
+    lo, hi = -6.0, 6.0
+    for _ in range(100):
+        mid = (lo + hi) / 2
+        if math.erf(mid) < y:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+class GtPrbsBer():
+    """
+    PRBS bit error rate soak test of many Gtxe2Channel/Gtye4Channel lanes.
+
+    The PRBS checkers (RXPRBSSEL) are selected through the GT ports by the
+    firmware.  Every interval the RX_PRBS_ERR_CNT counters of all the lanes
+    are read in one batch of queued DRP reads.  The counters are never reset:
+    the deltas are taken modulo the counter width and accumulated on the host
+    in 64 bits, so counter wrap is handled.  The test stops as soon as every
+    lane has proven targetBer (upper confidence limit below the target) or
+    after maxDuration seconds.
+
+    channels    : GT channel devices
+    lineRate    : line rate in bits/s (a scalar or one per lane)
+    errLoopback : when not None, the RXPRBS_ERR_LOOPBACK value to configure
+    """
+    def __init__(self,
+            channels,
+            lineRate,
+            targetBer   = 1e-12,
+            confidence  = 0.95,
+            interval    = 1.0,
+            maxDuration = None,
+            errLoopback = None):
+        self.channels    = list(channels)
+        self.lineRate    = np.broadcast_to(np.asarray(lineRate, dtype=np.float64), (len(self.channels),))
+        self.targetBer   = targetBer
+        self.confidence  = confidence
+        self.interval    = interval
+        self.maxDuration = maxDuration
+        self.errLoopback = errLoopback
+
+        # Group the lanes per channel type so each group shares the counter address
+        self._groups = {}
+        self._wrap   = np.zeros(len(self.channels), dtype=np.uint64)
+        for i, ch in enumerate(self.channels):
+            kind = next((k for k in PRBS_ERR_CNT if isinstance(ch, k)), None)
+            if kind is None:
+                raise TypeError(f'{ch.path}: RX_PRBS_ERR_CNT not supported for {type(ch).__name__}')
+            self._groups.setdefault(kind, []).append(i)
+            self._wrap[i] = 1 << (16*PRBS_ERR_CNT[kind][1])
+
+    def _readCounters(self):
+        counts = np.zeros(len(self.channels), dtype=np.uint64)
+        for kind, lanes in self._groups.items():
+            addr, numWords, _ = PRBS_ERR_CNT[kind]
+            words = drpReadMany([self.channels[i] for i in lanes], addr, numWords).astype(np.uint64)
+            counts[lanes] = sum(words[:, n] << np.uint64(16*n) for n in range(numWords))
+        return counts
+
+    def start(self):
+        """
+        Configure the loopback, take the counter baseline and clear the results
+        """
+        if self.errLoopback is not None:
+            for kind, lanes in self._groups.items():
+                addr, bit = PRBS_ERR_CNT[kind][2]
+                for i in lanes:
+                    word = int(drpRead(self.channels[i], addr)[0])
+                    word = (word & ~(1 << bit)) | ((1 if self.errLoopback else 0) << bit)
+                    drpWrite(self.channels[i], [(addr, word)])
+
+        self._last   = self._readCounters()
+        self._t0     = time.monotonic()
+        self.errors  = np.zeros(len(self.channels), dtype=np.uint64)
+        self.elapsed = 0.0
+        self.history = {'time' : [], 'errors' : []}
+
+    def sample(self):
+        """
+        Read all the counters once and accumulate the errors since the last sample
+        """
+        counts = self._readCounters()
+        self.elapsed = time.monotonic() - self._t0
+
+        # Modulo arithmetic on the counter width absorbs a wrap between samples
+        self.errors += (counts + self._wrap - self._last) % self._wrap
+        self._last   = counts
+
+        self.history['time'].append(self.elapsed)
+        self.history['errors'].append(self.errors.copy())
+
+    @property
+    def bits(self):
+        return self.lineRate * self.elapsed
+
+    @property
+    def ber(self):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self.errors / self.bits
+
+    @property
+    def limits(self):
+        """
+        (lower, upper) BER confidence limits of every lane
+        """
+        lam = np.array([poissonLimits(int(k), self.confidence) for k in self.errors])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return lam[:, 0] / self.bits, lam[:, 1] / self.bits
+
+    @property
+    def proven(self):
+        return self.limits[1] < self.targetBer
+
+    def run(self):
+        """
+        Run the soak test until every lane has proven targetBer or maxDuration
+        is reached.  Returns the per-lane proven flags.
+        """
+        self.start()
+        while True:
+            time.sleep(self.interval)
+            self.sample()
+            if self.proven.all() or ((self.maxDuration is not None) and (self.elapsed >= self.maxDuration)):
+                return self.proven
+
+    def requiredTime(self, ber):
+        """
+        The number of seconds each lane must run error free
+        to prove ber at the configured confidence
+        """
+        return -math.log(1-self.confidence) / (ber * self.lineRate)
+
+    def save(self, filename):
+        """
+        Save the error time series to a .csv (time then one column per lane) or a numpy .npz file
+        """
+        t      = np.array(self.history['time'])
+        errors = np.array(self.history['errors']).reshape(len(t), len(self.channels))
+        if filename.endswith('.csv'):
+            header = ','.join(['time'] + [ch.path for ch in self.channels])
+            np.savetxt(filename, np.column_stack([t, errors]), delimiter=',', header=header, comments='')
+        else:
+            lower, upper = self.limits
+            np.savez(filename, time=t, errors=errors, lineRate=self.lineRate, ber=self.ber, lower=lower, upper=upper,
+                     lanes=np.array([ch.path for ch in self.channels]))
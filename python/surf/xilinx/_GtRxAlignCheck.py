@@ -14,6 +14,9 @@
 #-----------------------------------------------------------------------------
 
 import pyrogue as pr
+import numpy as np
+
+PHASE_BINS = 40
 
 class GtRxAlignCheck(pr.Device):
     def __init__(   self,
@@ -26,31 +29,30 @@ class GtRxAlignCheck(pr.Device):
         # Variables
         ##############################
 
-        # self.addRemoteVariables(
-            # name         = "PhaseCount",
-            # description  = "Timing frame phase",
-            # offset       =  0x00,
-            # bitSize      =  16,
-            # bitOffset    =  0,
-            # mode         = "RO",
-            # pollInterval = 1,
-            # number       =  128,
-            # stride       =  2,
-            # hidden       =  True,
-        # )
-
-        self.addRemoteVariables(
+        # Histogram of the comma alignment latency: 40 8-bit counters packed
+        # 4 per word, read as one array in a single block transaction
+        self.add(pr.RemoteVariable(
             name         = "PhaseCount",
-            description  = "Timing frame phase",
+            description  = "Timing frame phase histogram",
             offset       =  0x00,
-            bitSize      =  32,
+            bitSize      =  8*PHASE_BINS,
             bitOffset    =  0,
+            numValues    =  PHASE_BINS,
+            valueBits    =  8,
+            valueStride  =  8,
+            base         = pr.UInt,
             mode         = "RO",
             pollInterval = 1,
-            number       =  64,
-            stride       =  4,
             hidden       =  True,
-        )
+        ))
+
+        self.add(pr.LinkVariable(
+            name         = "PhaseMostLikely",
+            description  = "Most frequent timing frame phase of the histogram",
+            mode         = 'RO',
+            dependencies = [self.PhaseCount],
+            linkedGet    = lambda read: int(np.argmax(self.PhaseCount.get(read=read))),
+        ))
 
         self.add(pr.RemoteVariable(
             name         = "PhaseTarget",
@@ -184,3 +186,48 @@ class GtRxAlignCheck(pr.Device):
             linkedGet    = lambda read: self.RefClkFreqRaw.get(read=read) * 1.0e-6,
             disp         = '{:0.3f}',
         ))
+
+    def phaseHistogram(self, read=True):
+        """
+        Return the phase histogram as a numpy array, one block read
+        """
+        return np.asarray(self.PhaseCount.get(read=read), dtype=np.int64)
+
+    def analyzePhase(self, hist=None, read=True):
+        """
+        Host side analysis of the phase histogram against PhaseTarget/Mask.
+
+        Returns a dict with the number of samples, the most likely phase, the
+        mean and spread (standard deviation) of the phase, the fraction of the
+        samples which satisfy ((phase ^ PhaseTarget) & Mask) == 0, the expected
+        number of transceiver resets before a lock and whether the most likely
+        phase is accepted by the target (stable).
+        """
+        if hist is None:
+            hist = self.phaseHistogram(read=read)
+        hist   = np.asarray(hist, dtype=np.int64)
+        phase  = np.arange(len(hist))
+        total  = int(hist.sum())
+        target = self.PhaseTarget.get(read=read)
+        mask   = self.Mask.get(read=read)
+
+        accept = ((phase ^ target) & mask) == 0
+        good   = int(hist[accept].sum())
+
+        if total == 0:
+            return {'total': 0, 'mostLikely': None, 'mean': None, 'spread': None,
+                    'acceptFraction': None, 'expectedResets': None, 'stable': False}
+
+        mean  = float((phase * hist).sum() / total)
+        best  = int(np.argmax(hist))
+        frac  = good / total
+
+        return {
+            'total'          : total,
+            'mostLikely'     : best,
+            'mean'           : mean,
+            'spread'         : float(np.sqrt((((phase - mean) ** 2) * hist).sum() / total)),
+            'acceptFraction' : frac,
+            'expectedResets' : (1 / frac - 1) if good > 0 else float('inf'),
+            'stable'         : bool(accept[best]),
+        }
@@ -13,2541 +13,270 @@
 
 import pyrogue as pr
 
+from surf.xilinx._GtDrp import addDrpVariables
+
+# DRP attributes: (name, DRP address, bitSize, bitOffset, mode[, RemoteVariable kwargs])
+GTPE2_CHANNEL_DRP = (
+    ('ACJTAG_RESET',               0x000,  1, 15, 'RW'),
+    ('ACJTAG_DEBUG_MODE',          0x000,  1, 14, 'RW'),
+    ('ACJTAG_MODE',                0x000,  1, 13, 'RW'),
+    ('UCODEER_CLR',                0x000,  1,  1, 'RW'),
+    ('RXBUFRESET_TIME',            0x00C,  5, 11, 'RW'),
+    ('RXCDRPHRESET_TIME',          0x00D,  5, 10, 'RW'),
+    ('RXCDRFREQRESET_TIME',        0x00D,  5,  5, 'RW'),
+    ('RXPMARESET_TIME',            0x00D,  5,  0, 'RW'),
+    ('RXPCSRESET_TIME',            0x00E,  5,  7, 'RW'),
+    ('RXLPMRESET_TIME',            0x00E,  7,  0, 'RW'),
+    ('RXISCANRESET_TIME',          0x00F,  5,  7, 'RW'),
+    ('RXSYNC_OVRD',                0x010,  1, 15, 'RW'),
+    ('TXSYNC_OVRD',                0x010,  1, 14, 'RW'),
+    ('RXSYNC_SKIP_DA',             0x010,  1, 13, 'RW'),
+    ('TXSYNC_SKIP_DA',             0x010,  1, 12, 'RW'),
+    ('TXSYNC_MULTILANE',           0x010,  1, 11, 'RW'),
+    ('RXSYNC_MULTILANE',           0x010,  1, 10, 'RW'),
+    ('TXPCSRESET_TIME',            0x010,  5,  5, 'RW'),
+    ('TXPMARESET_TIME',            0x010,  5,  0, 'RW'),
+    ('RX_XCLK_SEL',                0x011,  1, 14, 'RW'),
+    ('RX_DATA_WIDTH',              0x011,  3, 11, 'RW'),
+    ('RX_CLK25_DIV',               0x011,  5,  6, 'RW'),
+    ('RX_CM_SEL',                  0x011,  2,  4, 'RW'),
+    ('RXPRBS_ERR_LOOPBACK',        0x011,  1,  0, 'RW'),
+    ('SATA_BURST_SEQ_LEN',         0x012,  4, 12, 'RW'),
+    ('OUTREFCLK_SEL_INV',          0x012,  2, 10, 'RW'),
+    ('SATA_BURST_VAL',             0x012,  3,  7, 'RW'),
+    ('RXOOB_CFG',                  0x012,  7,  0, 'RW'),
+    ('SAS_MIN_COM',                0x013,  6,  9, 'RW'),
+    ('SATA_MIN_BURST',             0x013,  6,  3, 'RW'),
+    ('SATA_EIDLE_VAL',             0x013,  3,  0, 'RW'),
+    ('SATA_MIN_WAKE',              0x014,  6,  6, 'RW'),
+    ('SATA_MIN_INIT',              0x014,  6,  0, 'RW'),
+    ('SAS_MAX_COM',                0x015,  7,  6, 'RW'),
+    ('SATA_MAX_BURST',             0x015,  6,  0, 'RW'),
+    ('SATA_MAX_WAKE',              0x016,  6,  6, 'RW'),
+    ('SATA_MAX_INIT',              0x016,  6,  0, 'RW'),
+    ('RXOSCALRESET_TIMEOUT',       0x017,  5, 11, 'RW'),
+    ('RXOSCALRESET_TIME',          0x017,  5,  6, 'RW'),
+    ('TRANS_TIME_RATE',            0x018,  8,  0, 'RW'),
+    ('PMA_LOOPBACK_CFG',           0x019,  1, 15, 'RW'),
+    ('TX_PREDRIVER_MODE',          0x019,  1, 12, 'RW'),
+    ('TX_EIDLE_DEASSERT_DELAY',    0x019,  3,  9, 'RW'),
+    ('TX_EIDLE_ASSERT_DELAY',      0x019,  3,  6, 'RW'),
+    ('TX_LOOPBACK_DRIVE_HIZ',      0x019,  1,  5, 'RW'),
+    ('TX_DRIVE_MODE',              0x019,  5,  0, 'RW'),
+    ('PD_TRANS_TIME_TO_P2',        0x01A,  8,  8, 'RW'),
+    ('PD_TRANS_TIME_NONE_P2',      0x01A,  8,  0, 'RW'),
+    ('PD_TRANS_TIME_FROM_P2',      0x01B, 12,  1, 'RW'),
+    ('PCS_PCIE_EN',                0x01B,  1,  0, 'RW'),
+    ('TXBUF_RESET_ON_RATE_CHANGE', 0x01C,  1, 15, 'RW'),
+    ('TXBUF_EN',                   0x01C,  1, 14, 'RW'),
+    ('TXGEARBOX_EN',               0x01C,  1,  5, 'RW'),
+    ('GEARBOX_MODE',               0x01C,  3,  0, 'RW'),
+    ('RXLPM_HOLD_DURING_EIDLE',    0x01E,  1, 14, 'RW'),
+    ('RX_OS_CFG',                  0x024, 13,  0, 'RW'),
+    ('RXLPM_LF_CFG_WRD1',          0x02A,  2, 14, 'RW'),
+    ('RXLPM_HF_CFG',               0x02A, 14,  0, 'RW'),
+    ('RXLPM_LF_CFG_WRD0',          0x02B, 16,  0, 'RW'),
+    ('ES_QUALIFIER_WRD0',          0x02C, 16,  0, 'RW'),
+    ('ES_QUALIFIER_WRD1',          0x02D, 16,  0, 'RW'),
+    ('ES_QUALIFIER_WRD2',          0x02E, 16,  0, 'RW'),
+    ('ES_QUALIFIER_WRD3',          0x02F, 16,  0, 'RW'),
+    ('ES_QUALIFIER_WRD4',          0x030, 16,  0, 'RW'),
+    ('ES_SDATA_MASK_WRD0',         0x036, 16,  0, 'RW'),
+    ('ES_SDATA_MASK_WRD1',         0x037, 16,  0, 'RW'),
+    ('ES_SDATA_MASK_WRD2',         0x038, 16,  0, 'RW'),
+    ('ES_SDATA_MASK_WRD3',         0x039, 16,  0, 'RW'),
+    ('ES_SDATA_MASK_WRD4',         0x03A, 16,  0, 'RW'),
+    ('ES_PRESCALE',                0x03B,  5, 11, 'RW'),
+    ('ES_VERT_OFFSET',             0x03B,  9,  0, 'RW'),
+    ('ES_HORZ_OFFSET',             0x03C, 12,  0, 'RW'),
+    ('RX_DISPERR_SEQ_MATCH',       0x03D,  1, 15, 'RW'),
+    ('DEC_PCOMMA_DETECT',          0x03D,  1, 14, 'RW'),
+    ('DEC_MCOMMA_DETECT',          0x03D,  1, 13, 'RW'),
+    ('DEC_VALID_COMMA_ONLY',       0x03D,  1, 12, 'RW'),
+    ('ES_ERRDET_EN',               0x03D,  1,  9, 'RW'),
+    ('ES_EYE_SCAN_EN',             0x03D,  1,  8, 'RW'),
+    ('ES_CONTROL',                 0x03D,  6,  0, 'RW'),
+    ('ALIGN_COMMA_ENABLE',         0x03E,  9,  0, 'RW'),
+    ('ALIGN_MCOMMA_VALUE',         0x03F,  9,  0, 'RW'),
+    ('RXSLIDE_MODE',               0x040,  2, 14, 'RW'),
+    ('ALIGN_PCOMMA_VALUE',         0x040, 10,  0, 'RW'),
+    ('ALIGN_COMMA_WORD',           0x041,  2, 13, 'RW'),
+    ('RX_SIG_VALID_DLY',           0x041,  5,  8, 'RW'),
+    ('ALIGN_PCOMMA_DET',           0x041,  1,  7, 'RW'),
+    ('ALIGN_MCOMMA_DET',           0x041,  1,  6, 'RW'),
+    ('SHOW_REALIGN_COMMA',         0x041,  1,  5, 'RW'),
+    ('ALIGN_COMMA_DOUBLE',         0x041,  1,  4, 'RW'),
+    ('RXSLIDE_AUTO_WAIT',          0x041,  4,  0, 'RW'),
+    ('CLK_CORRECT_USE',            0x044,  1, 14, 'RW'),
+    ('CLK_COR_SEQ_1_ENABLE',       0x044,  4, 10, 'RW'),
+    ('CLK_COR_SEQ_1_1',            0x044, 10,  0, 'RW'),
+    ('CLK_COR_MAX_LAT',            0x045,  6, 10, 'RW'),
+    ('CLK_COR_SEQ_1_2',            0x045, 10,  0, 'RW'),
+    ('CLK_COR_MIN_LAT',            0x046,  6, 10, 'RW'),
+    ('CLK_COR_SEQ_1_3',            0x046, 10,  0, 'RW'),
+    ('CLK_COR_REPEAT_WAIT',        0x047,  5, 10, 'RW'),
+    ('CLK_COR_SEQ_1_4',            0x047, 10,  0, 'RW'),
+    ('CLK_COR_SEQ_2_USE',          0x048,  1, 14, 'RW'),
+    ('CLK_COR_SEQ_2_ENABLE',       0x048,  4, 10, 'RW'),
+    ('CLK_COR_SEQ_2_1',            0x048, 10,  0, 'RW'),
+    ('CLK_COR_KEEP_IDLE',          0x049,  1, 14, 'RW'),
+    ('CLK_COR_PRECEDENCE',         0x049,  1, 12, 'RW'),
+    ('CLK_COR_SEQ_LEN',            0x049,  2, 10, 'RW'),
+    ('CLK_COR_SEQ_2_2',            0x049, 10,  0, 'RW'),
+    ('CLK_COR_SEQ_2_3',            0x04A, 10,  0, 'RW'),
+    ('RXGEARBOX_EN',               0x04B,  1, 15, 'RW'),
+    ('CLK_COR_SEQ_2_4',            0x04B, 10,  0, 'RW'),
+    ('CHAN_BOND_SEQ_1_ENABLE',     0x04C,  4, 12, 'RW'),
+    ('CHAN_BOND_SEQ_1_1',          0x04C, 10,  0, 'RW'),
+    ('CHAN_BOND_SEQ_LEN',          0x04D,  2, 14, 'RW'),
+    ('CHAN_BOND_SEQ_1_2',          0x04D, 10,  0, 'RW'),
+    ('CHAN_BOND_KEEP_ALIGN',       0x04E,  1, 15, 'RW'),
+    ('CHAN_BOND_SEQ_1_3',          0x04E, 10,  0, 'RW'),
+    ('CHAN_BOND_SEQ_1_4',          0x04F, 10,  0, 'RW'),
+    ('CHAN_BOND_SEQ_2_ENABLE',     0x050,  4, 12, 'RW'),
+    ('CHAN_BOND_SEQ_2_USE',        0x050,  1, 11, 'RW'),
+    ('CHAN_BOND_SEQ_2_1',          0x050, 10,  0, 'RW'),
+    ('FTS_LANE_DESKEW_CFG',        0x051,  4, 12, 'RW'),
+    ('FTS_LANE_DESKEW_EN',         0x051,  1, 11, 'RW'),
+    ('CHAN_BOND_SEQ_2_2',          0x051, 10,  0, 'RW'),
+    ('FTS_DESKEW_SEQ_ENABLE',      0x052,  4, 12, 'RW'),
+    ('CBCC_DATA_SOURCE_SEL',       0x052,  1, 11, 'RW'),
+    ('CHAN_BOND_SEQ_2_3',          0x052, 10,  0, 'RW'),
+    ('CHAN_BOND_MAX_SKEW',         0x053,  4, 12, 'RW'),
+    ('CHAN_BOND_SEQ_2_4',          0x053, 10,  0, 'RW'),
+    ('RXDLY_TAP_CFG',              0x054, 16,  0, 'RW'),
+    ('RXDLY_CFG',                  0x055, 16,  0, 'RW'),
+    ('RXPH_MONITOR_SEL',           0x057,  5,  8, 'RW'),
+    ('RX_DDI_SEL',                 0x057,  6,  0, 'RW'),
+    ('TX_XCLK_SEL',                0x059,  1,  7, 'RW'),
+    ('RXBUF_EN',                   0x059,  1,  6, 'RW'),
+    ('TXOOB_CFG',                  0x05A,  1,  9, 'RW'),
+    ('LOOPBACK_CFG',               0x05A,  1,  8, 'RW'),
+    ('TXPI_CFG5',                  0x05D,  3,  8, 'RW'),
+    ('TXPI_CFG4',                  0x05D,  1,  7, 'RW'),
+    ('TXPI_CFG3',                  0x05D,  1,  6, 'RW'),
+    ('TXPI_CFG2',                  0x05D,  2,  4, 'RW'),
+    ('TXPI_CFG1',                  0x05D,  2,  2, 'RW'),
+    ('TXPI_CFG0',                  0x05D,  2,  0, 'RW'),
+    ('SATA_PLL_CFG',               0x05E,  2, 14, 'RW'),
+    ('TXPHDLY_CFG_WRD0',           0x060, 16,  0, 'RW'),
+    ('TXPHDLY_CFG_WRD1',           0x061,  8,  0, 'RW'),
+    ('TXDLY_CFG',                  0x062, 16,  0, 'RW'),
+    ('TXDLY_TAP_CFG',              0x063, 16,  0, 'RW'),
+    ('TXPH_CFG',                   0x064, 16,  0, 'RW'),
+    ('TXPH_MONITOR_SEL',           0x065,  5,  8, 'RW'),
+    ('RX_BIAS_CFG',                0x066, 16,  0, 'RW'),
+    ('RXOOB_CLK_CFG',              0x068,  1,  3, 'RW'),
+    ('TX_CLKMUX_EN',               0x068,  1,  1, 'RW'),
+    ('RX_CLKMUX_EN',               0x068,  1,  0, 'RW'),
+    ('TERM_RCAL_CFG',              0x069, 15,  0, 'RW'),
+    ('TX_CLK25_DIV',               0x06A,  5,  0, 'RW'),
+    ('PMA_RSV5',                   0x06B,  1, 15, 'RW'),
+    ('PMA_RSV4',                   0x06B,  4,  8, 'RW'),
+    ('TX_DATA_WIDTH',              0x06B,  3,  0, 'RW'),
+    ('PCS_RSVD_ATTR_WRD0',         0x06F, 16,  0, 'RW'),
+    ('PCS_RSVD_ATTR_WRD1',         0x070, 16,  0, 'RW'),
+    ('PCS_RSVD_ATTR_WRD2',         0x071, 16,  0, 'RW'),
+    ('TX_MARGIN_FULL_1',           0x075,  7,  8, 'RW'),
+    ('TX_MARGIN_FULL_0',           0x075,  7,  0, 'RW'),
+    ('TX_MARGIN_FULL_3',           0x076,  7,  8, 'RW'),
+    ('TX_MARGIN_FULL_2',           0x076,  7,  0, 'RW'),
+    ('TX_MARGIN_LOW_0',            0x077,  7,  8, 'RW'),
+    ('TX_MARGIN_FULL_4',           0x077,  7,  0, 'RW'),
+    ('TX_MARGIN_LOW_2',            0x078,  7,  8, 'RW'),
+    ('TX_MARGIN_LOW_1',            0x078,  7,  0, 'RW'),
+    ('TX_MARGIN_LOW_4',            0x079,  7,  8, 'RW'),
+    ('TX_MARGIN_LOW_3',            0x079,  7,  0, 'RW'),
+    ('TX_DEEMPH1',                 0x07A,  6,  8, 'RW'),
+    ('TX_DEEMPH0',                 0x07A,  6,  0, 'RW'),
+    ('TX_RXDETECT_REF',            0x07C,  3,  8, 'RW'),
+    ('TX_MAINCURSOR_SEL',          0x07C,  1,  3, 'RW'),
+    ('PMA_RSV3',                   0x07C,  2,  0, 'RW'),
+    ('PMA_RSV7',                   0x07D,  1, 15, 'RW'),
+    ('PMA_RSV6',                   0x07D,  1, 14, 'RW'),
+    ('TX_RXDETECT_CFG',            0x07D, 14,  0, 'RW'),
+    ('CLK_COMMON_SWING',           0x07E,  1, 15, 'RW'),
+    ('RX_CM_TRIM',                 0x07E,  4,  0, 'RW'),
+    ('RXLPM_CFG1',                 0x081,  1,  4, 'RW'),
+    ('RXLPM_CFG',                  0x081,  4,  0, 'RW'),
+    ('PMA_RSV2_WRD0',              0x082, 16,  0, 'RW'),
+    ('PMA_RSV2_WRD1',              0x083, 16,  0, 'RW'),
+    ('DMONITOR_CFG_WRD0',          0x086, 16,  0, 'RW'),
+    ('DMONITOR_CFG_WRD1',          0x087,  8,  0, 'RW'),
+    ('RXLPM_BIAS_STARTUP_DISABLE', 0x088,  1, 15, 'RW'),
+    ('RXLPM_HF_CFG3',              0x088,  4, 11, 'RW'),
+    ('TXOUT_DIV',                  0x088,  3,  4, 'RW'),
+    ('RXOUT_DIV',                  0x088,  3,  0, 'RW'),
+    ('CFOK_CFG_WRD0',              0x089, 16,  0, 'RW'),
+    ('CFOK_CFG_WRD1',              0x08A, 16,  0, 'RW'),
+    ('CFOK_CFG_WRD2',              0x08B, 11,  0, 'RW'),
+    ('CFOK_CFG3',                  0x08C,  7,  0, 'RW'),
+    ('RXPI_CFG0',                  0x08D,  3, 13, 'RW'),
+    ('RXLPM_CM_CFG',               0x08D,  1, 12, 'RW'),
+    ('CFOK_CFG5',                  0x08D,  2, 10, 'RW'),
+    ('RXLPM_LF_CFG2',              0x08D,  5,  5, 'RW'),
+    ('RXLPM_HF_CFG2',              0x08D,  5,  0, 'RW'),
+    ('RXLPM_IPCM_CFG',             0x08E,  1, 15, 'RW'),
+    ('RXLPM_INCM_CFG',             0x08E,  1, 14, 'RW'),
+    ('CFOK_CFG4',                  0x08E,  1, 13, 'RW'),
+    ('CFOK_CFG6',                  0x08E,  4,  9, 'RW'),
+    ('RXLPM_GC_CFG',               0x08E,  9,  0, 'RW'),
+    ('RXLPM_GC_CFG2',              0x08F,  3,  5, 'RW'),
+    ('RXPI_CFG1',                  0x08F,  1,  4, 'RW'),
+    ('RXPI_CFG2',                  0x08F,  1,  3, 'RW'),
+    ('RXLPM_OSINT_CFG',            0x08F,  3,  0, 'RW'),
+    ('ES_CLK_PHASE_SEL',           0x091,  1, 15, 'RW'),
+    ('USE_PCS_CLK_PHASE_SEL',      0x091,  1, 14, 'RW'),
+    ('CFOK_CFG2',                  0x091,  7,  6, 'RW'),
+    ('ADAPT_CFG0_WRD0',            0x092, 16,  0, 'RW'),
+    ('ADAPT_CFG0_WRD1',            0x093,  4,  0, 'RW'),
+    ('TXPI_PPM_CFG',               0x095,  8,  0, 'RW'),
+    ('TXPI_GREY_SEL',              0x096,  1,  5, 'RW'),
+    ('TXPI_INVSTROBE_SEL',         0x096,  1,  4, 'RW'),
+    ('TXPI_PPMCLK_SEL',            0x096,  1,  3, 'RW'),
+    ('TXPI_SYNFREQ_PPM',           0x096,  3,  0, 'RW'),
+    ('TST_RSV_WRD0',               0x097, 16,  0, 'RW'),
+    ('TST_RSV_WRD1',               0x098, 16,  0, 'RW'),
+    ('PMA_RSV_WRD0',               0x099, 16,  0, 'RW'),
+    ('PMA_RSV_WRD1',               0x09A, 16,  0, 'RW'),
+    ('RX_BUFFER_CFG',              0x09B,  6,  0, 'RW'),
+    ('RXBUF_THRESH_OVRD',          0x09C,  1,  8, 'RW'),
+    ('RXBUF_RESET_ON_EIDLE',       0x09C,  1,  6, 'RW'),
+    ('RXBUF_THRESH_UNDFLW',        0x09C,  6,  0, 'RW'),
+    ('RXBUF_EIDLE_HI_CNT',         0x09D,  4, 12, 'RW'),
+    ('RXBUF_EIDLE_LO_CNT',         0x09D,  4,  8, 'RW'),
+    ('RXBUF_ADDR_MODE',            0x09D,  1,  7, 'RW'),
+    ('RXBUF_THRESH_OVFLW',         0x09D,  6,  1, 'RW'),
+    ('RX_DEFER_RESET_BUF_EN',      0x09D,  1,  0, 'RW'),
+    ('RXBUF_RESET_ON_COMMAALIGN',  0x09E,  1,  2, 'RW'),
+    ('RXBUF_RESET_ON_RATE_CHANGE', 0x09E,  1,  1, 'RW'),
+    ('RXBUF_RESET_ON_CB_CHANGE',   0x09E,  1,  0, 'RW'),
+    ('TXDLY_LCFG',                 0x09F,  9,  0, 'RW'),
+    ('RXDLY_LCFG',                 0x0A0,  9,  0, 'RW'),
+    ('RXPH_CFG_WRD0',              0x0A1, 16,  0, 'RW'),
+    ('RXPH_CFG_WRD1',              0x0A2,  8,  0, 'RW'),
+    ('RXPHDLY_CFG_WRD0',           0x0A3, 16,  0, 'RW'),
+    ('RXPHDLY_CFG_WRD1',           0x0A4,  8,  0, 'RW'),
+    ('RX_DEBUG_CFG',               0x0A5, 14,  0, 'RW'),
+    ('ES_PMA_CFG',                 0x0A6, 10,  0, 'RW'),
+    ('RXCDR_PH_RESET_ON_EIDLE',    0x0A7,  1, 13, 'RW'),
+    ('RXCDR_FR_RESET_ON_EIDLE',    0x0A7,  1, 12, 'RW'),
+    ('RXCDR_HOLD_DURING_EIDLE',    0x0A7,  1, 11, 'RW'),
+    ('RXCDR_LOCK_CFG',             0x0A7,  6,  0, 'RW'),
+    ('RXCDR_CFG_WRD0',             0x0A8, 16,  0, 'RW'),
+    ('RXCDR_CFG_WRD1',             0x0A9, 16,  0, 'RW'),
+    ('RXCDR_CFG_WRD2',             0x0AA, 16,  0, 'RW'),
+    ('RXCDR_CFG_WRD3',             0x0AB, 16,  0, 'RW'),
+    ('RXCDR_CFG_WRD4',             0x0AC, 16,  0, 'RW'),
+    ('RXCDR_CFG_WRD5',             0x0AD,  3,  0, 'RW'),
+)
+
 class Gtpe2Channel(pr.Device):
-    def __init__(self, **kwargs):
+    def __init__(self, attributes=None, **kwargs):
         super().__init__(**kwargs)
 
         ##############################
         # Variables
         ##############################
 
-        self.add(pr.RemoteVariable(
-            name         = "ACJTAG_RESET",
-            description  = "",
-            offset       =  (0x0000<<2),
-            bitSize      =  1,
-            bitOffset    =  15,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ACJTAG_DEBUG_MODE",
-            description  = "",
-            offset       =  (0x0000<<2),
-            bitSize      =  1,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ACJTAG_MODE",
-            description  = "",
-            offset       =  (0x0000<<2),
-            bitSize      =  1,
-            bitOffset    =  13,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "UCODEER_CLR",
-            description  = "",
-            offset       =  (0x0000<<2),
-            bitSize      =  1,
-            bitOffset    =  1,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXBUFRESET_TIME",
-            description  = "",
-            offset       =  (0x000C<<2),
-            bitSize      =  5,
-            bitOffset    =  11,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXCDRPHRESET_TIME",
-            description  = "",
-            offset       =  (0x000D<<2),
-            bitSize      =  5,
-            bitOffset    =  10,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXCDRFREQRESET_TIME",
-            description  = "",
-            offset       =  (0x000D<<2),
-            bitSize      =  5,
-            bitOffset    =  5,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXPMARESET_TIME",
-            description  = "",
-            offset       =  (0x000D<<2),
-            bitSize      =  5,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXPCSRESET_TIME",
-            description  = "",
-            offset       =  (0x000E<<2),
-            bitSize      =  5,
-            bitOffset    =  7,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPMRESET_TIME",
-            description  = "",
-            offset       =  (0x000E<<2),
-            bitSize      =  7,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXISCANRESET_TIME",
-            description  = "",
-            offset       =  (0x000F<<2),
-            bitSize      =  5,
-            bitOffset    =  7,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXSYNC_OVRD",
-            description  = "",
-            offset       =  (0x0010<<2),
-            bitSize      =  1,
-            bitOffset    =  15,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXSYNC_OVRD",
-            description  = "",
-            offset       =  (0x0010<<2),
-            bitSize      =  1,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXSYNC_SKIP_DA",
-            description  = "",
-            offset       =  (0x0010<<2),
-            bitSize      =  1,
-            bitOffset    =  13,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXSYNC_SKIP_DA",
-            description  = "",
-            offset       =  (0x0010<<2),
-            bitSize      =  1,
-            bitOffset    =  12,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXSYNC_MULTILANE",
-            description  = "",
-            offset       =  (0x0010<<2),
-            bitSize      =  1,
-            bitOffset    =  11,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXSYNC_MULTILANE",
-            description  = "",
-            offset       =  (0x0010<<2),
-            bitSize      =  1,
-            bitOffset    =  10,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPCSRESET_TIME",
-            description  = "",
-            offset       =  (0x0010<<2),
-            bitSize      =  5,
-            bitOffset    =  5,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPMARESET_TIME",
-            description  = "",
-            offset       =  (0x0010<<2),
-            bitSize      =  5,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RX_XCLK_SEL",
-            description  = "",
-            offset       =  (0x0011<<2),
-            bitSize      =  1,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RX_DATA_WIDTH",
-            description  = "",
-            offset       =  (0x0011<<2),
-            bitSize      =  3,
-            bitOffset    =  11,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RX_CLK25_DIV",
-            description  = "",
-            offset       =  (0x0011<<2),
-            bitSize      =  5,
-            bitOffset    =  6,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RX_CM_SEL",
-            description  = "",
-            offset       =  (0x0011<<2),
-            bitSize      =  2,
-            bitOffset    =  4,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXPRBS_ERR_LOOPBACK",
-            description  = "",
-            offset       =  (0x0011<<2),
-            bitSize      =  1,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "SATA_BURST_SEQ_LEN",
-            description  = "",
-            offset       =  (0x0012<<2),
-            bitSize      =  4,
-            bitOffset    =  12,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "OUTREFCLK_SEL_INV",
-            description  = "",
-            offset       =  (0x0012<<2),
-            bitSize      =  2,
-            bitOffset    =  10,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "SATA_BURST_VAL",
-            description  = "",
-            offset       =  (0x0012<<2),
-            bitSize      =  3,
-            bitOffset    =  7,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXOOB_CFG",
-            description  = "",
-            offset       =  (0x0012<<2),
-            bitSize      =  7,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "SAS_MIN_COM",
-            description  = "",
-            offset       =  (0x0013<<2),
-            bitSize      =  6,
-            bitOffset    =  9,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "SATA_MIN_BURST",
-            description  = "",
-            offset       =  (0x0013<<2),
-            bitSize      =  6,
-            bitOffset    =  3,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "SATA_EIDLE_VAL",
-            description  = "",
-            offset       =  (0x0013<<2),
-            bitSize      =  3,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "SATA_MIN_WAKE",
-            description  = "",
-            offset       =  (0x0014<<2),
-            bitSize      =  6,
-            bitOffset    =  6,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "SATA_MIN_INIT",
-            description  = "",
-            offset       =  (0x0014<<2),
-            bitSize      =  6,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "SAS_MAX_COM",
-            description  = "",
-            offset       =  (0x0015<<2),
-            bitSize      =  7,
-            bitOffset    =  6,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "SATA_MAX_BURST",
-            description  = "",
-            offset       =  (0x0015<<2),
-            bitSize      =  6,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "SATA_MAX_WAKE",
-            description  = "",
-            offset       =  (0x0016<<2),
-            bitSize      =  6,
-            bitOffset    =  6,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "SATA_MAX_INIT",
-            description  = "",
-            offset       =  (0x0016<<2),
-            bitSize      =  6,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXOSCALRESET_TIMEOUT",
-            description  = "",
-            offset       =  (0x0017<<2),
-            bitSize      =  5,
-            bitOffset    =  11,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXOSCALRESET_TIME",
-            description  = "",
-            offset       =  (0x0017<<2),
-            bitSize      =  5,
-            bitOffset    =  6,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TRANS_TIME_RATE",
-            description  = "",
-            offset       =  (0x0018<<2),
-            bitSize      =  8,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PMA_LOOPBACK_CFG",
-            description  = "",
-            offset       =  (0x0019<<2),
-            bitSize      =  1,
-            bitOffset    =  15,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_PREDRIVER_MODE",
-            description  = "",
-            offset       =  (0x0019<<2),
-            bitSize      =  1,
-            bitOffset    =  12,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_EIDLE_DEASSERT_DELAY",
-            description  = "",
-            offset       =  (0x0019<<2),
-            bitSize      =  3,
-            bitOffset    =  9,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_EIDLE_ASSERT_DELAY",
-            description  = "",
-            offset       =  (0x0019<<2),
-            bitSize      =  3,
-            bitOffset    =  6,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_LOOPBACK_DRIVE_HIZ",
-            description  = "",
-            offset       =  (0x0019<<2),
-            bitSize      =  1,
-            bitOffset    =  5,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_DRIVE_MODE",
-            description  = "",
-            offset       =  (0x0019<<2),
-            bitSize      =  5,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PD_TRANS_TIME_TO_P2",
-            description  = "",
-            offset       =  (0x001A<<2),
-            bitSize      =  8,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PD_TRANS_TIME_NONE_P2",
-            description  = "",
-            offset       =  (0x001A<<2),
-            bitSize      =  8,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PD_TRANS_TIME_FROM_P2",
-            description  = "",
-            offset       =  (0x001B<<2),
-            bitSize      =  12,
-            bitOffset    =  1,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PCS_PCIE_EN",
-            description  = "",
-            offset       =  (0x001B<<2),
-            bitSize      =  1,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXBUF_RESET_ON_RATE_CHANGE",
-            description  = "",
-            offset       =  (0x001C<<2),
-            bitSize      =  1,
-            bitOffset    =  15,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXBUF_EN",
-            description  = "",
-            offset       =  (0x001C<<2),
-            bitSize      =  1,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXGEARBOX_EN",
-            description  = "",
-            offset       =  (0x001C<<2),
-            bitSize      =  1,
-            bitOffset    =  5,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "GEARBOX_MODE",
-            description  = "",
-            offset       =  (0x001C<<2),
-            bitSize      =  3,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_HOLD_DURING_EIDLE",
-            description  = "",
-            offset       =  (0x001E<<2),
-            bitSize      =  1,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RX_OS_CFG",
-            description  = "",
-            offset       =  (0x0024<<2),
-            bitSize      =  13,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_LF_CFG_WRD1",
-            description  = "",
-            offset       =  (0x002A<<2),
-            bitSize      =  2,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_HF_CFG",
-            description  = "",
-            offset       =  (0x002A<<2),
-            bitSize      =  14,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_LF_CFG_WRD0",
-            description  = "",
-            offset       =  (0x002B<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_QUALIFIER_WRD0",
-            description  = "",
-            offset       =  (0x002C<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_QUALIFIER_WRD1",
-            description  = "",
-            offset       =  (0x002D<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_QUALIFIER_WRD2",
-            description  = "",
-            offset       =  (0x002E<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_QUALIFIER_WRD3",
-            description  = "",
-            offset       =  (0x002F<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_QUALIFIER_WRD4",
-            description  = "",
-            offset       =  (0x0030<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_SDATA_MASK_WRD0",
-            description  = "",
-            offset       =  (0x0036<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_SDATA_MASK_WRD1",
-            description  = "",
-            offset       =  (0x0037<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_SDATA_MASK_WRD2",
-            description  = "",
-            offset       =  (0x0038<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_SDATA_MASK_WRD3",
-            description  = "",
-            offset       =  (0x0039<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_SDATA_MASK_WRD4",
-            description  = "",
-            offset       =  (0x003A<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_PRESCALE",
-            description  = "",
-            offset       =  (0x003B<<2),
-            bitSize      =  5,
-            bitOffset    =  11,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_VERT_OFFSET",
-            description  = "",
-            offset       =  (0x003B<<2),
-            bitSize      =  9,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_HORZ_OFFSET",
-            description  = "",
-            offset       =  (0x003C<<2),
-            bitSize      =  12,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RX_DISPERR_SEQ_MATCH",
-            description  = "",
-            offset       =  (0x003D<<2),
-            bitSize      =  1,
-            bitOffset    =  15,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "DEC_PCOMMA_DETECT",
-            description  = "",
-            offset       =  (0x003D<<2),
-            bitSize      =  1,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "DEC_MCOMMA_DETECT",
-            description  = "",
-            offset       =  (0x003D<<2),
-            bitSize      =  1,
-            bitOffset    =  13,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "DEC_VALID_COMMA_ONLY",
-            description  = "",
-            offset       =  (0x003D<<2),
-            bitSize      =  1,
-            bitOffset    =  12,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_ERRDET_EN",
-            description  = "",
-            offset       =  (0x003D<<2),
-            bitSize      =  1,
-            bitOffset    =  9,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_EYE_SCAN_EN",
-            description  = "",
-            offset       =  (0x003D<<2),
-            bitSize      =  1,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_CONTROL",
-            description  = "",
-            offset       =  (0x003D<<2),
-            bitSize      =  6,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ALIGN_COMMA_ENABLE",
-            description  = "",
-            offset       =  (0x003E<<2),
-            bitSize      =  9,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ALIGN_MCOMMA_VALUE",
-            description  = "",
-            offset       =  (0x003F<<2),
-            bitSize      =  9,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXSLIDE_MODE",
-            description  = "",
-            offset       =  (0x0040<<2),
-            bitSize      =  2,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ALIGN_PCOMMA_VALUE",
-            description  = "",
-            offset       =  (0x0040<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ALIGN_COMMA_WORD",
-            description  = "",
-            offset       =  (0x0041<<2),
-            bitSize      =  2,
-            bitOffset    =  13,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RX_SIG_VALID_DLY",
-            description  = "",
-            offset       =  (0x0041<<2),
-            bitSize      =  5,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ALIGN_PCOMMA_DET",
-            description  = "",
-            offset       =  (0x0041<<2),
-            bitSize      =  1,
-            bitOffset    =  7,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ALIGN_MCOMMA_DET",
-            description  = "",
-            offset       =  (0x0041<<2),
-            bitSize      =  1,
-            bitOffset    =  6,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "SHOW_REALIGN_COMMA",
-            description  = "",
-            offset       =  (0x0041<<2),
-            bitSize      =  1,
-            bitOffset    =  5,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ALIGN_COMMA_DOUBLE",
-            description  = "",
-            offset       =  (0x0041<<2),
-            bitSize      =  1,
-            bitOffset    =  4,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXSLIDE_AUTO_WAIT",
-            description  = "",
-            offset       =  (0x0041<<2),
-            bitSize      =  4,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_CORRECT_USE",
-            description  = "",
-            offset       =  (0x0044<<2),
-            bitSize      =  1,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_SEQ_1_ENABLE",
-            description  = "",
-            offset       =  (0x0044<<2),
-            bitSize      =  4,
-            bitOffset    =  10,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_SEQ_1_1",
-            description  = "",
-            offset       =  (0x0044<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_MAX_LAT",
-            description  = "",
-            offset       =  (0x0045<<2),
-            bitSize      =  6,
-            bitOffset    =  10,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_SEQ_1_2",
-            description  = "",
-            offset       =  (0x0045<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_MIN_LAT",
-            description  = "",
-            offset       =  (0x0046<<2),
-            bitSize      =  6,
-            bitOffset    =  10,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_SEQ_1_3",
-            description  = "",
-            offset       =  (0x0046<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_REPEAT_WAIT",
-            description  = "",
-            offset       =  (0x0047<<2),
-            bitSize      =  5,
-            bitOffset    =  10,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_SEQ_1_4",
-            description  = "",
-            offset       =  (0x0047<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_SEQ_2_USE",
-            description  = "",
-            offset       =  (0x0048<<2),
-            bitSize      =  1,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_SEQ_2_ENABLE",
-            description  = "",
-            offset       =  (0x0048<<2),
-            bitSize      =  4,
-            bitOffset    =  10,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_SEQ_2_1",
-            description  = "",
-            offset       =  (0x0048<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_KEEP_IDLE",
-            description  = "",
-            offset       =  (0x0049<<2),
-            bitSize      =  1,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_PRECEDENCE",
-            description  = "",
-            offset       =  (0x0049<<2),
-            bitSize      =  1,
-            bitOffset    =  12,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_SEQ_LEN",
-            description  = "",
-            offset       =  (0x0049<<2),
-            bitSize      =  2,
-            bitOffset    =  10,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_SEQ_2_2",
-            description  = "",
-            offset       =  (0x0049<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_SEQ_2_3",
-            description  = "",
-            offset       =  (0x004A<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXGEARBOX_EN",
-            description  = "",
-            offset       =  (0x004B<<2),
-            bitSize      =  1,
-            bitOffset    =  15,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COR_SEQ_2_4",
-            description  = "",
-            offset       =  (0x004B<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CHAN_BOND_SEQ_1_ENABLE",
-            description  = "",
-            offset       =  (0x004C<<2),
-            bitSize      =  4,
-            bitOffset    =  12,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CHAN_BOND_SEQ_1_1",
-            description  = "",
-            offset       =  (0x004C<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CHAN_BOND_SEQ_LEN",
-            description  = "",
-            offset       =  (0x004D<<2),
-            bitSize      =  2,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CHAN_BOND_SEQ_1_2",
-            description  = "",
-            offset       =  (0x004D<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CHAN_BOND_KEEP_ALIGN",
-            description  = "",
-            offset       =  (0x004E<<2),
-            bitSize      =  1,
-            bitOffset    =  15,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CHAN_BOND_SEQ_1_3",
-            description  = "",
-            offset       =  (0x004E<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CHAN_BOND_SEQ_1_4",
-            description  = "",
-            offset       =  (0x004F<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CHAN_BOND_SEQ_2_ENABLE",
-            description  = "",
-            offset       =  (0x0050<<2),
-            bitSize      =  4,
-            bitOffset    =  12,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CHAN_BOND_SEQ_2_USE",
-            description  = "",
-            offset       =  (0x0050<<2),
-            bitSize      =  1,
-            bitOffset    =  11,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CHAN_BOND_SEQ_2_1",
-            description  = "",
-            offset       =  (0x0050<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "FTS_LANE_DESKEW_CFG",
-            description  = "",
-            offset       =  (0x0051<<2),
-            bitSize      =  4,
-            bitOffset    =  12,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "FTS_LANE_DESKEW_EN",
-            description  = "",
-            offset       =  (0x0051<<2),
-            bitSize      =  1,
-            bitOffset    =  11,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CHAN_BOND_SEQ_2_2",
-            description  = "",
-            offset       =  (0x0051<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "FTS_DESKEW_SEQ_ENABLE",
-            description  = "",
-            offset       =  (0x0052<<2),
-            bitSize      =  4,
-            bitOffset    =  12,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CBCC_DATA_SOURCE_SEL",
-            description  = "",
-            offset       =  (0x0052<<2),
-            bitSize      =  1,
-            bitOffset    =  11,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CHAN_BOND_SEQ_2_3",
-            description  = "",
-            offset       =  (0x0052<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CHAN_BOND_MAX_SKEW",
-            description  = "",
-            offset       =  (0x0053<<2),
-            bitSize      =  4,
-            bitOffset    =  12,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CHAN_BOND_SEQ_2_4",
-            description  = "",
-            offset       =  (0x0053<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXDLY_TAP_CFG",
-            description  = "",
-            offset       =  (0x0054<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXDLY_CFG",
-            description  = "",
-            offset       =  (0x0055<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXPH_MONITOR_SEL",
-            description  = "",
-            offset       =  (0x0057<<2),
-            bitSize      =  5,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RX_DDI_SEL",
-            description  = "",
-            offset       =  (0x0057<<2),
-            bitSize      =  6,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_XCLK_SEL",
-            description  = "",
-            offset       =  (0x0059<<2),
-            bitSize      =  1,
-            bitOffset    =  7,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXBUF_EN",
-            description  = "",
-            offset       =  (0x0059<<2),
-            bitSize      =  1,
-            bitOffset    =  6,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXOOB_CFG",
-            description  = "",
-            offset       =  (0x005A<<2),
-            bitSize      =  1,
-            bitOffset    =  9,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "LOOPBACK_CFG",
-            description  = "",
-            offset       =  (0x005A<<2),
-            bitSize      =  1,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPI_CFG5",
-            description  = "",
-            offset       =  (0x005D<<2),
-            bitSize      =  3,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPI_CFG4",
-            description  = "",
-            offset       =  (0x005D<<2),
-            bitSize      =  1,
-            bitOffset    =  7,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPI_CFG3",
-            description  = "",
-            offset       =  (0x005D<<2),
-            bitSize      =  1,
-            bitOffset    =  6,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPI_CFG2",
-            description  = "",
-            offset       =  (0x005D<<2),
-            bitSize      =  2,
-            bitOffset    =  4,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPI_CFG1",
-            description  = "",
-            offset       =  (0x005D<<2),
-            bitSize      =  2,
-            bitOffset    =  2,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPI_CFG0",
-            description  = "",
-            offset       =  (0x005D<<2),
-            bitSize      =  2,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "SATA_PLL_CFG",
-            description  = "",
-            offset       =  (0x005E<<2),
-            bitSize      =  2,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPHDLY_CFG_WRD0",
-            description  = "",
-            offset       =  (0x0060<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPHDLY_CFG_WRD1",
-            description  = "",
-            offset       =  (0x0061<<2),
-            bitSize      =  8,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXDLY_CFG",
-            description  = "",
-            offset       =  (0x0062<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXDLY_TAP_CFG",
-            description  = "",
-            offset       =  (0x0063<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPH_CFG",
-            description  = "",
-            offset       =  (0x0064<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPH_MONITOR_SEL",
-            description  = "",
-            offset       =  (0x0065<<2),
-            bitSize      =  5,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RX_BIAS_CFG",
-            description  = "",
-            offset       =  (0x0066<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXOOB_CLK_CFG",
-            description  = "",
-            offset       =  (0x0068<<2),
-            bitSize      =  1,
-            bitOffset    =  3,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_CLKMUX_EN",
-            description  = "",
-            offset       =  (0x0068<<2),
-            bitSize      =  1,
-            bitOffset    =  1,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RX_CLKMUX_EN",
-            description  = "",
-            offset       =  (0x0068<<2),
-            bitSize      =  1,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TERM_RCAL_CFG",
-            description  = "",
-            offset       =  (0x0069<<2),
-            bitSize      =  15,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        # "This feature is intended for internal use only." (UG482)
-        # self.add(pr.RemoteVariable(
-            # name         = "TERM_RCAL_OVRD",
-            # description  = "",
-            # offset       =  (0x006A<<2),
-            # bitSize      =  3,
-            # bitOffset    =  13,
-            # base         = pr.UInt,
-            # mode         = "RW",
-        # ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_CLK25_DIV",
-            description  = "",
-            offset       =  (0x006A<<2),
-            bitSize      =  5,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PMA_RSV5",
-            description  = "",
-            offset       =  (0x006B<<2),
-            bitSize      =  1,
-            bitOffset    =  15,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PMA_RSV4",
-            description  = "",
-            offset       =  (0x006B<<2),
-            bitSize      =  4,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_DATA_WIDTH",
-            description  = "",
-            offset       =  (0x006B<<2),
-            bitSize      =  3,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PCS_RSVD_ATTR_WRD0",
-            description  = "",
-            offset       =  (0x006F<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PCS_RSVD_ATTR_WRD1",
-            description  = "",
-            offset       =  (0x0070<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PCS_RSVD_ATTR_WRD2",
-            description  = "",
-            offset       =  (0x0071<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_MARGIN_FULL_1",
-            description  = "",
-            offset       =  (0x0075<<2),
-            bitSize      =  7,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_MARGIN_FULL_0",
-            description  = "",
-            offset       =  (0x0075<<2),
-            bitSize      =  7,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_MARGIN_FULL_3",
-            description  = "",
-            offset       =  (0x0076<<2),
-            bitSize      =  7,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_MARGIN_FULL_2",
-            description  = "",
-            offset       =  (0x0076<<2),
-            bitSize      =  7,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_MARGIN_LOW_0",
-            description  = "",
-            offset       =  (0x0077<<2),
-            bitSize      =  7,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_MARGIN_FULL_4",
-            description  = "",
-            offset       =  (0x0077<<2),
-            bitSize      =  7,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_MARGIN_LOW_2",
-            description  = "",
-            offset       =  (0x0078<<2),
-            bitSize      =  7,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_MARGIN_LOW_1",
-            description  = "",
-            offset       =  (0x0078<<2),
-            bitSize      =  7,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_MARGIN_LOW_4",
-            description  = "",
-            offset       =  (0x0079<<2),
-            bitSize      =  7,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_MARGIN_LOW_3",
-            description  = "",
-            offset       =  (0x0079<<2),
-            bitSize      =  7,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_DEEMPH1",
-            description  = "",
-            offset       =  (0x007A<<2),
-            bitSize      =  6,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_DEEMPH0",
-            description  = "",
-            offset       =  (0x007A<<2),
-            bitSize      =  6,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_RXDETECT_REF",
-            description  = "",
-            offset       =  (0x007C<<2),
-            bitSize      =  3,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_MAINCURSOR_SEL",
-            description  = "",
-            offset       =  (0x007C<<2),
-            bitSize      =  1,
-            bitOffset    =  3,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PMA_RSV3",
-            description  = "",
-            offset       =  (0x007C<<2),
-            bitSize      =  2,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PMA_RSV7",
-            description  = "",
-            offset       =  (0x007D<<2),
-            bitSize      =  1,
-            bitOffset    =  15,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PMA_RSV6",
-            description  = "",
-            offset       =  (0x007D<<2),
-            bitSize      =  1,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TX_RXDETECT_CFG",
-            description  = "",
-            offset       =  (0x007D<<2),
-            bitSize      =  14,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CLK_COMMON_SWING",
-            description  = "",
-            offset       =  (0x007E<<2),
-            bitSize      =  1,
-            bitOffset    =  15,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RX_CM_TRIM",
-            description  = "",
-            offset       =  (0x007E<<2),
-            bitSize      =  4,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_CFG1",
-            description  = "",
-            offset       =  (0x0081<<2),
-            bitSize      =  1,
-            bitOffset    =  4,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_CFG",
-            description  = "",
-            offset       =  (0x0081<<2),
-            bitSize      =  4,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PMA_RSV2_WRD0",
-            description  = "",
-            offset       =  (0x0082<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PMA_RSV2_WRD1",
-            description  = "",
-            offset       =  (0x0083<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "DMONITOR_CFG_WRD0",
-            description  = "",
-            offset       =  (0x0086<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "DMONITOR_CFG_WRD1",
-            description  = "",
-            offset       =  (0x0087<<2),
-            bitSize      =  8,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_BIAS_STARTUP_DISABLE",
-            description  = "",
-            offset       =  (0x0088<<2),
-            bitSize      =  1,
-            bitOffset    =  15,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_HF_CFG3",
-            description  = "",
-            offset       =  (0x0088<<2),
-            bitSize      =  4,
-            bitOffset    =  11,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXOUT_DIV",
-            description  = "",
-            offset       =  (0x0088<<2),
-            bitSize      =  3,
-            bitOffset    =  4,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXOUT_DIV",
-            description  = "",
-            offset       =  (0x0088<<2),
-            bitSize      =  3,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CFOK_CFG_WRD0",
-            description  = "",
-            offset       =  (0x0089<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CFOK_CFG_WRD1",
-            description  = "",
-            offset       =  (0x008A<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CFOK_CFG_WRD2",
-            description  = "",
-            offset       =  (0x008B<<2),
-            bitSize      =  11,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CFOK_CFG3",
-            description  = "",
-            offset       =  (0x008C<<2),
-            bitSize      =  7,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXPI_CFG0",
-            description  = "",
-            offset       =  (0x008D<<2),
-            bitSize      =  3,
-            bitOffset    =  13,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_CM_CFG",
-            description  = "",
-            offset       =  (0x008D<<2),
-            bitSize      =  1,
-            bitOffset    =  12,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CFOK_CFG5",
-            description  = "",
-            offset       =  (0x008D<<2),
-            bitSize      =  2,
-            bitOffset    =  10,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_LF_CFG2",
-            description  = "",
-            offset       =  (0x008D<<2),
-            bitSize      =  5,
-            bitOffset    =  5,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_HF_CFG2",
-            description  = "",
-            offset       =  (0x008D<<2),
-            bitSize      =  5,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_IPCM_CFG",
-            description  = "",
-            offset       =  (0x008E<<2),
-            bitSize      =  1,
-            bitOffset    =  15,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_INCM_CFG",
-            description  = "",
-            offset       =  (0x008E<<2),
-            bitSize      =  1,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CFOK_CFG4",
-            description  = "",
-            offset       =  (0x008E<<2),
-            bitSize      =  1,
-            bitOffset    =  13,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CFOK_CFG6",
-            description  = "",
-            offset       =  (0x008E<<2),
-            bitSize      =  4,
-            bitOffset    =  9,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_GC_CFG",
-            description  = "",
-            offset       =  (0x008E<<2),
-            bitSize      =  9,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_GC_CFG2",
-            description  = "",
-            offset       =  (0x008F<<2),
-            bitSize      =  3,
-            bitOffset    =  5,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXPI_CFG1",
-            description  = "",
-            offset       =  (0x008F<<2),
-            bitSize      =  1,
-            bitOffset    =  4,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXPI_CFG2",
-            description  = "",
-            offset       =  (0x008F<<2),
-            bitSize      =  1,
-            bitOffset    =  3,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXLPM_OSINT_CFG",
-            description  = "",
-            offset       =  (0x008F<<2),
-            bitSize      =  3,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_CLK_PHASE_SEL",
-            description  = "",
-            offset       =  (0x0091<<2),
-            bitSize      =  1,
-            bitOffset    =  15,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "USE_PCS_CLK_PHASE_SEL",
-            description  = "",
-            offset       =  (0x0091<<2),
-            bitSize      =  1,
-            bitOffset    =  14,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "CFOK_CFG2",
-            description  = "",
-            offset       =  (0x0091<<2),
-            bitSize      =  7,
-            bitOffset    =  6,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ADAPT_CFG0_WRD0",
-            description  = "",
-            offset       =  (0x0092<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ADAPT_CFG0_WRD1",
-            description  = "",
-            offset       =  (0x0093<<2),
-            bitSize      =  4,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPI_PPM_CFG",
-            description  = "",
-            offset       =  (0x0095<<2),
-            bitSize      =  8,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPI_GREY_SEL",
-            description  = "",
-            offset       =  (0x0096<<2),
-            bitSize      =  1,
-            bitOffset    =  5,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPI_INVSTROBE_SEL",
-            description  = "",
-            offset       =  (0x0096<<2),
-            bitSize      =  1,
-            bitOffset    =  4,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPI_PPMCLK_SEL",
-            description  = "",
-            offset       =  (0x0096<<2),
-            bitSize      =  1,
-            bitOffset    =  3,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXPI_SYNFREQ_PPM",
-            description  = "",
-            offset       =  (0x0096<<2),
-            bitSize      =  3,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TST_RSV_WRD0",
-            description  = "",
-            offset       =  (0x0097<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TST_RSV_WRD1",
-            description  = "",
-            offset       =  (0x0098<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PMA_RSV_WRD0",
-            description  = "",
-            offset       =  (0x0099<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "PMA_RSV_WRD1",
-            description  = "",
-            offset       =  (0x009A<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RX_BUFFER_CFG",
-            description  = "",
-            offset       =  (0x009B<<2),
-            bitSize      =  6,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXBUF_THRESH_OVRD",
-            description  = "",
-            offset       =  (0x009C<<2),
-            bitSize      =  1,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXBUF_RESET_ON_EIDLE",
-            description  = "",
-            offset       =  (0x009C<<2),
-            bitSize      =  1,
-            bitOffset    =  6,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXBUF_THRESH_UNDFLW",
-            description  = "",
-            offset       =  (0x009C<<2),
-            bitSize      =  6,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXBUF_EIDLE_HI_CNT",
-            description  = "",
-            offset       =  (0x009D<<2),
-            bitSize      =  4,
-            bitOffset    =  12,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXBUF_EIDLE_LO_CNT",
-            description  = "",
-            offset       =  (0x009D<<2),
-            bitSize      =  4,
-            bitOffset    =  8,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXBUF_ADDR_MODE",
-            description  = "",
-            offset       =  (0x009D<<2),
-            bitSize      =  1,
-            bitOffset    =  7,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXBUF_THRESH_OVFLW",
-            description  = "",
-            offset       =  (0x009D<<2),
-            bitSize      =  6,
-            bitOffset    =  1,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RX_DEFER_RESET_BUF_EN",
-            description  = "",
-            offset       =  (0x009D<<2),
-            bitSize      =  1,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXBUF_RESET_ON_COMMAALIGN",
-            description  = "",
-            offset       =  (0x009E<<2),
-            bitSize      =  1,
-            bitOffset    =  2,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXBUF_RESET_ON_RATE_CHANGE",
-            description  = "",
-            offset       =  (0x009E<<2),
-            bitSize      =  1,
-            bitOffset    =  1,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXBUF_RESET_ON_CB_CHANGE",
-            description  = "",
-            offset       =  (0x009E<<2),
-            bitSize      =  1,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "TXDLY_LCFG",
-            description  = "",
-            offset       =  (0x009F<<2),
-            bitSize      =  9,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXDLY_LCFG",
-            description  = "",
-            offset       =  (0x00A0<<2),
-            bitSize      =  9,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXPH_CFG_WRD0",
-            description  = "",
-            offset       =  (0x00A1<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXPH_CFG_WRD1",
-            description  = "",
-            offset       =  (0x00A2<<2),
-            bitSize      =  8,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXPHDLY_CFG_WRD0",
-            description  = "",
-            offset       =  (0x00A3<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXPHDLY_CFG_WRD1",
-            description  = "",
-            offset       =  (0x00A4<<2),
-            bitSize      =  8,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RX_DEBUG_CFG",
-            description  = "",
-            offset       =  (0x00A5<<2),
-            bitSize      =  14,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "ES_PMA_CFG",
-            description  = "",
-            offset       =  (0x00A6<<2),
-            bitSize      =  10,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXCDR_PH_RESET_ON_EIDLE",
-            description  = "",
-            offset       =  (0x00A7<<2),
-            bitSize      =  1,
-            bitOffset    =  13,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXCDR_FR_RESET_ON_EIDLE",
-            description  = "",
-            offset       =  (0x00A7<<2),
-            bitSize      =  1,
-            bitOffset    =  12,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXCDR_HOLD_DURING_EIDLE",
-            description  = "",
-            offset       =  (0x00A7<<2),
-            bitSize      =  1,
-            bitOffset    =  11,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXCDR_LOCK_CFG",
-            description  = "",
-            offset       =  (0x00A7<<2),
-            bitSize      =  6,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXCDR_CFG_WRD0",
-            description  = "",
-            offset       =  (0x00A8<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXCDR_CFG_WRD1",
-            description  = "",
-            offset       =  (0x00A9<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXCDR_CFG_WRD2",
-            description  = "",
-            offset       =  (0x00AA<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXCDR_CFG_WRD3",
-            description  = "",
-            offset       =  (0x00AB<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXCDR_CFG_WRD4",
-            description  = "",
-            offset       =  (0x00AC<<2),
-            bitSize      =  16,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
-
-        self.add(pr.RemoteVariable(
-            name         = "RXCDR_CFG_WRD5",
-            description  = "",
-            offset       =  (0x00AD<<2),
-            bitSize      =  3,
-            bitOffset    =  0,
-            base         = pr.UInt,
-            mode         = "RW",
-        ))
+        addDrpVariables(self, GTPE2_CHANNEL_DRP, names=attributes)
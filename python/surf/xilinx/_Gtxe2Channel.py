@@ -13,1550 +13,307 @@
 
 import pyrogue as pr
 
+from surf.xilinx._GtDrp import addDrpVariables
+
+_RX_INT_DATAWIDTH_ENUM = {
+    0 : '2-byte',
+    1 : '4-byte',
+}
+
+_RX_DATA_WIDTH_ENUM = {
+    2 : '16',
+    3 : '20',
+    4 : '32',
+    5 : '40',
+    6 : '64',
+    7 : '80',
+}
+
+_TX_DRIVE_MODE_ENUM = {
+    0 : 'DIRECT',
+    1 : 'PIPE',
+    2 : 'PIPEGEN3',
+}
+
+_RXSLIDE_MODE_ENUM = {
+    0 : 'OFF',
+    1 : 'AUTO',
+    2 : 'PCS',
+    3 : 'PMA',
+}
+
+_ALIGN_COMMA_WORD_ENUM = {
+    1 : '1',
+    2 : '2',
+    4 : '4',
+}
+
+_CLK_COR_SEQ_LEN_ENUM = {
+    0 : '1',
+    1 : '2',
+    2 : '3',
+    3 : '4',
+}
+
+_CBCC_DATA_SOURCE_SEL_ENUM = {
+    0 : 'ENCODED',
+    1 : 'DECODED',
+}
+
+_TX_XCLK_SEL_ENUM = {
+    0 : 'TXOUT',
+    1 : 'TXUSR',
+}
+
+_RX_XCLK_SEL_ENUM = {
+    0 : 'RXREC',
+    1 : 'RXUSR',
+}
+
+_SATA_CPLL_CFG_ENUM = {
+    0 : 'VCO_3000MHZ',
+    1 : 'VCO_1500MHZ',
+    2 : 'VCO_750MHZ',
+}
+
+_CPLL_REFCLK_DIV_ENUM = {
+    16 : '1',
+    0 : '2',
+    1 : '3',
+    2 : '4',
+    3 : '5',
+    5 : '6',
+    6 : '8',
+    7 : '10',
+    13 : '12',
+    14 : '16',
+    15 : '20',
+}
+
+_CPLL_FBDIV_45_ENUM = {
+    0 : '4',
+    1 : '5',
+}
+
+_TXOUT_DIV_ENUM = {
+    0 : '1',
+    1 : '2',
+    2 : '4',
+    3 : '8',
+    4 : '16',
+}
+
+_RXBUF_ADDR_MODE_ENUM = {
+    0 : 'FULL',
+    1 : 'FAST',
+}
+
+# DRP attributes: (name, DRP address, bitSize, bitOffset, mode[, RemoteVariable kwargs])
+GTXE2_CHANNEL_DRP = (
+    ('UCODEER_CLR',                  0x000,  1,  1, 'RW'),
+    ('RXDFELPMRESET_TIME',           [0x00D, 0x00E], [1, 6], [15, 0], 'RW'),
+    ('RXCDRPHRESET_TIME',            0x00D,  5, 10, 'RW'),
+    ('RXCDRFREQRESET_TIME',          0x00D,  5,  5, 'RW'),
+    ('RXBUFRESET_TIME',              0x00D,  5,  0, 'RW'),
+    ('RXPCSRESET_TIME',              0x00E,  5, 11, 'RW'),
+    ('RXPMARESET_TIME',              0x00E,  5,  6, 'RW'),
+    ('RXISCANRESET_TIME',            0x00F,  5, 10, 'RW'),
+    ('TXPCSRESET_TIME',              0x00F,  5,  5, 'RW'),
+    ('TXPMARESET_TIME',              0x00F,  5,  0, 'RW'),
+    ('RX_INT_DATAWIDTH',             0x011,  1, 14, 'RW', dict(enum=_RX_INT_DATAWIDTH_ENUM)),
+    ('RX_DATA_WIDTH',                0x011,  3, 11, 'RW', dict(value=2, enum=_RX_DATA_WIDTH_ENUM)),
+    ('RX_CLK25_DIV',                 0x011,  5,  6, 'RW', dict(enum={x: f'{x + 1}' for x in range(32)})),
+    ('RX_CM_SEL',                    0x011,  2,  4, 'RW'),
+    ('RX_CM_TRIM',                   0x011,  3,  1, 'RW'),
+    ('RXPRBS_ERR_LOOPBACK',          0x011,  1,  0, 'RW'),
+    ('SATA_BURST_SEQ_LEN',           0x012,  4, 12, 'RW'),
+    ('OUTREFCLK_SEL_INV',            0x012,  2, 10, 'RW'),
+    ('SATA_BURST_VAL',               0x012,  3,  7, 'RW'),
+    ('RXOOB_CFG',                    0x012,  7,  0, 'RW'),
+    ('SAS_MIN_COM',                  0x013,  6,  9, 'RW'),
+    ('SATA_MIN_BURST',               0x013,  6,  3, 'RW'),
+    ('SATA_EIDLE_VAL',               0x013,  3,  0, 'RW'),
+    ('SATA_MIN_WAKE',                0x014,  6,  6, 'RW'),
+    ('SATA_MIN_INIT',                0x014,  6,  0, 'RW'),
+    ('SAS_MAX_COM',                  0x015,  7,  6, 'RW'),
+    ('SATA_MAX_BURST',               0x015,  6,  0, 'RW'),
+    ('SATA_MAX_WAKE',                0x016,  6,  6, 'RW'),
+    ('SATA_MAX_INIT',                0x016,  6,  0, 'RW'),
+    ('TRANS_TIME_RATE',              0x018,  8,  0, 'RW'),
+    ('TX_PREDRIVER_MODE',            0x019,  1, 12, 'RW'),
+    ('TX_EIDLE_DEASSERT_DELAY',      0x019,  3,  9, 'RW'),
+    ('TX_EIDLE_ASSERT_DELAY',        0x019,  3,  6, 'RW'),
+    ('TX_LOOPBACK_DRIVE_HIZ',        0x019,  1,  5, 'RW', dict(base=pr.Bool)),
+    ('TX_DRIVE_MODE',                0x019,  5,  0, 'RW', dict(enum=_TX_DRIVE_MODE_ENUM)),
+    ('PD_TRANS_TIME_TO_P2',          0x01A,  8,  8, 'RW'),
+    ('PD_TRANS_TIME_NONE_P2',        0x01A,  8,  0, 'RW'),
+    ('PD_TRANS_TIME_FROM_P2',        0x01B, 12,  1, 'RW'),
+    ('PCS_PCIE_EN',                  0x01B,  1,  0, 'RW', dict(base=pr.Bool)),
+    ('TXBUF_RESET_ON_RATE_CHANGE',   0x01C,  1, 15, 'RW', dict(base=pr.Bool)),
+    ('TXBUF_EN',                     0x01C,  1, 14, 'RW', dict(base=pr.Bool)),
+    ('TXGEARBOX_EN',                 0x01C,  1,  5, 'RW', dict(base=pr.Bool)),
+    ('GEARBOX_MODE',                 0x01C,  3,  0, 'RW'),
+    ('RX_DFE_GAIN_CFG',              [0x01D, 0x01E], [16, 7], [0, 0], 'RW'),
+    ('RX_DFE_LPM_HOLD_DURING_EIDLE', 0x01E,  1, 14, 'RW'),
+    ('RX_DFE_H2_CFG',                0x01F, 12,  0, 'RW'),
+    ('RX_DFE_H3_CFG',                0x020, 12,  0, 'RW'),
+    ('RX_DFE_H4_CFG',                0x021, 11,  0, 'RW'),
+    ('RX_DFE_H5_CFG',                0x022, 11,  0, 'RW'),
+    ('RX_DFE_KL_CFG',                0x023, 13,  0, 'RW'),
+    ('RX_DFE_UT_CFG',                [0x024, 0x025], [1, 16], [15, 0], 'RW'),
+    ('RX_OS_CFG',                    0x024, 13,  0, 'RW'),
+    ('RX_DFE_VP_CFG',                [0x026, 0x027], [16, 1], [0, 0], 'RW'),
+    ('RX_DFE_XYD_CFG',               0x028, 13,  0, 'RW'),
+    ('RX_DFE_LPM_CFG',               0x029, 16,  0, 'RW'),
+    ('RXLPM_HF_CFG',                 0x02A, 14,  0, 'RW'),
+    ('RXLPM_LF_CFG',                 0x02B, 14,  0, 'RW'),
+    ('ES_QUALIFIER',                 [0x02C, 0x02D, 0x02E, 0x02F, 0x030], [16, 16, 16, 16, 16], [0, 0, 0, 0, 0], 'RW'),
+    ('ES_QUAL_MASK',                 [0x031, 0x032, 0x033, 0x034, 0x035], [16, 16, 16, 16, 16], [0, 0, 0, 0, 0], 'RW'),
+    ('ES_SDATA_MASK',                [0x036, 0x037, 0x038, 0x039, 0x03A], [16, 16, 16, 16, 16], [0, 0, 0, 0, 0], 'RW'),
+    ('ES_PRESCALE',                  0x03B,  5, 11, 'RW'),
+    ('ES_VERT_OFFSET',               0x03B,  9,  0, 'RW'),
+    ('ES_HORZ_OFFSET',               0x03C, 12,  0, 'RW'),
+    ('RX_DISPERR_SEQ_MATCH',         0x03D,  1, 15, 'RW', dict(base=pr.Bool)),
+    ('DEC_PCOMMA_DETECT',            0x03D,  1, 14, 'RW', dict(base=pr.Bool)),
+    ('DEC_MCOMMA_DETECT',            0x03D,  1, 13, 'RW', dict(base=pr.Bool)),
+    ('DEC_VALID_COMMA_ONLY',         0x03D,  1, 12, 'RW', dict(base=pr.Bool)),
+    ('ES_ERRDET_EN',                 0x03D,  1,  9, 'RW', dict(base=pr.Bool)),
+    ('ES_EYE_SCAN_EN',               0x03D,  1,  8, 'RW', dict(base=pr.Bool)),
+    ('ES_CONTROL',                   0x03D,  6,  0, 'RW'),
+    ('ALIGN_COMMA_ENABLE',           0x03E, 10,  0, 'RW'),
+    ('ALIGN_MCOMMA_VALUE',           0x03F, 10,  0, 'RW'),
+    ('RXSLIDE_MODE',                 0x040,  2, 14, 'RW', dict(enum=_RXSLIDE_MODE_ENUM)),
+    ('ALIGN_PCOMMA_VALUE',           0x040, 10,  0, 'RW'),
+    ('ALIGN_COMMA_WORD',             0x041,  3, 13, 'RW', dict(value=1, enum=_ALIGN_COMMA_WORD_ENUM)),
+    ('RX_SIG_VALID_DLY',             0x041,  5,  8, 'RO', dict(enum={x: f'{x + 1}' for x in range(32)})),
+    ('ALIGN_PCOMMA_DET',             0x041,  1,  7, 'RW', dict(base=pr.Bool)),
+    ('ALIGN_MCOMMA_DET',             0x041,  1,  6, 'RW', dict(base=pr.Bool)),
+    ('SHOW_REALIGN_COMMA',           0x041,  1,  5, 'RW', dict(base=pr.Bool)),
+    ('ALIGN_COMMA_DOUBLE',           0x041,  1,  4, 'RW', dict(base=pr.Bool)),
+    ('RXSLIDE_AUTO_WAIT',            0x041,  4,  0, 'RW'),
+    ('CLK_CORRECT_USE',              0x044,  1, 14, 'RW', dict(base=pr.Bool)),
+    ('CLK_COR_SEQ_1_ENABLE',         0x044,  4, 10, 'RW'),
+    ('CLK_COR_SEQ_1_1',              0x044, 10,  0, 'RW'),
+    ('CLK_COR_MAX_LAT',              0x045,  6, 10, 'RW'),
+    ('CLK_COR_SEQ_1_2',              0x045, 10,  0, 'RW'),
+    ('CLK_COR_MIN_LAT',              0x046,  6, 10, 'RW'),
+    ('CLK_COR_SEQ_1_3',              0x046, 10,  0, 'RW'),
+    ('CLK_COR_REPEAT_WAIT',          0x047,  5, 10, 'RW'),
+    ('CLK_COR_SEQ_1_4',              0x047, 10,  0, 'RW'),
+    ('CLK_COR_SEQ_2_USE',            0x048,  1, 14, 'RW', dict(base=pr.Bool)),
+    ('CLK_COR_SEQ_2_ENABLE',         0x048,  4, 10, 'RW'),
+    ('CLK_COR_SEQ_2_1',              0x048, 10,  0, 'RW'),
+    ('CLK_COR_KEEP_IDLE',            0x049,  1, 13, 'RW', dict(base=pr.Bool)),
+    ('CLK_COR_PRECEDENCE',           0x049,  1, 12, 'RW', dict(base=pr.Bool)),
+    ('CLK_COR_SEQ_LEN',              0x049,  2, 10, 'RW', dict(enum=_CLK_COR_SEQ_LEN_ENUM)),
+    ('CLK_COR_SEQ_2_2',              0x049, 10,  0, 'RW'),
+    ('CLK_COR_SEQ_2_3',              0x04A, 10,  0, 'RW'),
+    ('RXGEARBOX_EN',                 0x04B,  1, 15, 'RW', dict(base=pr.Bool)),
+    ('CLK_COR_SEQ_2_4',              0x04B, 10,  0, 'RW'),
+    ('CHAN_BOND_SEQ_1_ENABLE',       0x04C,  4, 12, 'RW'),
+    ('CHAN_BOND_SEQ_1_1',            0x04C, 10,  0, 'RW'),
+    ('CHAN_BOND_SEQ_LEN',            0x04D,  2, 14, 'RW', dict(enum={x: f'{x + 1}' for x in range(4)})),
+    ('CHAN_BOND_SEQ_1_2',            0x04D, 10,  0, 'RW'),
+    ('CHAN_BOND_KEEP_ALIGN',         0x04E,  1, 15, 'RW', dict(base=pr.Bool)),
+    ('CHAN_BOND_SEQ_1_3',            0x04E, 10,  0, 'RW'),
+    ('CHAN_BOND_SEQ_1_4',            0x04F, 10,  0, 'RW'),
+    ('CHAN_BOND_SEQ_2_ENABLE',       0x050,  4, 12, 'RW'),
+    ('CHAN_BOND_SEQ_2_USE',          0x050,  1, 11, 'RW', dict(base=pr.Bool)),
+    ('CHAN_BOND_SEQ_2_1',            0x050, 10,  0, 'RW'),
+    ('FTS_LANE_DESKEW_CFG',          0x051,  4, 12, 'RW'),
+    ('FTS_LANE_DESKEW_EN',           0x051,  1, 11, 'RW', dict(base=pr.Bool)),
+    ('CHAN_BOND_SEQ_2_2',            0x051, 10,  0, 'RW'),
+    ('FTS_DESKEW_SEQ_ENABLE',        0x052,  4, 12, 'RW'),
+    ('CBCC_DATA_SOURCE_SEL',         0x052,  1, 11, 'RW', dict(enum=_CBCC_DATA_SOURCE_SEL_ENUM)),
+    ('CHAN_BOND_SEQ_2_3',            0x052, 10,  0, 'RW'),
+    ('CHAN_BOND_MAX_SKEW',           0x053,  4, 12, 'RW', dict(value=1, enum={x: f'{x}' for x in range(1, 15)})),
+    ('CHAN_BOND_SEQ_2_4',            0x053, 10,  0, 'RW'),
+    ('RXDLY_TAP_CFG',                0x054, 16,  0, 'RW'),
+    ('RXDLY_CFG',                    0x055, 16,  0, 'RW'),
+    ('RXPH_MONITOR_SEL',             0x057,  5,  8, 'RW'),
+    ('RX_DDI_SEL',                   0x057,  6,  0, 'RW'),
+    ('TX_XCLK_SEL',                  0x059,  1,  7, 'RW', dict(enum=_TX_XCLK_SEL_ENUM)),
+    ('RX_XCLK_SEL',                  0x059,  1,  6, 'RW', dict(enum=_RX_XCLK_SEL_ENUM)),
+    ('CPLL_INIT_CFG',                [0x05B, 0x05C], [16, 8], [0, 0], 'RW'),
+    ('CPLL_CFG',                     [0x05C, 0x05D], [8, 16], [8, 0], 'RW'),
+    ('SATA_CPLL_CFG',                0x05E,  2, 14, 'RW', dict(enum=_SATA_CPLL_CFG_ENUM)),
+    ('CPLL_REFCLK_DIV',              0x05E,  5,  8, 'RW', dict(enum=_CPLL_REFCLK_DIV_ENUM)),
+    ('CPLL_FBDIV_45',                0x05E,  1,  7, 'RW', dict(enum=_CPLL_FBDIV_45_ENUM)),
+    ('CPLL_FBDIV',                   0x05E,  7,  0, 'RW', dict(enum=_CPLL_REFCLK_DIV_ENUM)),
+    ('CPLL_LOCK_CFG',                0x05F, 16,  0, 'RW'),
+    ('TXPHDLY_CFG',                  [0x060, 0x061], [16, 8], [0, 0], 'RW'),
+    ('TXDLY_CFG',                    0x062, 16,  0, 'RW'),
+    ('TXDLY_TAP_CFG',                0x063, 16,  0, 'RW'),
+    ('TXPH_CFG',                     0x064, 16,  0, 'RW'),
+    ('TXPH_MONITOR_SEL',             0x065,  5,  8, 'RW'),
+    ('RX_BIAS_CFG',                  0x066, 12,  0, 'RW'),
+    ('TX_CLKMUX_PD',                 0x068,  1,  1, 'RW'),
+    ('RX_CLKMUX_PD',                 0x068,  1,  0, 'RW'),
+    ('TERM_RCAL_OVRD',               0x069,  1,  8, 'RW'),
+    ('TERM_RCAL_CFG',                0x069,  5,  0, 'RW'),
+    ('TX_CLKDIV_25',                 0x06A,  5,  0, 'RW', dict(enum={x: f'{x + 1}' for x in range(32)})),
+    ('TX_QPI_STATUS_EN',             0x06B,  1, 15, 'RW'),
+    ('TX_INT_DATAWIDTH',             0x06B,  1,  4, 'RW', dict(enum=_RX_INT_DATAWIDTH_ENUM)),
+    ('TX_DATA_WIDTH',                0x06B,  3,  0, 'RW', dict(value=2, enum=_RX_DATA_WIDTH_ENUM)),
+    ('PCS_RSVD_ATTR',                [0x06F, 0x070, 0x071], [16, 16, 16], [0, 0, 0], 'RW'),
+    ('RX_DFE_KL_CFG2',               [0x074, 0x074, 0x07F, 0x07F, 0x083, 0x08C], [4, 5, 4, 5, 9, 5], [0, 11, 0, 10, 7, 3], 'RW'),
+    ('TX_MARGIN_FULL_1',             0x075,  7,  8, 'RW'),
+    ('TX_MARGIN_FULL_0',             0x075,  7,  0, 'RW'),
+    ('TX_MARGIN_FULL_3',             0x076,  7,  8, 'RW'),
+    ('TX_MARGIN_FULL_2',             0x076,  7,  0, 'RW'),
+    ('TX_MARGIN_LOW_0',              0x077,  7,  8, 'RW'),
+    ('TX_MARGIN_FULL_4',             0x077,  7,  0, 'RW'),
+    ('TX_MARGIN_LOW_2',              0x078,  7,  8, 'RW'),
+    ('TX_MARGIN_LOW_1',              0x078,  7,  0, 'RW'),
+    ('TX_MARGIN_LOW_4',              0x079,  7,  8, 'RW'),
+    ('TX_MARGIN_LOW_3',              0x079,  7,  0, 'RW'),
+    ('TX_DEEMPH1',                   0x07A,  5,  8, 'RW'),
+    ('TX_DEEMPH0',                   0x07A,  5,  0, 'RW'),
+    ('TX_RXDETECT_REF',              0x07C,  3,  8, 'RW'),
+    ('TX_MAINCURSOR_SEL',            0x07C,  1,  3, 'RW'),
+    ('PMA_RSV3',                     0x07C,  2,  0, 'RW'),
+    ('TX_RXDETECT_CFG',              0x07D, 14,  0, 'RW'),
+    ('PMA_RSV2',                     0x082, 16,  0, 'RW'),
+    ('DMONITOR_CFG',                 [0x086, 0x087], [16, 8], [0, 0], 'RW'),
+    ('TXOUT_DIV',                    0x088,  3,  4, 'RW', dict(enum=_TXOUT_DIV_ENUM)),
+    ('RXOUT_DIV',                    0x088,  3,  0, 'RW', dict(enum=_TXOUT_DIV_ENUM)),
+    ('PMA_RSV4',                     [0x091, 0x092], [16, 16], [0, 0], 'RW'),
+    ('TST_RSV',                      [0x097, 0x098], [16, 16], [0, 0], 'RW'),
+    ('PNA_RSV',                      [0x099, 0x09A], [16, 16], [0, 0], 'RW'),
+    ('RX_BUFFER_CFG',                0x09B,  6,  0, 'RW'),
+    ('RXBUF_THRESH_OVFLW',           0x09C,  6,  8, 'RW'),
+    ('RXBUF_THRESH_UNDFLW',          0x09C,  6,  0, 'RW'),
+    ('RXBUF_EIDLE_HI_CNT',           0x09D,  4, 12, 'RW'),
+    ('RXBUF_EIDLE_LO_CNT',           0x09D,  4,  8, 'RW'),
+    ('RXBUF_ADDR_MODE',              0x09D,  1,  7, 'RW', dict(enum=_RXBUF_ADDR_MODE_ENUM)),
+    ('RXBUF_RESET_ON_EIDLE',         0x09D,  1,  6, 'RW', dict(base=pr.Bool)),
+    ('RXBUF_RESET_ON_CB_CHANGE',     0x09D,  1,  5, 'RW', dict(base=pr.Bool)),
+    ('RXBUF_RESET_ON_RATE_CHANGE',   0x09D,  1,  4, 'RW', dict(base=pr.Bool)),
+    ('RXBUF_RESET_ON_COMMAALIGN',    0x09D,  1,  3, 'RW', dict(base=pr.Bool)),
+    ('RXBUF_THRESH_OVRD',            0x09D,  1,  2, 'RW', dict(base=pr.Bool)),
+    ('RXBUF_EN',                     0x09D,  1,  1, 'RW', dict(base=pr.Bool)),
+    ('RX_DEFER_RESET_BUF_EN',        0x09D,  1,  0, 'RW', dict(base=pr.Bool)),
+    ('TXDLY_LCFG',                   0x09F,  9,  0, 'RW'),
+    ('RXDLY_LCFG',                   0x0A0,  9,  0, 'RW'),
+    ('RXPH_CFG',                     [0x0A1, 0x0A2], [16, 8], [0, 0], 'RW'),
+    ('RXPHDLY_CFG',                  [0x0A3, 0x0A4], [16, 8], [0, 0], 'RW'),
+    ('RX_DEBUG_CFG',                 0x0A5, 12,  0, 'RW'),
+    ('ES_PMA_CFG',                   0x0A6, 10,  0, 'RW'),
+    ('RXCDR_PH_RESET_ON_EIDLE',      0x0A7,  1, 13, 'RW', dict(base=pr.Bool)),
+    ('RXCDR_FR_RESET_ON_EIDLE',      0x0A7,  1, 12, 'RW', dict(base=pr.Bool)),
+    ('RXCDR_HOLD_DURING_EIDLE',      0x0A7,  1, 11, 'RW', dict(base=pr.Bool)),
+    ('RXCDR_LOCK_CFG',               0x0A7,  6,  0, 'RW'),
+    ('RXCDR_CFG',                    [0x0A8, 0x0A9, 0x0AA, 0x0AB, 0x0AC], [16, 16, 16, 16, 8], [0, 0, 0, 0, 0], 'RW'),
+    ('COMMA_ALIGN_LATENCY',          0x14E,  7,  0, 'RW'),
+    ('RX_PRBS_ERR_CNT',              0x15C, 16,  0, 'RO'),
+)
+
 class Gtxe2Channel(pr.Device):
-    def __init__(self, read_only=False, **kwargs):
+    def __init__(self, read_only=False, attributes=None, **kwargs):
         super().__init__(**kwargs)
 
-        mode = 'RO' if read_only else 'RW'
-
-        self.add(pr.RemoteVariable(
-            offset = 0x000 << 2,
-            bitOffset = 1,
-            mode = mode,
-            name = "UCODEER_CLR",
-            bitSize = 1))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x00D << 2, 0x00E <<2],
-            bitOffset = [15, 0],
-            bitSize = [1, 6],
-            mode = mode,
-            name = 'RXDFELPMRESET_TIME'))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x00D << 2,
-            bitOffset = 10,
-            mode = mode,
-            name = 'RXCDRPHRESET_TIME',
-            bitSize = 5))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x00D << 2,
-            bitOffset = 5,
-            mode = mode,
-            name = 'RXCDRFREQRESET_TIME',
-            bitSize = 5))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x00D << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RXBUFRESET_TIME',
-            bitSize = 5))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x00E << 2,
-            bitOffset = 11,
-            mode = mode,
-            name = 'RXPCSRESET_TIME',
-            bitSize = 5))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x00E << 2,
-            bitOffset = 6,
-            mode = mode,
-            name = 'RXPMARESET_TIME',
-            bitSize = 5))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x00F << 2,
-            bitOffset = 10,
-            mode = mode,
-            name = 'RXISCANRESET_TIME',
-            bitSize = 5))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x00F << 2,
-            bitOffset = 5,
-            mode = mode,
-            name = 'TXPCSRESET_TIME',
-            bitSize = 5))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x00F << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TXPMARESET_TIME',
-            bitSize = 5))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x011 << 2,
-            bitOffset = 14,
-            mode = mode,
-            name = 'RX_INT_DATAWIDTH',
-            bitSize = 1,
-            enum = {
-                0: '2-byte',
-                1: '4-byte'}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x011 << 2,
-            bitOffset = 11,
-            mode = mode,
-            name = 'RX_DATA_WIDTH',
-            bitSize = 3,
-            value = 2,
-            enum = {
-                2: '16',
-                3: '20',
-                4: '32',
-                5: '40',
-                6: '64',
-                7: '80'}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x011 << 2,
-            bitOffset = 6,
-            mode = mode,
-            name = 'RX_CLK25_DIV',
-            bitSize = 5,
-            enum = {x:f'{x+1}' for x in range(32)}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x011 << 2,
-            bitOffset = 4,
-            mode = mode,
-            name = 'RX_CM_SEL',
-            bitSize = 2))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x011 << 2,
-            bitOffset = 1,
-            mode = mode,
-            name = 'RX_CM_TRIM',
-            bitSize = 3))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x011 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RXPRBS_ERR_LOOPBACK',
-            bitSize = 1))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x012 << 2,
-            bitOffset = 12,
-            mode = mode,
-            name = 'SATA_BURST_SEQ_LEN',
-            bitSize = 4))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x012 << 2,
-            bitOffset = 10,
-            mode = mode,
-            name = 'OUTREFCLK_SEL_INV',
-            bitSize = 2))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x012 << 2,
-            bitOffset = 7,
-            mode = mode,
-            name = 'SATA_BURST_VAL',
-            bitSize = 3))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x012 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RXOOB_CFG',
-            bitSize = 7))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x013 << 2,
-            bitOffset = 9,
-            mode = mode,
-            name = 'SAS_MIN_COM',
-            bitSize = 6))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x013 << 2,
-            bitOffset = 3,
-            mode = mode,
-            name = 'SATA_MIN_BURST',
-            bitSize = 6))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x013 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'SATA_EIDLE_VAL',
-            bitSize = 3))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x014 << 2,
-            bitOffset = 6,
-            mode = mode,
-            name = 'SATA_MIN_WAKE',
-            bitSize = 6))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x014 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'SATA_MIN_INIT',
-            bitSize = 6))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x015 << 2,
-            bitOffset = 6,
-            mode = mode,
-            name = 'SAS_MAX_COM',
-            bitSize = 7))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x015 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'SATA_MAX_BURST',
-            bitSize = 6))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x016 << 2,
-            bitOffset = 6,
-            mode = mode,
-            name = 'SATA_MAX_WAKE',
-            bitSize = 6))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x016 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'SATA_MAX_INIT',
-            bitSize = 6))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x018 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TRANS_TIME_RATE',
-            bitSize = 8))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x019 << 2,
-            bitOffset = 12,
-            mode = mode,
-            name = 'TX_PREDRIVER_MODE',
-            bitSize = 1))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x019 << 2,
-            bitOffset = 9,
-            mode = mode,
-            name = 'TX_EIDLE_DEASSERT_DELAY',
-            bitSize = 3))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x019 << 2,
-            bitOffset = 6,
-            mode = mode,
-            name = 'TX_EIDLE_ASSERT_DELAY',
-            bitSize = 3))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x019 << 2,
-            bitOffset = 5,
-            mode = mode,
-            name = 'TX_LOOPBACK_DRIVE_HIZ',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x019 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TX_DRIVE_MODE',
-            bitSize = 5,
-            enum = {
-                0: 'DIRECT',
-                1: 'PIPE',
-                2: 'PIPEGEN3'}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x01A << 2,
-            bitOffset = 8,
-            mode = mode,
-            name = 'PD_TRANS_TIME_TO_P2',
-            bitSize = 8))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x01A << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'PD_TRANS_TIME_NONE_P2',
-            bitSize = 8))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x01B << 2,
-            bitOffset = 1,
-            mode = mode,
-            name = 'PD_TRANS_TIME_FROM_P2',
-            bitSize = 12))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x01B << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'PCS_PCIE_EN',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x01C << 2,
-            bitOffset = 15,
-            mode = mode,
-            name = 'TXBUF_RESET_ON_RATE_CHANGE',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x01C << 2,
-            bitOffset = 14,
-            mode = mode,
-            name = 'TXBUF_EN',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x01C << 2,
-            bitOffset = 5,
-            mode = mode,
-            name = 'TXGEARBOX_EN',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x01C << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'GEARBOX_MODE',
-            bitSize = 3))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x01D << 2, 0x01E << 2],
-            bitOffset = [0, 0],
-            bitSize = [16, 7],
-            mode = mode,
-            name = 'RX_DFE_GAIN_CFG'))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x01E << 2,
-            bitOffset = 14,
-            mode = mode,
-            name = 'RX_DFE_LPM_HOLD_DURING_EIDLE',
-            bitSize = 1))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x01F << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RX_DFE_H2_CFG',
-            bitSize = 12))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x020 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RX_DFE_H3_CFG',
-            bitSize = 12))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x021 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RX_DFE_H4_CFG',
-            bitSize = 11))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x022 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RX_DFE_H5_CFG',
-            bitSize = 11))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x023 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RX_DFE_KL_CFG',
-            bitSize = 13))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x024 << 2, 0x025 <<2],
-            bitOffset = [15, 0],
-            bitSize = [1, 16],
-            mode = mode,
-            name = 'RX_DFE_UT_CFG'))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x024 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RX_OS_CFG',
-            bitSize = 13))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x026 << 2, 0x027 << 2],
-            bitOffset = [0, 0],
-            bitSize = [16, 1],
-            mode = mode,
-            name = 'RX_DFE_VP_CFG'))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x028 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RX_DFE_XYD_CFG',
-            bitSize = 13))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x029 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RX_DFE_LPM_CFG',
-            bitSize = 16))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x02A << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RXLPM_HF_CFG',
-            bitSize = 14))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x02B << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RXLPM_LF_CFG',
-            bitSize = 14))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x02C << 2,
-                      0x02D << 2,
-                      0x02E << 2,
-                      0x02F << 2,
-                      0x030 << 2],
-            bitOffset = [0, 0, 0, 0, 0],
-            bitSize = [16, 16, 16, 16, 16],
-            mode = mode,
-            name = 'ES_QUALIFIER'))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x031 << 2,
-                      0x032 << 2,
-                      0x033 << 2,
-                      0x034 << 2,
-                      0x035 << 2],
-            bitOffset = [0, 0, 0, 0, 0],
-            bitSize = [16, 16, 16, 16, 16],
-            mode = mode,
-            name = 'ES_QUAL_MASK'))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x036 << 2,
-                      0x037 << 2,
-                      0x038 << 2,
-                      0x039 << 2,
-                      0x03A << 2],
-            bitOffset = [0, 0, 0, 0, 0],
-            bitSize = [16, 16, 16, 16, 16],
-            mode = mode,
-            name = 'ES_SDATA_MASK'))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x03B << 2,
-            bitOffset = 11,
-            mode = mode,
-            name = 'ES_PRESCALE',
-            bitSize = 5))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x03B << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'ES_VERT_OFFSET',
-            bitSize = 9))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x03C << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'ES_HORZ_OFFSET',
-            bitSize = 12))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x03D << 2,
-            bitOffset = 15,
-            mode = mode,
-            name = 'RX_DISPERR_SEQ_MATCH',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x03D << 2,
-            bitOffset = 14,
-            mode = mode,
-            name = 'DEC_PCOMMA_DETECT',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x03D << 2,
-            bitOffset = 13,
-            mode = mode,
-            name = 'DEC_MCOMMA_DETECT',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x03D << 2,
-            bitOffset = 12,
-            mode = mode,
-            name = 'DEC_VALID_COMMA_ONLY',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x03D << 2,
-            bitOffset = 9,
-            mode = mode,
-            name = 'ES_ERRDET_EN',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x03D << 2,
-            bitOffset = 8,
-            mode = mode,
-            name = 'ES_EYE_SCAN_EN',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x03D << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'ES_CONTROL',
-            bitSize = 6))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x03E << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'ALIGN_COMMA_ENABLE',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x03F << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'ALIGN_MCOMMA_VALUE',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x040 << 2,
-            bitOffset = 14,
-            mode = mode,
-            name = 'RXSLIDE_MODE',
-            bitSize = 2,
-            enum = {
-                0: 'OFF',
-                1: 'AUTO',
-                2: 'PCS',
-                3: 'PMA'}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x040 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'ALIGN_PCOMMA_VALUE',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x041 << 2,
-            bitOffset = 13,
-            mode = mode,
-            name = 'ALIGN_COMMA_WORD',
-            bitSize = 3,
-            value = 1,
-            enum = {
-                1: '1',
-                2: '2',
-                4: '4'}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x041 << 2,
-            bitOffset = 8,
-            mode = 'RO',
-            name = 'RX_SIG_VALID_DLY',
-            bitSize = 5,
-            enum = {x: f'{x+1}' for x in range(32)}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x041 << 2,
-            bitOffset = 7,
-            mode = mode,
-            name = 'ALIGN_PCOMMA_DET',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x041 << 2,
-            bitOffset = 6,
-            mode = mode,
-            name = 'ALIGN_MCOMMA_DET',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x041 << 2,
-            bitOffset = 5,
-            mode = mode,
-            name = 'SHOW_REALIGN_COMMA',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x041 << 2,
-            bitOffset = 4,
-            mode = mode,
-            name = 'ALIGN_COMMA_DOUBLE',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x041 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RXSLIDE_AUTO_WAIT',
-            bitSize = 4))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x044 << 2,
-            bitOffset = 14,
-            mode = mode,
-            name = 'CLK_CORRECT_USE',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x044 << 2,
-            bitOffset = 10,
-            mode = mode,
-            name = 'CLK_COR_SEQ_1_ENABLE',
-            bitSize = 4))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x044 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CLK_COR_SEQ_1_1',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x045 << 2,
-            bitOffset = 10,
-            mode = mode,
-            name = 'CLK_COR_MAX_LAT',
-            bitSize = 6))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x045 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CLK_COR_SEQ_1_2',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x046 << 2,
-            bitOffset = 10,
-            mode = mode,
-            name = 'CLK_COR_MIN_LAT',
-            bitSize = 6))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x046 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CLK_COR_SEQ_1_3',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x047 << 2,
-            bitOffset = 10,
-            mode = mode,
-            name = 'CLK_COR_REPEAT_WAIT',
-            bitSize = 5))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x047 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CLK_COR_SEQ_1_4',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x048 << 2,
-            bitOffset = 14,
-            mode = mode,
-            name = 'CLK_COR_SEQ_2_USE',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x048 << 2,
-            bitOffset = 10,
-            mode = mode,
-            name = 'CLK_COR_SEQ_2_ENABLE',
-            bitSize = 4))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x048 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CLK_COR_SEQ_2_1',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x049 << 2,
-            bitOffset = 13,
-            mode = mode,
-            name = 'CLK_COR_KEEP_IDLE',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x049 << 2,
-            bitOffset = 12,
-            mode = mode,
-            name = 'CLK_COR_PRECEDENCE',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x049 << 2,
-            bitOffset = 10,
-            mode = mode,
-            name = 'CLK_COR_SEQ_LEN',
-            bitSize = 2,
-            enum = {
-                0: '1',
-                1: '2',
-                2: '3',
-                3: '4'}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x049 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CLK_COR_SEQ_2_2',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x04A << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CLK_COR_SEQ_2_3',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x04B << 2,
-            bitOffset = 15,
-            mode = mode,
-            name = 'RXGEARBOX_EN',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x04B << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CLK_COR_SEQ_2_4',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x04C << 2,
-            bitOffset = 12,
-            mode = mode,
-            name = 'CHAN_BOND_SEQ_1_ENABLE',
-            bitSize = 4))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x04C << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CHAN_BOND_SEQ_1_1',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x04D << 2,
-            bitOffset = 14,
-            mode = mode,
-            name = 'CHAN_BOND_SEQ_LEN',
-            bitSize = 2,
-            enum = {x:f'{x+1}' for x in range(4)}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x04D << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CHAN_BOND_SEQ_1_2',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x04E << 2,
-            bitOffset = 15,
-            mode = mode,
-            name = 'CHAN_BOND_KEEP_ALIGN',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x04E << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CHAN_BOND_SEQ_1_3',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x04F << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CHAN_BOND_SEQ_1_4',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x050 << 2,
-            bitOffset = 12,
-            mode = mode,
-            name = 'CHAN_BOND_SEQ_2_ENABLE',
-            bitSize = 4))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x050 << 2,
-            bitOffset = 11,
-            mode = mode,
-            name = 'CHAN_BOND_SEQ_2_USE',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x050 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CHAN_BOND_SEQ_2_1',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x051 << 2,
-            bitOffset = 12,
-            mode = mode,
-            name = 'FTS_LANE_DESKEW_CFG',
-            bitSize = 4))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x051 << 2,
-            bitOffset = 11,
-            mode = mode,
-            name = 'FTS_LANE_DESKEW_EN',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x051 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CHAN_BOND_SEQ_2_2',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x052 << 2,
-            bitOffset = 12,
-            mode = mode,
-            name = 'FTS_DESKEW_SEQ_ENABLE',
-            bitSize = 4))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x052 << 2,
-            bitOffset = 11,
-            mode = mode,
-            name = 'CBCC_DATA_SOURCE_SEL',
-            bitSize = 1,
-            enum = {
-                0: 'ENCODED',
-                1: 'DECODED'}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x052 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CHAN_BOND_SEQ_2_3',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x053 << 2,
-            bitOffset = 12,
-            mode = mode,
-            name = 'CHAN_BOND_MAX_SKEW',
-            bitSize = 4,
-            value = 1,
-            enum = {x:f'{x}' for x in range(1, 15)}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x053 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CHAN_BOND_SEQ_2_4',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x054 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RXDLY_TAP_CFG',
-            bitSize = 16))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x055 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RXDLY_CFG',
-            bitSize = 16))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x057 << 2,
-            bitOffset = 8,
-            mode = mode,
-            name = 'RXPH_MONITOR_SEL',
-            bitSize = 5))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x057 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RX_DDI_SEL',
-            bitSize = 6))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x059 << 2,
-            bitOffset = 7,
-            mode = mode,
-            name = 'TX_XCLK_SEL',
-            bitSize = 1,
-            enum = {
-                0: 'TXOUT',
-                1: 'TXUSR'}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x059 << 2,
-            bitOffset = 6,
-            mode = mode,
-            name = 'RX_XCLK_SEL',
-            bitSize = 1,
-            enum = {
-                0: 'RXREC',
-                1: 'RXUSR'}))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x05B << 2,
-                      0x05C <<2],
-            bitOffset = [0, 0],
-            bitSize = [16, 8],
-            mode = mode,
-            name = 'CPLL_INIT_CFG'))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x05C << 2,
-                      0x05D << 2],
-            bitOffset = [8, 0],
-            bitSize = [8, 16],
-            mode = mode,
-            name = 'CPLL_CFG'))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x05E << 2,
-            bitOffset = 14,
-            mode = mode,
-            name = 'SATA_CPLL_CFG',
-            bitSize = 2,
-            enum = {
-                0: 'VCO_3000MHZ',
-                1: 'VCO_1500MHZ',
-                2: 'VCO_750MHZ'}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x05E << 2,
-            bitOffset = 8,
-            mode = mode,
-            name = 'CPLL_REFCLK_DIV',
-            bitSize = 5,
-            enum = {
-                16: '1',
-                0: '2',
-                1: '3',
-                2: '4',
-                3: '5',
-                5: '6',
-                6: '8',
-                7: '10',
-                13: '12',
-                14: '16',
-                15: '20'}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x05E << 2,
-            bitOffset = 7,
-            mode = mode,
-            name = 'CPLL_FBDIV_45',
-            bitSize = 1,
-            enum = {
-                0: '4',
-                1: '5'}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x05E << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CPLL_FBDIV',
-            bitSize = 7,
-            enum = {
-                16: '1',
-                0: '2',
-                1: '3',
-                2: '4',
-                3: '5',
-                5: '6',
-                6: '8',
-                7: '10',
-                13: '12',
-                14: '16',
-                15: '20'}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x05F << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'CPLL_LOCK_CFG',
-            bitSize = 16))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x060 << 2, 0x061 << 2],
-            bitOffset = [0, 0],
-            bitSize = [16, 8],
-            mode = mode,
-            name = 'TXPHDLY_CFG'))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x062 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TXDLY_CFG',
-            bitSize = 16))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x063 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TXDLY_TAP_CFG',
-            bitSize = 16))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x064 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TXPH_CFG',
-            bitSize = 16))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x065 << 2,
-            bitOffset = 8,
-            mode = mode,
-            name = 'TXPH_MONITOR_SEL',
-            bitSize = 5))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x066 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RX_BIAS_CFG',
-            bitSize = 12))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x068 << 2,
-            bitOffset = 1,
-            mode = mode,
-            name = 'TX_CLKMUX_PD',
-            bitSize = 1))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x068 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RX_CLKMUX_PD',
-            bitSize = 1))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x069 << 2,
-            bitOffset = 8,
-            mode = mode,
-            name = 'TERM_RCAL_OVRD',
-            bitSize = 1))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x069 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TERM_RCAL_CFG',
-            bitSize = 5))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x06A << 2,
-            bitOffset =0,
-            mode = mode,
-            name = 'TX_CLKDIV_25',
-            bitSize = 5,
-            enum = {x:f'{x+1}' for x in range(32)}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x06B << 2,
-            bitOffset = 15,
-            mode = mode,
-            name = 'TX_QPI_STATUS_EN',
-            bitSize = 1))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x06B << 2,
-            bitOffset = 4,
-            mode = mode,
-            name = 'TX_INT_DATAWIDTH',
-            bitSize = 1,
-            enum = {
-                0: '2-byte',
-                1: '4-byte'}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x06B << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TX_DATA_WIDTH',
-            bitSize = 3,
-            value = 2,
-            enum = {
-                2: '16',
-                3: '20',
-                4: '32',
-                5: '40',
-                6: '64',
-                7: '80'}))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x06F << 2,
-                      0x070 << 2,
-                      0x071 << 2],
-            bitOffset = [0, 0, 0],
-            bitSize = [16, 16, 16],
-            mode = mode,
-            name = 'PCS_RSVD_ATTR'))
-
-        # Yes, this one is weird
-        self.add(pr.RemoteVariable(
-            offset = [0x074 << 2,
-                      0x074 << 2,
-                      0x07F << 2,
-                      0x07F << 2,
-                      0x083 << 2,
-                      0x08C << 2],
-            bitOffset = [0, 11, 0, 10, 7, 3],
-            bitSize = [4, 5, 4, 5, 9, 5],
-            mode = mode,
-            name = 'RX_DFE_KL_CFG2'))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x075 << 2,
-            bitOffset = 8,
-            mode = mode,
-            name = 'TX_MARGIN_FULL_1',
-            bitSize = 7))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x075 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TX_MARGIN_FULL_0',
-            bitSize = 7))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x076 << 2,
-            bitOffset = 8,
-            mode = mode,
-            name = 'TX_MARGIN_FULL_3',
-            bitSize = 7))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x076 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TX_MARGIN_FULL_2',
-            bitSize = 7))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x077 << 2,
-            bitOffset = 8,
-            mode = mode,
-            name = 'TX_MARGIN_LOW_0',
-            bitSize = 7))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x077 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TX_MARGIN_FULL_4',
-            bitSize = 7))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x078 << 2,
-            bitOffset = 8,
-            mode = mode,
-            name = 'TX_MARGIN_LOW_2',
-            bitSize = 7))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x078 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TX_MARGIN_LOW_1',
-            bitSize = 7))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x079 << 2,
-            bitOffset = 8,
-            mode = mode,
-            name = 'TX_MARGIN_LOW_4',
-            bitSize = 7))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x079 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TX_MARGIN_LOW_3',
-            bitSize = 7))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x07A << 2,
-            bitOffset = 8,
-            mode = mode,
-            name = 'TX_DEEMPH1',
-            bitSize = 5))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x07A << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TX_DEEMPH0',
-            bitSize = 5))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x07C << 2,
-            bitOffset = 8,
-            mode = mode,
-            name = 'TX_RXDETECT_REF',
-            bitSize = 3))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x07C << 2,
-            bitOffset = 3,
-            mode = mode,
-            name = 'TX_MAINCURSOR_SEL',
-            bitSize = 1))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x07C << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'PMA_RSV3',
-            bitSize = 2))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x07D << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TX_RXDETECT_CFG',
-            bitSize = 14))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x082 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'PMA_RSV2',
-            bitSize = 16))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x086 << 2,
-                      0x087 << 2],
-            bitOffset = [0, 0],
-            bitSize = [16, 8],
-            mode = mode,
-            name = 'DMONITOR_CFG'))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x088 << 2,
-            bitOffset = 4,
-            bitSize = 3,
-            mode = mode,
-            name = 'TXOUT_DIV',
-            enum = {
-                0: '1',
-                1: '2',
-                2: '4',
-                3: '8',
-                4: '16'}))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x088 << 2,
-            bitOffset = 0,
-            bitSize = 3,
-            mode = mode,
-            name = 'RXOUT_DIV',
-            enum = {
-                0: '1',
-                1: '2',
-                2: '4',
-                3: '8',
-                4: '16'}))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x091 << 2,
-                      0x092 << 2],
-            bitOffset = [0, 0],
-            mode = mode,
-            name = 'PMA_RSV4',
-            bitSize = [16, 16]))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x097 << 2,
-                      0x098 << 2],
-            bitOffset = [0, 0],
-            bitSize = [16, 16],
-            mode = mode,
-            name = 'TST_RSV'))
-
-
-        self.add(pr.RemoteVariable(
-            offset = [0x099 << 2,
-                      0x09A << 2],
-            bitOffset = [0, 0],
-            bitSize = [16, 16],
-            mode = mode,
-            name = 'PNA_RSV'))
-
-
-        self.add(pr.RemoteVariable(
-            offset = 0x09B << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RX_BUFFER_CFG',
-            bitSize = 6))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x09C << 2,
-            bitOffset = 8,
-            mode = mode,
-            name = 'RXBUF_THRESH_OVFLW',
-            bitSize = 6))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x09C << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RXBUF_THRESH_UNDFLW',
-            bitSize = 6))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x09D << 2,
-            bitOffset = 12,
-            mode = mode,
-            name = 'RXBUF_EIDLE_HI_CNT',
-            bitSize = 4))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x09D << 2,
-            bitOffset = 8,
-            mode = mode,
-            name = 'RXBUF_EIDLE_LO_CNT',
-            bitSize = 4))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x09D << 2,
-            bitOffset = 7,
-            mode = mode,
-            name = 'RXBUF_ADDR_MODE',
-            enum = {
-                0: 'FULL',
-                1: 'FAST'},
-            bitSize = 1))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x09D << 2,
-            bitOffset = 6,
-            mode = mode,
-            name = 'RXBUF_RESET_ON_EIDLE',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x09D << 2,
-            bitOffset = 5,
-            mode = mode,
-            name = 'RXBUF_RESET_ON_CB_CHANGE',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x09D << 2,
-            bitOffset = 4,
-            mode = mode,
-            name = 'RXBUF_RESET_ON_RATE_CHANGE',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x09D << 2,
-            bitOffset = 3,
-            mode = mode,
-            name = 'RXBUF_RESET_ON_COMMAALIGN',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x09D << 2,
-            bitOffset = 2,
-            mode = mode,
-            name = 'RXBUF_THRESH_OVRD',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x09D << 2,
-            bitOffset = 1,
-            mode = mode,
-            name = 'RXBUF_EN',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x09D << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RX_DEFER_RESET_BUF_EN',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x09F << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'TXDLY_LCFG',
-            bitSize = 9))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x0A0 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RXDLY_LCFG',
-            bitSize = 9))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x0A1 << 2,
-                      0x0A2 << 2],
-            bitOffset = [0, 0],
-            bitSize = [16, 8],
-            mode = mode,
-            name = 'RXPH_CFG'))
-
-
-        self.add(pr.RemoteVariable(
-            offset = [0x0A3 << 2,
-                      0x0A4 << 2],
-            bitOffset = [0, 0],
-            bitSize = [16, 8],
-            mode = mode,
-            name = 'RXPHDLY_CFG'))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x0A5 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RX_DEBUG_CFG',
-            bitSize = 12))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x0A6 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'ES_PMA_CFG',
-            bitSize = 10))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x0A7 << 2,
-            bitOffset = 13,
-            mode = mode,
-            name = 'RXCDR_PH_RESET_ON_EIDLE',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x0A7 << 2,
-            bitOffset = 12,
-            mode = mode,
-            name = 'RXCDR_FR_RESET_ON_EIDLE',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x0A7 << 2,
-            bitOffset = 11,
-            mode = mode,
-            name = 'RXCDR_HOLD_DURING_EIDLE',
-            bitSize = 1,
-            base = pr.Bool))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x0A7 << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'RXCDR_LOCK_CFG',
-            bitSize = 6))
-
-        self.add(pr.RemoteVariable(
-            offset = [0x0A8 << 2,
-                      0x0A9 << 2,
-                      0x0AA << 2,
-                      0x0AB << 2,
-                      0x0AC << 2],
-            bitOffset = [0, 0, 0, 0, 0],
-            bitSize = [16, 16, 16, 16, 8],
-            mode = mode,
-            name = 'RXCDR_CFG'))
-
-        self.add(pr.RemoteVariable(
-            offset = 0x14E << 2,
-            bitOffset = 0,
-            mode = mode,
-            name = 'COMMA_ALIGN_LATENCY',
-            bitSize = 7))
+        ##############################
+        # Variables
+        ##############################
 
-        self.add(pr.RemoteVariable(
-            offset = 0x15C << 2,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'RX_PRBS_ERR_CNT',
-            bitSize = 16))
+        addDrpVariables(self, GTXE2_CHANNEL_DRP, names=attributes, mode='RO' if read_only else None)
@@ -13,4051 +13,735 @@
 
 import pyrogue as pr
 
-class Gtye4Channel(pr.Device):
-
-    def _start(self):
-        super()._start()
-        print(f'{self.path} - {len(self.variables)=}')
+from surf.xilinx._GtDrp import addDrpVariables
+
+_RX_DATA_WIDTH_ENUM = {
+    0 : '-',
+    2 : '16',
+    3 : '20',
+    4 : '32',
+    5 : '40',
+    6 : '64',
+    7 : '80',
+    8 : '128',
+    9 : '160',
+}
+
+_RXELECIDLE_CFG_ENUM = {
+    0 : 'SIGCFG_1',
+    1 : 'SIGCFG_2',
+    2 : 'SIGCFG_3',
+    3 : 'SIGCFG_4',
+    4 : 'SIGCFG_6',
+    5 : 'SIGCFG_8',
+    6 : 'SIGCFG_12',
+    7 : 'SIGCFG_16',
+}
+
+_RXPMACLK_SEL_ENUM = {
+    2 : 'CROSSING',
+    0 : 'DATA',
+    1 : 'EYESCAN',
+}
+
+_TX_PROGCLK_SEL_ENUM = {
+    0 : 'POSTPI',
+    1 : 'PREPI',
+    2 : 'CPLL',
+}
+
+_CHAN_BOND_SEQ_LEN_ENUM = {
+    0 : '1',
+    1 : '2',
+    2 : '3',
+    3 : '4',
+}
+
+_TRUE_FALSE_ENUM = {
+    0 : 'FALSE',
+    1 : 'TRUE',
+}
+
+_PCI3_AUTO_REALIGN_ENUM = {
+    0 : 'FRST_SMPL',
+    1 : 'OVR_8_BLK',
+    2 : 'OVR_64_BLK',
+    3 : 'OVR_1K_BLK',
+}
+
+_ALIGN_COMMA_WORD_ENUM = {
+    0 : '-',
+    1 : '1',
+    2 : '2',
+    4 : '4',
+}
+
+_CPLL_FBDIV_ENUM = {
+    0 : '2',
+    1 : '3',
+    2 : '4',
+    3 : '5',
+    16 : '1',
+}
+
+_CPLL_FBDIV_45_ENUM = {
+    0 : '4',
+    1 : '5',
+}
+
+_CPLL_REFCLK_DIV_ENUM = {
+    0 : '2',
+    16 : '1',
+}
+
+_SATA_CPLL_CFG_ENUM = {
+    0 : 'VCO_3000MHZ',
+    1 : 'VCO_1500MHZ',
+    2 : 'VCO_750MHZ',
+}
+
+_TX_PROGDIV_CFG_ENUM = {
+    0 : '-',
+    32768 : '0',
+    57440 : '10',
+    57455 : '100',
+    24654 : '128',
+    57862 : '132',
+    57410 : '16',
+    16.5788 : '5',
+    57442 : '20',
+    57414 : '32',
+    57856 : '33',
+    57432 : '4',
+    57415 : '40',
+    57464 : '5',
+    57422 : '64',
+    57858 : '66',
+    57408 : '8',
+    57423 : '80',
+}
+
+_CBCC_DATA_SOURCE_SEL_ENUM = {
+    1 : 'DECODED',
+    0 : 'ENCODED',
+}
+
+_RXOUT_DIV_ENUM = {
+    0 : '1',
+    1 : '2',
+    2 : '4',
+    3 : '8',
+    4 : '16',
+    5 : '32',
+}
+
+_RX_SIG_VALID_DLY_ENUM = {
+    0 : '1',
+    1 : '2',
+    2 : '3',
+    3 : '4',
+    4 : '5',
+    5 : '6',
+    6 : '7',
+    7 : '8',
+    8 : '9',
+    9 : '10',
+    10 : '11',
+    11 : '12',
+    12 : '13',
+    13 : '14',
+    14 : '15',
+    15 : '16',
+    16 : '17',
+    17 : '18',
+    18 : '19',
+    19 : '20',
+    20 : '21',
+    21 : '22',
+    22 : '23',
+    23 : '24',
+    24 : '25',
+    25 : '26',
+    26 : '27',
+    27 : '28',
+    28 : '29',
+    29 : '30',
+    30 : '31',
+    31 : '32',
+}
+
+_RXSLIDE_MODE_ENUM = {
+    0 : 'OFF',
+    1 : 'AUTO',
+    2 : 'PCS',
+    3 : 'PMA',
+}
+
+_RX_XCLK_SEL_ENUM = {
+    0 : 'RXDES',
+    1 : 'RXUSR',
+    2 : 'RXPMA',
+}
+
+_RXBUF_ADDR_MODE_ENUM = {
+    1 : 'FAST',
+    0 : 'FULL',
+}
+
+_TX_XCLK_SEL_ENUM = {
+    0 : 'TXOUT',
+    1 : 'TXUSR',
+}
+
+_TXFIFO_ADDR_CFG_ENUM = {
+    1 : 'HIGH',
+    0 : 'LOW',
+}
+
+_TX_DRIVE_MODE_ENUM = {
+    0 : 'DIRECT',
+    1 : 'PIPE',
+    2 : 'PIPEGEN3',
+}
+
+_RXOOB_CLK_CFG_ENUM = {
+    1 : 'FABRIC',
+    0 : 'PMA',
+}
+
+# DRP attributes: (name, DRP address, bitSize, bitOffset, mode[, RemoteVariable kwargs])
+GTYE4_CHANNEL_DRP = (
+    ('CDR_SWAP_MODE_EN',             0x002,  1,  0, 'RW'),
+    ('RXBUFRESET_TIME',              0x003,  5, 11, 'RW'),
+    ('CFOK_PWRSVE_EN',               0x003,  1, 10, 'RW'),
+    ('EYE_SCAN_SWAP_EN',             0x003,  1,  9, 'RW'),
+    ('RX_DATA_WIDTH',                0x003,  4,  5, 'RW', dict(enum=_RX_DATA_WIDTH_ENUM)),
+    ('RXCDRFREQRESET_TIME',          0x003,  5,  0, 'RW'),
+    ('RXCDRPHRESET_TIME',            0x004,  5, 11, 'RW'),
+    ('PCI3_RX_ELECIDLE_H2L_DISABLE', 0x004,  3,  8, 'RW'),
+    ('RXDFELPMRESET_TIME',           0x004,  7,  1, 'RW'),
+    ('RX_FABINT_USRCLK_FLOP',        0x004,  1,  0, 'RW'),
+    ('RXPMARESET_TIME',              0x005,  5, 11, 'RW'),
+    ('PCI3_RX_ELECIDLE_LP4_DISABLE', 0x005,  1, 10, 'RW'),
+    ('PCI3_RX_FIFO_DISABLE',         0x005,  1,  8, 'RW'),
+    ('PCI3_RX_ELECIDLE_EI2_ENABLE',  0x005,  1,  9, 'RW'),
+    ('RXPCSRESET_TIME',              0x005,  5,  3, 'RW'),
+    ('RXELECIDLE_CFG',               0x005,  3,  0, 'RW', dict(enum=_RXELECIDLE_CFG_ENUM)),
+    ('RXDFE_HB_CFG1',                0x006, 16,  0, 'RW'),
+    ('TXPMARESET_TIME',              0x009,  5, 11, 'RW'),
+    ('TXPCSRESET_TIME',              0x009,  5,  3, 'RW'),
+    ('RX_PMA_POWER_SAVE',            0x009,  1, 10, 'RW'),
+    ('TX_PMA_POWER_SAVE',            0x009,  1,  9, 'RW'),
+    ('SRSTMODE',                     0x009,  1,  8, 'RW'),
+    ('TX_FIFO_BYP_EN',               0x00A,  1,  3, 'RW'),
+    ('TX_FABINT_USRCLK_FLOP',        0x00B,  1,  4, 'RW'),
+    ('RXPMACLK_SEL',                 0x00B,  2,  8, 'RW', dict(enum=_RXPMACLK_SEL_ENUM)),
+    ('TX_PROGCLK_SEL',               0x00C,  2, 10, 'RW', dict(enum=_TX_PROGCLK_SEL_ENUM)),
+    ('RXISCANRESET_TIME',            0x00C,  5,  5, 'RW'),
+    ('TXAMONSEL',                    0x00D,  6,  2, 'RW'),
+    ('BLOCKSEL',                     0x00D,  2,  0, 'RW'),
+    ('RXCDR_CFG0',                   0x00E, 16,  0, 'RW'),
+    ('RXCDR_CFG1',                   0x00F, 16,  0, 'RW'),
+    ('RXCDR_CFG2',                   0x010, 16,  0, 'RW'),
+    ('RXCDR_CFG3',                   0x011, 16,  0, 'RW', dict(overlapEn=True)),
+    ('SELCKOK',                      0x011,  1,  7, 'RW', dict(overlapEn=True)),
+    ('RXCDR_CFG4',                   0x012, 16,  0, 'RW'),
+    ('CPLL_LOCK_CFG',                0x013, 16,  0, 'RW'),
+    ('CHAN_BOND_MAX_SKEW',           0x014,  4, 12, 'RW'),
+    ('CHAN_BOND_SEQ_LEN',            0x014,  2, 10, 'RW', dict(enum=_CHAN_BOND_SEQ_LEN_ENUM)),
+    ('CHAN_BOND_SEQ_1_1',            0x014, 10,  0, 'RW'),
+    ('PCI3_RX_ELECIDLE_HI_COUNT',    0x015,  6, 10, 'RW'),
+    ('CHAN_BOND_SEQ_1_3',            0x015, 10,  0, 'RW'),
+    ('PCI3_RX_ELECIDLE_H2L_COUNT',   0x016,  6, 10, 'RW'),
+    ('CHAN_BOND_SEQ_1_4',            0x016, 10,  0, 'RW'),
+    ('RX_BUFFER_CFG',                0x017,  6, 10, 'RW'),
+    ('RX_DEFER_RESET_BUF_EN',        0x017,  1,  9, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('OOBDIVCTL',                    0x017,  2,  7, 'RW'),
+    ('PCI3_AUTO_REALIGN',            0x017,  2,  5, 'RW', dict(enum=_PCI3_AUTO_REALIGN_ENUM)),
+    ('PCI3_PIPE_RX_ELECIDLE',        0x017,  1,  4, 'RW'),
+    ('CHAN_BOND_SEQ_1_ENABLE',       0x018,  4, 12, 'RW'),
+    ('PCI3_RX_ASYNC_EBUF_BYPASS',    0x018,  2, 10, 'RW'),
+    ('CHAN_BOND_SEQ_2_1',            0x018, 10,  0, 'RW'),
+    ('CHAN_BOND_SEQ_2_2',            0x019, 10,  0, 'RW'),
+    ('CHAN_BOND_SEQ_2_3',            0x01A, 10,  0, 'RW'),
+    ('CHAN_BOND_SEQ_2_4',            0x01B, 10,  0, 'RW'),
+    ('CHAN_BOND_SEQ_2_ENABLE',       0x01C,  4, 12, 'RW'),
+    ('CHAN_BOND_SEQ_2_USE',          0x01C,  1, 11, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('CLK_COR_KEEP_IDLE',            0x01C,  1,  6, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('CLK_COR_MIN_LAT',              0x01C,  6,  0, 'RW'),
+    ('CLK_COR_MAX_LAT',              0x01D,  6, 10, 'RW'),
+    ('CLK_COR_PRECEDENCE',           0x01D,  1,  9, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('CLK_COR_REPEAT_WAIT',          0x01D,  5,  4, 'RW'),
+    ('CLK_COR_SEQ_LEN',              0x01D,  2,  2, 'RW', dict(enum=_CHAN_BOND_SEQ_LEN_ENUM)),
+    ('CHAN_BOND_KEEP_ALIGN',         0x01D,  1,  0, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('CLK_COR_SEQ_1_1',              0x01E, 10,  0, 'RW'),
+    ('CLK_COR_SEQ_1_2',              0x01F, 10,  0, 'RW'),
+    ('CLK_COR_SEQ_1_3',              0x020, 10,  0, 'RW'),
+    ('CLK_COR_SEQ_1_4',              0x021, 10,  0, 'RW'),
+    ('CLK_COR_SEQ_1_ENABLE',         0x022,  4, 12, 'RW'),
+    ('CLK_COR_SEQ_2_1',              0x022, 10,  0, 'RW'),
+    ('CLK_COR_SEQ_2_2',              0x023, 10,  0, 'RW'),
+    ('CLK_COR_SEQ_2_ENABLE',         0x024,  4, 12, 'RW'),
+    ('CLK_COR_SEQ_2_USE',            0x024,  1, 11, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('CLK_CORRECT_USE',              0x024,  1, 10, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('CLK_COR_SEQ_2_3',              0x024, 10,  0, 'RW'),
+    ('CLK_COR_SEQ_2_4',              0x025, 10,  0, 'RW'),
+    ('RXDFE_HE_CFG0',                0x026, 16,  0, 'RW'),
+    ('ALIGN_COMMA_WORD',             0x027,  3, 13, 'RW', dict(enum=_ALIGN_COMMA_WORD_ENUM)),
+    ('ALIGN_COMMA_DOUBLE',           0x027,  1, 12, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('SHOW_REALIGN_COMMA',           0x027,  1, 11, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('ALIGN_COMMA_ENABLE',           0x027, 10,  0, 'RW'),
+    ('CPLL_FBDIV',                   0x028,  8,  8, 'RW', dict(enum=_CPLL_FBDIV_ENUM)),
+    ('CPLL_FBDIV_45',                0x028,  1,  7, 'RW', dict(enum=_CPLL_FBDIV_45_ENUM)),
+    ('RXCDR_LOCK_CFG0',              0x029, 16,  0, 'RW'),
+    ('CPLL_REFCLK_DIV',              0x02A,  5, 11, 'RW', dict(enum=_CPLL_REFCLK_DIV_ENUM)),
+    ('CPLL_IPS_EN',                  0x02A,  1, 10, 'RW'),
+    ('CPLL_IPS_REFCLK_SEL',          0x02A,  3,  7, 'RW'),
+    ('SATA_CPLL_CFG',                0x02A,  2,  5, 'RW', dict(enum=_SATA_CPLL_CFG_ENUM)),
+    ('A_TXDIFFCTRL',                 0x02A,  5,  0, 'RW'),
+    ('CPLL_INIT_CFG0',               0x02B, 16,  0, 'RW'),
+    ('DEC_PCOMMA_DETECT',            0x02C,  1, 15, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('TX_DIVRESET_TIME',             0x02C,  5,  7, 'RW'),
+    ('RX_DIVRESET_TIME',             0x02C,  5,  2, 'RW'),
+    ('A_TXPROGDIVRESET',             0x02C,  1,  1, 'RW'),
+    ('A_RXPROGDIVRESET',             0x02C,  1,  0, 'RW'),
+    ('RXCDR_LOCK_CFG1',              0x02D, 16,  0, 'RW'),
+    ('RXCFOK_CFG1',                  0x02E, 16,  0, 'RW'),
+    ('RXDFE_H2_CFG0',                0x02F, 16,  0, 'RW'),
+    ('RXDFE_H2_CFG1',                0x030, 16,  0, 'RW'),
+    ('RXCFOK_CFG2',                  0x031, 16,  0, 'RW'),
+    ('RXLPM_CFG',                    0x032, 16,  0, 'RW'),
+    ('RXLPM_KH_CFG0',                0x033, 16,  0, 'RW'),
+    ('RXLPM_KH_CFG1',                0x034, 16,  0, 'RW'),
+    ('RXDFELPM_KL_CFG0',             0x035, 16,  0, 'RW'),
+    ('RXDFELPM_KL_CFG1',             0x036, 16,  0, 'RW'),
+    ('RXLPM_OS_CFG0',                0x037, 16,  0, 'RW'),
+    ('RXLPM_OS_CFG1',                0x038, 16,  0, 'RW'),
+    ('RXLPM_GC_CFG',                 0x039, 16,  0, 'RW'),
+    ('DMONITOR_CFG1',                0x03A,  8,  8, 'RW'),
+    ('ES_CONTROL',                   0x03C,  6, 10, 'RW'),
+    ('ES_PRESCALE',                  0x03C,  5,  0, 'RW'),
+    ('ES_EYE_SCAN_EN',               0x03C,  1,  8, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('ES_ERRDET_EN',                 0x03C,  1,  9, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('RXDFE_GC_CFG2',                0x03D, 16,  0, 'RW'),
+    ('TXDLY_LCFG',                   0x03E, 16,  0, 'RW'),
+    ('ES_QUALIFIER0',                0x03F, 16,  0, 'RW'),
+    ('ES_QUALIFIER1',                0x040, 16,  0, 'RW'),
+    ('ES_QUALIFIER2',                0x041, 16,  0, 'RW'),
+    ('ES_QUALIFIER3',                0x042, 16,  0, 'RW'),
+    ('ES_QUALIFIER4',                0x043, 16,  0, 'RW'),
+    ('ES_QUAL_MASK0',                0x044, 16,  0, 'RW'),
+    ('ES_QUAL_MASK1',                0x045, 16,  0, 'RW'),
+    ('ES_QUAL_MASK2',                0x046, 16,  0, 'RW'),
+    ('ES_QUAL_MASK3',                0x047, 16,  0, 'RW'),
+    ('ES_QUAL_MASK4',                0x048, 16,  0, 'RW'),
+    ('ES_SDATA_MASK0',               0x049, 16,  0, 'RW'),
+    ('ES_SDATA_MASK1',               0x04A, 16,  0, 'RW'),
+    ('ES_SDATA_MASK2',               0x04B, 16,  0, 'RW'),
+    ('ES_SDATA_MASK3',               0x04C, 16,  0, 'RW'),
+    ('ES_SDATA_MASK4',               0x04D, 16,  0, 'RW'),
+    ('FTS_LANE_DESKEW_EN',           0x04E,  1,  4, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('FTS_DESKEW_SEQ_ENABLE',        0x04E,  4,  0, 'RW'),
+    ('ES_HORZ_OFFSET',               0x04F, 12,  4, 'RW'),
+    ('FTS_LANE_DESKEW_CFG',          0x04F,  4,  0, 'RW'),
+    ('RXDFE_HC_CFG1',                0x050, 16,  0, 'RW'),
+    ('ES_PMA_CFG',                   0x051, 10,  0, 'RW'),
+    ('RX_DFE_AGC_CFG1',              0x052,  3,  2, 'RW'),
+    ('TXFE_CFG2',                    0x053, 16,  0, 'RW'),
+    ('TXFE_CFG3',                    0x054, 16,  0, 'RW'),
+    ('PCIE_64B_DYN_CLKSW_DIS',       0x055,  1, 14, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('LOCAL_MASTER',                 0x055,  1, 13, 'RW'),
+    ('PCS_PCIE_EN',                  0x055,  1, 12, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('PCIE_GEN4_64BIT_INT_EN',       0x055,  1, 11, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('ALIGN_MCOMMA_DET',             0x055,  1, 10, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('ALIGN_MCOMMA_VALUE',           0x055, 10,  0, 'RW'),
+    ('ALIGN_PCOMMA_DET',             0x056,  1, 10, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('ALIGN_PCOMMA_VALUE',           0x056, 10,  0, 'RW'),
+    ('TX_PROGDIV_CFG',               0x057, 16,  0, 'RW', dict(enum=_TX_PROGDIV_CFG_ENUM)),
+    ('RXDFE_OS_CFG0',                0x058, 16,  0, 'RW'),
+    ('RXPHDLY_CFG',                  0x059, 16,  0, 'RW'),
+    ('RXDFE_OS_CFG1',                0x05A, 16,  0, 'RW'),
+    ('RXDLY_CFG',                    0x05B, 16,  0, 'RW'),
+    ('RXDLY_LCFG',                   0x05C, 16,  0, 'RW'),
+    ('RXDFE_HF_CFG0',                0x05D, 16,  0, 'RW'),
+    ('RXDFE_HD_CFG0',                0x05E, 16,  0, 'RW'),
+    ('RX_BIAS_CFG0',                 0x05F, 16,  0, 'RW'),
+    ('PCS_RSVD0',                    0x060, 16,  0, 'RW', dict(overlapEn=True)),
+    ('PCIE_GEN4_NEW_EIEOS_DET_EN',   0x060,  5,  4, 'RW', dict(overlapEn=True)),
+    ('USB3_RXTERMINATION_CTRL',      0x060,  2,  0, 'RW', dict(overlapEn=True)),
+    ('RXPH_MONITOR_SEL',             0x061,  5, 11, 'RW'),
+    ('RX_CM_BUF_PD',                 0x061,  1, 10, 'RW'),
+    ('RX_CM_BUF_CFG',                0x061,  4,  6, 'RW'),
+    ('RX_CM_TRIM',                   0x061,  4,  2, 'RW'),
+    ('RX_CM_SEL',                    0x061,  2,  0, 'RW'),
+    ('RX_I2V_FILTER_EN',             0x062,  1, 15, 'RW'),
+    ('RX_SUM_DFETAPREP_EN',          0x062,  1, 14, 'RW'),
+    ('RX_SUM_VCM_OVWR',              0x062,  1, 13, 'RW'),
+    ('RX_SUM_IREF_TUNE',             0x062,  4,  9, 'RW'),
+    ('EYESCAN_VP_RANGE',             0x062,  2,  7, 'RW'),
+    ('RX_SUM_VCMTUNE',               0x062,  4,  3, 'RW'),
+    ('RX_SUM_VREF_TUNE',             0x062,  3,  0, 'RW'),
+    ('CBCC_DATA_SOURCE_SEL',         0x063,  1, 15, 'RW', dict(enum=_CBCC_DATA_SOURCE_SEL_ENUM)),
+    ('OOB_PWRUP',                    0x063,  1, 14, 'RW'),
+    ('RXOOB_CFG',                    0x063,  9,  5, 'RW'),
+    ('RXOUT_DIV',                    0x063,  3,  0, 'RW', dict(enum=_RXOUT_DIV_ENUM)),
+    ('RX_SIG_VALID_DLY',             0x064,  5, 11, 'RW', dict(enum=_RX_SIG_VALID_DLY_ENUM)),
+    ('RXSLIDE_MODE',                 0x064,  2,  9, 'RW', dict(enum=_RXSLIDE_MODE_ENUM)),
+    ('RXPRBS_ERR_LOOPBACK',          0x064,  1,  8, 'RW'),
+    ('RXSLIDE_AUTO_WAIT',            0x064,  4,  4, 'RW'),
+    ('RXBUF_EN',                     0x064,  1,  3, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('RX_XCLK_SEL',                  0x064,  2,  1, 'RW', dict(enum=_RX_XCLK_SEL_ENUM)),
+    ('RXGEARBOX_EN',                 0x064,  1,  0, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('RXBUF_THRESH_OVFLW',           0x065,  6, 10, 'RW'),
+    ('DMONITOR_CFG0',                0x065, 10,  0, 'RW'),
+    ('RXBUF_THRESH_OVRD',            0x066,  1, 15, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('RXBUF_RESET_ON_COMMAALIGN',    0x066,  1, 14, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('RXBUF_RESET_ON_RATE_CHANGE',   0x066,  1, 13, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('RXBUF_RESET_ON_CB_CHANGE',     0x066,  1, 12, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('RXBUF_THRESH_UNDFLW',          0x066,  6,  6, 'RW'),
+    ('RX_CLKMUX_EN',                 0x066,  1,  5, 'RW'),
+    ('RX_DISPERR_SEQ_MATCH',         0x066,  1,  4, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('RX_WIDEMODE_CDR',              0x066,  2,  2, 'RW'),
+    ('RX_INT_DATAWIDTH',             0x066,  2,  0, 'RW'),
+    ('RXBUF_EIDLE_HI_CNT',           0x067,  4, 12, 'RW'),
+    ('RXCDR_HOLD_DURING_EIDLE',      0x067,  1, 11, 'RW'),
+    ('RX_DFE_LPM_HOLD_DURING_EIDLE', 0x067,  1, 10, 'RW'),
+    ('RX_WIDEMODE_CDR_GEN3',         0x067,  2,  8, 'RW'),
+    ('RXBUF_EIDLE_LO_CNT',           0x067,  4,  4, 'RW'),
+    ('RXBUF_RESET_ON_EIDLE',         0x067,  1,  3, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('RXCDR_FR_RESET_ON_EIDLE',      0x067,  1,  2, 'RW'),
+    ('RXCDR_PH_RESET_ON_EIDLE',      0x067,  1,  1, 'RW'),
+    ('RXBUF_ADDR_MODE',              0x067,  1,  0, 'RW', dict(enum=_RXBUF_ADDR_MODE_ENUM)),
+    ('SATA_BURST_VAL',               0x068,  3, 13, 'RW'),
+    ('SAS_12G_MODE',                 0x068,  1, 10, 'RW'),
+    ('USB_TXIDLE_TUNE_ENABLE',       0x068,  1,  9, 'RW'),
+    ('USB_RXIDLE_P0_CTRL',           0x068,  1,  8, 'RW'),
+    ('SATA_BURST_SEQ_LEN',           0x068,  4,  4, 'RW'),
+    ('SATA_EIDLE_VAL',               0x068,  3,  0, 'RW'),
+    ('USB_POLL_SATA_MIN_BURST',      0x069,  7,  9, 'RW'),
+    ('RX_WIDEMODE_CDR_GEN4',         0x069,  2,  7, 'RW'),
+    ('USB_U2_SAS_MIN_COM',           0x069,  7,  0, 'RW'),
+    ('USB_PING_SATA_MIN_INIT',       0x06A,  7,  9, 'RW'),
+    ('USB_U1_SATA_MIN_WAKE',         0x06A,  7,  0, 'RW'),
+    ('USB_POLL_SATA_MAX_BURST',      0x06B,  7,  9, 'RW'),
+    ('USB_U2_SAS_MAX_COM',           0x06B,  7,  0, 'RW'),
+    ('USB_PING_SATA_MAX_INIT',       0x06C,  7,  9, 'RW'),
+    ('USB_U1_SATA_MAX_WAKE',         0x06C,  7,  0, 'RW'),
+    ('RX_CLK25_DIV',                 0x06D,  5,  3, 'RW', dict(enum=_RX_SIG_VALID_DLY_ENUM)),
+    ('RXDFE_UT_CFG1',                0x06E, 16,  0, 'RW'),
+    ('TXPHDLY_CFG1',                 0x06F, 16,  0, 'RW'),
+    ('RXDFE_VP_CFG0',                0x070, 16,  0, 'RW'),
+    ('TXPH_MONITOR_SEL',             0x071,  5,  2, 'RW'),
+    ('TAPDLY_SET_TX',                0x071,  2,  0, 'RW'),
+    ('ADAPT_CFG2',                   0x072, 16,  0, 'RW'),
+    ('RXDFE_VP_CFG1',                0x073, 16,  0, 'RW'),
+    ('TERM_RCAL_CFG',                0x074, 15,  0, 'RW'),
+    ('RXPI_CFG0',                    0x075, 16,  0, 'RW'),
+    ('PD_TRANS_TIME_FROM_P2',        0x076, 12,  4, 'RW'),
+    ('TERM_RCAL_OVRD',               0x076,  3,  1, 'RW'),
+    ('PD_TRANS_TIME_NONE_P2',        0x077,  8,  8, 'RW'),
+    ('PD_TRANS_TIME_TO_P2',          0x077,  8,  0, 'RW'),
+    ('TRANS_TIME_RATE',              0x078,  8,  8, 'RW'),
+    ('TST_RSV0',                     0x079,  8,  8, 'RW'),
+    ('TST_RSV1',                     0x079,  8,  0, 'RW'),
+    ('TX_CLK25_DIV',                 0x07A,  5, 11, 'RW', dict(enum=_RX_SIG_VALID_DLY_ENUM)),
+    ('TX_XCLK_SEL',                  0x07A,  1, 10, 'RW', dict(enum=_TX_XCLK_SEL_ENUM)),
+    ('TX_DATA_WIDTH',                0x07A,  4,  0, 'RW', dict(enum=_RX_DATA_WIDTH_ENUM)),
+    ('TX_DEEMPH0',                   0x07B,  6, 10, 'RW'),
+    ('TX_DEEMPH1',                   0x07B,  6,  2, 'RW'),
+    ('TX_MAINCURSOR_SEL',            0x07C,  1, 14, 'RW'),
+    ('TXGEARBOX_EN',                 0x07C,  1, 13, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('TXOUT_DIV',                    0x07C,  3,  8, 'RW', dict(enum=_RXOUT_DIV_ENUM)),
+    ('TXBUF_EN',                     0x07C,  1,  7, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('TXBUF_RESET_ON_RATE_CHANGE',   0x07C,  1,  6, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('TX_RXDETECT_REF',              0x07C,  3,  3, 'RW'),
+    ('TXFIFO_ADDR_CFG',              0x07C,  1,  2, 'RW', dict(enum=_TXFIFO_ADDR_CFG_ENUM)),
+    ('TX_SW_MEAS',                   0x07C,  2,  0, 'RW'),
+    ('TX_RXDETECT_CFG',              0x07D, 14,  2, 'RW'),
+    ('TX_CLKMUX_EN',                 0x07E,  1, 15, 'RW'),
+    ('TX_LOOPBACK_DRIVE_HIZ',        0x07E,  1, 14, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('TX_DRIVE_MODE',                0x07E,  5,  8, 'RW', dict(enum=_TX_DRIVE_MODE_ENUM)),
+    ('TX_EIDLE_ASSERT_DELAY',        0x07E,  3,  5, 'RW'),
+    ('TX_EIDLE_DEASSERT_DELAY',      0x07E,  3,  2, 'RW'),
+    ('TX_MARGIN_FULL_0',             0x07F,  7,  9, 'RW'),
+    ('TX_MARGIN_FULL_1',             0x07F,  7,  1, 'RW'),
+    ('TX_MARGIN_FULL_2',             0x080,  7,  9, 'RW'),
+    ('TX_MARGIN_FULL_3',             0x080,  7,  1, 'RW'),
+    ('TX_MARGIN_FULL_4',             0x081,  7,  9, 'RW'),
+    ('TX_MARGIN_LOW_0',              0x081,  7,  1, 'RW'),
+    ('TX_MARGIN_LOW_1',              0x082,  7,  9, 'RW'),
+    ('TX_MARGIN_LOW_2',              0x082,  7,  1, 'RW'),
+    ('TX_MARGIN_LOW_3',              0x083,  7,  9, 'RW'),
+    ('TX_MARGIN_LOW_4',              0x083,  7,  1, 'RW'),
+    ('RXDFE_H3_CFG0',                0x084, 16,  0, 'RW'),
+    ('TX_INT_DATAWIDTH',             0x085,  2, 10, 'RW'),
+    ('RXPRBS_LINKACQ_CNT',           0x089,  8,  0, 'RW'),
+    ('TX_PMADATA_OPT',               0x08A,  1, 15, 'RW'),
+    ('RXSYNC_OVRD',                  0x08A,  1, 14, 'RW'),
+    ('TXSYNC_OVRD',                  0x08A,  1, 13, 'RW'),
+    ('TX_IDLE_DATA_ZERO',            0x08A,  1, 12, 'RW'),
+    ('A_RXOSCALRESET',               0x08A,  1, 11, 'RW'),
+    ('RXOOB_CLK_CFG',                0x08A,  1, 10, 'RW', dict(enum=_RXOOB_CLK_CFG_ENUM)),
+    ('TXSYNC_SKIP_DA',               0x08A,  1,  9, 'RW'),
+    ('RXSYNC_SKIP_DA',               0x08A,  1,  8, 'RW'),
+    ('RXOSCALRESET_TIME',            0x08A,  5,  0, 'RW'),
+    ('TXSYNC_MULTILANE',             0x08B,  1, 10, 'RW'),
+    ('RXSYNC_MULTILANE',             0x08B,  1,  9, 'RW'),
+    ('ACJTAG_MODE',                  0x08C,  1, 15, 'RW'),
+    ('ACJTAG_DEBUG_MODE',            0x08C,  1, 14, 'RW'),
+    ('ACJTAG_RESET',                 0x08C,  1, 13, 'RW'),
+    ('RX_SUM_VCM_BIAS_TUNE_EN',      0x08C,  1, 12, 'RW'),
+    ('RX_TUNE_AFE_OS',               0x08C,  2, 10, 'RW'),
+    ('RX_DFE_KL_LPM_KL_CFG0',        0x08C,  2,  8, 'RW'),
+    ('RX_DFE_KL_LPM_KL_CFG1',        0x08C,  3,  5, 'RW'),
+    ('RX_SUM_DEGEN_AVTT_OVERITE',    0x08C,  1,  4, 'RW'),
+    ('RX_SUM_PWR_SAVING',            0x08C,  1,  3, 'RW'),
+    ('RX_EN_SUM_RCAL_B',             0x08C,  1,  2, 'RW'),
+    ('RXDFELPM_KL_CFG2',             0x08D, 16,  0, 'RW'),
+    ('TXDLY_CFG',                    0x08E, 16,  0, 'RW'),
+    ('TXPH_CFG',                     0x08F, 16,  0, 'RW'),
+    ('TXPHDLY_CFG0',                 0x090, 16,  0, 'RW'),
+    ('ADAPT_CFG0',                   0x091, 16,  0, 'RW'),
+    ('ADAPT_CFG1',                   0x092, 16,  0, 'RW'),
+    ('RXCFOK_CFG0',                  0x093, 16,  0, 'RW'),
+    ('ES_CLK_PHASE_SEL',             0x094,  1, 11, 'RW'),
+    ('USE_PCS_CLK_PHASE_SEL',        0x094,  1, 10, 'RW'),
+    ('SAMPLE_CLK_PHASE',             0x094,  1,  9, 'RW'),
+    ('TX_PMA_RSV0',                  0x095, 16,  0, 'RW'),
+    ('RX_AFE_CM_EN',                 0x097,  1, 12, 'RW'),
+    ('RX_CAPFF_SARC_ENB',            0x097,  1, 11, 'RW'),
+    ('RX_EYESCAN_VS_NEG_DIR',        0x097,  1, 10, 'RW'),
+    ('RX_EYESCAN_VS_UT_SIGN',        0x097,  1,  9, 'RW'),
+    ('RX_EYESCAN_VS_CODE',           0x097,  7,  2, 'RW'),
+    ('RX_EYESCAN_VS_RANGE',          0x097,  2,  0, 'RW'),
+    ('RXDFE_H5_CFG1',                0x098, 16,  0, 'RW'),
+    ('GEARBOX_MODE',                 0x099,  5, 11, 'RW'),
+    ('TXPI_SYNFREQ_PPM',             0x099,  3,  8, 'RW'),
+    ('TXPI_INVSTROBE_SEL',           0x099,  1,  6, 'RW'),
+    ('TXPI_GRAY_SEL',                0x099,  1,  5, 'RW'),
+    ('TXPI_PPM_CFG',                 0x09A,  8,  0, 'RW'),
+    ('RX_DFELPM_KLKH_AGC_STUP_EN',   0x09B,  1, 15, 'RW'),
+    ('RX_DFELPM_CFG0',               0x09B,  4, 11, 'RW'),
+    ('RX_DFELPM_CFG1',               0x09B,  1, 10, 'RW'),
+    ('RX_DFE_KL_LPM_KH_CFG0',        0x09B,  2,  8, 'RW'),
+    ('RX_DFE_KL_LPM_KH_CFG1',        0x09B,  3,  5, 'RW'),
+    ('TXFE_CFG0',                    0x09D, 16,  0, 'RW'),
+    ('RXDFE_UT_CFG0',                0x09E, 16,  0, 'RW'),
+    ('CPLL_CFG0',                    0x09F, 16,  0, 'RW'),
+    ('CPLL_CFG1',                    0x0A0, 16,  0, 'RW'),
+    ('TXFE_CFG1',                    0x0A1, 16,  0, 'RW'),
+    ('RXCDR_CFG0_GEN3',              0x0A2, 16,  0, 'RW'),
+    ('RXCDR_CFG1_GEN3',              0x0A3, 16,  0, 'RW'),
+    ('RXCDR_CFG2_GEN3',              0x0A4, 16,  0, 'RW'),
+    ('RXCDR_CFG3_GEN3',              0x0A5, 16,  0, 'RW'),
+    ('RXCDR_CFG4_GEN3',              0x0A6, 16,  0, 'RW'),
+    ('TXPI_CFG0',                    0x0A7, 16,  0, 'RW'),
+    ('TXPI_CFG1',                    0x0A8, 16,  0, 'RW'),
+    ('PCIE_RXPMA_CFG',               0x0A9, 16,  0, 'RW'),
+    ('PCIE_TXPCS_CFG_GEN3',          0x0AA, 16,  0, 'RW'),
+    ('PCIE_TXPMA_CFG',               0x0AB, 16,  0, 'RW'),
+    ('RX_CLK_SLIP_OVRD',             0x0AC,  5,  3, 'RW'),
+    ('TXPI_PPM',                     0x0AC,  1,  0, 'RW'),
+    ('PCIE_PLL_SEL_MODE_GEN4',       0x0AD,  2, 13, 'RW'),
+    ('PCIE_PLL_SEL_MODE_GEN3',       0x0AD,  2, 11, 'RW'),
+    ('PCIE_PLL_SEL_MODE_GEN12',      0x0AD,  2,  9, 'RW'),
+    ('RATE_SW_USE_DRP',              0x0AD,  1,  8, 'RW'),
+    ('RXDFE_HD_CFG1',                0x0AE, 16,  0, 'RW'),
+    ('RXCDR_CFG5_GEN3',              0x0AF, 16,  0, 'RW'),
+    ('RXDFE_KH_CFG3',                0x0B0, 16,  0, 'RW'),
+    ('RXDFE_KH_CFG2',                0x0B1, 16,  0, 'RW'),
+    ('RXDFE_KH_CFG1',                0x0B2, 16,  0, 'RW'),
+    ('RXDFE_H5_CFG0',                0x0B3, 16,  0, 'RW'),
+    ('RXCDR_CFG5',                   0x0B4, 16,  0, 'RW'),
+    ('RXDFE_HE_CFG1',                0x0B5, 16,  0, 'RW'),
+    ('CPLL_CFG3',                    0x0B6, 16,  0, 'RW'),
+    ('RXDFE_H6_CFG0',                0x0B7, 16,  0, 'RW'),
+    ('RXDFE_H6_CFG1',                0x0B8, 16,  0, 'RW'),
+    ('RXDFE_H7_CFG0',                0x0B9, 16,  0, 'RW'),
+    ('DDI_REALIGN_WAIT',             0x0BA,  5,  2, 'RW'),
+    ('DDI_CTRL',                     0x0BA,  2,  0, 'RW'),
+    ('TXGBOX_FIFO_INIT_RD_ADDR',     0x0BB,  3,  9, 'RW'),
+    ('TX_SAMPLE_PERIOD',             0x0BB,  3,  6, 'RW'),
+    ('RXGBOX_FIFO_INIT_RD_ADDR',     0x0BB,  3,  3, 'RW'),
+    ('RX_SAMPLE_PERIOD',             0x0BB,  3,  0, 'RW'),
+    ('CPLL_CFG2',                    0x0BC, 16,  0, 'RW'),
+    ('RXPHSAMP_CFG',                 0x0BD, 16,  0, 'RW'),
+    ('RXPHSLIP_CFG',                 0x0BE, 16,  0, 'RW'),
+    ('RXPHBEACON_CFG',               0x0BF, 16,  0, 'RW'),
+    ('RXDFE_H7_CFG1',                0x0C0, 16,  0, 'RW'),
+    ('RXDFE_H8_CFG0',                0x0C1, 16,  0, 'RW'),
+    ('RXDFE_H8_CFG1',                0x0C2, 16,  0, 'RW'),
+    ('PCIE_BUFG_DIV_CTRL',           0x0C3, 16,  0, 'RW'),
+    ('PCIE_RXPCS_CFG_GEN3',          0x0C4, 16,  0, 'RW'),
+    ('RXDFE_H9_CFG0',                0x0C5, 16,  0, 'RW'),
+    ('RX_PROGDIV_CFG',               0x0C6, 16,  0, 'RW', dict(enum=_TX_PROGDIV_CFG_ENUM)),
+    ('RXDFE_H9_CFG1',                0x0C7, 16,  0, 'RW'),
+    ('RXDFE_HA_CFG0',                0x0C8, 16,  0, 'RW'),
+    ('CHAN_BOND_SEQ_1_2',            0x0CA, 10,  0, 'RW'),
+    ('RXDFE_GC_CFG0',                0x0CB, 16,  0, 'RW'),
+    ('RXDFE_GC_CFG1',                0x0CC, 16,  0, 'RW'),
+    ('RX_DDI_SEL',                   0x0CD,  6,  2, 'RW'),
+    ('DEC_VALID_COMMA_ONLY',         0x0CD,  1,  1, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('DEC_MCOMMA_DETECT',            0x0CD,  1,  0, 'RW', dict(enum=_TRUE_FALSE_ENUM)),
+    ('RXDFE_CFG0',                   0x0CE, 16,  0, 'RW'),
+    ('RXDFE_CFG1',                   0x0CF, 16,  0, 'RW'),
+    ('RX_RESLOAD_OVRD',              0x0D0,  1,  8, 'RW'),
+    ('RX_CTLE_PWR_SAVING',           0x0D0,  1,  7, 'RW'),
+    ('RX_DEGEN_CTRL',                0x0D0,  3,  4, 'RW'),
+    ('RX_RESLOAD_CTRL',              0x0D0,  4,  0, 'RW'),
+    ('RX_EN_CTLE_RCAL_B',            0x0D1,  1, 12, 'RW'),
+    ('RX_CTLE_RES_CTRL',             0x0D1,  4,  8, 'RW'),
+    ('RX_SUM_RES_CTRL',              0x0D1,  4,  0, 'RW'),
+    ('RXPI_CFG1',                    0x0D2, 16,  0, 'RW'),
+    ('LPBK_EN_RCAL_B',               0x0D3,  1, 13, 'RW'),
+    ('LPBK_IND_CTRL2',               0x0D3,  3,  5, 'RW'),
+    ('LPBK_BIAS_CTRL',               0x0D3,  3,  2, 'RW'),
+    ('RX_XMODE_SEL',                 0x0D3,  1,  1, 'RW'),
+    ('ISCAN_CK_PH_SEL2',             0x0D3,  1,  0, 'RW'),
+    ('LPBK_IND_CTRL1',               0x0D4,  3, 11, 'RW'),
+    ('LPBK_RG_CTRL',                 0x0D4,  4,  7, 'RW'),
+    ('LPBK_IND_CTRL0',               0x0D4,  3,  0, 'RW'),
+    ('CKCAL1_CFG_3',                 0x0D5, 16,  0, 'RW', dict(overlapEn=True)),
+    ('CKCAL1_DCC_PWRDN',             0x0D5,  2,  1, 'RW', dict(overlapEn=True)),
+    ('CKCAL1_IQ_PWRDN',              0x0D5,  1,  0, 'RW', dict(overlapEn=True)),
+    ('CKCAL2_CFG_3',                 0x0D6, 16,  0, 'RW'),
+    ('CKCAL2_CFG_4',                 0x0D7, 16,  0, 'RW'),
+    ('RX_PMA_RSV0',                  0x0D8, 16,  0, 'RW'),
+    ('CKCAL2_CFG_2',                 0x0D9, 16,  0, 'RW'),
+    ('RXCDR_LOCK_CFG2',              0x0DA, 16,  0, 'RW'),
+    ('CKCAL1_CFG_2',                 0x0DB, 16,  0, 'RW'),
+    ('RTX_BUF_TERM_CTRL',            0x0DD,  2,  3, 'RW'),
+    ('RTX_BUF_CML_CTRL',             0x0DD,  3,  0, 'RW'),
+    ('TXPH_CFG2',                    0x0DE, 16,  0, 'RW'),
+    ('RXCDR_LOCK_CFG4',              0x0DF, 16,  0, 'RW'),
+    ('CTLE3_OCAP_EXT_CTRL',          0x0E0,  3,  6, 'RW'),
+    ('CTLE3_OCAP_EXT_EN',            0x0E0,  1,  5, 'RW'),
+    ('TX_VREG_VREFSEL',              0x0E2,  2, 12, 'RW'),
+    ('TX_VREG_CTRL',                 0x0E2,  3,  9, 'RW'),
+    ('TX_VREG_PDB',                  0x0E2,  1,  8, 'RW'),
+    ('ES_QUALIFIER5',                0x0E7, 16,  0, 'RW'),
+    ('ES_QUALIFIER6',                0x0E8, 16,  0, 'RW'),
+    ('ES_QUALIFIER7',                0x0E9, 16,  0, 'RW'),
+    ('ES_QUALIFIER8',                0x0EA, 16,  0, 'RW'),
+    ('ES_QUALIFIER9',                0x0EB, 16,  0, 'RW'),
+    ('ES_QUAL_MASK5',                0x0EC, 16,  0, 'RW'),
+    ('ES_QUAL_MASK6',                0x0ED, 16,  0, 'RW'),
+    ('ES_QUAL_MASK7',                0x0EE, 16,  0, 'RW'),
+    ('ES_QUAL_MASK8',                0x0EF, 16,  0, 'RW'),
+    ('ES_QUAL_MASK9',                0x0F0, 16,  0, 'RW'),
+    ('ES_SDATA_MASK5',               0x0F1, 16,  0, 'RW'),
+    ('ES_SDATA_MASK6',               0x0F2, 16,  0, 'RW'),
+    ('ES_SDATA_MASK7',               0x0F3, 16,  0, 'RW'),
+    ('ES_SDATA_MASK8',               0x0F4, 16,  0, 'RW'),
+    ('ES_SDATA_MASK9',               0x0F5, 16,  0, 'RW'),
+    ('TX_PMA_RSV1',                  0x0F6, 16,  0, 'RW'),
+    ('CKCAL1_CFG_0',                 0x0F7, 16,  0, 'RW'),
+    ('CKCAL1_CFG_1',                 0x0F8, 16,  0, 'RW'),
+    ('CKCAL2_CFG_0',                 0x0F9, 16,  0, 'RW'),
+    ('TXSWBST_MAG',                  0x0FA,  3, 13, 'RW'),
+    ('TXDRV_FREQBAND',               0x0FA,  2,  9, 'RW'),
+    ('TXSWBST_BST',                  0x0FA,  2,  7, 'RW'),
+    ('TXSWBST_EN',                   0x0FA,  1,  6, 'RW'),
+    ('RX_VREG_CTRL',                 0x0FA,  3,  1, 'RW'),
+    ('RX_VREG_PDB',                  0x0FA,  1,  0, 'RW'),
+    ('LPBK_EXT_RCAL',                0x0FB,  4,  6, 'RW'),
+    ('PREIQ_FREQ_BST',               0x0FB,  2,  4, 'RW'),
+    ('TX_PI_BIASSET',                0x0FB,  2,  1, 'RW'),
+    ('TX_PHICAL_CFG0',               0x0FC, 16,  0, 'RW'),
+    ('TX_PHICAL_CFG1',               0x0FD, 16,  0, 'RW'),
+    ('RXCDR_LOCK_CFG3',              0x0FE, 16,  0, 'RW'),
+    ('RXDFE_UT_CFG2',                0x100, 16,  0, 'RW'),
+    ('CKCAL2_CFG_1',                 0x101, 16,  0, 'RW'),
+    ('Y_ALL_MODE',                   0x102,  1,  2, 'RW'),
+    ('RCLK_SIPO_DLY_ENB',            0x102,  1,  1, 'RW'),
+    ('RCLK_SIPO_INV_EN',             0x102,  1,  0, 'RW'),
+    ('RX_PROGDIV_RATE',              0x103, 16,  0, 'RW'),
+    ('RXDFE_HF_CFG1',                0x104, 16,  0, 'RW'),
+    ('TX_PROGDIV_RATE',              0x105, 16,  0, 'RW'),
+    ('TX_DCC_LOOP_RST_CFG',          0x106, 16,  0, 'RW'),
+    ('RXDFE_HC_CFG0',                0x107, 16,  0, 'RW'),
+    ('RXCKCAL1_I_LOOP_RST_CFG',      0x108, 16,  0, 'RW'),
+    ('RXCKCAL1_Q_LOOP_RST_CFG',      0x109, 16,  0, 'RW'),
+    ('RXCKCAL1_IQ_LOOP_RST_CFG',     0x10A, 16,  0, 'RW'),
+    ('RXCKCAL2_D_LOOP_RST_CFG',      0x10B, 16,  0, 'RW'),
+    ('RXCKCAL2_X_LOOP_RST_CFG',      0x10C, 16,  0, 'RW'),
+    ('RXCKCAL2_S_LOOP_RST_CFG',      0x10D, 16,  0, 'RW'),
+    ('RXCKCAL2_DX_LOOP_RST_CFG',     0x10E, 16,  0, 'RW'),
+    ('RXDFE_KH_CFG0',                0x110, 16,  0, 'RW'),
+    ('RXDFE_H4_CFG1',                0x111, 16,  0, 'RW'),
+    ('RXDFE_H4_CFG0',                0x112, 16,  0, 'RW'),
+    ('RXDFE_H3_CFG1',                0x113, 16,  0, 'RW'),
+    ('CH_HSPMUX',                    0x116, 16,  0, 'RW'),
+    ('PCIE3_CLK_COR_MIN_LAT',        0x117,  5, 11, 'RW'),
+    ('PCIE3_CLK_COR_MAX_LAT',        0x117,  5,  6, 'RW'),
+    ('PCIE3_CLK_COR_THRSH_TIMER',    0x117,  6,  0, 'RW'),
+    ('USB_MODE',                     0x118,  1, 15, 'RW'),
+    ('USB_EXT_CNTL',                 0x118,  1, 14, 'RW'),
+    ('USB_CLK_COR_EQ_EN',            0x118,  1, 13, 'RW'),
+    ('USB_PCIE_ERR_REP_DIS',         0x118,  1, 12, 'RW'),
+    ('PCIE3_CLK_COR_FULL_THRSH',     0x118,  6,  6, 'RW'),
+    ('PCIE3_CLK_COR_EMPTY_THRSH',    0x118,  5,  0, 'RW'),
+    ('USB_RAW_ELEC',                 0x119,  1, 15, 'RW'),
+    ('DELAY_ELEC',                   0x119,  1, 14, 'RW'),
+    ('USB_BOTH_BURST_IDLE',          0x119,  1, 13, 'RW'),
+    ('TXREFCLKDIV2_SEL',             0x119,  1, 12, 'RW'),
+    ('TX_DEEMPH2',                   0x119,  6,  6, 'RW'),
+    ('TX_DEEMPH3',                   0x119,  6,  0, 'RW'),
+    ('RXREFCLKDIV2_SEL',             0x11A,  1,  6, 'RW'),
+    ('A_RXTERMINATION',              0x11A,  1,  5, 'RW'),
+    ('USB_LFPS_TPERIOD',             0x11A,  4,  1, 'RW'),
+    ('USB_LFPS_TPERIOD_ACCURATE',    0x11A,  1,  0, 'RW'),
+    ('RXCDR_CFG2_GEN4',              0x11B, 16,  0, 'RW'),
+    ('RXCDR_CFG3_GEN4',              0x11C, 16,  0, 'RW'),
+    ('USB_BURSTMIN_U3WAKE',          0x11D,  7,  8, 'RW'),
+    ('USB_BURSTMAX_U3WAKE',          0x11D,  7,  0, 'RW'),
+    ('USB_IDLEMIN_POLLING',          0x11E, 10,  0, 'RW'),
+    ('USB_IDLEMAX_POLLING',          0x11F, 10,  0, 'RW'),
+    ('USB_LFPSPOLLING_BURST',        0x120,  9,  0, 'RW'),
+    ('USB_LFPSPING_BURST',           0x121,  9,  0, 'RW'),
+    ('USB_LFPSU1EXIT_BURST',         0x122,  9,  0, 'RW'),
+    ('USB_LFPSU2LPEXIT_BURST_MS',    0x123,  9,  0, 'RW'),
+    ('USB_LFPSU3WAKE_BURST_MS',      0x124,  9,  0, 'RW'),
+    ('USB_LFPSPOLLING_IDLE_MS',      0x125,  9,  0, 'RW'),
+    ('RXDFE_HA_CFG1',                0x126, 16,  0, 'RW'),
+    ('RXDFE_HB_CFG0',                0x127, 16,  0, 'RW'),
+    ('RXCDR_CFG3_GEN2',              0x135,  6, 10, 'RW'),
+    ('RXCDR_CFG2_GEN2',              0x135, 10,  0, 'RW'),
+    ('COMMA_ALIGN_LATENCY',          0x250,  7,  0, 'RO'),
+    ('es_error_count',               0x251, 16,  0, 'RO'),
+    ('es_sample_count',              0x252, 16,  0, 'RO'),
+    ('es_control_status',            0x253,  4,  0, 'RO'),
+    ('es_rdata_byte4',               0x254, 16,  0, 'RO'),
+    ('es_rdata_byte3',               0x255, 16,  0, 'RO'),
+    ('es_rdata_byte2',               0x256, 16,  0, 'RO'),
+    ('es_rdata_byte1',               0x257, 16,  0, 'RO'),
+    ('es_rdata_byte0',               0x258, 16,  0, 'RO'),
+    ('es_sdata_byte4',               0x259, 16,  0, 'RO'),
+    ('es_sdata_byte3',               0x25A, 16,  0, 'RO'),
+    ('es_sdata_byte2',               0x25B, 16,  0, 'RO'),
+    ('es_sdata_byte1',               0x25C, 16,  0, 'RO'),
+    ('es_sdata_byte0',               0x25D, 16,  0, 'RO'),
+    ('RX_PRBS_ERR_CNT',              [0x25E, 0x25F], [16, 16], [0, 0], 'RO'),
+    ('TXGBOX_FIFO_LATENCY',          0x263, 16,  0, 'RO'),
+    ('RXGBOX_FIFO_LATENCY',          0x269, 16,  0, 'RO'),
+    ('es_sdata_byte5',               0x283, 16,  0, 'RO'),
+    ('es_sdata_byte6',               0x284, 16,  0, 'RO'),
+    ('es_sdata_byte7',               0x285, 16,  0, 'RO'),
+    ('es_sdata_byte8',               0x286, 16,  0, 'RO'),
+    ('es_sdata_byte9',               0x287, 16,  0, 'RO'),
+    ('es_rdata_byte5',               0x288, 16,  0, 'RO'),
+    ('es_rdata_byte6',               0x289, 16,  0, 'RO'),
+    ('es_rdata_byte7',               0x28A, 16,  0, 'RO'),
+    ('es_rdata_byte8',               0x28B, 16,  0, 'RO'),
+    ('es_rdata_byte9',               0x28C, 16,  0, 'RO'),
+)
 
-    def __init__(self, **kwargs):
+class Gtye4Channel(pr.Device):
+    def __init__(self, attributes=None, **kwargs):
         super().__init__(**kwargs)
 
         ##############################
         # Variables
         ##############################
 
-        def addVar(**kwargs):
-            kwargs['offset'] = kwargs['offset'] << 2
-            self.add(pr.RemoteVariable(**kwargs))
-
-        addVar(
-            name         = "CDR_SWAP_MODE_EN",
-            offset       =  0x02,
-            bitSize      =  1,
-            mode         = "RW")
-
-        addVar(
-            name         = "RXBUFRESET_TIME",
-            offset       =  0x03,
-            bitSize      =  5,
-            bitOffset    =  11,
-            mode         = "RW")
-
-
-        addVar(
-            name         = "CFOK_PWRSVE_EN",
-            offset       =  0x03,
-            bitSize      =  1,
-            bitOffset    =  10,
-            mode         = "RW")
-
-        addVar(
-            name         = "EYE_SCAN_SWAP_EN",
-            offset       = 0x3,
-            bitSize      =  1,
-            bitOffset    =  9,
-            mode         = "RW")
-
-        addVar(
-            name         = "RX_DATA_WIDTH",
-            offset       =  0x03,
-            bitSize      =  4,
-            bitOffset    =  5,
-            mode         = "RW",
-            enum         = {
-                0 : '-',
-                2 : '16',
-                3 : '20',
-                4 : '32',
-                5 : '40',
-                6 : '64',
-                7 : '80',
-                8 : '128',
-                9 : '160'})
-
-        addVar(
-            name         = "RXCDRFREQRESET_TIME",
-            offset       =  0x03,
-            bitSize      =  5,
-            bitOffset    =  0,
-            mode         = "RW")
-
-        addVar(
-            offset = 0x0004,
-            bitSize = 5,
-            bitOffset =11,
-            mode = 'RW',
-            name = 'RXCDRPHRESET_TIME')
-
-        addVar(
-            offset = 0x0004,
-            bitSize = 3,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'PCI3_RX_ELECIDLE_H2L_DISABLE')
-
-        addVar(
-            offset = 0x0004,
-            bitSize = 7,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'RXDFELPMRESET_TIME')
-
-        addVar(
-            offset = 0x0004,
-            bitSize = 1,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RX_FABINT_USRCLK_FLOP')
-
-        addVar(
-            offset = 0x0005,
-            bitSize = 5,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'RXPMARESET_TIME')
-
-        addVar(
-            offset = 0x0005,
-            bitSize = 1,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'PCI3_RX_ELECIDLE_LP4_DISABLE')
-
-        addVar(
-            offset = 0x0005,
-            bitSize = 1,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'PCI3_RX_FIFO_DISABLE')
-
-        addVar(
-            offset = 0x0005,
-            bitSize = 1,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'PCI3_RX_ELECIDLE_EI2_ENABLE')
-
-        addVar(
-            offset = 0x0005,
-            bitSize = 5,
-            bitOffset = 3,
-            mode = 'RW',
-            name = 'RXPCSRESET_TIME')
-
-        addVar(
-            offset = 0x0005,
-            bitSize = 3,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXELECIDLE_CFG',
-            enum = {
-                0 : 'SIGCFG_1',
-                1 : 'SIGCFG_2',
-                2 : 'SIGCFG_3',
-                3 : 'SIGCFG_4',
-                4 : 'SIGCFG_6',
-                5 : 'SIGCFG_8',
-                6 : 'SIGCFG_12',
-                7 : 'SIGCFG_16'})
-
-        addVar(
-            offset = 0x0006,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_HB_CFG1')
-
-        addVar(
-            offset = 0x0009,
-            bitSize = 5,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'TXPMARESET_TIME')
-
-        addVar(
-            offset = 0x0009,
-            bitSize = 5,
-            bitOffset = 3,
-            mode = 'RW',
-            name = 'TXPCSRESET_TIME')
-
-        addVar(
-            offset = 0x0009,
-            bitSize = 1,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'RX_PMA_POWER_SAVE')
-
-        addVar(
-            offset = 0x0009,
-            bitSize = 1,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'TX_PMA_POWER_SAVE')
-
-        addVar(
-            offset = 0x0009,
-            bitSize = 1,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'SRSTMODE')
-
-        addVar(
-            offset = 0x000A,
-            bitSize = 1,
-            bitOffset = 3,
-            mode = 'RW',
-            name = 'TX_FIFO_BYP_EN')
-
-        addVar(
-            offset = 0x000B,
-            bitSize = 1,
-            bitOffset = 4,
-            mode = 'RW',
-            name = 'TX_FABINT_USRCLK_FLOP')
-
-
-        addVar(
-            offset = 0x000B,
-            bitSize = 2,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'RXPMACLK_SEL',
-            enum = {
-                2 : 'CROSSING',
-                0 : 'DATA',
-                1 : 'EYESCAN'})
-
-        addVar(
-            offset = 0x000C,
-            bitSize = 2,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'TX_PROGCLK_SEL',
-            enum = {
-                0 : 'POSTPI',
-                1 : 'PREPI',
-                2 : 'CPLL'})
-
-        addVar(
-            offset = 0x000C,
-            bitSize = 5,
-            bitOffset = 5,
-            mode = 'RW',
-            name = 'RXISCANRESET_TIME')
-
-        addVar(
-            offset = 0x000D,
-            bitSize = 6,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'TXAMONSEL')
-
-        addVar(
-            offset = 0x000D,
-            bitSize = 2,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'BLOCKSEL')
-
-        addVar(
-            offset = 0x000E,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_CFG0')
-
-        addVar(
-            offset = 0x000F,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_CFG1')
-
-        addVar(
-            offset = 0x0010,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_CFG2')
-
-        addVar(
-            overlapEn = True,
-            offset = 0x0011,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_CFG3')
-
-        addVar(
-            overlapEn = True,
-            offset = 0x0011,
-            bitSize = 1,
-            bitOffset = 7,
-            mode = 'RW',
-            name = 'SELCKOK')
-
-        addVar(
-            offset = 0x0012,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_CFG4')
-
-        addVar(
-            offset = 0x0013,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CPLL_LOCK_CFG')
-
-        addVar(
-            offset = 0x0014,
-            bitSize = 4,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'CHAN_BOND_MAX_SKEW')
-
-        addVar(
-            offset = 0x0014,
-            bitSize = 2,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'CHAN_BOND_SEQ_LEN',
-            enum = {
-                0 : '1',
-                1 : '2',
-                2 : '3',
-                3 : '4'})
-
-        addVar(
-            offset = 0x0014,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CHAN_BOND_SEQ_1_1')
-
-        addVar(
-            offset = 0x0015,
-            bitSize = 6,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'PCI3_RX_ELECIDLE_HI_COUNT')
-
-        addVar(
-            offset = 0x0015,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CHAN_BOND_SEQ_1_3')
-
-        addVar(
-            offset = 0x0016,
-            bitSize = 6,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'PCI3_RX_ELECIDLE_H2L_COUNT')
-
-        addVar(
-            offset = 0x0016,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CHAN_BOND_SEQ_1_4')
-
-        addVar(
-            offset = 0x0017,
-            bitSize = 6,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'RX_BUFFER_CFG')
-
-        addVar(
-            offset = 0x0017,
-            bitSize = 1,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'RX_DEFER_RESET_BUF_EN',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0017,
-            bitSize = 2,
-            bitOffset = 7,
-            mode = 'RW',
-            name = 'OOBDIVCTL')
-
-        addVar(
-            offset = 0x0017,
-            bitSize = 2,
-            bitOffset = 5,
-            mode = 'RW',
-            name = 'PCI3_AUTO_REALIGN',
-            enum = {
-                0 : 'FRST_SMPL',
-                1 : 'OVR_8_BLK',
-                2 : 'OVR_64_BLK',
-                3 : 'OVR_1K_BLK'})
-
-
-        addVar(
-            offset = 0x0017,
-            bitSize = 1,
-            bitOffset = 4,
-            mode = 'RW',
-            name = 'PCI3_PIPE_RX_ELECIDLE')
-
-        addVar(
-            offset = 0x0018,
-            bitSize = 4,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'CHAN_BOND_SEQ_1_ENABLE')
-
-        addVar(
-            offset = 0x0018,
-            bitSize = 2,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'PCI3_RX_ASYNC_EBUF_BYPASS')
-
-        addVar(
-            offset = 0x0018,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CHAN_BOND_SEQ_2_1')
-
-        addVar(
-            offset = 0x0019,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CHAN_BOND_SEQ_2_2')
-
-        addVar(
-            offset = 0x001A,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CHAN_BOND_SEQ_2_3')
-
-        addVar(
-            offset = 0x001B,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CHAN_BOND_SEQ_2_4')
-
-        addVar(
-            offset = 0x001C,
-            bitSize = 4,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'CHAN_BOND_SEQ_2_ENABLE')
-
-        addVar(
-            offset = 0x001C,
-            bitSize = 1,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'CHAN_BOND_SEQ_2_USE',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x001C,
-            bitSize = 1,
-            bitOffset = 6,
-            mode = 'RW',
-            name = 'CLK_COR_KEEP_IDLE',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x001C,
-            bitSize = 6,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CLK_COR_MIN_LAT')
-
-        addVar(
-            offset = 0x001D,
-            bitSize = 6,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'CLK_COR_MAX_LAT')
-
-        addVar(
-            offset = 0x001D,
-            bitSize = 1,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'CLK_COR_PRECEDENCE',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x001D,
-            bitSize = 5,
-            bitOffset = 4,
-            mode = 'RW',
-            name = 'CLK_COR_REPEAT_WAIT')
-
-        addVar(
-            offset = 0x001D,
-            bitSize = 2,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'CLK_COR_SEQ_LEN',
-            enum = {
-                0 : '1',
-                1 : '2',
-                2 : '3',
-                3 : '4'})
-
-        addVar(
-            offset = 0x001D,
-            bitSize = 1,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CHAN_BOND_KEEP_ALIGN',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x001E,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CLK_COR_SEQ_1_1')
-
-        addVar(
-            offset = 0x001F,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CLK_COR_SEQ_1_2')
-
-        addVar(
-            offset = 0x0020,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CLK_COR_SEQ_1_3')
-
-        addVar(
-            offset = 0x0021,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CLK_COR_SEQ_1_4')
-
-        addVar(
-            offset = 0x0022,
-            bitSize = 4,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'CLK_COR_SEQ_1_ENABLE')
-
-        addVar(
-            offset = 0x0022,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CLK_COR_SEQ_2_1')
-
-        addVar(
-            offset = 0x0023,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CLK_COR_SEQ_2_2')
-
-        addVar(
-            offset = 0x0024,
-            bitSize = 4,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'CLK_COR_SEQ_2_ENABLE')
-
-        addVar(
-            offset = 0x0024,
-            bitSize = 1,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'CLK_COR_SEQ_2_USE',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0024,
-            bitSize = 1,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'CLK_CORRECT_USE',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0024,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CLK_COR_SEQ_2_3')
-
-        addVar(
-            offset = 0x0025,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CLK_COR_SEQ_2_4')
-
-        addVar(
-            offset = 0x0026,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_HE_CFG0')
-
-        addVar(
-            offset = 0x0027,
-            bitSize = 3,
-            bitOffset = 13,
-            mode = 'RW',
-            name = 'ALIGN_COMMA_WORD',
-            enum = {
-                0 : '-',
-                1 : '1',
-                2 : '2',
-                4 : '4'})
-
-        addVar(
-            offset = 0x0027,
-            bitSize = 1,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'ALIGN_COMMA_DOUBLE',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0027,
-            bitSize = 1,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'SHOW_REALIGN_COMMA',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0027,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ALIGN_COMMA_ENABLE')
-
-        addVar(
-            offset = 0x0028,
-            bitSize = 8,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'CPLL_FBDIV',
-            enum = {
-                0 : '2',
-                1 : '3',
-                2 : '4',
-                3 : '5',
-                16 : '1'})
-
-        addVar(
-            offset = 0x0028,
-            bitSize = 1,
-            bitOffset = 7,
-            mode = 'RW',
-            name = 'CPLL_FBDIV_45',
-            enum = {
-                0 : '4',
-                1 : '5'})
-
-        addVar(
-            offset = 0x0029,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_LOCK_CFG0')
-
-        addVar(
-            offset = 0x002A,
-            bitSize = 5,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'CPLL_REFCLK_DIV',
-            enum = {
-                0 : '2',
-                16 : '1'})
-
-        addVar(
-            offset = 0x002A,
-            bitSize = 1,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'CPLL_IPS_EN')
-
-        addVar(
-            offset = 0x002A,
-            bitSize = 3,
-            bitOffset = 7,
-            mode = 'RW',
-            name = 'CPLL_IPS_REFCLK_SEL')
-
-        addVar(
-            offset = 0x002A,
-            bitSize = 2,
-            bitOffset = 5,
-            mode = 'RW',
-            name = 'SATA_CPLL_CFG',
-            enum = {
-                0 : 'VCO_3000MHZ',
-                1 : 'VCO_1500MHZ',
-                2 : 'VCO_750MHZ'})
-
-        addVar(
-            offset = 0x002A,
-            bitSize = 5,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'A_TXDIFFCTRL')
-
-        addVar(
-            offset = 0x002B,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CPLL_INIT_CFG0')
-
-        addVar(
-            offset = 0x002C,
-            bitSize = 1,
-            bitOffset = 15,
-            mode = 'RW',
-            name = 'DEC_PCOMMA_DETECT',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x002C,
-            bitSize = 5,
-            bitOffset = 7,
-            mode = 'RW',
-            name = 'TX_DIVRESET_TIME')
-
-        addVar(
-            offset = 0x002C,
-            bitSize = 5,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'RX_DIVRESET_TIME')
-
-        addVar(
-            offset = 0x002C,
-            bitSize = 1,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'A_TXPROGDIVRESET')
-
-        addVar(
-            offset = 0x002C,
-            bitSize = 1,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'A_RXPROGDIVRESET')
-
-        addVar(
-            offset = 0x002D,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_LOCK_CFG1')
-
-        addVar(
-            offset = 0x002E,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCFOK_CFG1')
-
-        addVar(
-            offset = 0x002F,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H2_CFG0')
-
-        addVar(
-            offset = 0x0030,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H2_CFG1')
-
-        addVar(
-            offset = 0x0031,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCFOK_CFG2')
-
-        addVar(
-            offset = 0x0032,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXLPM_CFG')
-
-        addVar(
-            offset = 0x0033,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXLPM_KH_CFG0')
-
-        addVar(
-            offset = 0x0034,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXLPM_KH_CFG1')
-
-        addVar(
-            offset = 0x0035,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFELPM_KL_CFG0')
-
-        addVar(
-            offset = 0x0036,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFELPM_KL_CFG1')
-
-        addVar(
-            offset = 0x0037,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXLPM_OS_CFG0')
-
-        addVar(
-            offset = 0x0038,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXLPM_OS_CFG1')
-
-        addVar(
-            offset = 0x0039,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXLPM_GC_CFG')
-
-        addVar(
-            offset = 0x003A,
-            bitSize = 8,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'DMONITOR_CFG1')
-
-        addVar(
-            offset = 0x003C,
-            bitSize = 6,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'ES_CONTROL')
-
-        addVar(
-            offset = 0x003C,
-            bitSize = 5,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_PRESCALE')
-
-        addVar(
-            offset = 0x003C,
-            bitSize = 1,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'ES_EYE_SCAN_EN',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x003C,
-            bitSize = 1,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'ES_ERRDET_EN',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x003D,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_GC_CFG2')
-
-        addVar(
-            offset = 0x003E,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TXDLY_LCFG')
-
-        addVar(
-            offset = 0x003F,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUALIFIER0')
-
-        addVar(
-            offset = 0x0040,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUALIFIER1')
-
-        addVar(
-            offset = 0x0041,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUALIFIER2')
-
-        addVar(
-            offset = 0x0042,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUALIFIER3')
-
-        addVar(
-            offset = 0x0043,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUALIFIER4')
-
-        addVar(
-            offset = 0x0044,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUAL_MASK0')
-
-        addVar(
-            offset = 0x0045,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUAL_MASK1')
-
-        addVar(
-            offset = 0x0046,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUAL_MASK2')
-
-        addVar(
-            offset = 0x0047,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUAL_MASK3')
-
-        addVar(
-            offset = 0x0048,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUAL_MASK4')
-
-        addVar(
-            offset = 0x0049,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_SDATA_MASK0')
-
-        addVar(
-            offset = 0x004A,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_SDATA_MASK1')
-
-        addVar(
-            offset = 0x004B,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_SDATA_MASK2')
-
-        addVar(
-            offset = 0x004C,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_SDATA_MASK3')
-
-        addVar(
-            offset = 0x004D,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_SDATA_MASK4')
-
-        addVar(
-            offset = 0x004E,
-            bitSize = 1,
-            bitOffset = 4,
-            mode = 'RW',
-            name = 'FTS_LANE_DESKEW_EN',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x004E,
-            bitSize = 4,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'FTS_DESKEW_SEQ_ENABLE')
-
-        addVar(
-            offset = 0x004F,
-            bitSize = 12,
-            bitOffset = 4,
-            mode = 'RW',
-            name = 'ES_HORZ_OFFSET')
-
-        addVar(
-            offset = 0x004F,
-            bitSize = 4,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'FTS_LANE_DESKEW_CFG')
-
-        addVar(
-            offset = 0x0050,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_HC_CFG1')
-
-        addVar(
-            offset = 0x0051,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_PMA_CFG')
-
-        addVar(
-            offset = 0x0052,
-            bitSize = 3,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'RX_DFE_AGC_CFG1')
-
-        addVar(
-            offset = 0x0053,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TXFE_CFG2')
-
-        addVar(
-            offset = 0x0054,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TXFE_CFG3')
-
-        addVar(
-            offset = 0x0055,
-            bitSize = 1,
-            bitOffset = 14,
-            mode = 'RW',
-            name = 'PCIE_64B_DYN_CLKSW_DIS',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0055,
-            bitSize = 1,
-            bitOffset = 13,
-            mode = 'RW',
-            name = 'LOCAL_MASTER')
-
-        addVar(
-            offset = 0x0055,
-            bitSize = 1,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'PCS_PCIE_EN',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0055,
-            bitSize = 1,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'PCIE_GEN4_64BIT_INT_EN',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0055,
-            bitSize = 1,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'ALIGN_MCOMMA_DET',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0055,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ALIGN_MCOMMA_VALUE')
-
-        addVar(
-            offset = 0x0056,
-            bitSize = 1,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'ALIGN_PCOMMA_DET',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0056,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ALIGN_PCOMMA_VALUE')
-
-
-
-        addVar(
-            offset = 0x0057,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TX_PROGDIV_CFG',
-            enum = {
-                0 : '-',
-                32768 : '0',
-                57440 : '10',
-                57455 : '100',
-                24654 : '128',
-                57862 : '132',
-                57410 : '16',
-                16.57880 : '5',
-                57442 : '20',
-                57414 : '32',
-                57856 : '33',
-                57432 : '4',
-                57415 : '40',
-                57464 : '5',
-                57422 : '64',
-                57858 : '66',
-                57408 : '8',
-                57423 : '80'})
-
-        addVar(
-            offset = 0x0058,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_OS_CFG0')
-
-        addVar(
-            offset = 0x0059,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXPHDLY_CFG')
-
-        addVar(
-            offset = 0x005A,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_OS_CFG1')
-
-        addVar(
-            offset = 0x005B,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDLY_CFG')
-
-        addVar(
-            offset = 0x005C,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDLY_LCFG')
-
-        addVar(
-            offset = 0x005D,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_HF_CFG0')
-
-        addVar(
-            offset = 0x005E,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_HD_CFG0')
-
-        addVar(
-            offset = 0x005F,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RX_BIAS_CFG0')
-
-        addVar(
-            overlapEn = True,
-            offset = 0x0060,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'PCS_RSVD0')
-
-        addVar(
-            overlapEn = True,
-            offset = 0x0060,
-            bitSize = 5,
-            bitOffset = 4,
-            mode = 'RW',
-            name = 'PCIE_GEN4_NEW_EIEOS_DET_EN')
-
-        addVar(
-            overlapEn = True,
-            offset = 0x0060,
-            bitSize = 2,
-            bitOffset = 0,
-            mode = 'RW',
-             name = 'USB3_RXTERMINATION_CTRL')
-
-        addVar(
-            offset = 0x0061,
-            bitSize = 5,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'RXPH_MONITOR_SEL')
-
-        addVar(
-            offset = 0x0061,
-            bitSize = 1,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'RX_CM_BUF_PD')
-
-        addVar(
-            offset = 0x0061,
-            bitSize = 4,
-            bitOffset = 6,
-            mode = 'RW',
-            name = 'RX_CM_BUF_CFG')
-
-        addVar(
-            offset = 0x0061,
-            bitSize = 4,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'RX_CM_TRIM')
-
-        addVar(
-            offset = 0x0061,
-            bitSize = 2,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RX_CM_SEL')
-
-        addVar(
-            offset = 0x0062,
-            bitSize = 1,
-            bitOffset = 15,
-            mode = 'RW',
-            name = 'RX_I2V_FILTER_EN')
-
-
-        addVar(
-            offset = 0x0062,
-            bitSize = 1,
-            bitOffset = 14,
-            mode = 'RW',
-            name = 'RX_SUM_DFETAPREP_EN')
-
-        addVar(
-            offset = 0x0062,
-            bitSize = 1,
-            bitOffset = 13,
-            mode = 'RW',
-            name = 'RX_SUM_VCM_OVWR')
-
-        addVar(
-            offset = 0x0062,
-            bitSize = 4,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'RX_SUM_IREF_TUNE')
-
-        addVar(
-            offset = 0x0062,
-            bitSize = 2,
-            bitOffset = 7,
-            mode = 'RW',
-            name = 'EYESCAN_VP_RANGE')
-
-        addVar(
-            offset = 0x0062,
-            bitSize = 4,
-            bitOffset = 3,
-            mode = 'RW',
-            name = 'RX_SUM_VCMTUNE')
-
-        addVar(
-            offset = 0x0062,
-            bitSize = 3,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RX_SUM_VREF_TUNE')
-
-        addVar(
-            offset = 0x0063,
-            bitSize = 1,
-            bitOffset = 15,
-            mode = 'RW',
-            name = 'CBCC_DATA_SOURCE_SEL',
-            enum = {
-                1 : 'DECODED',
-                0 : 'ENCODED'})
-
-        addVar(
-            offset = 0x0063,
-            bitSize = 1,
-            bitOffset = 14,
-            mode = 'RW',
-            name = 'OOB_PWRUP')
-
-        addVar(
-            offset = 0x0063,
-            bitSize = 9,
-            bitOffset = 5,
-            mode = 'RW',
-            name = 'RXOOB_CFG')
-
-        addVar(
-            offset = 0x0063,
-            bitSize = 3,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXOUT_DIV',
-            enum = {
-                0 : '1',
-                1 : '2',
-                2 : '4',
-                3 : '8',
-                4 : '16',
-                5 : '32'})
-
-        addVar(
-            offset = 0x0064,
-            bitSize = 5,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'RX_SIG_VALID_DLY',
-            enum = {
-                0 : '1',
-                1 : '2',
-                2 : '3',
-                3 : '4',
-                4 : '5',
-                5 : '6',
-                6 : '7',
-                7 : '8',
-                8 : '9',
-                9 : '10',
-                10 : '11',
-                11 : '12',
-                12 : '13',
-                13 : '14',
-                14 : '15',
-                15 : '16',
-                16 : '17',
-                17 : '18',
-                18 : '19',
-                19 : '20',
-                20 : '21',
-                21 : '22',
-                22 : '23',
-                23 : '24',
-                24 : '25',
-                25 : '26',
-                26 : '27',
-                27 : '28',
-                28 : '29',
-                29 : '30',
-                30 : '31',
-                31 : '32'})
-
-        addVar(
-            offset = 0x0064,
-            bitSize = 2,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'RXSLIDE_MODE',
-            enum = {
-                0 : 'OFF',
-                1 : 'AUTO',
-                2 : 'PCS',
-                3 : 'PMA'})
-
-        addVar(
-            offset = 0x0064,
-            bitSize = 1,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'RXPRBS_ERR_LOOPBACK')
-
-        addVar(
-            offset = 0x0064,
-            bitSize = 4,
-            bitOffset = 4,
-            mode = 'RW',
-            name = 'RXSLIDE_AUTO_WAIT')
-
-        addVar(
-            offset = 0x0064,
-            bitSize = 1,
-            bitOffset = 3,
-            mode = 'RW',
-            name = 'RXBUF_EN',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0064,
-            bitSize = 2,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'RX_XCLK_SEL',
-            enum = {
-                0 : 'RXDES',
-                1 : 'RXUSR',
-                2 : 'RXPMA'})
-
-        addVar(
-            offset = 0x0064,
-            bitSize = 1,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXGEARBOX_EN',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0065,
-            bitSize = 6,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'RXBUF_THRESH_OVFLW')
-
-        addVar(
-            offset = 0x0065,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'DMONITOR_CFG0')
-
-        addVar(
-            offset = 0x0066,
-            bitSize = 1,
-            bitOffset = 15,
-            mode = 'RW',
-            name = 'RXBUF_THRESH_OVRD',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0066,
-            bitSize = 1,
-            bitOffset = 14,
-            mode = 'RW',
-            name = 'RXBUF_RESET_ON_COMMAALIGN',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0066,
-            bitSize = 1,
-            bitOffset = 13,
-            mode = 'RW',
-            name = 'RXBUF_RESET_ON_RATE_CHANGE',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0066,
-            bitSize = 1,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'RXBUF_RESET_ON_CB_CHANGE',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0066,
-            bitSize = 6,
-            bitOffset = 6,
-            mode = 'RW',
-            name = 'RXBUF_THRESH_UNDFLW')
-
-        addVar(
-            offset = 0x0066,
-            bitSize = 1,
-            bitOffset = 5,
-            mode = 'RW',
-            name = 'RX_CLKMUX_EN')
-
-        addVar(
-            offset = 0x0066,
-            bitSize = 1,
-            bitOffset = 4,
-            mode = 'RW',
-            name = 'RX_DISPERR_SEQ_MATCH',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0066,
-            bitSize = 2,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'RX_WIDEMODE_CDR')
-
-        addVar(
-            offset = 0x0066,
-            bitSize = 2,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RX_INT_DATAWIDTH')
-
-        addVar(
-            offset = 0x0067,
-            bitSize = 4,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'RXBUF_EIDLE_HI_CNT')
-
-        addVar(
-            offset = 0x0067,
-            bitSize = 1,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'RXCDR_HOLD_DURING_EIDLE')
-
-        addVar(
-            offset = 0x0067,
-            bitSize = 1,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'RX_DFE_LPM_HOLD_DURING_EIDLE')
-
-        addVar(
-            offset = 0x0067,
-            bitSize = 2,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'RX_WIDEMODE_CDR_GEN3')
-
-        addVar(
-            offset = 0x0067,
-            bitSize = 4,
-            bitOffset = 4,
-            mode = 'RW',
-            name = 'RXBUF_EIDLE_LO_CNT')
-
-        addVar(
-            offset = 0x0067,
-            bitSize = 1,
-            bitOffset = 3,
-            mode = 'RW',
-            name = 'RXBUF_RESET_ON_EIDLE',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x0067,
-            bitSize = 1,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'RXCDR_FR_RESET_ON_EIDLE')
-
-        addVar(
-            offset = 0x0067,
-            bitSize = 1,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'RXCDR_PH_RESET_ON_EIDLE')
-
-        addVar(
-            offset = 0x0067,
-            bitSize = 1,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXBUF_ADDR_MODE',
-            enum = {
-                1 : 'FAST',
-                0 : 'FULL'})
-
-        addVar(
-            offset = 0x0068,
-            bitSize = 3,
-            bitOffset = 13,
-            mode = 'RW',
-            name = 'SATA_BURST_VAL')
-
-        addVar(
-            offset = 0x0068,
-            bitSize = 1,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'SAS_12G_MODE')
-
-        addVar(
-            offset = 0x0068,
-            bitSize = 1,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'USB_TXIDLE_TUNE_ENABLE')
-
-        addVar(
-            offset = 0x0068,
-            bitSize = 1,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'USB_RXIDLE_P0_CTRL')
-
-        addVar(
-            offset = 0x0068,
-            bitSize = 4,
-            bitOffset = 4,
-            mode = 'RW',
-            name = 'SATA_BURST_SEQ_LEN')
-
-        addVar(
-            offset = 0x0068,
-            bitSize = 3,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'SATA_EIDLE_VAL')
-
-        addVar(
-            offset = 0x0069,
-            bitSize = 7,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'USB_POLL_SATA_MIN_BURST')
-
-        addVar(
-            offset = 0x0069,
-            bitSize = 2,
-            bitOffset = 7,
-            mode = 'RW',
-            name = 'RX_WIDEMODE_CDR_GEN4')
-
-        addVar(
-            offset = 0x0069,
-            bitSize = 7,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'USB_U2_SAS_MIN_COM')
-
-        addVar(
-            offset = 0x006A,
-            bitSize = 7,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'USB_PING_SATA_MIN_INIT')
-
-        addVar(
-            offset = 0x006A,
-            bitSize = 7,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'USB_U1_SATA_MIN_WAKE')
-
-        addVar(
-            offset = 0x006B,
-            bitSize = 7,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'USB_POLL_SATA_MAX_BURST')
-
-        addVar(
-            offset = 0x006B,
-            bitSize = 7,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'USB_U2_SAS_MAX_COM')
-
-        addVar(
-            offset = 0x006C,
-            bitSize = 7,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'USB_PING_SATA_MAX_INIT')
-
-        addVar(
-            offset = 0x006C,
-            bitSize = 7,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'USB_U1_SATA_MAX_WAKE')
-
-        addVar(
-            offset = 0x006D,
-            bitSize = 5,
-            bitOffset = 3,
-            mode = 'RW',
-            name = 'RX_CLK25_DIV',
-            enum = {
-                0 : '1',
-                1 : '2',
-                2 : '3',
-                3 : '4',
-                4 : '5',
-                5 : '6',
-                6 : '7',
-                7 : '8',
-                8 : '9',
-                9 : '10',
-                10 : '11',
-                11 : '12',
-                12 : '13',
-                13 : '14',
-                14 : '15',
-                15 : '16',
-                16 : '17',
-                17 : '18',
-                18 : '19',
-                19 : '20',
-                20 : '21',
-                21 : '22',
-                22 : '23',
-                23 : '24',
-                24 : '25',
-                25 : '26',
-                26 : '27',
-                27 : '28',
-                28 : '29',
-                29 : '30',
-                30 : '31',
-                31 : '32'})
-
-        addVar(
-            offset = 0x006E,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_UT_CFG1')
-
-        addVar(
-            offset = 0x006F,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TXPHDLY_CFG1')
-
-        addVar(
-            offset = 0x0070,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_VP_CFG0')
-
-        addVar(
-            offset = 0x0071,
-            bitSize = 5,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'TXPH_MONITOR_SEL')
-
-        addVar(
-            offset = 0x0071,
-            bitSize = 2,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TAPDLY_SET_TX')
-
-        addVar(
-            offset = 0x0072,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ADAPT_CFG2')
-
-        addVar(
-            offset = 0x0073,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_VP_CFG1')
-
-        addVar(
-            offset = 0x0074,
-            bitSize = 15,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TERM_RCAL_CFG')
-
-        addVar(
-            offset = 0x0075,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXPI_CFG0')
-
-        addVar(
-            offset = 0x0076,
-            bitSize = 12,
-            bitOffset = 4,
-            mode = 'RW',
-            name = 'PD_TRANS_TIME_FROM_P2')
-
-        addVar(
-            offset = 0x0076,
-            bitSize = 3,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'TERM_RCAL_OVRD')
-
-        addVar(
-            offset = 0x0077,
-            bitSize = 8,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'PD_TRANS_TIME_NONE_P2')
-
-        addVar(
-            offset = 0x0077,
-            bitSize = 8,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'PD_TRANS_TIME_TO_P2')
-
-        addVar(
-            offset = 0x0078,
-            bitSize = 8,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'TRANS_TIME_RATE')
-
-        addVar(
-            offset = 0x0079,
-            bitSize = 8,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'TST_RSV0')
-
-        addVar(
-            offset = 0x0079,
-            bitSize = 8,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TST_RSV1')
-
-        addVar(
-            offset = 0x007A,
-            bitSize = 5,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'TX_CLK25_DIV',
-            enum = {
-                0 : '1',
-                1 : '2',
-                2 : '3',
-                3 : '4',
-                4 : '5',
-                5 : '6',
-                6 : '7',
-                7 : '8',
-                8 : '9',
-                9 : '10',
-                10 : '11',
-                11 : '12',
-                12 : '13',
-                13 : '14',
-                14 : '15',
-                15 : '16',
-                16 : '17',
-                17 : '18',
-                18 : '19',
-                19 : '20',
-                20 : '21',
-                21 : '22',
-                22 : '23',
-                23 : '24',
-                24 : '25',
-                25 : '26',
-                26 : '27',
-                27 : '28',
-                28 : '29',
-                29 : '30',
-                30 : '31',
-                31 : '32'})
-
-        addVar(
-            offset = 0x007A,
-            bitSize = 1,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'TX_XCLK_SEL',
-            enum = {
-                0 : 'TXOUT',
-                1 : 'TXUSR'})
-
-        addVar(
-            offset = 0x007A,
-            bitSize = 4,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TX_DATA_WIDTH',
-            enum = {
-                0 : '-',
-                2 : '16',
-                3 : '20',
-                4 : '32',
-                5 : '40',
-                6 : '64',
-                7 : '80',
-                8 : '128',
-                9 : '160'})
-
-        addVar(
-            offset = 0x007B,
-            bitSize = 6,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'TX_DEEMPH0')
-
-        addVar(
-            offset = 0x007B,
-            bitSize = 6,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'TX_DEEMPH1')
-
-        addVar(
-            offset = 0x007C,
-            bitSize = 1,
-            bitOffset = 14,
-            mode = 'RW',
-            name = 'TX_MAINCURSOR_SEL')
-
-        addVar(
-            offset = 0x007C,
-            bitSize = 1,
-            bitOffset = 13,
-            mode = 'RW',
-            name = 'TXGEARBOX_EN',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x007C,
-            bitSize = 3,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'TXOUT_DIV',
-            enum = {
-                0 : '1',
-                1 : '2',
-                2 : '4',
-                3 : '8',
-                4 : '16',
-                5 : '32'})
-
-        addVar(
-            offset = 0x007C,
-            bitSize = 1,
-            bitOffset = 7,
-            mode = 'RW',
-            name = 'TXBUF_EN',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x007C,
-            bitSize = 1,
-            bitOffset = 6,
-            mode = 'RW',
-            name = 'TXBUF_RESET_ON_RATE_CHANGE',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x007C,
-            bitSize = 3,
-            bitOffset = 3,
-            mode = 'RW',
-            name = 'TX_RXDETECT_REF')
-
-        addVar(
-            offset = 0x007C,
-            bitSize = 1,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'TXFIFO_ADDR_CFG',
-            enum = {
-                1 : 'HIGH',
-                0 : 'LOW'})
-
-        addVar(
-            offset = 0x007C,
-            bitSize = 2,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TX_SW_MEAS')
-
-        addVar(
-            offset = 0x007D,
-            bitSize = 14,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'TX_RXDETECT_CFG')
-
-        addVar(
-            offset = 0x007E,
-            bitSize = 1,
-            bitOffset = 15,
-            mode = 'RW',
-            name = 'TX_CLKMUX_EN')
-
-        addVar(
-            offset = 0x007E,
-            bitSize = 1,
-            bitOffset = 14,
-            mode = 'RW',
-            name = 'TX_LOOPBACK_DRIVE_HIZ',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x007E,
-            bitSize = 5,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'TX_DRIVE_MODE',
-            enum = {
-                0 : 'DIRECT',
-                1 : 'PIPE',
-                2 : 'PIPEGEN3'})
-
-        addVar(
-            offset = 0x007E,
-            bitSize = 3,
-            bitOffset = 5,
-            mode = 'RW',
-            name = 'TX_EIDLE_ASSERT_DELAY')
-
-        addVar(
-            offset = 0x007E,
-            bitSize = 3,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'TX_EIDLE_DEASSERT_DELAY')
-
-        addVar(
-            offset = 0x007F,
-            bitSize = 7,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'TX_MARGIN_FULL_0')
-
-        addVar(
-            offset = 0x007F,
-            bitSize = 7,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'TX_MARGIN_FULL_1')
-
-        addVar(
-            offset = 0x0080,
-            bitSize = 7,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'TX_MARGIN_FULL_2')
-
-        addVar(
-            offset = 0x0080,
-            bitSize = 7,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'TX_MARGIN_FULL_3')
-
-        addVar(
-            offset = 0x0081,
-            bitSize = 7,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'TX_MARGIN_FULL_4')
-
-        addVar(
-            offset = 0x0081,
-            bitSize = 7,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'TX_MARGIN_LOW_0')
-
-        addVar(
-            offset = 0x0082,
-            bitSize = 7,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'TX_MARGIN_LOW_1')
-
-        addVar(
-            offset = 0x0082,
-            bitSize = 7,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'TX_MARGIN_LOW_2')
-
-        addVar(
-            offset = 0x0083,
-            bitSize = 7,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'TX_MARGIN_LOW_3')
-
-        addVar(
-            offset = 0x0083,
-            bitSize = 7,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'TX_MARGIN_LOW_4')
-
-        addVar(
-            offset = 0x0084,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H3_CFG0')
-
-        addVar(
-            offset = 0x0085,
-            bitSize = 2,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'TX_INT_DATAWIDTH')
-
-        addVar(
-            offset = 0x0089,
-            bitSize = 8,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXPRBS_LINKACQ_CNT')
-
-        addVar(
-            offset = 0x008A,
-            bitSize = 1,
-            bitOffset = 15,
-            mode = 'RW',
-            name = 'TX_PMADATA_OPT')
-
-        addVar(
-            offset = 0x008A,
-            bitSize = 1,
-            bitOffset = 14,
-            mode = 'RW',
-            name = 'RXSYNC_OVRD')
-
-        addVar(
-            offset = 0x008A,
-            bitSize = 1,
-            bitOffset = 13,
-            mode = 'RW',
-            name = 'TXSYNC_OVRD')
-
-        addVar(
-            offset = 0x008A,
-            bitSize = 1,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'TX_IDLE_DATA_ZERO')
-
-        addVar(
-            offset = 0x008A,
-            bitSize = 1,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'A_RXOSCALRESET')
-
-        addVar(
-            offset = 0x008A,
-            bitSize = 1,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'RXOOB_CLK_CFG',
-            enum = {
-                1 : 'FABRIC',
-                0 : 'PMA'})
-
-        addVar(
-            offset = 0x008A,
-            bitSize = 1,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'TXSYNC_SKIP_DA')
-
-        addVar(
-            offset = 0x008A,
-            bitSize = 1,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'RXSYNC_SKIP_DA')
-
-        addVar(
-            offset = 0x008A,
-            bitSize = 5,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXOSCALRESET_TIME')
-
-        addVar(
-            offset = 0x008B,
-            bitSize = 1,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'TXSYNC_MULTILANE')
-
-        addVar(
-            offset = 0x008B,
-            bitSize = 1,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'RXSYNC_MULTILANE')
-
-        addVar(
-            offset = 0x008C,
-            bitSize = 1,
-            bitOffset = 15,
-            mode = 'RW',
-            name = 'ACJTAG_MODE')
-
-        addVar(
-            offset = 0x008C,
-            bitSize = 1,
-            bitOffset = 14,
-            mode = 'RW',
-            name = 'ACJTAG_DEBUG_MODE')
-
-        addVar(
-            offset = 0x008C,
-            bitSize = 1,
-            bitOffset = 13,
-            mode = 'RW',
-            name = 'ACJTAG_RESET')
-
-        addVar(
-            offset = 0x008C,
-            bitSize = 1,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'RX_SUM_VCM_BIAS_TUNE_EN')
-
-        addVar(
-            offset = 0x008C,
-            bitSize = 2,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'RX_TUNE_AFE_OS')
-
-        addVar(
-            offset = 0x008C,
-            bitSize = 2,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'RX_DFE_KL_LPM_KL_CFG0')
-
-        addVar(
-            offset = 0x008C,
-            bitSize = 3,
-            bitOffset = 5,
-            mode = 'RW',
-            name = 'RX_DFE_KL_LPM_KL_CFG1')
-
-
-        addVar(
-            offset = 0x008C,
-            bitSize = 1,
-            bitOffset = 4,
-            mode = 'RW',
-            name = 'RX_SUM_DEGEN_AVTT_OVERITE')
-
-        addVar(
-            offset = 0x008C,
-            bitSize = 1,
-            bitOffset = 3,
-            mode = 'RW',
-            name = 'RX_SUM_PWR_SAVING')
-
-        addVar(
-            offset = 0x008C,
-            bitSize = 1,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'RX_EN_SUM_RCAL_B')
-
-        addVar(
-            offset = 0x008D,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFELPM_KL_CFG2')
-
-        addVar(
-            offset = 0x008E,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TXDLY_CFG')
-
-        addVar(
-            offset = 0x008F,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TXPH_CFG')
-
-        addVar(
-            offset = 0x0090,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TXPHDLY_CFG0')
-
-        addVar(
-            offset = 0x0091,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ADAPT_CFG0')
-
-        addVar(
-            offset = 0x0092,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ADAPT_CFG1')
-
-        addVar(
-            offset = 0x0093,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCFOK_CFG0')
-
-        addVar(
-            offset = 0x0094,
-            bitSize = 1,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'ES_CLK_PHASE_SEL')
-
-        addVar(
-            offset = 0x0094,
-            bitSize = 1,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'USE_PCS_CLK_PHASE_SEL')
-
-        addVar(
-            offset = 0x0094,
-            bitSize = 1,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'SAMPLE_CLK_PHASE')
-
-        addVar(
-            offset = 0x0095,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TX_PMA_RSV0')
-
-        addVar(
-            offset = 0x0097,
-            bitSize = 1,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'RX_AFE_CM_EN')
-
-        addVar(
-            offset = 0x0097,
-            bitSize = 1,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'RX_CAPFF_SARC_ENB')
-
-        addVar(
-            offset = 0x0097,
-            bitSize = 1,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'RX_EYESCAN_VS_NEG_DIR')
-
-        addVar(
-            offset = 0x0097,
-            bitSize = 1,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'RX_EYESCAN_VS_UT_SIGN')
-
-        addVar(
-            offset = 0x0097,
-            bitSize = 7,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'RX_EYESCAN_VS_CODE')
-
-        addVar(
-            offset = 0x0097,
-            bitSize = 2,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RX_EYESCAN_VS_RANGE')
-
-        addVar(
-            offset = 0x0098,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H5_CFG1')
-
-        addVar(
-            offset = 0x0099,
-            bitSize = 5,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'GEARBOX_MODE')
-
-        addVar(
-            offset = 0x0099,
-            bitSize = 3,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'TXPI_SYNFREQ_PPM')
-
-        addVar(
-            offset = 0x0099,
-            bitSize = 1,
-            bitOffset = 6,
-            mode = 'RW',
-            name = 'TXPI_INVSTROBE_SEL')
-
-        addVar(
-            offset = 0x0099,
-            bitSize = 1,
-            bitOffset = 5,
-            mode = 'RW',
-            name = 'TXPI_GRAY_SEL')
-
-        addVar(
-            offset = 0x009A,
-            bitSize = 8,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TXPI_PPM_CFG')
-
-        addVar(
-            offset = 0x009B,
-            bitSize = 1,
-            bitOffset = 15,
-            mode = 'RW',
-            name = 'RX_DFELPM_KLKH_AGC_STUP_EN')
-
-        addVar(
-            offset = 0x009B,
-            bitSize = 4,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'RX_DFELPM_CFG0')
-
-        addVar(
-            offset = 0x009B,
-            bitSize = 1,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'RX_DFELPM_CFG1')
-
-        addVar(
-            offset = 0x009B,
-            bitSize = 2,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'RX_DFE_KL_LPM_KH_CFG0')
-
-        addVar(
-            offset = 0x009B,
-            bitSize = 3,
-            bitOffset = 5,
-            mode = 'RW',
-            name = 'RX_DFE_KL_LPM_KH_CFG1')
-
-        addVar(
-            offset = 0x009D,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TXFE_CFG0')
-
-        addVar(
-            offset = 0x009E,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_UT_CFG0')
-
-        addVar(
-            offset = 0x009F,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CPLL_CFG0')
-
-
-        addVar(
-            offset = 0x00A0,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CPLL_CFG1')
-
-        addVar(
-            offset = 0x00A1,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TXFE_CFG1')
-
-        addVar(
-            offset = 0x00A2,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_CFG0_GEN3')
-
-        addVar(
-            offset = 0x00A3,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_CFG1_GEN3')
-
-        addVar(
-            offset = 0x00A4,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_CFG2_GEN3')
-
-        addVar(
-            offset = 0x00A5,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_CFG3_GEN3')
-
-        addVar(
-            offset = 0x00A6,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_CFG4_GEN3')
-
-        addVar(
-            offset = 0x00A7,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TXPI_CFG0')
-
-        addVar(
-            offset = 0x00A8,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TXPI_CFG1')
-
-        addVar(
-            offset = 0x00A9,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'PCIE_RXPMA_CFG')
-
-        addVar(
-            offset = 0x00AA,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'PCIE_TXPCS_CFG_GEN3')
-
-        addVar(
-            offset = 0x00AB,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'PCIE_TXPMA_CFG')
-
-        addVar(
-            offset = 0x00AC,
-            bitSize = 5,
-            bitOffset = 3,
-            mode = 'RW',
-            name = 'RX_CLK_SLIP_OVRD')
-
-        addVar(
-            offset = 0x00AC,
-            bitSize = 1,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TXPI_PPM')
-
-        addVar(
-            offset = 0x00AD,
-            bitSize = 2,
-            bitOffset = 13,
-            mode = 'RW',
-            name = 'PCIE_PLL_SEL_MODE_GEN4')
-
-        addVar(
-            offset = 0x00AD,
-            bitSize = 2,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'PCIE_PLL_SEL_MODE_GEN3')
-
-        addVar(
-            offset = 0x00AD,
-            bitSize = 2,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'PCIE_PLL_SEL_MODE_GEN12')
-
-        addVar(
-            offset = 0x00AD,
-            bitSize = 1,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'RATE_SW_USE_DRP')
-
-        addVar(
-            offset = 0x00AE,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_HD_CFG1')
-
-        addVar(
-            offset = 0x00AF,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_CFG5_GEN3')
-
-        addVar(
-            offset = 0x00B0,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_KH_CFG3')
-
-        addVar(
-            offset = 0x00B1,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_KH_CFG2')
-
-        addVar(
-            offset = 0x00B2,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_KH_CFG1')
-
-        addVar(
-            offset = 0x00B3,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H5_CFG0')
-
-        addVar(
-            offset = 0x00B4,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_CFG5')
-
-        addVar(
-            offset = 0x00B5,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_HE_CFG1')
-
-        addVar(
-            offset = 0x00B6,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CPLL_CFG3')
-
-        addVar(
-            offset = 0x00B7,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H6_CFG0')
-
-        addVar(
-            offset = 0x00B8,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H6_CFG1')
-
-        addVar(
-            offset = 0x00B9,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H7_CFG0')
-
-        addVar(
-            offset = 0x00BA,
-            bitSize = 5,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'DDI_REALIGN_WAIT')
-
-        addVar(
-            offset = 0x00BA,
-            bitSize = 2,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'DDI_CTRL')
-
-        addVar(
-            offset = 0x00BB,
-            bitSize = 3,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'TXGBOX_FIFO_INIT_RD_ADDR')
-
-        addVar(
-            offset = 0x00BB,
-            bitSize = 3,
-            bitOffset = 6,
-            mode = 'RW',
-            name = 'TX_SAMPLE_PERIOD')
-
-
-        addVar(
-            offset = 0x00BB,
-            bitSize = 3,
-            bitOffset = 3,
-            mode = 'RW',
-            name = 'RXGBOX_FIFO_INIT_RD_ADDR')
-
-        addVar(
-            offset = 0x00BB,
-            bitSize = 3,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RX_SAMPLE_PERIOD')
-
-        addVar(
-            offset = 0x00BC,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CPLL_CFG2')
-
-        addVar(
-            offset = 0x00BD,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXPHSAMP_CFG')
-
-        addVar(
-            offset = 0x00BE,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXPHSLIP_CFG')
-
-        addVar(
-            offset = 0x00BF,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXPHBEACON_CFG')
-
-        addVar(
-            offset = 0x00C0,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H7_CFG1')
-
-        addVar(
-            offset = 0x00C1,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H8_CFG0')
-
-        addVar(
-            offset = 0x00C2,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H8_CFG1')
-
-        addVar(
-            offset = 0x00C3,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'PCIE_BUFG_DIV_CTRL')
-
-        addVar(
-            offset = 0x00C4,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'PCIE_RXPCS_CFG_GEN3')
-
-        addVar(
-            offset = 0x00C5,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H9_CFG0')
-
-        addVar(
-            offset = 0x00C6,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RX_PROGDIV_CFG',
-            enum = {
-                0 : '-',
-                32768 : '0',
-                57440 : '10',
-                57455 : '100',
-                24654 : '128',
-                57862 : '132',
-                57410 : '16',
-                16.57880 : '5',
-                57442 : '20',
-                57414 : '32',
-                57856 : '33',
-                57432 : '4',
-                57415 : '40',
-                57464 : '5',
-                57422 : '64',
-                57858 : '66',
-                57408 : '8',
-                57423 : '80'})
-
-        addVar(
-            offset = 0x00C7,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H9_CFG1')
-
-        addVar(
-            offset = 0x00C8,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_HA_CFG0')
-
-        addVar(
-            offset = 0x00CA,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CHAN_BOND_SEQ_1_2')
-
-        addVar(
-            offset = 0x00CB,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_GC_CFG0')
-
-        addVar(
-            offset = 0x00CC,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_GC_CFG1')
-
-
-        addVar(
-            offset = 0x00CD,
-            bitSize = 6,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'RX_DDI_SEL')
-
-        addVar(
-            offset = 0x00CD,
-            bitSize = 1,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'DEC_VALID_COMMA_ONLY',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-        addVar(
-            offset = 0x00CD,
-            bitSize = 1,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'DEC_MCOMMA_DETECT',
-            enum = {
-                0 : 'FALSE',
-                1 : 'TRUE'})
-
-
-        addVar(
-            offset = 0x00CE,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_CFG0')
-
-        addVar(
-            offset = 0x00CF,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_CFG1')
-
-        addVar(
-            offset = 0x00D0,
-            bitSize = 1,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'RX_RESLOAD_OVRD')
-
-        addVar(
-            offset = 0x00D0,
-            bitSize = 1,
-            bitOffset = 7,
-            mode = 'RW',
-            name = 'RX_CTLE_PWR_SAVING')
-
-        addVar(
-            offset = 0x00D0,
-            bitSize = 3,
-            bitOffset = 4,
-            mode = 'RW',
-            name = 'RX_DEGEN_CTRL')
-
-        addVar(
-            offset = 0x00D0,
-            bitSize = 4,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RX_RESLOAD_CTRL')
-
-        addVar(
-            offset = 0x00D1,
-            bitSize = 1,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'RX_EN_CTLE_RCAL_B')
-
-        addVar(
-            offset = 0x00D1,
-            bitSize = 4,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'RX_CTLE_RES_CTRL')
-
-        addVar(
-            offset = 0x00D1,
-            bitSize = 4,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RX_SUM_RES_CTRL')
-
-        addVar(
-            offset = 0x00D2,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXPI_CFG1')
-
-        addVar(
-            offset = 0x00D3,
-            bitSize = 1,
-            bitOffset = 13,
-            mode = 'RW',
-            name = 'LPBK_EN_RCAL_B')
-
-        addVar(
-            offset = 0x00D3,
-            bitSize = 3,
-            bitOffset = 5,
-            mode = 'RW',
-            name = 'LPBK_IND_CTRL2')
-
-        addVar(
-            offset = 0x00D3,
-            bitSize = 3,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'LPBK_BIAS_CTRL')
-
-        addVar(
-            offset = 0x00D3,
-            bitSize = 1,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'RX_XMODE_SEL')
-
-        addVar(
-            offset = 0x00D3,
-            bitSize = 1,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ISCAN_CK_PH_SEL2')
-
-        addVar(
-            offset = 0x00D4,
-            bitSize = 3,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'LPBK_IND_CTRL1')
-
-        addVar(
-            offset = 0x00D4,
-            bitSize = 4,
-            bitOffset = 7,
-            mode = 'RW',
-            name = 'LPBK_RG_CTRL')
-
-        addVar(
-            offset = 0x00D4,
-            bitSize = 3,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'LPBK_IND_CTRL0')
-
-        addVar(
-            overlapEn = True,
-            offset = 0x00D5,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CKCAL1_CFG_3')
-
-        addVar(
-            overlapEn = True,
-            offset = 0x00D5,
-            bitSize = 2,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'CKCAL1_DCC_PWRDN')
-
-        addVar(
-            overlapEn = True,
-            offset = 0x00D5,
-            bitSize = 1,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CKCAL1_IQ_PWRDN')
-
-        addVar(
-            offset = 0x00D6,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CKCAL2_CFG_3')
-
-        addVar(
-            offset = 0x00D7,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CKCAL2_CFG_4')
-
-        addVar(
-            offset = 0x00D8,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RX_PMA_RSV0')
-
-        addVar(
-            offset = 0x00D9,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CKCAL2_CFG_2')
-
-        addVar(
-            offset = 0x00DA,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_LOCK_CFG2')
-
-        addVar(
-            offset = 0x00DB,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CKCAL1_CFG_2')
-
-        addVar(
-            offset = 0x00DD,
-            bitSize = 2,
-            bitOffset = 3,
-            mode = 'RW',
-            name = 'RTX_BUF_TERM_CTRL')
-
-        addVar(
-            offset = 0x00DD,
-            bitSize = 3,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RTX_BUF_CML_CTRL')
-
-
-        addVar(
-            offset = 0x00DE,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TXPH_CFG2')
-
-        addVar(
-            offset = 0x00DF,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_LOCK_CFG4')
-
-        addVar(
-            offset = 0x00E0,
-            bitSize = 3,
-            bitOffset = 6,
-            mode = 'RW',
-            name = 'CTLE3_OCAP_EXT_CTRL')
-
-        addVar(
-            offset = 0x00E0,
-            bitSize = 1,
-            bitOffset = 5,
-            mode = 'RW',
-            name = 'CTLE3_OCAP_EXT_EN')
-
-        addVar(
-            offset = 0x00E2,
-            bitSize = 2,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'TX_VREG_VREFSEL')
-
-        addVar(
-            offset = 0x00E2,
-            bitSize = 3,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'TX_VREG_CTRL')
-
-        addVar(
-            offset = 0x00E2,
-            bitSize = 1,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'TX_VREG_PDB')
-
-        addVar(
-            offset = 0x00E7,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUALIFIER5')
-
-        addVar(
-            offset = 0x00E8,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUALIFIER6')
-
-        addVar(
-            offset = 0x00E9,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUALIFIER7')
-
-        addVar(
-            offset = 0x00EA,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUALIFIER8')
-
-        addVar(
-            offset = 0x00EB,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUALIFIER9')
-
-        addVar(
-            offset = 0x00EC,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUAL_MASK5')
-
-        addVar(
-            offset = 0x00ED,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUAL_MASK6')
-
-        addVar(
-            offset = 0x00EE,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUAL_MASK7')
-
-        addVar(
-            offset = 0x00EF,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUAL_MASK8')
-
-        addVar(
-            offset = 0x00F0,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_QUAL_MASK9')
-
-        addVar(
-            offset = 0x00F1,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_SDATA_MASK5')
-
-        addVar(
-            offset = 0x00F2,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_SDATA_MASK6')
-
-        addVar(
-            offset = 0x00F3,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_SDATA_MASK7')
-
-        addVar(
-            offset = 0x00F4,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_SDATA_MASK8')
-
-        addVar(
-            offset = 0x00F5,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'ES_SDATA_MASK9')
-
-        addVar(
-            offset = 0x00F6,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TX_PMA_RSV1')
-
-        addVar(
-            offset = 0x00F7,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CKCAL1_CFG_0')
-
-        addVar(
-            offset = 0x00F8,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CKCAL1_CFG_1')
-
-        addVar(
-            offset = 0x00F9,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CKCAL2_CFG_0')
-
-        addVar(
-            offset = 0x00FA,
-            bitSize = 3,
-            bitOffset = 13,
-            mode = 'RW',
-            name = 'TXSWBST_MAG')
-
-        addVar(
-            offset = 0x00FA,
-            bitSize = 2,
-            bitOffset = 9,
-            mode = 'RW',
-            name = 'TXDRV_FREQBAND')
-
-        addVar(
-            offset = 0x00FA,
-            bitSize = 2,
-            bitOffset = 7,
-            mode = 'RW',
-            name = 'TXSWBST_BST')
-
-        addVar(
-            offset = 0x00FA,
-            bitSize = 1,
-            bitOffset = 6,
-            mode = 'RW',
-            name = 'TXSWBST_EN')
-
-        addVar(
-            offset = 0x00FA,
-            bitSize = 3,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'RX_VREG_CTRL')
-
-        addVar(
-            offset = 0x00FA,
-            bitSize = 1,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RX_VREG_PDB')
-
-        addVar(
-            offset = 0x00FB,
-            bitSize = 4,
-            bitOffset = 6,
-            mode = 'RW',
-            name = 'LPBK_EXT_RCAL')
-
-        addVar(
-            offset = 0x00FB,
-            bitSize = 2,
-            bitOffset = 4,
-            mode = 'RW',
-            name = 'PREIQ_FREQ_BST')
-
-
-        addVar(
-            offset = 0x00FB,
-            bitSize = 2,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'TX_PI_BIASSET')
-
-        addVar(
-            offset = 0x00FC,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TX_PHICAL_CFG0')
-
-        addVar(
-            offset = 0x00FD,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TX_PHICAL_CFG1')
-
-        addVar(
-            offset = 0x00FE,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_LOCK_CFG3')
-
-        addVar(
-            offset = 0x0100,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_UT_CFG2')
-
-        addVar(
-            offset = 0x0101,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CKCAL2_CFG_1')
-
-        addVar(
-            offset = 0x0102,
-            bitSize = 1,
-            bitOffset = 2,
-            mode = 'RW',
-            name = 'Y_ALL_MODE')
-
-        addVar(
-            offset = 0x0102,
-            bitSize = 1,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'RCLK_SIPO_DLY_ENB')
-
-        addVar(
-            offset = 0x0102,
-            bitSize = 1,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RCLK_SIPO_INV_EN')
-
-        addVar(
-            offset = 0x0103,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RX_PROGDIV_RATE')
-
-        addVar(
-            offset = 0x0104,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_HF_CFG1')
-
-        addVar(
-            offset = 0x0105,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TX_PROGDIV_RATE')
-
-        addVar(
-            offset = 0x0106,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TX_DCC_LOOP_RST_CFG')
-
-        addVar(
-            offset = 0x0107,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_HC_CFG0')
-
-        addVar(
-            offset = 0x0108,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCKCAL1_I_LOOP_RST_CFG')
-
-        addVar(
-            offset = 0x0109,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCKCAL1_Q_LOOP_RST_CFG')
-
-        addVar(
-            offset = 0x010A,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCKCAL1_IQ_LOOP_RST_CFG')
-
-        addVar(
-            offset = 0x010B,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCKCAL2_D_LOOP_RST_CFG')
-
-        addVar(
-            offset = 0x010C,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCKCAL2_X_LOOP_RST_CFG')
-
-        addVar(
-            offset = 0x010D,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCKCAL2_S_LOOP_RST_CFG')
-
-        addVar(
-            offset = 0x010E,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCKCAL2_DX_LOOP_RST_CFG')
-
-        addVar(
-            offset = 0x0110,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_KH_CFG0')
-
-        addVar(
-            offset = 0x0111,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H4_CFG1')
-
-        addVar(
-            offset = 0x0112,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H4_CFG0')
-
-        addVar(
-            offset = 0x0113,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_H3_CFG1')
-
-        addVar(
-            offset = 0x0116,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'CH_HSPMUX')
-
-        addVar(
-            offset = 0x0117,
-            bitSize = 5,
-            bitOffset = 11,
-            mode = 'RW',
-            name = 'PCIE3_CLK_COR_MIN_LAT')
-
-        addVar(
-            offset = 0x0117,
-            bitSize = 5,
-            bitOffset = 6,
-            mode = 'RW',
-            name = 'PCIE3_CLK_COR_MAX_LAT')
-
-        addVar(
-            offset = 0x0117,
-            bitSize = 6,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'PCIE3_CLK_COR_THRSH_TIMER')
-
-        addVar(
-            offset = 0x0118,
-            bitSize = 1,
-            bitOffset = 15,
-            mode = 'RW',
-            name = 'USB_MODE')
-
-        addVar(
-            offset = 0x0118,
-            bitSize = 1,
-            bitOffset = 14,
-            mode = 'RW',
-            name = 'USB_EXT_CNTL')
-
-        addVar(
-            offset = 0x0118,
-            bitSize = 1,
-            bitOffset = 13,
-            mode = 'RW',
-            name = 'USB_CLK_COR_EQ_EN')
-
-        addVar(
-            offset = 0x0118,
-            bitSize = 1,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'USB_PCIE_ERR_REP_DIS')
-
-        addVar(
-            offset = 0x0118,
-            bitSize = 6,
-            bitOffset = 6,
-            mode = 'RW',
-            name = 'PCIE3_CLK_COR_FULL_THRSH')
-
-
-        addVar(
-            offset = 0x0118,
-            bitSize = 5,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'PCIE3_CLK_COR_EMPTY_THRSH')
-
-        addVar(
-            offset = 0x0119,
-            bitSize = 1,
-            bitOffset = 15,
-            mode = 'RW',
-            name = 'USB_RAW_ELEC')
-
-        addVar(
-            offset = 0x0119,
-            bitSize = 1,
-            bitOffset = 14,
-            mode = 'RW',
-            name = 'DELAY_ELEC')
-
-        addVar(
-            offset = 0x0119,
-            bitSize = 1,
-            bitOffset = 13,
-            mode = 'RW',
-            name = 'USB_BOTH_BURST_IDLE')
-
-        addVar(
-            offset = 0x0119,
-            bitSize = 1,
-            bitOffset = 12,
-            mode = 'RW',
-            name = 'TXREFCLKDIV2_SEL')
-
-        addVar(
-            offset = 0x0119,
-            bitSize = 6,
-            bitOffset = 6,
-            mode = 'RW',
-            name = 'TX_DEEMPH2')
-
-        addVar(
-            offset = 0x0119,
-            bitSize = 6,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'TX_DEEMPH3')
-
-        addVar(
-            offset = 0x011A,
-            bitSize = 1,
-            bitOffset = 6,
-            mode = 'RW',
-            name = 'RXREFCLKDIV2_SEL')
-
-        addVar(
-            offset = 0x011A,
-            bitSize = 1,
-            bitOffset = 5,
-            mode = 'RW',
-            name = 'A_RXTERMINATION')
-
-        addVar(
-            offset = 0x011A,
-            bitSize = 4,
-            bitOffset = 1,
-            mode = 'RW',
-            name = 'USB_LFPS_TPERIOD')
-
-        addVar(
-            offset = 0x011A,
-            bitSize = 1,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'USB_LFPS_TPERIOD_ACCURATE')
-
-        addVar(
-            offset = 0x011B,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_CFG2_GEN4')
-
-        addVar(
-            offset = 0x011C,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_CFG3_GEN4')
-
-        addVar(
-            offset = 0x011D,
-            bitSize = 7,
-            bitOffset = 8,
-            mode = 'RW',
-            name = 'USB_BURSTMIN_U3WAKE')
-
-        addVar(
-            offset = 0x011D,
-            bitSize = 7,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'USB_BURSTMAX_U3WAKE')
-
-        addVar(
-            offset = 0x011E,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'USB_IDLEMIN_POLLING')
-
-        addVar(
-            offset = 0x011F,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'USB_IDLEMAX_POLLING')
-
-        addVar(
-            offset = 0x0120,
-            bitSize = 9,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'USB_LFPSPOLLING_BURST')
-
-        addVar(
-            offset = 0x0121,
-            bitSize = 9,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'USB_LFPSPING_BURST')
-
-        addVar(
-            offset = 0x0122,
-            bitSize = 9,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'USB_LFPSU1EXIT_BURST')
-
-        addVar(
-            offset = 0x0123,
-            bitSize = 9,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'USB_LFPSU2LPEXIT_BURST_MS')
-
-        addVar(
-            offset = 0x0124,
-            bitSize = 9,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'USB_LFPSU3WAKE_BURST_MS')
-
-        addVar(
-            offset = 0x0125,
-            bitSize = 9,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'USB_LFPSPOLLING_IDLE_MS')
-
-        addVar(
-            offset = 0x0126,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_HA_CFG1')
-
-        addVar(
-            offset = 0x0127,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXDFE_HB_CFG0')
-
-        addVar(
-            offset = 0x0135,
-            bitSize = 6,
-            bitOffset = 10,
-            mode = 'RW',
-            name = 'RXCDR_CFG3_GEN2')
-
-        addVar(
-            offset = 0x0135,
-            bitSize = 10,
-            bitOffset = 0,
-            mode = 'RW',
-            name = 'RXCDR_CFG2_GEN2')
-
-        addVar(
-            offset = 0x0250,
-            bitSize = 7,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'COMMA_ALIGN_LATENCY')
-
-        addVar(
-            offset = 0x0251,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_error_count')
-
-        addVar(
-            offset = 0x0252,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_sample_count')
-
-        addVar(
-            offset = 0x0253,
-            bitSize = 4,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_control_status')
-
-        addVar(
-            offset = 0x0254,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_rdata_byte4')
-
-        addVar(
-            offset = 0x0255,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_rdata_byte3')
-
-        addVar(
-            offset = 0x0256,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_rdata_byte2')
-
-
-        addVar(
-            offset = 0x0257,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_rdata_byte1')
-
-        addVar(
-            offset = 0x0258,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_rdata_byte0')
-
-        addVar(
-            offset = 0x0259,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_sdata_byte4')
-
-        addVar(
-            offset = 0x025A,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_sdata_byte3')
-
-        addVar(
-            offset = 0x025B,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_sdata_byte2')
-
-        addVar(
-            offset = 0x025C,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_sdata_byte1')
-
-        addVar(
-            offset = 0x025D,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_sdata_byte0')
-
-        self.add(pr.RemoteVariable(
-            offset = [0x025E << 2, 0x025f << 2],
-            bitSize = [16, 16],
-            bitOffset = [0, 0],
-            mode = 'RO',
-            name = 'RX_PRBS_ERR_CNT'))
-
-
-        addVar(
-            offset = 0x0263,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'TXGBOX_FIFO_LATENCY')
-
-        addVar(
-            offset = 0x0269,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'RXGBOX_FIFO_LATENCY')
-
-        addVar(
-            offset = 0x0283,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_sdata_byte5')
-
-        addVar(
-            offset = 0x0284,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_sdata_byte6')
-
-        addVar(
-            offset = 0x0285,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_sdata_byte7')
-
-        addVar(
-            offset = 0x0286,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_sdata_byte8')
-
-        addVar(
-            offset = 0x0287,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_sdata_byte9')
-
-        addVar(
-            offset = 0x0288,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_rdata_byte5')
-
-        addVar(
-            offset = 0x0289,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_rdata_byte6')
-
-        addVar(
-            offset = 0x028A,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_rdata_byte7')
-
-        addVar(
-            offset = 0x028B,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_rdata_byte8')
-
-        addVar(
-            offset = 0x028C,
-            bitSize = 16,
-            bitOffset = 0,
-            mode = 'RO',
-            name = 'es_rdata_byte9')
+        addDrpVariables(self, GTYE4_CHANNEL_DRP, names=attributes)
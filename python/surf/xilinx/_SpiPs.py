@@ -20,6 +20,7 @@
 #-----------------------------------------------------------------------------
 # Virtual Address Decoding:
 #   ADDR[50:48] = SPI Device Index
+#   ADDR[47]    = SPI Streaming (auto-increment) mode
 #   ADDR[46:44] = SPI Address Bytes
 #   ADDR[43:40] = SPI Data Bytes
 #   ADDR[33:02] = SPI Address available
@@ -32,14 +33,45 @@ import rogue
 import threading
 import time
 import queue
+from contextlib import ExitStack
+
+# Register offsets of the batched FIFO accesses
+CR_OFFSET  = 0x00
+SR_OFFSET  = 0x04
+TXD_OFFSET = 0x1C
+RXD_OFFSET = 0x20
+
+# Depth of the TX and RX FIFOs in bytes
+FIFO_DEPTH = 128
+
+# Longest SPI frame: it must fit the FIFOs and the 7-bit RX watermark
+FRAME_BYTES = FIFO_DEPTH - 1
+
+def spiPsOffset(devIdx, addrBytes, dataBytes, stream=False):
+    """
+    Virtual base offset of a SPI device behind SpiPs, the register at SPI
+    address n is at offset base + 4*n.  Devices supporting the streaming
+    (auto-increment) mode set stream: accesses to consecutive registers,
+    whether one block or back to back transactions of separate variables,
+    are then sent as one SPI frame with a single address header.  The device
+    classes do not choose their own offset, so streaming is enabled where the
+    device is placed behind SpiPs, e.g. offset=spiPsOffset(0, 2, 1, stream=True).
+    """
+    return (devIdx << 48) | (int(stream) << 47) | (addrBytes << 44) | (dataBytes << 40)
 
 class _Regs(pr.Device):
     def __init__(self,
             pollPeriod = 0.0,
+            maxBackoff = 0.01,
+            timeout    = 1.0,
             **kwargs):
         super().__init__(**kwargs)
 
         self._pollPeriod = pollPeriod
+        self._maxBackoff = maxBackoff
+        self._timeout    = timeout
+        self._latency    = 0.0
+        self._status     = 0
 
         self._queue = queue.Queue()
         self._pollThread = threading.Thread(target=self._pollWorker)
@@ -341,6 +373,14 @@ class _Regs(pr.Device):
             mode        = 'RO',
         ))
 
+        # (variable, shift, mask) of the CR register fields, merged into raw CR writes by transfer()
+        self._crVars = []
+        for var in self.variables.values():
+            if isinstance(var, pr.RemoteVariable) and var.offset == CR_OFFSET:
+                bo = var.bitOffset[0] if isinstance(var.bitOffset, list) else var.bitOffset
+                bs = var.bitSize[0] if isinstance(var.bitSize, list) else var.bitSize
+                self._crVars.append((var, bo, (1 << bs) - 1))
+
         ####################################################################
         @self.command()
         def TestLoad():
@@ -402,135 +442,262 @@ class _Regs(pr.Device):
     def ClearRxFifo(self):
         # print (f'{self.path}.ClearRxFifo()')
 
-        # Clear RXFIFO and check if RX_FIFO_not_empty (RX_FIFO_not_empty = 0x10)
-        while ( (self.SR.get(read=True) & 0x10) != 0 ):
-            self.RXD.get(read=True)
+        # Pop the RXFIFO only while RX_FIFO_not_empty (0x10) is reported, with
+        # each pop and the following status check queued back to back.  An
+        # already empty FIFO costs a single status read.
+        with self._memLock:
+            self._clearError()
+            status = self._rawTxnChunker(SR_OFFSET, None, txnType=rogue.interfaces.memory.Read, numWords=1)
+            self._wait()
+
+            drained = 0
+            while ( (status[0] & 0x10) != 0 ) and ( drained < FIFO_DEPTH ):
+                self._rawTxnChunker(RXD_OFFSET, None, txnType=rogue.interfaces.memory.Read, numWords=1)
+                status = self._rawTxnChunker(SR_OFFSET, None, txnType=rogue.interfaces.memory.Read, numWords=1)
+                self._wait()
+                drained += 1
+
+        if drained > 0:
             self.SR.set(0x7F)
-        for i in range(128):
-            self.RXD.get(read=True)
 
     ####################################################################
 
-    def transfer(self, csValue, txBuffer, byteSize):
-
-        # Set the RX watermark
-        if self.RXWR.value() != byteSize:
-            self.RXWR.set(byteSize)
-
-        # Set CS
-        if self.CS.value() != csValue:
-            self.CS.set(csValue)
-
-        # Load the TX FIFO
-        self.Man_start_en.set(1)
-        for i in range(byteSize):
-            self.TXD.set(txBuffer[i])
-
-        # Start the transfer
-        self.Manual_CS.set(1) # Force manual due to observed CS glitch in waveforms when AUTO CS
-        self.Man_start_en.set(0)
-
-        # Create the RX buffer and clear the "Rx FIFO Not Empty" flag
-        rxBuffer = [None for x in range(byteSize)]
-        # self.SR.set(0x10)
+    def _wait(self):
+        self._waitTransaction(0)
+        if self._getError() != '':
+            raise pr.MemoryError(name=self.name, address=self.address, msg=self._getError())
 
-        # Wait for the buffer to fill out: Rx FIFO Not Empty = 0x10
-        while ( (self.SR.get(read=True) & 0x10) == 0 ):
-            time.sleep(self._pollPeriod)
+    def _crWord(self, **fields):
+        # CR register value from the variable shadows with some fields overridden
+        word = 0
+        for var, shift, mask in self._crVars:
+            word |= (fields.get(var.name, var.value()) & mask) << shift
+        return word
 
-        # Read the RX FIFO
-        self.Manual_CS.set(0) # release manual due to observed CS glitch in waveforms when AUTO CS
-        for i in range(byteSize):
-            rxBuffer[i] = self.RXD.get(read=True)
+    def transfer(self, csValue, txBuffer, byteSize):
+        """
+        Shift byteSize bytes of txBuffer out on chip select csValue and return
+        the bytes received.  The TXD pushes and the RXD pops are single-word
+        transactions against the FIFO addresses, queued back to back together
+        with the CR writes around them and waited on once, so a transfer costs
+        about three round trips whatever its length.  The SR value read at the
+        end of the transfer (before its sticky bits are cleared) is kept in
+        self._status.
+        """
+        with self._memLock:
+
+            # Set the RX watermark
+            if self.RXWR.value() != byteSize:
+                self.RXWR.set(byteSize)
+
+            # Load the TX FIFO in manual start mode (with the new CS), then start
+            # the transfer.  Manual CS is forced due to observed CS glitch in
+            # waveforms when AUTO CS.  The first RX watermark check is queued
+            # right behind: short transfers are usually done by the time it arrives.
+            self._clearError()
+            self._rawTxnChunker(CR_OFFSET, [self._crWord(CS=csValue, Man_start_en=1, Manual_CS=0)], txnType=rogue.interfaces.memory.Write)
+            for i in range(byteSize):
+                self._rawTxnChunker(TXD_OFFSET, [txBuffer[i]], txnType=rogue.interfaces.memory.Write)
+            self._rawTxnChunker(CR_OFFSET, [self._crWord(CS=csValue, Man_start_en=1, Manual_CS=1)], txnType=rogue.interfaces.memory.Write)
+            self._rawTxnChunker(CR_OFFSET, [self._crWord(CS=csValue, Man_start_en=0, Manual_CS=1)], txnType=rogue.interfaces.memory.Write)
+            status = self._rawTxnChunker(SR_OFFSET, None, txnType=rogue.interfaces.memory.Read, numWords=1)
+            start  = time.monotonic()
+            self._wait()
+
+            # Wait for the buffer to fill up to the RX watermark (Rx FIFO Not Empty = 0x10):
+            # wait for the expected latency, then back off exponentially
+            delay = max(self._pollPeriod, self._latency)
+            polls = 0
+            while ( (status[0] & 0x10) == 0 ):
+                if (time.monotonic() - start) > self._timeout:
+                    raise pr.MemoryError(name=self.name, address=self.address|SR_OFFSET, msg=f'SPI transfer timeout after {self._timeout} s')
+                time.sleep(delay)
+                delay  = min(max(2*delay, 1.0E-6), self._maxBackoff)
+                polls += 1
+                status = self._rawTxnChunker(SR_OFFSET, None, txnType=rogue.interfaces.memory.Read, numWords=1)
+                self._wait()
+
+            # Track the latency of the transfers which need more than one poll
+            elapsed = (time.monotonic() - start) if polls > 0 else 0.0
+            self._latency = 0.75*self._latency + 0.25*elapsed
+
+            # Release manual CS, read the RX FIFO, then read and clear the status register
+            self._rawTxnChunker(CR_OFFSET, [self._crWord(CS=csValue, Man_start_en=0, Manual_CS=0)], txnType=rogue.interfaces.memory.Write)
+            rxData = [self._rawTxnChunker(RXD_OFFSET, None, txnType=rogue.interfaces.memory.Read, numWords=1) for i in range(byteSize)]
+            status = self._rawTxnChunker(SR_OFFSET, None, txnType=rogue.interfaces.memory.Read, numWords=1)
+            self._rawTxnChunker(SR_OFFSET, [0x7F], txnType=rogue.interfaces.memory.Write)
+            self._wait()
+
+        # Refresh the CR shadows without a read back
+        for var, value in ((self.CS, csValue), (self.Man_start_en, 0), (self.Manual_CS, 0)):
+            if var.value() != value:
+                var.set(value, write=False)
+
+        self._status = status[0]
 
         # Return the RX buffer
-        return rxBuffer
+        return [d[0] for d in rxData]
 
     ####################################################################
 
     def proxyTransaction(self, transaction):
         self._queue.put(transaction)
 
-    def _pollWorker(self):
-        while True:
-            #print('Main thread loop start')
-            transaction = self._queue.get()
-            if transaction is None:
-                return
-
-            with self._memLock, transaction.lock():
-                #tranId = transaction.id()
-                #print(f'Woke the pollWorker with id: {tranId}')
-
-                # Get the transaction virtual address
-                virtualAddress = transaction.address()
-
-                # Decode the  virtual address metadata
-                devIdx    = (virtualAddress >> 48) & 0x7
-                addrBytes = (virtualAddress >> 44) & 0x7
-                dataBytes = (virtualAddress >> 40) & 0x7
-                byteSize  = addrBytes + dataBytes
-                txBuffer  = [0x00 for x in range(byteSize)]
-
-                # Fill the address bytes
-                for i in range(addrBytes):
-                    txBuffer[i] = ( virtualAddress >> ( 8*(addrBytes-1-i) )+2 ) & 0xFF
-
-                # Check for write transaction
-                if transaction.type() == rogue.interfaces.memory.Write:
-                    # Convert data bytes to int and write data to proxy register
-                    dataBa = bytearray(4)
-                    transaction.getData(dataBa, 0)
-                    data = int.from_bytes(dataBa, 'little', signed=False)
-
-                    # Fill the data bytes
-                    for i in range(dataBytes):
-                        txBuffer[i+addrBytes] = ( data >> ( 8*(dataBytes-1-i) ) ) & 0xFF
-
-                    #print(f'Started write transaction: {tranId}')
-
-                # Check for read or verify transaction
-                elif (transaction.type() == rogue.interfaces.memory.Read) or (transaction.type() == rogue.interfaces.memory.Verify):
-
-                    # Set the R/W bit
-                    txBuffer[0] |= 0x80
-                    #print(f'Started read transaction: {tranId}')
-
-                else:
-                    # Post transactions not allowed
-                    transaction.error(f'Unsupported transaction type {transaction.type()}')
-                    return
-
-                # Kick off the proxy transaction
-                rxBuffer = self.transfer((0xF ^ 0x1 <<devIdx), txBuffer, byteSize)
-
-                # Check the error flag
-                resp = (self.SR.get(read=True) & 0x2)
-
-                # Clear status register by writing 1 to the write to clear bits
-                self.SR.set(0x7F)
-
-                #print(f'Resp: {resp}')
-                if resp != 0:
-                    self.ResetHw()
-                    transaction.error(f'AXIL tranaction failed with RESP: {resp}')
-
-                # Finish the transaction
-                elif transaction.type() == rogue.interfaces.memory.Write:
-                    transaction.done()
+    def _frame(self, devIdx, addrBytes, dataBytes, spiAddr, rnw, values):
+        """
+        One SPI frame: the address header of spiAddr followed by the data
+        bytes of every register in values (auto-increment/streaming mode when
+        there is more than one).  Returns the register values read back.
+        """
+        byteSize = addrBytes + dataBytes*len(values)
+        txBuffer = [0x00 for x in range(byteSize)]
+
+        # Fill the address bytes and set the R/W bit for reads
+        for i in range(addrBytes):
+            txBuffer[i] = ( spiAddr >> ( 8*(addrBytes-1-i) ) ) & 0xFF
+        if rnw:
+            txBuffer[0] |= 0x80
 
-                else:
-                    # parse the rxBuffer
-                    data = 0x0
-                    for i in range(dataBytes):
-                        data = (data << 8) | rxBuffer[i+addrBytes]
+        # Fill the data bytes, MSB first
+        for j, data in enumerate(values):
+            for i in range(dataBytes):
+                txBuffer[addrBytes + j*dataBytes + i] = ( data >> ( 8*(dataBytes-1-i) ) ) & 0xFF
+
+        # Kick off the proxy transaction
+        rxBuffer = self.transfer((0xF ^ 0x1 <<devIdx), txBuffer, byteSize)
+
+        # Check the error flag (status register read and cleared by the transfer)
+        resp = (self._status & 0x2)
+        if resp != 0:
+            self.ResetHw()
+            raise pr.MemoryError(name=self.name, address=spiAddr, msg=f'AXIL tranaction failed with RESP: {resp}')
+
+        # parse the rxBuffer
+        result = []
+        for j in range(len(values)):
+            data = 0x0
+            for i in range(dataBytes):
+                data = (data << 8) | rxBuffer[addrBytes + j*dataBytes + i]
+            result.append(data)
+        return result
+
+    def _decode(self, transaction):
+        """
+        Decode a proxy transaction into a dict of its SPI frame parameters and
+        register values, or None (with the transaction errored) when its type
+        is not supported.
+        """
+        # Decode the virtual address metadata
+        virtualAddress = transaction.address()
+        txn = dict(
+            transaction = transaction,
+            devIdx      = (virtualAddress >> 48) & 0x7,
+            stream      = (virtualAddress >> 47) & 0x1,
+            addrBytes   = (virtualAddress >> 44) & 0x7,
+            dataBytes   = (virtualAddress >> 40) & 0x7,
+            spiAddr     = (virtualAddress >> 2) & 0xFFFFFFFF,
+        )
+
+        # Check for write transaction
+        if transaction.type() == rogue.interfaces.memory.Write:
+            txn['rnw'] = 0
+
+        # Check for read or verify transaction
+        elif (transaction.type() == rogue.interfaces.memory.Read) or (transaction.type() == rogue.interfaces.memory.Verify):
+            txn['rnw'] = 1
+
+        else:
+            # Post transactions not allowed
+            transaction.error(f'Unsupported transaction type {transaction.type()}')
+            return None
+
+        # One SPI register per 32-bit word of the transaction
+        dataBa = bytearray(transaction.size())
+        if txn['rnw'] == 0:
+            transaction.getData(dataBa, 0)
+        txn['values'] = [int.from_bytes(dataBa[i:i+4], 'little', signed=False) for i in range(0, len(dataBa), 4)]
+
+        return txn
+
+    def _merge(self, txns):
+        """
+        Group the decoded transactions, in queue order, into runs which can
+        share SPI frames: same direction to consecutive registers of the same
+        streaming device.  Everything else is a run of its own.
+        """
+        runs = []
+        for txn in txns:
+            if len(runs) > 0:
+                last = runs[-1][-1]
+                if ( txn['stream'] and (txn['dataBytes'] > 0) and
+                     all(txn[k] == last[k] for k in ('devIdx', 'stream', 'addrBytes', 'dataBytes', 'rnw')) and
+                     (txn['spiAddr'] == last['spiAddr'] + len(last['values'])) ):
+                    runs[-1].append(txn)
+                    continue
+            runs.append([txn])
+        return runs
 
-                    #print(f'Got read data: {data:x}')
-                    dataBa = bytearray(data.to_bytes(4, 'little', signed=False))
+    def _pollWorker(self):
+        running = True
+        while running:
+            #print('Main thread loop start')
 
-                    #print(dataBa)
-                    transaction.setData(dataBa, 0)
-                    transaction.done()
+            # Wait for a transaction, then drain everything queued behind it so
+            # the register-per-block accesses of a device load can be merged
+            pending = [self._queue.get()]
+            while True:
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if None in pending:
+                running  = False
+                pending = pending[:pending.index(None)]
+
+            with self._memLock, ExitStack() as stack:
+                txns = []
+                for transaction in pending:
+                    stack.enter_context(transaction.lock())
+                    if not transaction.expired():
+                        txn = self._decode(transaction)
+                        if txn is not None:
+                            txns.append(txn)
+
+                for run in self._merge(txns):
+                    first = run[0]
+
+                    # Streaming devices get as many consecutive registers per frame
+                    # as the FIFOs hold, the others one register per frame
+                    if first['stream'] and (first['dataBytes'] > 0):
+                        burst = max(1, (FRAME_BYTES - first['addrBytes']) // first['dataBytes'])
+                    else:
+                        burst = 1
+
+                    values = [v for txn in run for v in txn['values']]
+
+                    try:
+                        result = []
+                        for j in range(0, len(values), burst):
+                            if all(txn['transaction'].expired() for txn in run):
+                                break
+                            result += self._frame(first['devIdx'], first['addrBytes'], first['dataBytes'], first['spiAddr'] + j, first['rnw'], values[j:j+burst])
+                    except pr.MemoryError as e:
+                        for txn in run:
+                            txn['transaction'].error(str(e))
+                        continue
+
+                    # Finish the transactions of the run
+                    pos = 0
+                    for txn in run:
+                        transaction = txn['transaction']
+                        count       = len(txn['values'])
+                        if not transaction.expired():
+                            if first['rnw'] == 1:
+                                #print(f'Got read data: {result[pos:pos+count]}')
+                                transaction.setData(bytearray(b''.join(data.to_bytes(4, 'little', signed=False) for data in result[pos:pos+count])), 0)
+                            transaction.done()
+                        pos += count
 
     def _stop(self):
         self._queue.put(None)
@@ -538,8 +705,9 @@ class _Regs(pr.Device):
 
 class _ProxySlave(rogue.interfaces.memory.Slave):
 
-    def __init__(self, regs):
-        super().__init__(4,4)
+    def __init__(self, regs, maxSize=4096):
+        # Bursts up to maxSize bytes, split into SPI frames by the Regs worker
+        super().__init__(4,maxSize)
         self._regs = regs
 
     def _doTransaction(self, transaction):
@@ -551,6 +719,9 @@ class SpiPs(pr.Device):
     def __init__(self,
             hidden     = True,
             pollPeriod = 0.0,
+            maxBackoff = 0.01,
+            timeout    = 1.0,
+            maxSize    = 4096,
             **kwargs):
         super().__init__(hidden=hidden, **kwargs)
 
@@ -560,9 +731,11 @@ class SpiPs(pr.Device):
             offset     = 0x0000,
             hidden     = hidden,
             pollPeriod = pollPeriod,
+            maxBackoff = maxBackoff,
+            timeout    = timeout,
             expand     = False,
         ))
-        self.proxy = _ProxySlave(self.Regs)
+        self.proxy = _ProxySlave(self.Regs, maxSize)
 
     def add(self, node):
         pr.Node.add(self, node)
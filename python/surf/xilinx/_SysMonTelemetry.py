@@ -0,0 +1,143 @@
+#-----------------------------------------------------------------------------
+# Description:
+# Batched XADC / SYSMON telemetry snapshots with vectorized conversions
+#-----------------------------------------------------------------------------
+# This file is part of the 'SLAC Firmware Standard Library'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'SLAC Firmware Standard Library', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import time
+import collections
+import pyrogue as pr
+import numpy as np
+
+from surf.xilinx._GtDrp import drpReadMany
+
+# Temperature transfer functions: degC = code * gain / 4096 - offset (UG480, UG580)
+TEMP_TRANSFER = {
+    'XADC'     : (503.975,     273.15),
+    'SYSMONE1' : (501.3743,    273.6777),
+    'SYSMONE4' : (509.3140064, 280.23087870),
+}
+
+SUPPLY_LSB = 732.0E-6 # 3V / 4096
+AUX_LSB    = 244.0E-6 # 1V / 4096
+
+_layouts = {}
+
+class SysMonLayout():
+    """
+    Register window of the sensors of an Xadc or AxiSysMonUltraScale,
+    built once from its variables.  The status, min/max and aux channel
+    registers are 16-bit DRP registers mapped to consecutive 32-bit words
+    starting at the base offset, so the window is read with one block read.
+    """
+    def __init__(self, dev):
+        self.base     = dev._sensorBase
+        self.numWords = dev._sensorWords
+        end           = self.base + 4*self.numWords
+
+        # Every RemoteVariable in the window is refreshed from the block read
+        self.variables = [v for v in dev.variables.values()
+                          if isinstance(v, pr.RemoteVariable) and self.base <= v.offset < end]
+        self.word      = np.array([(v.offset - self.base) // 4 for v in self.variables], dtype=np.int64)
+        bitOffsets     = [v.bitOffset[0] if isinstance(v.bitOffset, list) else v.bitOffset for v in self.variables]
+        bitSizes       = [v.bitSize[0] if isinstance(v.bitSize, list) else v.bitSize for v in self.variables]
+        self.shift     = np.array(bitOffsets, dtype=np.uint32)
+        self.mask      = np.array([(1 << bs) - 1 for bs in bitSizes], dtype=np.uint32)
+
+        # Linear transfer function of each sensor: value = code * scale - offset
+        gain, offset = TEMP_TRANSFER[dev._primitive]
+        self.names   = []
+        scales, offsets, index = [], [], []
+        for raw, name, function in dev._sensors:
+            if raw not in self.variables:
+                continue
+            if function is dev.convTemp:
+                scale, off = gain / 4096.0, offset
+            elif function is dev.convAuxVoltage:
+                scale, off = AUX_LSB, 0.0
+            else:
+                scale, off = SUPPLY_LSB, 0.0
+            self.names.append(name)
+            scales.append(scale)
+            offsets.append(off)
+            index.append(self.variables.index(raw))
+
+        self.scale  = np.array(scales, dtype=np.float64)
+        self.offset = np.array(offsets, dtype=np.float64)
+        self.index  = np.array(index, dtype=np.int64)
+
+    @classmethod
+    def of(cls, dev):
+        if id(dev) not in _layouts:
+            _layouts[id(dev)] = cls(dev)
+        return _layouts[id(dev)]
+
+    def decode(self, words):
+        """
+        Return the (raw values of the window variables, converted sensor values)
+        of a (..., numWords) words array
+        """
+        raw = (np.asarray(words, dtype=np.uint32)[..., self.word] >> self.shift) & self.mask
+        return raw, raw[..., self.index] * self.scale - self.offset
+
+def readSysMon(devs, update=True):
+    """
+    Read the sensors of several Xadc / AxiSysMonUltraScale devices.
+
+    The register window of every device is read with one block read, the
+    reads of all the devices are queued before waiting on any of them so
+    their round trips overlap.  All the values are converted with one numpy
+    pass per device type.  When update is set, the raw variable shadows are
+    refreshed from the same read so the converted LinkVariables follow
+    without any further transaction.
+
+    Returns one {name: value} dict of the converted sensors per device.
+    """
+    groups = collections.defaultdict(list)
+    for dev in devs:
+        layout = SysMonLayout.of(dev)
+        groups[(type(dev), layout.base, layout.numWords)].append(dev)
+
+    result = {}
+    for (_, base, numWords), group in groups.items():
+        words = drpReadMany(group, base >> 2, numWords)
+
+        for dev, w in zip(group, words):
+            layout     = SysMonLayout.of(dev)
+            raw, value = layout.decode(w)
+            result[id(dev)] = dict(zip(layout.names, value.tolist()))
+
+            if update:
+                for var, v in zip(layout.variables, raw.tolist()):
+                    var.set(bool(v) if var.nativeType is bool else v, write=False)
+                    var._queueUpdate()
+
+    return [result[id(dev)] for dev in devs]
+
+def addTelemetryPoll(dev, pollInterval):
+    """
+    Add the hidden TelemetryTime variable to dev.  Polling it takes a
+    snapshot of all the sensors, so the device costs one transaction per
+    poll interval instead of one per sensor.
+    """
+    def _snapshot():
+        readSysMon([dev])
+        return time.time()
+
+    dev.add(pr.LocalVariable(
+        name         = 'TelemetryTime',
+        description  = 'Time of the last sensor snapshot, polling it reads all the sensors with one block read',
+        mode         = 'RO',
+        value        = 0.0,
+        units        = 's',
+        pollInterval = pollInterval,
+        localGet     = _snapshot,
+        hidden       = True,
+    ))
@@ -16,6 +16,8 @@
 
 import pyrogue as pr
 
+from surf.xilinx._SysMonTelemetry import readSysMon, addTelemetryPoll
+
 class Xadc(pr.Device):
     def __init__(self,
                  description = "AXI-Lite XADC for Xilinx 7 Series (Refer to PG091 & PG019)",
@@ -23,9 +25,16 @@ class Xadc(pr.Device):
                  zynq        = False,
                  simpleViewList = ["Temperature", "VccInt", "VccAux", "VccBram"],
                  pollInterval = 5,
+                 batchPoll    = False,
                  **kwargs):
         super().__init__(description=description, **kwargs)
 
+        # Sensor registers window (0x200 - 0x2FC) read by readTelemetry()
+        self._primitive   = 'XADC'
+        self._sensorBase  = 0x200
+        self._sensorWords = 64
+        self._sensors     = []
+
         if isinstance(auxChannels, int):
             auxChannels = list(range(auxChannels))
 
@@ -34,6 +43,10 @@ class Xadc(pr.Device):
             self.simpleViewList.append('enable')
 
         def addPair(name, offset, bitSize, units, bitOffset, description, function, pollInterval=0):
+            # With batchPoll the snapshot poll refreshes the sensors instead
+            if batchPoll:
+                pollInterval = 0
+
             self.add(pr.RemoteVariable(
                 name         = ("Raw"+name),
                 offset       = offset,
@@ -53,6 +66,7 @@ class Xadc(pr.Device):
                 disp         = '{:1.3f}',
                 dependencies = [self.variables["Raw"+name]],
             ))
+            self._sensors.append((self.variables["Raw"+name], name, function))
 
         addPair(
             name         = 'Temperature',
@@ -335,6 +349,7 @@ class Xadc(pr.Device):
                 mode='RO',
                 variable=self.AuxRaw[ch],
                 linkedGet=self.convAuxVoltage))
+            self._sensors.append((self.AuxRaw[ch], f'Aux[{ch}]', self.convAuxVoltage))
 
             self.simpleViewList.append(f'Aux[{ch}]')
 
@@ -571,10 +586,20 @@ class Xadc(pr.Device):
             function     = self.convTemp,
         )
 
+        if batchPoll:
+            addTelemetryPoll(self, pollInterval)
+
         # Default to simple view
         if simpleViewList is not None:
             self.simpleView()
 
+    def readTelemetry(self, update=True):
+        """
+        Read all the sensors with one block read of the 0x200 - 0x2FC window
+        and return the converted values as a {name: value} dict
+        """
+        return readSysMon([self], update=update)[0]
+
     @staticmethod
     def convTemp(dev, var, read):
         value   = var.dependencies[0].get(read=read)
@@ -11,6 +11,11 @@ from surf.xilinx._AxiPciePhy          import *
 from surf.xilinx._AxiSysMonUltraScale import *
 from surf.xilinx._ClockManager        import *
 from surf.xilinx._GpioPs              import *
+from surf.xilinx._GtAttributes        import *
+from surf.xilinx._GtDrp               import *
+from surf.xilinx._GtDrpSnapshot       import *
+from surf.xilinx._GtEyeScan           import *
+from surf.xilinx._GtPrbsBer           import *
 from surf.xilinx._GtRxAlignCheck      import *
 from surf.xilinx._Gtye4Channel        import *
 from surf.xilinx._Gtye4Common         import *
@@ -22,6 +27,7 @@ from surf.xilinx._RfTile              import *
 from surf.xilinx._RfBlock             import *
 from surf.xilinx._RfDataConverter     import *
 from surf.xilinx._SpiPs               import *
+from surf.xilinx._SysMonTelemetry     import *
 from surf.xilinx._TmrInject           import *
 from surf.xilinx._TmrManager          import *
 from surf.xilinx._TmrSem              import *